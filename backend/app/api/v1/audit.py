@@ -1,10 +1,16 @@
 """Audit API endpoints for compliance tracking and reporting"""
 
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
@@ -12,6 +18,7 @@ from app.db.session import get_db
 from app.models.user import User, UserRole
 from app.schemas.audit import AuditLogFilter, AuditLogResponse
 from app.services.audit_service import AuditService
+from app.services.audit_writer import get_audit_writer
 
 router = APIRouter()
 
@@ -73,7 +80,7 @@ def require_audit_permission(current_user: User = Depends(get_current_user)) ->
 
 async def get_audit_service(db: AsyncSession = Depends(get_db)) -> AuditService:
     """Dependency to get AuditService instance"""
-    return AuditService(db)
+    return AuditService(db, writer=get_audit_writer(db))
 
 
 @router.get("/audit", response_model=list[AuditLogResponse])
@@ -266,7 +273,8 @@ async def export_audit_logs(
 
     This endpoint exports audit logs in JSON or CSV format for compliance
     reporting and external analysis. The export is limited to 10,000 records
-    to prevent performance issues.
+    to prevent performance issues; use GET /audit/export/stream for
+    complete exports.
 
     **Parameters:**
     - **format**: Export format - "json" (default) or "csv"
@@ -376,6 +384,137 @@ async def export_audit_logs(
         )
 
 
+# Column order of streamed CSV exports
+EXPORT_COLUMNS = (
+    "id", "user_id", "action", "entity_type", "entity_id",
+    "timestamp", "ip_address", "details",
+)
+# Rows serialized per chunk written to the response
+_EXPORT_CHUNK_ROWS = 500
+
+
+async def _csv_chunks(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode export rows as CSV, a few hundred rows per chunk"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    pending = 0
+    async for row in rows:
+        writer.writerow([
+            json.dumps(row[column]) if column == "details" and row[column] is not None
+            else row[column]
+            for column in EXPORT_COLUMNS
+        ])
+        pending += 1
+        if pending >= _EXPORT_CHUNK_ROWS:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode()
+
+
+async def _ndjson_chunks(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode export rows as newline-delimited JSON"""
+    lines: list[str] = []
+    async for row in rows:
+        lines.append(json.dumps(row) + "\n")
+        if len(lines) >= _EXPORT_CHUNK_ROWS:
+            yield "".join(lines).encode()
+            lines = []
+    if lines:
+        yield "".join(lines).encode()
+
+
+async def _gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip a stream of chunks incrementally"""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+@router.get("/audit/export/stream")
+async def stream_audit_export(
+    user_id: UUID = Query(None, description="Filter by user ID"),
+    action: str = Query(None, description="Filter by action type"),
+    entity_type: str = Query(None, description="Filter by entity type"),
+    entity_id: UUID = Query(None, description="Filter by entity ID"),
+    start_date: str = Query(None, description="Filter by start date (ISO format)"),
+    end_date: str = Query(None, description="Filter by end date (ISO format)"),
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="Export format (csv or ndjson)"),
+    compress: bool = Query(False, description="Gzip the export"),
+    audit_service: AuditService = Depends(get_audit_service),
+    current_user: User = Depends(require_audit_permission),
+) -> StreamingResponse:
+    """
+    Stream a complete audit log export.
+
+    Unlike GET /audit/export there is no row limit: entries are read from
+    the database page by page and written to the response as they arrive,
+    so exports of millions of entries run in constant memory.
+
+    **Parameters:**
+    - **format**: "csv" (default) or "ndjson" (one JSON object per line)
+    - **compress**: Gzip the file (.gz)
+    - All other parameters same as GET /audit endpoint
+
+    **Response:**
+    - File download, newest entries first
+
+    **Example Usage:**
+    ```
+    GET /api/v1/audit/export/stream?format=csv&compress=true&start_date=2015-01-01T00:00:00Z
+    ```
+    """
+    filters = AuditLogFilter(
+        user_id=user_id,
+        action=action,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        start_date=parse_iso_date(start_date, "start_date") if start_date else None,
+        end_date=parse_iso_date(end_date, "end_date") if end_date else None,
+    )
+
+    # Logged before streaming, as the row count is only known at the end
+    await audit_service.log(
+        action="EXPORT",
+        entity_type="AuditLog",
+        user_id=current_user.id,
+        details={
+            "export_format": format,
+            "streamed": True,
+            "compressed": compress,
+            "filters": {
+                "user_id": str(user_id) if user_id else None,
+                "action": action,
+                "entity_type": entity_type,
+                "entity_id": str(entity_id) if entity_id else None,
+                "start_date": start_date,
+                "end_date": end_date,
+            },
+        }
+    )
+
+    rows = audit_service.stream_audit_logs(filters)
+    if format == "csv":
+        chunks, media_type = _csv_chunks(rows), "text/csv"
+    else:
+        chunks, media_type = _ndjson_chunks(rows), "application/x-ndjson"
+    filename = f"audit_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{format}"
+    if compress:
+        chunks, media_type = _gzip_chunks(chunks), "application/gzip"
+        filename += ".gz"
+
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
 @router.post("/audit/cleanup")
 async def cleanup_old_audit_logs(
     retention_days: int = Query(3650, ge=1, le=7300, description="Number of days to retain audit logs (1-20 years)"),
@@ -9,7 +9,7 @@ as per Requirement 8 (Document Generation).
 import io
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,6 +21,7 @@ from app.schemas.document import (
     DesignReviewRequest,
     DesignReviewResponse,
     DocumentFormat,
+    DocumentJobStatus,
     DocumentType,
     FMEARequest,
     FMEAResponse,
@@ -30,6 +31,7 @@ from app.schemas.document import (
     TraceabilityMatrixResponse,
 )
 from app.services.audit_service import get_audit_service
+from app.services.document_jobs import DocumentJobQueue, get_document_job_queue
 from app.services.document_service import DocumentService
 from app.services.signature_service import get_signature_service
 
@@ -48,6 +50,7 @@ async def get_document_service(
         graph_service=graph_service,
         audit_service=audit_service,
         signature_service=signature_service,
+        document_store=get_document_job_queue().store,
     )
 
 
@@ -57,7 +60,7 @@ async def get_document_service(
 
 @router.post(
     "/design-review",
-    response_model=DesignReviewResponse,
+    response_model=DesignReviewResponse | DocumentJobStatus,
     status_code=status.HTTP_201_CREATED,
     summary="Generate Design Review PDF",
     description="Generate a design phase review PDF document with requirements and signatures.",
@@ -65,9 +68,16 @@ async def get_document_service(
 @require_permission(Permission.READ_WORKITEM)
 async def generate_design_review(
     request: DesignReviewRequest,
+    response: Response,
+    run_async: bool = Query(
+        False,
+        alias="async",
+        description="Queue the document as a background job and return its status",
+    ),
     document_service: DocumentService = Depends(get_document_service),
+    job_queue: DocumentJobQueue = Depends(get_document_job_queue),
     current_user: User = Depends(get_current_user),
-) -> DesignReviewResponse:
+) -> DesignReviewResponse | DocumentJobStatus:
     """
     Generate a design phase review PDF document.
 
@@ -80,14 +90,22 @@ async def generate_design_review(
     The generated document is stored and can be downloaded using the
     GET /api/v1/documents/{id} endpoint.
 
+    With `?async=true` the document is generated in the background and the
+    endpoint returns 202 with a job status; poll GET /api/v1/documents/jobs/{job_id}
+    until it is completed.
+
     **Required Permission:** READ_WORKITEM
     """
     try:
-        response = await document_service.generate_design_review_pdf(
+        if run_async:
+            response.status_code = status.HTTP_202_ACCEPTED
+            return await job_queue.submit(DocumentType.DESIGN_REVIEW, request, current_user)
+
+        result = await document_service.generate_design_review_pdf(
             request=request,
             user=current_user,
         )
-        return response
+        return result
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -106,7 +124,7 @@ async def generate_design_review(
 
 @router.post(
     "/traceability-matrix",
-    response_model=TraceabilityMatrixResponse,
+    response_model=TraceabilityMatrixResponse | DocumentJobStatus,
     status_code=status.HTTP_201_CREATED,
     summary="Generate Traceability Matrix PDF",
     description="Generate a requirements traceability matrix PDF showing requirement-test-risk relationships.",
@@ -114,9 +132,16 @@ async def generate_design_review(
 @require_permission(Permission.READ_WORKITEM)
 async def generate_traceability_matrix(
     request: TraceabilityMatrixRequest,
+    response: Response,
+    run_async: bool = Query(
+        False,
+        alias="async",
+        description="Queue the document as a background job and return its status",
+    ),
     document_service: DocumentService = Depends(get_document_service),
+    job_queue: DocumentJobQueue = Depends(get_document_job_queue),
     current_user: User = Depends(get_current_user),
-) -> TraceabilityMatrixResponse:
+) -> TraceabilityMatrixResponse | DocumentJobStatus:
     """
     Generate a requirements traceability matrix PDF document.
 
@@ -130,14 +155,22 @@ async def generate_traceability_matrix(
     The generated document is stored and can be downloaded using the
     GET /api/v1/documents/{id} endpoint.
 
+    With `?async=true` the document is generated in the background and the
+    endpoint returns 202 with a job status; poll GET /api/v1/documents/jobs/{job_id}
+    until it is completed.
+
     **Required Permission:** READ_WORKITEM
     """
     try:
-        response = await document_service.generate_traceability_matrix_pdf(
+        if run_async:
+            response.status_code = status.HTTP_202_ACCEPTED
+            return await job_queue.submit(DocumentType.TRACEABILITY_MATRIX, request, current_user)
+
+        result = await document_service.generate_traceability_matrix_pdf(
             request=request,
             user=current_user,
         )
-        return response
+        return result
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -156,7 +189,7 @@ async def generate_traceability_matrix(
 
 @router.post(
     "/fmea",
-    response_model=FMEAResponse,
+    response_model=FMEAResponse | DocumentJobStatus,
     status_code=status.HTTP_201_CREATED,
     summary="Generate FMEA Excel",
     description="Generate an FMEA (Failure Mode and Effects Analysis) Excel document.",
@@ -164,9 +197,16 @@ async def generate_traceability_matrix(
 @require_permission(Permission.READ_WORKITEM)
 async def generate_fmea(
     request: FMEARequest,
+    response: Response,
+    run_async: bool = Query(
+        False,
+        alias="async",
+        description="Queue the document as a background job and return its status",
+    ),
     document_service: DocumentService = Depends(get_document_service),
+    job_queue: DocumentJobQueue = Depends(get_document_job_queue),
     current_user: User = Depends(get_current_user),
-) -> FMEAResponse:
+) -> FMEAResponse | DocumentJobStatus:
     """
     Generate an FMEA Excel document.
 
@@ -181,14 +221,22 @@ async def generate_fmea(
     The generated document is stored and can be downloaded using the
     GET /api/v1/documents/{id} endpoint.
 
+    With `?async=true` the document is generated in the background and the
+    endpoint returns 202 with a job status; poll GET /api/v1/documents/jobs/{job_id}
+    until it is completed.
+
     **Required Permission:** READ_WORKITEM
     """
     try:
-        response = await document_service.generate_fmea_excel(
+        if run_async:
+            response.status_code = status.HTTP_202_ACCEPTED
+            return await job_queue.submit(DocumentType.FMEA, request, current_user)
+
+        result = await document_service.generate_fmea_excel(
             request=request,
             user=current_user,
         )
-        return response
+        return result
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -207,7 +255,7 @@ async def generate_fmea(
 
 @router.post(
     "/invoice",
-    response_model=InvoiceResponse,
+    response_model=InvoiceResponse | DocumentJobStatus,
     status_code=status.HTTP_201_CREATED,
     summary="Generate Invoice Word Document",
     description="Generate an invoice Word document based on time entries.",
@@ -215,9 +263,16 @@ async def generate_fmea(
 @require_permission(Permission.READ_WORKITEM)
 async def generate_invoice(
     request: InvoiceRequest,
+    response: Response,
+    run_async: bool = Query(
+        False,
+        alias="async",
+        description="Queue the document as a background job and return its status",
+    ),
     document_service: DocumentService = Depends(get_document_service),
+    job_queue: DocumentJobQueue = Depends(get_document_job_queue),
     current_user: User = Depends(get_current_user),
-) -> InvoiceResponse:
+) -> InvoiceResponse | DocumentJobStatus:
     """
     Generate an invoice Word document.
 
@@ -234,14 +289,22 @@ async def generate_invoice(
     The generated document is stored and can be downloaded using the
     GET /api/v1/documents/{id} endpoint.
 
+    With `?async=true` the document is generated in the background and the
+    endpoint returns 202 with a job status; poll GET /api/v1/documents/jobs/{job_id}
+    until it is completed.
+
     **Required Permission:** READ_WORKITEM
     """
     try:
-        response = await document_service.generate_invoice_word(
+        if run_async:
+            response.status_code = status.HTTP_202_ACCEPTED
+            return await job_queue.submit(DocumentType.INVOICE, request, current_user)
+
+        result = await document_service.generate_invoice_word(
             request=request,
             user=current_user,
         )
-        return response
+        return result
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -254,6 +317,42 @@ async def generate_invoice(
         )
 
 
+# ============================================================================
+# Document Job Endpoint
+# ============================================================================
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=DocumentJobStatus,
+    summary="Get Document Job",
+    description="Get the status of a background document generation job.",
+)
+@require_permission(Permission.READ_WORKITEM)
+async def get_document_job(
+    job_id: UUID,
+    job_queue: DocumentJobQueue = Depends(get_document_job_queue),
+    current_user: User = Depends(get_current_user),
+) -> DocumentJobStatus:
+    """
+    Get the status of a background document generation job.
+
+    - **job_id**: Job UUID returned by a generation endpoint called with `?async=true`
+
+    Once the job is completed, the document is downloaded from `download_url`.
+
+    **Required Permission:** READ_WORKITEM
+    """
+    job = await job_queue.get(job_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document job {job_id} not found",
+        )
+
+    return job
+
+
 # ============================================================================
 # Document Retrieval Endpoint (14.2.5)
 # ============================================================================
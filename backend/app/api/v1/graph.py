@@ -1,14 +1,17 @@
 """Graph API endpoints for visualization and knowledge management"""
 
+import json
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import get_current_user
 from app.core.security import Permission, require_permission
-from app.db.graph import GraphService, get_graph_service
+from app.db.graph import GraphFormat, GraphService, get_graph_service
 from app.models.user import User
-from app.schemas.graph import SearchResponse
+from app.schemas.graph import GraphExpandRequest, SearchResponse
+from app.utils.graph_layout import LayoutMode
 
 router = APIRouter()
 
@@ -21,6 +24,15 @@ async def get_graph_visualization(
     node_types: list[str] | None = Query(None, description="Filter by node types"),
     relationship_types: list[str] | None = Query(None, description="Filter by relationship types"),
     limit: int = Query(1000, ge=10, le=5000, description="Maximum nodes to return"),
+    layout: LayoutMode = Query(
+        "none",
+        description="Server-side node placement: none, hierarchical, force or force3d",
+    ),
+    output_format: GraphFormat = Query(
+        "json",
+        alias="format",
+        description="Payload format: json (per-node objects) or columnar (parallel arrays)",
+    ),
     current_user: User = Depends(get_current_user),
     graph_service: GraphService = Depends(get_graph_service)
 ) -> dict[str, Any]:
@@ -37,11 +49,24 @@ async def get_graph_visualization(
         node_types: Optional list of node types to include (WorkItem, Risk, etc.)
         relationship_types: Optional list of relationship types to include
         limit: Maximum number of nodes to return (10-5000)
+        layout: Node placement computed on the server. "none" (default)
+            leaves placement to the client, "hierarchical" layers requirement
+            trees top-down, "force" and "force3d" are force-directed (2D/3D)
+            and the most expensive. Layouts are cached per subgraph, so
+            repeated requests get stable positions.
+        output_format: "json" returns full react-flow/R3F objects per node.
+            "columnar" returns parallel arrays (ids, labels, type/status codes,
+            flat positions, edge index pairs) with the type dictionaries and
+            styles sent once; node properties are fetched on demand from
+            /graph/nodes/{node_id}. It is roughly an order of magnitude
+            smaller for large graphs.
 
     Returns:
         Dictionary containing:
-        - nodes: List of nodes formatted for visualization
-        - edges: List of edges formatted for visualization
+        - nodes: List of nodes formatted for visualization (columns for
+          format=columnar)
+        - edges: List of edges formatted for visualization (columns for
+          format=columnar)
         - metadata: Graph statistics and query info
     """
     # Validate node types if provided
@@ -80,7 +105,9 @@ async def get_graph_visualization(
             depth=depth,
             node_types=node_types,
             relationship_types=relationship_types,
-            limit=limit
+            limit=limit,
+            layout=layout,
+            output_format=output_format,
         )
 
         # Validate graph_data is a dict
@@ -128,6 +155,92 @@ async def get_graph_visualization(
         )
 
 
+@router.get("/stream")
+@require_permission(Permission.READ_WORKITEM)
+async def stream_graph(
+    center_node_id: str = Query(..., description="Node to start the traversal from"),
+    depth: int = Query(3, ge=1, le=5, description="Traversal depth (1-5)"),
+    node_types: list[str] | None = Query(None, description="Filter by node types"),
+    relationship_types: list[str] | None = Query(None, description="Filter by relationship types"),
+    cursor: int = Query(0, ge=0, description="Cursor from the previous page's end message"),
+    page_size: int = Query(2000, ge=10, le=20000, description="Maximum nodes per page"),
+    chunk_size: int = Query(200, ge=10, le=2000, description="Maximum nodes per chunk"),
+    current_user: User = Depends(get_current_user),
+    graph_service: GraphService = Depends(get_graph_service)
+) -> StreamingResponse:
+    """
+    Stream the neighbourhood of a node as newline-delimited JSON
+
+    Nodes arrive in breadth-first order from the center, in chunks of at
+    most chunk_size nodes. Each chunk also carries the edges whose later end
+    is in that chunk, so clients can render every chunk as it arrives. The
+    last line is an end message; when has_more is true, request the next
+    page with its cursor.
+
+    Args:
+        center_node_id: Node to start the traversal from
+        depth: Maximum traversal depth from the center (1-5); every page
+            repeats the traversal, so it is capped like the visualization
+        node_types: Optional list of node types to include
+        relationship_types: Optional list of relationship types to follow
+        cursor: Cursor of the previous page, 0 for the first page
+        page_size: Maximum number of nodes in this response
+        chunk_size: Maximum number of nodes per NDJSON line
+
+    Returns:
+        application/x-ndjson stream of {"type": "chunk", "nodes", "edges"}
+        lines followed by {"type": "end", "cursor", "has_more", ...}
+    """
+
+    async def lines():
+        async for message in graph_service.stream_graph(
+            center_node_id=center_node_id,
+            depth=depth,
+            node_types=node_types,
+            relationship_types=relationship_types,
+            cursor=cursor,
+            page_size=page_size,
+            chunk_size=chunk_size,
+        ):
+            yield json.dumps(message, default=str) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/expand")
+@require_permission(Permission.READ_WORKITEM)
+async def expand_graph_node(
+    request: GraphExpandRequest,
+    current_user: User = Depends(get_current_user),
+    graph_service: GraphService = Depends(get_graph_service)
+) -> dict[str, Any]:
+    """
+    Get the neighbours of a node that the client has not loaded yet
+
+    Only the delta is returned: nodes in known_node_ids are left out, but
+    edges between them and the new nodes are included.
+
+    Args:
+        request: Node to expand, known node ids and optional filters
+
+    Returns:
+        Dictionary with the new nodes, their edges, and cursor/has_more
+    """
+    try:
+        return await graph_service.expand_node(
+            node_id=request.node_id,
+            known_node_ids=request.known_node_ids,
+            node_types=request.node_types,
+            relationship_types=request.relationship_types,
+            limit=request.limit,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to expand node: {str(e)}"
+        )
+
+
 @router.get("/nodes/{node_id}")
 @require_permission(Permission.READ_WORKITEM)
 async def get_node_details(
@@ -183,6 +296,7 @@ async def search_graph(
     query: str = Query(..., min_length=1, description="Search query"),
     node_types: list[str] | None = Query(None, description="Filter by node types"),
     limit: int = Query(50, ge=1, le=200, description="Maximum results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
     current_user: User = Depends(get_current_user),
     graph_service: GraphService = Depends(get_graph_service)
 ) -> SearchResponse:
@@ -192,10 +306,15 @@ async def search_graph(
     Returns nodes in the same format as the visualization endpoint for consistency.
     All nodes have a 'label' field (not 'title') and include reactFlow/r3f data.
 
+    Results come from the full-text search index and are ranked by relevance:
+    query words match word prefixes in titles and descriptions, the whole
+    query matches substrings, and small typos in titles are tolerated.
+
     Args:
         query: Text to search for in node titles and descriptions
-        node_types: Optional filter by node types
+        node_types: Optional filter by node types (labels)
         limit: Maximum number of results (1-200)
+        offset: Number of results to skip, for pagination
 
     Returns:
         SearchResponse with formatted nodes matching the query
@@ -215,61 +334,30 @@ async def search_graph(
         # Log search request
         print(f"[GraphAPI] Search request: query='{query_text}', node_types={node_types}, limit={limit}")
 
-        # Search WorkItems (most common search case)
-        if not node_types or "WorkItem" in node_types:
-            workitems = await graph_service.search_workitems(
-                search_text=query_text,
-                limit=limit
-            )
-            print(f"[GraphAPI] Found {len(workitems)} workitems")
-        else:
-            workitems = []
-
-        # Search other node types if specified
-        other_nodes = []
-        if node_types:
-            for node_type in node_types:
-                if node_type != "WorkItem":
-                    nodes = await graph_service.search_nodes(
-                        label=node_type,
-                        limit=limit // len(node_types) if len(node_types) > 1 else limit
-                    )
-                    # Filter by query text (case-insensitive search in title, name, and description)
-                    query_lower = query_text.lower()
-                    filtered_nodes = [
-                        node for node in nodes
-                        if query_lower in str(node.get('title', '')).lower() or
-                           query_lower in str(node.get('name', '')).lower() or
-                           query_lower in str(node.get('description', '')).lower()
-                    ]
-                    other_nodes.extend(filtered_nodes)
-                    print(f"[GraphAPI] Found {len(filtered_nodes)} {node_type} nodes")
-
-        # Combine results
-        all_results = workitems + other_nodes
-
-        # Limit total results
-        truncated = len(all_results) > limit
-        if truncated:
-            all_results = all_results[:limit]
-
-        print(f"[GraphAPI] Formatting {len(all_results)} results for consistent output")
+        nodes, total = await graph_service.full_text_search(
+            query_text,
+            labels=node_types,
+            limit=limit,
+            offset=offset,
+        )
 
         # Format results consistently using the same format as visualization endpoint
         formatted_results = []
-        for node in all_results:
+        for node in nodes:
             formatted = graph_service._format_node_for_visualization(node)
             if formatted:
                 formatted_results.append(formatted)
 
-        print(f"[GraphAPI] Returning {len(formatted_results)} formatted results (truncated: {truncated})")
+        truncated = offset + len(nodes) < total
+        print(f"[GraphAPI] Returning {len(formatted_results)} of {total} results (truncated: {truncated})")
 
         # Return consistent response format (same as visualization endpoint)
         return SearchResponse(
             query=query_text,
             results=formatted_results,
-            total_found=len(formatted_results),
-            truncated=truncated
+            total_found=total,
+            truncated=truncated,
+            offset=offset,
         )
 
     except ValueError as e:
@@ -290,6 +378,31 @@ async def search_graph(
         )
 
 
+@router.post("/search/index")
+@require_permission(Permission.MANAGE_USERS)
+async def rebuild_search_index(
+    current_user: User = Depends(get_current_user),
+    graph_service: GraphService = Depends(get_graph_service)
+) -> dict[str, Any]:
+    """
+    Create the full-text search index and refill it from all vertices (admin only)
+
+    Nodes written through the graph service are indexed as they change; run
+    this after bulk imports or raw Cypher writes.
+
+    Returns:
+        Whether fuzzy matching is available and the number of indexed nodes
+    """
+    try:
+        return await graph_service.ensure_search_index(rebuild=True)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to rebuild search index: {str(e)}"
+        )
+
+
 @router.get("/traceability")
 @require_permission(Permission.READ_WORKITEM)
 async def get_traceability_matrix(
@@ -304,7 +417,8 @@ async def get_traceability_matrix(
         project_id: Optional project filter
 
     Returns:
-        Traceability matrix with requirements, tests, risks and their relationships
+        Traceability matrix with requirements, tests, risks, their
+        relationships and coverage statistics
     """
     try:
         matrix = await graph_service.get_traceability_matrix(project_id=project_id)
@@ -322,31 +436,46 @@ async def get_traceability_matrix(
 async def get_risk_chains(
     risk_id: str | None = Query(None, description="Starting risk ID"),
     max_depth: int = Query(5, ge=1, le=10, description="Maximum chain depth"),
+    top_k: int = Query(10, ge=1, le=100, description="Most probable chains per start risk"),
     current_user: User = Depends(get_current_user),
     graph_service: GraphService = Depends(get_graph_service)
 ) -> dict[str, Any]:
     """
     Get FMEA failure chains showing risk propagation paths
 
+    Only the top_k most probable chains per start risk are returned. For a
+    single risk the response also carries the aggregate probability of
+    every failure it can lead to. Use /risk-chains/stream for large models.
+
     Args:
         risk_id: Optional starting risk ID (if None, gets all chains)
         max_depth: Maximum chain depth to traverse (1-10)
+        top_k: Maximum chains per start risk (1-100)
 
     Returns:
         Risk chains with failure paths and probabilities
     """
     try:
-        chains = await graph_service.get_risk_chains(
+        chains: list[dict[str, Any]] = []
+        failure_probabilities: dict[str, float] = {}
+        async for result in graph_service.stream_risk_chains(
             risk_id=risk_id,
-            max_depth=max_depth
-        )
-
-        return {
+            max_depth=max_depth,
+            top_k=top_k
+        ):
+            chains.extend(result["chains"])
+            if risk_id:
+                failure_probabilities = result["failure_probabilities"]
+
+        response: dict[str, Any] = {
             "risk_id": risk_id,
             "max_depth": max_depth,
             "chains": chains,
             "total_chains": len(chains)
         }
+        if risk_id:
+            response["failure_probabilities"] = failure_probabilities
+        return response
 
     except Exception as e:
         raise HTTPException(
@@ -355,20 +484,63 @@ async def get_risk_chains(
         )
 
 
+@router.get("/risk-chains/stream")
+@require_permission(Permission.READ_WORKITEM)
+async def stream_risk_chains(
+    risk_id: str | None = Query(None, description="Starting risk ID"),
+    max_depth: int = Query(5, ge=1, le=10, description="Maximum chain depth"),
+    top_k: int = Query(10, ge=1, le=100, description="Most probable chains per start risk"),
+    current_user: User = Depends(get_current_user),
+    graph_service: GraphService = Depends(get_graph_service)
+) -> StreamingResponse:
+    """
+    Stream FMEA risk propagation as newline-delimited JSON
+
+    One line per start risk, sent as soon as that risk is computed, with its
+    top_k chains and the aggregate probability of every reachable failure.
+
+    Args:
+        risk_id: Optional starting risk ID (if None, every risk with
+            outgoing LEADS_TO edges)
+        max_depth: Maximum chain depth to traverse (1-10)
+        top_k: Maximum chains per start risk (1-100)
+
+    Returns:
+        application/x-ndjson stream of {"start_risk_id", "chains",
+        "failure_probabilities"} lines
+    """
+
+    async def lines():
+        async for result in graph_service.stream_risk_chains(
+            risk_id=risk_id,
+            max_depth=max_depth,
+            top_k=top_k,
+        ):
+            yield json.dumps(result, default=str) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.get("/schema")
 @require_permission(Permission.READ_WORKITEM)
 async def get_graph_schema(
+    include_indexes: bool = Query(False, description="Include PostgreSQL indexes on label tables"),
     current_user: User = Depends(get_current_user),
     graph_service: GraphService = Depends(get_graph_service)
 ) -> dict[str, Any]:
     """
     Get graph schema information including supported node types and relationships
 
+    Args:
+        include_indexes: Also list the indexes on the AGE label tables
+
     Returns:
         Graph schema with node types and relationship types
     """
     try:
         schema = await graph_service.initialize_graph_schema()
+        if include_indexes:
+            schema = {**schema, "indexes": await graph_service.list_indexes()}
         return schema
 
     except Exception as e:
@@ -378,6 +550,34 @@ async def get_graph_schema(
         )
 
 
+@router.post("/schema/indexes")
+@require_permission(Permission.MANAGE_USERS)
+async def ensure_graph_indexes(
+    create_labels: bool = Query(True, description="Create missing label tables of the schema first"),
+    current_user: User = Depends(get_current_user),
+    graph_service: GraphService = Depends(get_graph_service)
+) -> dict[str, Any]:
+    """
+    Create the property and edge indexes on all AGE label tables (admin only)
+
+    Idempotent: indexes that already exist are reported but left untouched.
+
+    Args:
+        create_labels: Create label tables for unused schema types before indexing
+
+    Returns:
+        Names of the created and already existing indexes
+    """
+    try:
+        return await graph_service.ensure_indexes(create_labels=create_labels)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to create graph indexes: {str(e)}"
+        )
+
+
 @router.post("/relationships")
 @require_permission(Permission.WRITE_WORKITEM)
 async def create_relationship(
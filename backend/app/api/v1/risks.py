@@ -293,6 +293,7 @@ async def create_failure_chain(
 async def get_risk_chains(
     risk_id: UUID,
     max_depth: int = Query(5, ge=1, le=10, description="Maximum chain depth to traverse"),
+    top_k: int = Query(10, ge=1, le=100, description="Maximum chains, most probable first"),
     risk_service: RiskService = Depends(get_risk_service),
     current_user: User = Depends(get_current_user),
 ) -> list[RiskChainResponse]:
@@ -301,6 +302,7 @@ async def get_risk_chains(
 
     - **risk_id**: Starting risk node UUID
     - **max_depth**: Maximum chain depth to traverse (1-10, default 5)
+    - **top_k**: Maximum chains to return, most probable first (1-100, default 10)
 
     Returns list of failure chains with:
     - Chain nodes (risks and failures)
@@ -316,7 +318,7 @@ async def get_risk_chains(
             detail=f"Risk {risk_id} not found"
         )
 
-    return await risk_service.get_risk_chains(risk_id=risk_id, max_depth=max_depth)
+    return await risk_service.get_risk_chains(risk_id=risk_id, max_depth=max_depth, top_k=top_k)
 
 
 # ============================================================================
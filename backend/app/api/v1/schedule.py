@@ -5,9 +5,10 @@ This module provides REST API endpoints for project scheduling using constraint
 programming with OR-Tools as per Requirement 7 (Offline Project Scheduling).
 """
 
+import hashlib
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
 from app.api.deps import get_current_user
 from app.core.security import Permission, require_permission
@@ -15,26 +16,47 @@ from app.models.user import User
 from app.schemas.schedule import (
     GanttChartData,
     ProjectSchedule,
+    RescheduleRequest,
+    ScheduleJobStatus,
     ScheduleRequest,
     ScheduleResponse,
     ScheduleUpdate,
 )
+from app.services.schedule_store import schedule_etag
 from app.services.scheduler_service import SchedulerService, get_scheduler_service
 
 router = APIRouter()
 
 
+def _not_modified(if_none_match: str | None, etag: str) -> bool:
+    """Whether the client's If-None-Match already names the current ETag"""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 # ============================================================================
 # Schedule Calculation Endpoints (13.2.1)
 # ============================================================================
 
-@router.post("/calculate", response_model=ScheduleResponse, status_code=status.HTTP_200_OK)
+@router.post(
+    "/calculate",
+    response_model=ScheduleResponse | ScheduleJobStatus,
+    status_code=status.HTTP_200_OK,
+)
 @require_permission(Permission.WRITE_WORKITEM)
 async def calculate_schedule(
     request: ScheduleRequest,
+    response: Response,
+    run_async: bool = Query(
+        False,
+        alias="async",
+        description="Queue the calculation as a background job and return its status",
+    ),
     scheduler_service: SchedulerService = Depends(get_scheduler_service),
     current_user: User = Depends(get_current_user),
-) -> ScheduleResponse:
+) -> ScheduleResponse | ScheduleJobStatus:
     """
     Calculate project schedule using constraint programming.
 
@@ -69,6 +91,11 @@ async def calculate_schedule(
         - working_hours_per_day: Working hours per day
         - respect_weekends: Whether to skip weekends
 
+    Query parameters:
+    - **async**: When true, the calculation runs in the scheduler process pool and
+      the endpoint returns 202 with a job status; poll `/jobs/{job_id}` and fetch
+      the schedule from `/jobs/{job_id}/result`
+
     Returns:
     - **status**: success, feasible, infeasible, or error
     - **schedule**: List of scheduled tasks with start/end dates
@@ -76,6 +103,15 @@ async def calculate_schedule(
     - **conflicts**: List of identified conflicts (if infeasible)
     """
     try:
+        if run_async:
+            response.status_code = status.HTTP_202_ACCEPTED
+            return await scheduler_service.submit_schedule_job(
+                project_id=request.project_id,
+                tasks=request.tasks,
+                resources=request.resources,
+                constraints=request.constraints,
+            )
+
         return await scheduler_service.schedule_project(
             project_id=request.project_id,
             tasks=request.tasks,
@@ -89,6 +125,96 @@ async def calculate_schedule(
         )
 
 
+# ============================================================================
+# Schedule Job Endpoints
+# ============================================================================
+
+@router.get("/jobs/{job_id}", response_model=ScheduleJobStatus)
+@require_permission(Permission.READ_WORKITEM)
+async def get_schedule_job(
+    job_id: UUID,
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
+    current_user: User = Depends(get_current_user),
+) -> ScheduleJobStatus:
+    """
+    Get the status of an asynchronous schedule calculation.
+
+    - **job_id**: Job UUID returned by `POST /calculate?async=true`
+
+    Raises 404 if the job is unknown or has been pruned.
+    """
+    job = await scheduler_service.get_schedule_job(job_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Schedule job {job_id} not found"
+        )
+
+    return job
+
+
+@router.get("/jobs/{job_id}/result", response_model=ScheduleResponse)
+@require_permission(Permission.READ_WORKITEM)
+async def get_schedule_job_result(
+    job_id: UUID,
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
+    current_user: User = Depends(get_current_user),
+) -> ScheduleResponse:
+    """
+    Get the schedule calculated by an asynchronous job.
+
+    - **job_id**: Job UUID
+
+    Raises 404 if the job is unknown, 409 if it has not completed.
+    """
+    job = await scheduler_service.get_schedule_job(job_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Schedule job {job_id} not found"
+        )
+
+    result = await scheduler_service.get_schedule_job_result(job_id)
+
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Schedule job {job_id} has no result (status: {job.status})"
+        )
+
+    return result
+
+
+@router.delete("/jobs/{job_id}", response_model=ScheduleJobStatus)
+@require_permission(Permission.WRITE_WORKITEM)
+async def cancel_schedule_job(
+    job_id: UUID,
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
+    current_user: User = Depends(get_current_user),
+) -> ScheduleJobStatus:
+    """
+    Cancel an asynchronous schedule calculation.
+
+    - **job_id**: Job UUID
+
+    Queued jobs never start; running jobs stop their solver search. Cancelling a
+    finished job returns its status unchanged.
+
+    Raises 404 if the job is unknown.
+    """
+    job = await scheduler_service.cancel_schedule_job(job_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Schedule job {job_id} not found"
+        )
+
+    return job
+
+
 # ============================================================================
 # Schedule Retrieval Endpoint (13.2.2)
 # ============================================================================
@@ -97,9 +223,11 @@ async def calculate_schedule(
 @require_permission(Permission.READ_WORKITEM)
 async def get_schedule(
     project_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(None),
     scheduler_service: SchedulerService = Depends(get_scheduler_service),
     current_user: User = Depends(get_current_user),
-) -> ProjectSchedule:
+) -> ProjectSchedule | Response:
     """
     Get the stored schedule for a project.
 
@@ -112,6 +240,9 @@ async def get_schedule(
     - Project duration and dates
     - Version and manual adjustments
 
+    The response carries an `ETag` for the schedule version; send it back in
+    `If-None-Match` to get 304 Not Modified while the schedule is unchanged.
+
     Raises 404 if no schedule exists for the project.
     """
     schedule = await scheduler_service.get_schedule(project_id)
@@ -122,6 +253,11 @@ async def get_schedule(
             detail=f"No schedule found for project {project_id}"
         )
 
+    etag = schedule_etag(schedule)
+    if _not_modified(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     return schedule
 
 
@@ -176,6 +312,59 @@ async def update_schedule(
     return result
 
 
+# ============================================================================
+# Incremental Re-schedule Endpoint
+# ============================================================================
+
+@router.post("/{project_id}/reschedule", response_model=ScheduleResponse)
+@require_permission(Permission.WRITE_WORKITEM)
+async def reschedule_project(
+    project_id: UUID,
+    request: RescheduleRequest,
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
+    current_user: User = Depends(get_current_user),
+) -> ScheduleResponse:
+    """
+    Re-plan a stored schedule after task edits without a full solve.
+
+    - **project_id**: Project UUID
+
+    Request body:
+    - **tasks**: Current tasks, including the edited ones
+    - **resources**: Available resources (defaults to the stored schedule's)
+    - **constraints**: Schedule constraints (defaults to the stored ones)
+    - **changed_task_ids**: Edited tasks; defaults to new tasks and tasks whose
+      estimated hours changed
+    - **freeze_started**: Keep tasks with `start_date_is` set at their current start
+
+    Only the changed tasks and their downstream dependents are re-optimized;
+    the stored start times seed the solver as hints.
+
+    Raises 404 if no schedule exists for the project.
+    """
+    try:
+        result = await scheduler_service.reschedule_project(
+            project_id=project_id,
+            tasks=request.tasks,
+            resources=request.resources,
+            constraints=request.constraints,
+            changed_task_ids=request.changed_task_ids,
+            freeze_started=request.freeze_started,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Schedule calculation failed: {str(e)}"
+        )
+
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No schedule found for project {project_id}"
+        )
+
+    return result
+
 
 # ============================================================================
 # Gantt Chart Data Endpoint (Requirement 3)
@@ -185,9 +374,11 @@ async def update_schedule(
 @require_permission(Permission.READ_WORKITEM)
 async def get_gantt_chart_data(
     project_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(None),
     scheduler_service: SchedulerService = Depends(get_scheduler_service),
     current_user: User = Depends(get_current_user),
-) -> GanttChartData:
+) -> GanttChartData | Response:
     """
     Get Gantt chart visualization data for a project.
 
@@ -215,6 +406,9 @@ async def get_gantt_chart_data(
     - **completion_percentage**: Percentage of completed tasks
 
     Returns empty data structure if no schedule exists for the project.
+
+    Responses for stored schedules carry an `ETag` of the payload; send it back
+    in `If-None-Match` to get 304 Not Modified while nothing changed.
     """
     gantt_data = await scheduler_service.get_gantt_chart_data(project_id)
 
@@ -235,4 +429,9 @@ async def get_gantt_chart_data(
             completion_percentage=0.0,
         )
 
+    etag = f'"{hashlib.sha256(gantt_data.model_dump_json().encode()).hexdigest()[:32]}"'
+    if _not_modified(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     return gantt_data
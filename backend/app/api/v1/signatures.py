@@ -9,6 +9,7 @@ from app.api.deps import get_current_user, get_signature_service
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.signature import (
+    BulkVerifySignaturesRequest,
     DigitalSignatureResponse,
     SignatureVerificationResponse,
     SignWorkItemRequest,
@@ -195,6 +196,78 @@ async def get_workitem_signatures(
     return signatures
 
 
+@router.post("/signatures/verify", response_model=list[SignatureVerificationResponse])
+async def verify_signatures(
+    request: BulkVerifySignaturesRequest,
+    current_user: User = Depends(get_current_user),
+    signature_service: SignatureService = Depends(get_signature_service),
+    audit_service: AuditService = Depends(get_audit_service),
+) -> list[SignatureVerificationResponse]:
+    """
+    Verify many digital signatures at once.
+
+    **Requirement 2.4**: Verify Digital_Signature integrity on access
+    **Requirement 7.3.5**: Integrates signature validation with audit logging
+
+    Verifies the given signatures and all valid signatures of the given
+    WorkItems, e.g. every signature of a design review, in one request.
+
+    Args:
+        request: Signature and WorkItem IDs, current contents and the
+            signers' public keys
+        current_user: Current authenticated user
+        signature_service: Digital signature service instance
+        audit_service: Audit service for compliance logging
+
+    Returns:
+        Verification result per signature
+
+    Raises:
+        HTTPException 400: Public keys are not valid base64
+        HTTPException 401: User not authenticated
+    """
+    import base64
+    import binascii
+
+    try:
+        public_keys = {
+            user_id: base64.b64decode(pem.encode(), validate=True)
+            for user_id, pem in request.public_keys.items()
+        }
+    except (binascii.Error, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to verify signatures: invalid public key encoding ({str(e)})",
+        )
+
+    try:
+        results = await signature_service.verify_signatures(
+            public_keys=public_keys,
+            signature_ids=request.signature_ids,
+            workitem_ids=request.workitem_ids,
+            workitem_contents=request.workitem_contents,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}",
+        )
+
+    # Log one verification event for the whole batch
+    await audit_service.log(
+        action="SIGNATURE_VERIFY_BULK",
+        entity_type="DigitalSignature",
+        user_id=current_user.id,
+        details={
+            "signature_count": len(results),
+            "valid_count": sum(1 for result in results if result.is_valid),
+            "workitem_ids": [str(workitem_id) for workitem_id in request.workitem_ids],
+        },
+    )
+
+    return results
+
+
 @router.post("/signatures/{signature_id}/verify", response_model=SignatureVerificationResponse)
 async def verify_signature(
     signature_id: UUID,
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi import status as http_status
 from fastapi.responses import JSONResponse
 
@@ -26,6 +26,7 @@ router = APIRouter()
 
 @router.get("/workitems", response_model=list[WorkItemResponse])
 async def get_workitems(
+    response: Response,
     search: str | None = Query(None, description="Search text for title and description"),
     type: str | None = Query(None, description="Filter by WorkItem type"),
     status_filter: str | None = Query(None, alias="status", description="Filter by status"),
@@ -34,6 +35,7 @@ async def get_workitems(
     priority: int | None = Query(None, ge=1, le=5, description="Filter by priority level"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="Cursor from X-Next-Cursor of the previous page"),
     current_user: User = Depends(get_current_user),
     workitem_service: WorkItemService = Depends(get_workitem_service),
     audit_service: AuditService = Depends(get_audit_service),
@@ -49,7 +51,10 @@ async def get_workitems(
     - created_by: UUID of creator
     - priority: Priority level (1-5)
 
-    Supports pagination with limit and offset parameters.
+    Supports pagination with limit and offset parameters. When more results
+    follow, the response carries an `X-Next-Cursor` header; pass it back as
+    `cursor` to fetch the next page. Cursor paging keeps the cost of a page
+    constant however deep it is, so prefer it over large offsets.
     """
     # Check read permission
     if not has_permission(current_user.role, Permission.READ_WORKITEM):
@@ -60,7 +65,7 @@ async def get_workitems(
 
     try:
         # Search WorkItems with filters
-        workitems = await workitem_service.search_workitems(
+        workitems, next_cursor = await workitem_service.search_workitems_page(
             search_text=search,
             workitem_type=type,
             status=status_filter,
@@ -68,7 +73,8 @@ async def get_workitems(
             created_by=created_by,
             priority=priority,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
 
         # Log audit event
@@ -90,8 +96,15 @@ async def get_workitems(
             }
         )
 
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         return workitems
 
+    except ValueError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -502,6 +515,89 @@ async def get_workitem_history(
         )
 
 
+def _parse_fields(fields: str | None) -> list[str] | None:
+    """Split a comma-separated field list"""
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+@router.get("/workitems/{workitem_id}/versions")
+async def get_workitem_versions(
+    workitem_id: UUID,
+    response: Response,
+    limit: int = Query(20, ge=1, le=200, description="Maximum number of versions"),
+    cursor: str | None = Query(None, description="Cursor from X-Next-Cursor of the previous page"),
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return, e.g. title,status"
+    ),
+    current_user: User = Depends(get_current_user),
+    workitem_service: WorkItemService = Depends(get_workitem_service),
+    audit_service: AuditService = Depends(get_audit_service),
+):
+    """
+    Get a page of a WorkItem's version history
+
+    Returns versions newest first, starting with the current version. When
+    older versions follow, the response carries an `X-Next-Cursor` header;
+    pass it back as `cursor` to fetch the next page. Use `fields` to return
+    only some fields of each version (`version` is always included).
+    """
+    # Check read permission
+    if not has_permission(current_user.role, Permission.READ_WORKITEM):
+        raise HTTPException(
+            status_code=http_status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to read WorkItems"
+        )
+
+    try:
+        page = await workitem_service.get_workitem_history_page(
+            workitem_id, limit=limit, cursor=cursor, fields=_parse_fields(fields)
+        )
+
+        if page is None:
+            raise HTTPException(
+                status_code=http_status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Version history not available (VersionService required)"
+            )
+        versions, next_cursor = page
+        if not versions:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail="WorkItem not found"
+            )
+
+        # Log audit event
+        await audit_service.log(
+            user_id=current_user.id,
+            action="READ",
+            entity_type="WorkItem",
+            entity_id=workitem_id,
+            details={
+                "action_type": "version_history",
+                "version_count": len(versions),
+                "paged": True
+            }
+        )
+
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return versions
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving WorkItem history: {str(e)}"
+        )
+
+
 @router.get("/workitems/{workitem_id}/version/{version}", response_model=WorkItemResponse)
 async def get_workitem_version(
     workitem_id: UUID,
@@ -626,6 +722,80 @@ async def compare_workitem_versions(
         )
 
 
+@router.get("/workitems/{workitem_id}/diff/{version1}/{version2}")
+async def diff_workitem_versions(
+    workitem_id: UUID,
+    version1: str,
+    version2: str,
+    fields: str | None = Query(
+        None, description="Comma-separated fields to compare, e.g. title,description"
+    ),
+    current_user: User = Depends(get_current_user),
+    workitem_service: WorkItemService = Depends(get_workitem_service),
+    audit_service: AuditService = Depends(get_audit_service),
+):
+    """
+    Compute a compact diff between two versions of a WorkItem
+
+    Unlike the compare endpoint, only differences are returned:
+
+    Returns:
+    - version1, version2: Compared versions
+    - changed_fields: field -> {from, to}; long text fields instead carry
+      `diff`, a list of word-level hunks (equal runs only by length)
+    - added_fields / removed_fields: Fields present in only one version
+    - unchanged_count: Number of unchanged fields
+    """
+    # Check read permission
+    if not has_permission(current_user.role, Permission.READ_WORKITEM):
+        raise HTTPException(
+            status_code=http_status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to read WorkItems"
+        )
+
+    try:
+        diff = await workitem_service.diff_workitem_versions(
+            workitem_id, version1, version2, fields=_parse_fields(fields)
+        )
+
+        if diff is None:
+            raise HTTPException(
+                status_code=http_status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Version comparison not available (VersionService required)"
+            )
+
+        # Log audit event
+        await audit_service.log(
+            user_id=current_user.id,
+            action="READ",
+            entity_type="WorkItem",
+            entity_id=workitem_id,
+            details={
+                "action_type": "version_comparison",
+                "version1": version1,
+                "version2": version2,
+                "changed_fields_count": len(diff["changed_fields"]),
+                "added_fields_count": len(diff["added_fields"]),
+                "removed_fields_count": len(diff["removed_fields"])
+            }
+        )
+
+        return diff
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error comparing WorkItem versions: {str(e)}"
+        )
+
+
 # Task-specific endpoints (Tasks are WorkItems with type='task')
 
 @router.get("/tasks/{task_id}/backlog-sprint-status")
@@ -69,6 +69,83 @@ class Settings(BaseSettings):
 
     # Graph Database (Apache AGE)
     AGE_GRAPH_NAME: str = Field(default="rxdx_graph", description="Apache AGE graph name")
+    AGE_POOL_MODE: Literal["session", "per_query"] = Field(
+        default="session",
+        description=(
+            "AGE connection setup mode: 'session' loads AGE once per pooled connection, "
+            "'per_query' repeats LOAD/SET before every query (e.g. behind PgBouncer "
+            "transaction pooling)"
+        )
+    )
+    AGE_STATEMENT_CACHE_SIZE: int = Field(
+        default=256,
+        description="Prepared statements kept per graph connection (LRU, 0 disables)"
+    )
+
+    # Scheduling
+    SCHEDULER_PROCESS_WORKERS: int = Field(
+        default=2,
+        ge=1,
+        description="Worker processes for asynchronous schedule calculation jobs"
+    )
+    SCHEDULER_MAX_RETAINED_JOBS: int = Field(
+        default=100,
+        ge=1,
+        description="Finished schedule jobs kept in the database for status/result polling"
+    )
+
+    # Audit log
+    AUDIT_WRITE_MODE: Literal["buffered", "sync"] = Field(
+        default="buffered",
+        description=(
+            "'buffered' queues audit entries in process and inserts them in batches "
+            "(SIGN and AUTH events are always written before the request returns); "
+            "'sync' commits every entry on the request path"
+        )
+    )
+    AUDIT_FLUSH_INTERVAL_MS: int = Field(
+        default=200,
+        ge=10,
+        description="Maximum time a buffered audit entry waits before it is written"
+    )
+    AUDIT_BATCH_SIZE: int = Field(
+        default=500,
+        ge=1,
+        description="Buffered audit entries that trigger an immediate flush, and rows per INSERT"
+    )
+    AUDIT_MAX_PENDING: int = Field(
+        default=10000,
+        ge=1,
+        description="Buffered audit entries at which logging waits for a flush (backpressure)"
+    )
+
+    # Document generation
+    DOCUMENT_PROCESS_WORKERS: int = Field(
+        default=2,
+        ge=1,
+        description=(
+            "Worker processes rendering PDF, Excel and Word documents; also the "
+            "number of background document jobs that run at once"
+        )
+    )
+    DOCUMENT_JOB_LEASE_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description=(
+            "Seconds an API worker holds a claimed document job without renewing "
+            "it before another worker may take the job over"
+        )
+    )
+
+    # Version history
+    VERSION_KEYFRAME_INTERVAL: int = Field(
+        default=20,
+        ge=1,
+        description=(
+            "Stored WorkItem versions per full snapshot; the versions in between "
+            "are stored as JSON Patch deltas"
+        )
+    )
 
     # Email - SMTP (Outgoing)
     SMTP_HOST: str = Field(default="localhost", description="SMTP server host")
@@ -1,12 +1,235 @@
 """Apache AGE graph database operations"""
 
+import asyncio
 import json
+import logging
+import re
+import time
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Literal
 
 import asyncpg
 
 from app.core.config import settings
+from app.utils.graph_layout import GraphLayoutEngine, LayoutMode
+from app.utils.risk_propagation import RiskGraph
+from app.utils.traceability import (
+    TRACEABILITY_RELATIONSHIPS,
+    TraceabilityMatrix,
+    build_traceability_matrix,
+)
+
+logger = logging.getLogger(__name__)
+
+# Wire formats of the visualization payload
+GraphFormat = Literal["json", "columnar"]
+
+# Statements the per-query mode issues around every Cypher call: LOAD, SET and
+# the ag_graph lookup on the check connection, then LOAD and SET again on the
+# query connection.
+_AGE_CONNECTION_SETUP_STATEMENTS = 2
+_AGE_GRAPH_CHECK_STATEMENTS = 1
+
+# Search path AGE queries run with; agtype and its operators resolve from ag_catalog
+_AGE_SEARCH_PATH = 'ag_catalog, "$user", public'
+
+_CYPHER_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Vertex properties used as lookup keys by almost every query
+INDEXED_VERTEX_PROPERTIES = ("id", "type", "status")
+
+# Property access expression matched by the "<label>_id_idx" expression indexes
+_VERTEX_ID_EXPRESSION = (
+    "ag_catalog.agtype_access_operator("
+    "VARIADIC ARRAY[{alias}.properties, '\"id\"'::ag_catalog.agtype])"
+)
+
+# Restricts an edge table alias "e" to the relationship types bound as $4
+_EDGE_LABEL_FILTER = (
+    "AND ($4::text[] IS NULL OR e.tableoid IN "
+    "(SELECT relid FROM labels WHERE name = ANY($4::text[])))"
+)
+
+# Cached traceability matrices and the risk graph are rebuilt after this long
+# even without a local edge mutation, which bounds staleness from other
+# workers' writes
+_TRACEABILITY_CACHE_SECONDS = 300.0
+
+# Word characters of a search query; each becomes a prefix term of the tsquery
+_SEARCH_TERM = re.compile(r"\w+")
+
+# Layout of the search side table, stored as its table comment. Bump it when
+# the table definition changes so the next startup recreates and refills it.
+_SEARCH_INDEX_VERSION = "node-search v1"
+
+# Node colors by node type and status; unknown types use the "entity" colors
+_NODE_COLORS: dict[str, dict[str, str]] = {
+    "requirement": {
+        "active": "#3B82F6",
+        "draft": "#93C5FD",
+        "completed": "#1E40AF",
+        "archived": "#6B7280",
+    },
+    "task": {
+        "active": "#10B981",
+        "draft": "#6EE7B7",
+        "completed": "#047857",
+        "archived": "#6B7280",
+    },
+    "test": {
+        "active": "#F59E0B",
+        "draft": "#FCD34D",
+        "completed": "#D97706",
+        "archived": "#6B7280",
+    },
+    "risk": {
+        "active": "#EF4444",
+        "draft": "#FCA5A5",
+        "completed": "#DC2626",
+        "archived": "#6B7280",
+    },
+    "document": {
+        "active": "#8B5CF6",
+        "draft": "#C4B5FD",
+        "completed": "#7C3AED",
+        "archived": "#6B7280",
+    },
+    "failure": {
+        "active": "#DC2626",
+        "draft": "#FCA5A5",
+        "completed": "#991B1B",
+        "archived": "#6B7280",
+    },
+    "entity": {
+        "active": "#6B7280",
+        "draft": "#9CA3AF",
+        "completed": "#4B5563",
+        "archived": "#6B7280",
+    },
+    "user": {
+        "active": "#06B6D4",
+        "draft": "#67E8F9",
+        "completed": "#0891B2",
+        "archived": "#6B7280",
+    },
+}
+
+# Edge styles by relationship type; see _edge_style for unknown types
+_EDGE_STYLES: dict[str, dict[str, Any]] = {
+    "TESTED_BY": {
+        "color": "#F59E0B",
+        "style": "solid",
+        "width": 2,
+        "animated": False,
+        "label": "Tested By",
+        "importance": "high",
+    },
+    "MITIGATES": {
+        "color": "#EF4444",
+        "style": "dashed",
+        "width": 3,
+        "animated": False,
+        "label": "Mitigates",
+        "importance": "critical",
+    },
+    "DEPENDS_ON": {
+        "color": "#6B7280",
+        "style": "solid",
+        "width": 2,
+        "animated": False,
+        "label": "Depends On",
+        "importance": "medium",
+    },
+    "IMPLEMENTS": {
+        "color": "#10B981",
+        "style": "solid",
+        "width": 2,
+        "animated": False,
+        "label": "Implements",
+        "importance": "high",
+    },
+    "LEADS_TO": {
+        "color": "#DC2626",
+        "style": "dotted",
+        "width": 2,
+        "animated": True,
+        "label": "Leads To",
+        "importance": "critical",
+    },
+    "RELATES_TO": {
+        "color": "#8B5CF6",
+        "style": "solid",
+        "width": 1,
+        "animated": False,
+        "label": "Relates To",
+        "importance": "low",
+    },
+    "NEXT_VERSION": {
+        "color": "#3B82F6",
+        "style": "dashed",
+        "width": 2,
+        "animated": True,
+        "label": "Next Version",
+        "importance": "medium",
+    },
+    "MENTIONED_IN": {
+        "color": "#9CA3AF",
+        "style": "dotted",
+        "width": 1,
+        "animated": False,
+        "label": "Mentioned In",
+        "importance": "low",
+    },
+    "REFERENCES": {
+        "color": "#6366F1",
+        "style": "solid",
+        "width": 1,
+        "animated": False,
+        "label": "References",
+        "importance": "medium",
+    },
+}
+
+
+def _edge_style(edge_type: str) -> dict[str, Any]:
+    """Return the display style of a relationship type"""
+    return _EDGE_STYLES.get(
+        edge_type,
+        {
+            "color": "#6B7280",
+            "style": "solid",
+            "width": 1,
+            "animated": False,
+            "label": edge_type.replace("_", " ").title(),
+            "importance": "low",
+        },
+    )
+
+
+def _optional_int(value: str | None) -> int | None:
+    """Parse an integer property read as text, None if absent or not numeric"""
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+
+@dataclass
+class GraphQueryStats:
+    """Per-request counters for graph database round trips"""
+
+    queries: int = 0
+    setup_statements_avoided: int = 0
+
+
+# Set by the logging middleware at the start of each request
+graph_query_stats_var: ContextVar[GraphQueryStats | None] = ContextVar(
+    "graph_query_stats", default=None
+)
 
 
 class GraphService:
@@ -15,6 +238,14 @@ class GraphService:
     def __init__(self):
         self.pool: asyncpg.Pool | None = None
         self.graph_name = settings.AGE_GRAPH_NAME
+        self.pool_mode = settings.AGE_POOL_MODE
+        self._graph_ready = False
+        self._search_ready = False
+        self._trigram_search = False
+        self._traceability_cache: dict[str, tuple[float, TraceabilityMatrix]] = {}
+        self._risk_graph_cache: tuple[float, RiskGraph] | None = None
+        self.setup_statements_avoided = 0
+        self.layout_engine = GraphLayoutEngine()
 
     async def connect(self):
         """Create connection pool to PostgreSQL with AGE"""
@@ -24,38 +255,59 @@ class GraphService:
             url = str(settings.DATABASE_URL).replace(
                 "postgresql+asyncpg://", "postgresql://"
             )
+            # In session mode every physical connection loads AGE once when the
+            # pool opens it, so queries can run without any per-call setup. The
+            # search path is a startup setting: asyncpg runs RESET ALL when a
+            # connection is released, which returns to it instead of dropping it
+            session_mode = self.pool_mode == "session"
             self.pool = await asyncpg.create_pool(
                 url,
                 min_size=5,
                 max_size=20,
                 command_timeout=60,
+                statement_cache_size=settings.AGE_STATEMENT_CACHE_SIZE,
+                server_settings={"search_path": _AGE_SEARCH_PATH} if session_mode else None,
+                init=self._init_connection if session_mode else None,
             )
 
-            # Load AGE extension and set search path for each connection
-            async def init_connection(conn):
-                await conn.execute("LOAD 'age';")
-                await conn.execute("SET search_path = ag_catalog, '$user', public;")
-
-            # Apply initialization to all connections in the pool
-            async with self.pool.acquire() as conn:
-                await init_connection(conn)
+            if not session_mode:
+                async with self.pool.acquire() as conn:
+                    await self._init_connection(conn)
 
     async def close(self):
         """Close connection pool"""
         if self.pool:
             await self.pool.close()
             self.pool = None
+        self._graph_ready = False
+
+    async def _init_connection(self, conn: asyncpg.Connection) -> None:
+        """Load AGE and set the search path on a connection"""
+        await conn.execute("LOAD 'age';")
+        await conn.execute(f"SET search_path = {_AGE_SEARCH_PATH};")
+
+    def _record_query(self, setup_avoided: int) -> None:
+        """Count a graph query and the setup statements it did not need"""
+        self.setup_statements_avoided += setup_avoided
+        stats = graph_query_stats_var.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.setup_statements_avoided += setup_avoided
 
     async def _ensure_graph_exists(self):
         """Ensure the graph database exists"""
         if self.pool is None:
             raise RuntimeError("Database pool not initialized. Call connect() first.")
 
+        session_mode = self.pool_mode == "session"
+        if session_mode and self._graph_ready:
+            return
+
         async with self.pool.acquire() as conn:
             try:
-                # Ensure AGE is loaded and search path is set
-                await conn.execute("LOAD 'age';")
-                await conn.execute("SET search_path = ag_catalog, '$user', public;")
+                if not session_mode:
+                    # Ensure AGE is loaded and search path is set
+                    await self._init_connection(conn)
 
                 # Check if graph exists
                 check_query = f"SELECT * FROM ag_catalog.ag_graph WHERE name = '{self.graph_name}'"
@@ -69,6 +321,10 @@ class GraphService:
                     await conn.fetch(create_query)
                     print(f"Created graph: {self.graph_name}")
 
+                # The graph is never dropped by the application, so one
+                # successful check holds for the life of the process
+                self._graph_ready = True
+
             except Exception as e:
                 print(f"Graph creation error: {e}")
                 # Graph might already exist, continue
@@ -89,42 +345,125 @@ class GraphService:
         if not self.pool:
             await self.connect()
 
+        session_mode = self.pool_mode == "session"
+
         # Ensure the graph exists before executing queries
-        await self._ensure_graph_exists()
+        if session_mode:
+            avoided = _AGE_CONNECTION_SETUP_STATEMENTS * 2
+            if self._graph_ready:
+                avoided += _AGE_GRAPH_CHECK_STATEMENTS
+            else:
+                await self._ensure_graph_exists()
+        else:
+            avoided = 0
+            await self._ensure_graph_exists()
 
-        # Use the full ag_catalog.cypher function with explicit type casting
-        sql_query = f"""
-        SELECT * FROM ag_catalog.cypher('{self.graph_name}', $$
-            {query}
-        $$) as (result ag_catalog.agtype);
-        """
+        sql_query, args = self._cypher_sql(query, params)
 
         if self.pool is None:
             raise RuntimeError("Database pool not initialized after connect() call.")
 
         async with self.pool.acquire() as conn:
             try:
-                # Ensure AGE is loaded and search path is set for this connection
-                await conn.execute("LOAD 'age';")
-                await conn.execute("SET search_path = ag_catalog, '$user', public;")
-
-                rows = await conn.fetch(sql_query)
+                if not session_mode:
+                    # Ensure AGE is loaded and search path is set for this connection
+                    await self._init_connection(conn)
 
-                # Parse AGE agtype results to Python dicts
-                results = []
-                for row in rows:
-                    result = row["result"]
-                    # AGE returns results as agtype, convert to dict
-                    if result:
-                        results.append(self._parse_agtype(result))
+                rows = await conn.fetch(sql_query, *args)
+                self._record_query(avoided)
 
-                return results
+                return self._parse_rows(rows)
             except Exception as e:
                 # Log the error for debugging
                 print(f"Query execution error: {e}")
                 print(f"Query: {sql_query}")
                 raise
 
+    async def execute_batched(
+        self, query: str, param_sets: list[dict[str, Any]]
+    ) -> list[list[dict] | Exception]:
+        """
+        Execute one parameterized Cypher query per parameter set in a single
+        transaction on a single connection.
+
+        Each execution runs in its own savepoint, so a failing batch is rolled
+        back and reported without discarding the others.
+
+        Args:
+            query: Cypher query string
+            param_sets: Parameters for each execution
+
+        Returns:
+            Per parameter set, the result rows or the exception it raised
+        """
+        if not param_sets:
+            return []
+
+        if not self.pool:
+            await self.connect()
+
+        session_mode = self.pool_mode == "session"
+        if not (session_mode and self._graph_ready):
+            await self._ensure_graph_exists()
+
+        if self.pool is None:
+            raise RuntimeError("Database pool not initialized after connect() call.")
+
+        results: list[list[dict] | Exception] = []
+        async with self.pool.acquire() as conn:
+            if not session_mode:
+                await self._init_connection(conn)
+
+            async with conn.transaction():
+                for params in param_sets:
+                    sql_query, args = self._cypher_sql(query, params)
+                    try:
+                        async with conn.transaction():
+                            rows = await conn.fetch(sql_query, *args)
+                        self._record_query(
+                            _AGE_CONNECTION_SETUP_STATEMENTS * 2
+                            + _AGE_GRAPH_CHECK_STATEMENTS
+                        )
+                        results.append(self._parse_rows(rows))
+                    except Exception as e:
+                        logger.warning(f"Batched query execution error: {e}")
+                        results.append(e)
+
+        return results
+
+    def _cypher_sql(
+        self, query: str, params: dict[str, Any] | None
+    ) -> tuple[str, list[str]]:
+        """Wrap a Cypher query in the AGE cypher() SQL call"""
+        # Use the full ag_catalog.cypher function with explicit type casting.
+        # Parameters travel as a single agtype map bound to $1, so the SQL text
+        # only depends on the query template and its prepared statement is
+        # reused from the connection's statement cache.
+        if params:
+            sql_query = f"""
+        SELECT * FROM ag_catalog.cypher('{self.graph_name}', $$
+            {query}
+        $$, $1) as (result ag_catalog.agtype);
+        """
+            return sql_query, [json.dumps(params, default=str)]
+
+        sql_query = f"""
+        SELECT * FROM ag_catalog.cypher('{self.graph_name}', $$
+            {query}
+        $$) as (result ag_catalog.agtype);
+        """
+        return sql_query, []
+
+    def _parse_rows(self, rows: list[Any]) -> list[dict]:
+        """Parse AGE agtype results to Python values"""
+        results = []
+        for row in rows:
+            result = row["result"]
+            # AGE returns results as agtype, convert to dict
+            if result:
+                results.append(self._parse_agtype(result))
+        return results
+
     async def create_node(
         self, label: str, properties: dict[str, Any]
     ) -> dict[str, Any]:
@@ -138,10 +477,15 @@ class GraphService:
         Returns:
             Created node with ID
         """
-        props_str = self._dict_to_cypher_props(properties)
+        params: dict[str, Any] = {}
+        props_str = self._dict_to_cypher_props(properties, params)
         query = f"CREATE (n:{label} {props_str}) RETURN n"
 
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
+        if properties.get("id") is not None:
+            await self._sync_search_index(str(properties["id"]))
+        if label == "WorkItem":
+            self.invalidate_traceability()
         return results[0] if results else {}
 
     async def create_relationship(
@@ -165,11 +509,13 @@ class GraphService:
         """
         # Validate requirement traceability chains
         if rel_type in ("DEPENDS_ON", "RELATES_TO", "IMPLEMENTS", "REFERENCES"):
-            validation_query = f"""
-            MATCH (a {{id: '{from_id}'}}), (b {{id: '{to_id}'}})
+            validation_query = """
+            MATCH (a {id: $from_id}), (b {id: $to_id})
             RETURN a.type as a_type, a.req_subtype as a_sub, b.type as b_type, b.req_subtype as b_sub
             """
-            val_results = await self.execute_query(validation_query)
+            val_results = await self.execute_query(
+                validation_query, {"from_id": from_id, "to_id": to_id}
+            )
             if val_results:
                 val = val_results[0]
                 if val.get("a_type") == "requirement" and val.get("b_type") == "requirement":
@@ -185,15 +531,19 @@ class GraphService:
                                 raise ValueError(f"Invalid requirement trace: {a_sub} cannot trace to {b_sub}. "
                                                  f"Allowed traces are to the same level or exactly one level adjacent (e.g., UN <-> DIR).")
 
-        props_str = self._dict_to_cypher_props(properties) if properties else ""
+        params: dict[str, Any] = {"from_id": from_id, "to_id": to_id}
+        props_str = (
+            self._dict_to_cypher_props(properties, params) if properties else ""
+        )
 
         query = f"""
-        MATCH (a {{id: '{from_id}'}}), (b {{id: '{to_id}'}})
+        MATCH (a {{id: $from_id}}), (b {{id: $to_id}})
         CREATE (a)-[r:{rel_type} {props_str}]->(b)
         RETURN r
         """
 
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
+        self._graph_changed(rel_type)
         return results[0] if results else {}
 
     async def update_relationship(
@@ -234,18 +584,22 @@ class GraphService:
             )
 
         # Delete old relationship and create new one with updated type
-        props_str = self._dict_to_cypher_props(properties) if properties else ""
+        params: dict[str, Any] = {"source_id": source_id, "target_id": target_id}
+        props_str = (
+            self._dict_to_cypher_props(properties, params) if properties else ""
+        )
 
         query = f"""
-        MATCH (a {{id: '{source_id}'}})-[r]->( b {{id: '{target_id}'}})
+        MATCH (a {{id: $source_id}})-[r]->( b {{id: $target_id}})
         WHERE id(r) = {relationship_id}
         DELETE r
         WITH a, b
         CREATE (a)-[new_r:{new_type} {props_str}]->(b)
-        RETURN new_r, id(new_r) as rel_id, '{source_id}' as source_id, '{target_id}' as target_id
+        RETURN new_r, id(new_r) as rel_id, $source_id as source_id, $target_id as target_id
         """
 
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
+        self._graph_changed()
         if not results:
             return {}
 
@@ -277,6 +631,8 @@ class GraphService:
 
         results = await self.execute_query(query)
         deleted_count = results[0].get("deleted_count", 0) if results else 0
+        if deleted_count > 0:
+            self._graph_changed()
         return deleted_count > 0
 
     async def get_relationship(self, relationship_id: str) -> dict[str, Any] | None:
@@ -310,32 +666,40 @@ class GraphService:
 
     async def get_node(self, node_id: str) -> dict[str, Any] | None:
         """Get a node by ID"""
-        query = f"MATCH (n {{id: '{node_id}'}}) RETURN n"
-        results = await self.execute_query(query)
+        query = "MATCH (n {id: $node_id}) RETURN n"
+        results = await self.execute_query(query, {"node_id": str(node_id)})
         return results[0] if results else None
 
     async def update_node(
         self, node_id: str, properties: dict[str, Any]
     ) -> dict[str, Any]:
         """Update node properties"""
-        set_clauses = ", ".join([f"n.{k} = '{v}'" for k, v in properties.items()])
+        params: dict[str, Any] = {"node_id": str(node_id)}
+        set_clauses = []
+        for i, (k, v) in enumerate(properties.items()):
+            params[f"s{i}"] = self._to_cypher_value(v)
+            set_clauses.append(f"n.{self._cypher_key(k)} = $s{i}")
         query = f"""
-        MATCH (n {{id: '{node_id}'}})
-        SET {set_clauses}
+        MATCH (n {{id: $node_id}})
+        SET {", ".join(set_clauses)}
         RETURN n
         """
 
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
+        await self._sync_search_index(str(node_id))
+        self._graph_changed()
         return results[0] if results else {}
 
     async def delete_node(self, node_id: str) -> bool:
         """Delete a node and its relationships"""
-        query = f"""
-        MATCH (n {{id: '{node_id}'}})
+        query = """
+        MATCH (n {id: $node_id})
         DETACH DELETE n
         """
 
-        await self.execute_query(query)
+        await self.execute_query(query, {"node_id": str(node_id)})
+        await self._sync_search_index(str(node_id), deleted=True)
+        self._graph_changed()
         return True
 
     async def find_related_nodes(
@@ -369,11 +733,11 @@ class GraphService:
         depth_pattern = f"*1..{depth}" if depth > 1 else ""
 
         query = f"""
-        MATCH (n {{id: '{node_id}'}}){pattern}{depth_pattern}(related)
+        MATCH (n {{id: $node_id}}){pattern}{depth_pattern}(related)
         RETURN DISTINCT related
         """
 
-        return await self.execute_query(query)
+        return await self.execute_query(query, {"node_id": str(node_id)})
 
     async def search_nodes(
         self,
@@ -393,15 +757,18 @@ class GraphService:
             List of matching nodes
         """
         label_str = f":{label}" if label else ""
-        props_str = self._dict_to_cypher_props(properties) if properties else ""
+        params: dict[str, Any] = {}
+        props_str = (
+            self._dict_to_cypher_props(properties, params) if properties else ""
+        )
 
         query = f"""
         MATCH (n{label_str} {props_str})
         RETURN n
-        LIMIT {limit}
+        LIMIT {int(limit)}
         """
 
-        return await self.execute_query(query)
+        return await self.execute_query(query, params)
 
     async def create_workitem_node(
         self,
@@ -462,8 +829,8 @@ class GraphService:
 
     async def get_workitem(self, workitem_id: str) -> dict[str, Any] | None:
         """Get a WorkItem node by ID"""
-        query = f"MATCH (w:WorkItem {{id: '{workitem_id}'}}) RETURN w"
-        results = await self.execute_query(query)
+        query = "MATCH (w:WorkItem {id: $workitem_id}) RETURN w"
+        results = await self.execute_query(query, {"workitem_id": str(workitem_id)})
 
         if results:
             # Extract the node data from the parsed result
@@ -478,10 +845,10 @@ class GraphService:
         self, workitem_id: str, version: str
     ) -> dict[str, Any] | None:
         """Get a specific version of a WorkItem"""
-        query = (
-            f"MATCH (w:WorkItem {{id: '{workitem_id}', version: '{version}'}}) RETURN w"
+        query = "MATCH (w:WorkItem {id: $workitem_id, version: $version}) RETURN w"
+        results = await self.execute_query(
+            query, {"workitem_id": str(workitem_id), "version": version}
         )
-        results = await self.execute_query(query)
 
         if results:
             # Extract the node data from the parsed result
@@ -527,50 +894,98 @@ class GraphService:
         status: str | None = None,
         assigned_to: str | None = None,
         limit: int = 100,
+        created_by: str | None = None,
+        priority: int | None = None,
+        offset: int = 0,
+        after: tuple[str, str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Search WorkItems with full-text search and filters
 
+        With search text the search index is used and results are ranked by
+        relevance (see full_text_search); without it WorkItems are ordered
+        newest first by (updated_at, id). All filters and the page bounds
+        are applied in the query, so every page is filled up to ``limit``.
+
         Args:
             search_text: Text to search in title and description
             workitem_type: Filter by WorkItem type
             status: Filter by status
             assigned_to: Filter by assigned user
             limit: Maximum number of results
+            created_by: Filter by creator
+            priority: Filter by priority
+            offset: Number of results to skip
+            after: Keyset cursor (updated_at, id) of the last WorkItem of the
+                previous page; only WorkItems sorting after it are returned.
+                Ignored for text searches, which page by offset.
 
         Returns:
             List of matching WorkItems
         """
+        if search_text and search_text.strip():
+            property_filters = {
+                key: value
+                for key, value in (
+                    ("type", workitem_type),
+                    ("status", status),
+                    ("assigned_to", str(assigned_to) if assigned_to else None),
+                    ("created_by", str(created_by) if created_by else None),
+                    ("priority", priority),
+                )
+                if value is not None and value != ""
+            }
+            nodes, _ = await self.full_text_search(
+                search_text,
+                labels=["WorkItem"],
+                property_filters=property_filters,
+                limit=limit,
+                offset=offset,
+            )
+            return [node["properties"] for node in nodes]
+
         # Build WHERE clauses
         where_clauses = []
+        params: dict[str, Any] = {}
 
         if workitem_type:
-            where_clauses.append(f"w.type = '{workitem_type}'")
+            where_clauses.append("w.type = $workitem_type")
+            params["workitem_type"] = workitem_type
         if status:
-            where_clauses.append(f"w.status = '{status}'")
+            where_clauses.append("w.status = $status")
+            params["status"] = status
         if assigned_to:
-            where_clauses.append(f"w.assigned_to = '{assigned_to}'")
-
-        # Add text search (case-insensitive contains)
-        if search_text:
-            escaped_text = search_text.replace("'", "\\'").lower()
+            where_clauses.append("w.assigned_to = $assigned_to")
+            params["assigned_to"] = str(assigned_to)
+        if created_by:
+            where_clauses.append("w.created_by = $created_by")
+            params["created_by"] = str(created_by)
+        if priority is not None:
+            where_clauses.append("w.priority = $priority")
+            params["priority"] = int(priority)
+        if after:
+            # Keyset condition matching ORDER BY updated_at DESC, id DESC
             where_clauses.append(
-                f"(toLower(w.title) CONTAINS '{escaped_text}' OR "
-                f"toLower(w.description) CONTAINS '{escaped_text}')"
+                "(w.updated_at < $after_updated_at"
+                " OR (w.updated_at = $after_updated_at AND w.id < $after_id))"
             )
+            params["after_updated_at"] = after[0]
+            params["after_id"] = after[1]
 
         where_clause = " AND ".join(where_clauses) if where_clauses else "true"
+        skip_clause = f"SKIP {int(offset)}" if offset else ""
 
         query = f"""
         MATCH (w:WorkItem)
         WHERE {where_clause}
         RETURN w
-        ORDER BY w.updated_at DESC
-        LIMIT {limit}
+        ORDER BY w.updated_at DESC, w.id DESC
+        {skip_clause}
+        LIMIT {int(limit)}
         """
 
         print(f"[GraphService] Executing search_workitems query: {query}")
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
         print(f"[GraphService] Got {len(results)} results from execute_query")
         if results:
             print(f"[GraphService] First result: {results[0]}")
@@ -586,9 +1001,264 @@ class GraphService:
         print(f"[GraphService] Returning {len(workitems)} workitems")
         return workitems
 
+    def _search_table(self) -> str:
+        """Qualified name of the full-text search side table"""
+        return f'public."{self.graph_name}_node_search"'
+
+    def _search_upsert_sql(self, where: str) -> str:
+        """Build the statement copying vertices into the search table"""
+        graph = f'"{self.graph_name}"'
+        return f"""
+        INSERT INTO {self._search_table()}
+            (node_id, label, title, body, properties, updated_at)
+        SELECT DISTINCT ON (p ->> 'id')
+               p ->> 'id', l.name,
+               coalesce(p ->> 'title', p ->> 'name', ''),
+               coalesce(p ->> 'description', ''),
+               p, now()
+        FROM (
+            SELECT v.id, v.tableoid, v.properties::text::jsonb AS p
+            FROM {graph}._ag_label_vertex v
+            {where}
+        ) v
+        JOIN ag_catalog.ag_label l ON l.relation::oid = v.tableoid
+        WHERE p ? 'id'
+        ORDER BY p ->> 'id', v.id DESC
+        ON CONFLICT (node_id) DO UPDATE SET
+            label = EXCLUDED.label,
+            title = EXCLUDED.title,
+            body = EXCLUDED.body,
+            properties = EXCLUDED.properties,
+            updated_at = EXCLUDED.updated_at
+        """
+
+    async def ensure_search_index(self, rebuild: bool = False) -> dict[str, Any]:
+        """
+        Create the full-text search side table and its indexes
+
+        Every vertex with an id property has one row holding its label, title
+        (or name), description and properties. A generated tsvector column
+        (title weighted above description) serves ranked prefix matching
+        through a GIN index. When the pg_trgm extension can be created,
+        trigram GIN indexes on title and description also serve fuzzy
+        matching and substring (ILIKE) matches.
+
+        create_node, update_node and delete_node keep the table in sync;
+        text of vertices written with raw Cypher is picked up by a rebuild.
+        The table is filled when it is first created or its definition
+        (_SEARCH_INDEX_VERSION) changed; otherwise only on request.
+
+        Args:
+            rebuild: Re-copy every vertex into the table and drop rows of
+                vertices that no longer exist
+
+        Returns:
+            Dictionary with 'trigram' (fuzzy matching available) and, after a
+            rebuild, the number of 'indexed' nodes
+        """
+        table = self._search_table()
+        prefix = f"{self.graph_name}_node_search"
+
+        rows = await self._execute_sql(
+            "SELECT obj_description(to_regclass($1), 'pg_class') AS version", table
+        )
+        if not rows or rows[0]["version"] != _SEARCH_INDEX_VERSION:
+            # Missing or outdated: recreate it and copy every vertex in
+            await self._execute_sql(f"DROP TABLE IF EXISTS {table}")
+            rebuild = True
+
+        try:
+            await self._execute_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            trigram = True
+        except Exception as e:
+            logger.warning(f"pg_trgm unavailable, fuzzy search disabled: {e}")
+            trigram = False
+
+        statements = [
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                node_id text PRIMARY KEY,
+                label text NOT NULL,
+                title text NOT NULL DEFAULT '',
+                body text NOT NULL DEFAULT '',
+                properties jsonb NOT NULL,
+                document tsvector GENERATED ALWAYS AS (
+                    setweight(to_tsvector('simple', title), 'A')
+                    || setweight(to_tsvector('simple', body), 'B')
+                ) STORED,
+                updated_at timestamptz NOT NULL DEFAULT now()
+            )
+            """,
+            f'CREATE INDEX IF NOT EXISTS "{prefix}_document_idx" '
+            f"ON {table} USING gin (document)",
+            f'CREATE INDEX IF NOT EXISTS "{prefix}_label_idx" ON {table} (label)',
+        ]
+        if trigram:
+            statements += [
+                f'CREATE INDEX IF NOT EXISTS "{prefix}_title_trgm_idx" '
+                f"ON {table} USING gin (title gin_trgm_ops)",
+                f'CREATE INDEX IF NOT EXISTS "{prefix}_body_trgm_idx" '
+                f"ON {table} USING gin (body gin_trgm_ops)",
+            ]
+        statements.append(f"COMMENT ON TABLE {table} IS '{_SEARCH_INDEX_VERSION}'")
+        for statement in statements:
+            await self._execute_sql(statement)
+
+        self._search_ready = True
+        self._trigram_search = trigram
+        result: dict[str, Any] = {"trigram": trigram}
+
+        if rebuild:
+            graph = f'"{self.graph_name}"'
+            await self._execute_sql(
+                f"""
+                DELETE FROM {table} s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {graph}._ag_label_vertex v
+                    WHERE {_VERTEX_ID_EXPRESSION.format(alias="v")}
+                        = to_json(s.node_id)::text::ag_catalog.agtype
+                )
+                """
+            )
+            await self._execute_sql(self._search_upsert_sql(""))
+            rows = await self._execute_sql(f"SELECT count(*) AS indexed FROM {table}")
+            result["indexed"] = rows[0]["indexed"] if rows else 0
+
+        return result
+
+    async def _sync_search_index(self, node_id: str, deleted: bool = False) -> None:
+        """
+        Bring the search table row of one node up to date
+
+        Failures are logged and swallowed so a search index problem never
+        fails the graph write itself.
+        """
+        try:
+            if not self._search_ready:
+                await self.ensure_search_index()
+
+            if deleted:
+                await self._execute_sql(
+                    f"DELETE FROM {self._search_table()} WHERE node_id = $1", node_id
+                )
+                return
+
+            where = (
+                f"WHERE {_VERTEX_ID_EXPRESSION.format(alias='v')} "
+                "= $1::ag_catalog.agtype"
+            )
+            await self._execute_sql(self._search_upsert_sql(where), json.dumps(node_id))
+        except Exception as e:
+            logger.warning(f"Search index sync failed for {node_id}: {e}")
+
+    async def full_text_search(
+        self,
+        search_text: str,
+        labels: list[str] | None = None,
+        property_filters: dict[str, Any] | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Search nodes of all labels through the search side table
+
+        A node matches when every word of the query is a prefix of a word in
+        its title or description, when the query is a substring of either
+        (case-insensitive), or, with pg_trgm, when the query is similar to a
+        word sequence in the title (typos). Results are ranked by tsvector
+        rank plus title similarity; ties are broken by node id so pages are
+        stable.
+
+        Args:
+            search_text: Text to search for
+            labels: Vertex labels to search, or None for all
+            property_filters: Exact property values the nodes must have
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            Tuple of (nodes as {"id", "label", "properties"}, total matches)
+        """
+        if not self._search_ready:
+            await self.ensure_search_index()
+
+        terms = _SEARCH_TERM.findall(search_text.lower())
+        ts_query = " & ".join(f"{term}:*" for term in terms)
+        pattern = (
+            "%"
+            + search_text.strip()
+            .replace("\\", "\\\\")
+            .replace("%", "\\%")
+            .replace("_", "\\_")
+            + "%"
+        )
+
+        matches = [
+            "($1 <> '' AND s.document @@ to_tsquery('simple', $1))",
+            "s.title ILIKE $2",
+            "s.body ILIKE $2",
+        ]
+        score = (
+            "ts_rank_cd(s.document, to_tsquery('simple', $1))"
+            " + CASE WHEN s.title ILIKE $2 THEN 0.5 ELSE 0 END"
+        )
+        args: list[Any] = [
+            ts_query,
+            pattern,
+            labels or None,
+            json.dumps(property_filters) if property_filters else None,
+            limit,
+            offset,
+        ]
+        if self._trigram_search:
+            matches.append("$7 <% s.title")
+            score += " + word_similarity($7, s.title)"
+            args.append(search_text.strip())
+
+        # The side table only finds and ranks nodes; labels and properties
+        # come from the vertices themselves, so writes that bypass the
+        # search table (raw Cypher SETs) are never served stale
+        graph = f'"{self.graph_name}"'
+        sql = f"""
+        WITH matched AS (
+            SELECT s.node_id, {score} AS score
+            FROM {self._search_table()} s
+            WHERE ({" OR ".join(matches)})
+              AND ($3::text[] IS NULL OR s.label = ANY($3::text[]))
+        )
+        SELECT m.node_id, n.label, n.properties, count(*) OVER () AS total
+        FROM matched m
+        CROSS JOIN LATERAL (
+            SELECT l.name AS label, v.properties::text AS properties
+            FROM {graph}._ag_label_vertex v
+            JOIN ag_catalog.ag_label l ON l.relation::oid = v.tableoid
+            WHERE {_VERTEX_ID_EXPRESSION.format(alias="v")}
+                = to_json(m.node_id)::text::ag_catalog.agtype
+            ORDER BY v.id DESC
+            LIMIT 1
+        ) n
+        WHERE ($3::text[] IS NULL OR n.label = ANY($3::text[]))
+          AND ($4::jsonb IS NULL OR n.properties::jsonb @> $4::jsonb)
+        ORDER BY m.score DESC, m.node_id
+        LIMIT $5 OFFSET $6
+        """
+
+        rows = await self._execute_sql(sql, *args)
+
+        nodes = [
+            {
+                "id": row["node_id"],
+                "label": row["label"],
+                "properties": self._parse_agtype(row["properties"]),
+            }
+            for row in rows
+        ]
+        total = rows[0]["total"] if rows else 0
+        return nodes, total
+
     async def get_traceability_matrix(
         self, project_id: str | None = None
-    ) -> dict[str, list[dict[str, Any]]]:
+    ) -> dict[str, Any]:
         """
         Get traceability matrix showing relationships between requirements, tests, and risks
 
@@ -596,130 +1266,219 @@ class GraphService:
             project_id: Optional project filter
 
         Returns:
-            Dictionary with requirements, tests, risks and their relationships
+            Dictionary with requirement rows (test and risk IDs per
+            requirement), tests and risks with their requirement IDs, and
+            coverage statistics
         """
-        # Build project filter if provided
-        project_filter = f"AND r.project_id = '{project_id}'" if project_id else ""
+        matrix = await self.get_traceability(project_id)
+        return matrix.to_response()
 
-        # Get requirements and their relationships
-        requirements_query = f"""
-        MATCH (r:WorkItem {{type: 'requirement'}})
-        WHERE true {project_filter}
-        OPTIONAL MATCH (r)-[:TESTED_BY]->(t:WorkItem {{type: 'test'}})
-        OPTIONAL MATCH (r)-[:MITIGATES]->(risk:WorkItem {{type: 'risk'}})
-        RETURN r,
-               COLLECT(DISTINCT t) as tests,
-               COLLECT(DISTINCT risk) as risks
+    async def get_traceability(
+        self, project_id: str | None = None
+    ) -> TraceabilityMatrix:
         """
+        Get the indexed traceability links of a project
 
-        requirements_results = await self.execute_query(requirements_query)
+        Matrices are cached per project. Edge and WorkItem mutations made
+        through this service drop the cache; entries also expire after
+        _TRACEABILITY_CACHE_SECONDS to pick up writes from other workers.
 
-        # Get all tests and their coverage
-        tests_query = f"""
-        MATCH (t:WorkItem {{type: 'test'}})
-        WHERE true {project_filter}
-        OPTIONAL MATCH (r:WorkItem {{type: 'requirement'}})-[:TESTED_BY]->(t)
-        RETURN t,
-               COLLECT(DISTINCT r) as requirements
-        """
-
-        tests_results = await self.execute_query(tests_query)
+        Args:
+            project_id: Optional project filter
 
-        # Get all risks and their mitigations
-        risks_query = f"""
-        MATCH (risk:WorkItem {{type: 'risk'}})
-        WHERE true {project_filter}
-        OPTIONAL MATCH (r:WorkItem {{type: 'requirement'}})-[:MITIGATES]->(risk)
-        RETURN risk,
-               COLLECT(DISTINCT r) as requirements
+        Returns:
+            TraceabilityMatrix of the project's requirements, tests and risks
+        """
+        key = project_id or ""
+        cached = self._traceability_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _TRACEABILITY_CACHE_SECONDS:
+            return cached[1]
+
+        matrix = await self._load_traceability(project_id)
+        self._traceability_cache[key] = (time.monotonic(), matrix)
+        return matrix
+
+    def invalidate_traceability(self) -> None:
+        """Drop all cached traceability matrices"""
+        self._traceability_cache.clear()
+
+    def _graph_changed(self, rel_type: str | None = None) -> None:
+        """Drop cached analyses that depend on a relationship type (all if None)"""
+        if rel_type is None or rel_type in TRACEABILITY_RELATIONSHIPS:
+            self.invalidate_traceability()
+        if rel_type is None or rel_type == "LEADS_TO":
+            self._risk_graph_cache = None
+
+    async def _load_traceability(self, project_id: str | None) -> TraceabilityMatrix:
+        """Read requirement, test and risk summaries and their links in one statement"""
+        graph = f'"{self.graph_name}"'
+        sql = f"""
+        WITH
+        labels AS (
+            SELECT l.relation::oid AS relid, l.name
+            FROM ag_catalog.ag_label l
+            JOIN ag_catalog.ag_graph g ON l.graph = g.graphid
+            WHERE g.name = $1
+        ),
+        items AS (
+            SELECT v.id, v.properties::text::jsonb AS p
+            FROM {graph}._ag_label_vertex v
+            WHERE v.tableoid IN (SELECT relid FROM labels WHERE name = 'WorkItem')
+        ),
+        nodes AS (
+            SELECT id, p->>'id' AS item_id, p->>'type' AS item_type,
+                   p->>'title' AS title, p->>'status' AS status,
+                   COALESCE(p->>'is_signed' = 'true', false) AS is_signed
+            FROM items
+            WHERE p->>'type' IN ('requirement', 'test', 'risk')
+              AND ($2::text IS NULL OR p->>'project_id' = $2)
+        )
+        SELECT 'node' AS kind, item_type AS type, item_id AS id, title, status,
+               is_signed, NULL::text AS target_id
+        FROM nodes
+        UNION ALL
+        SELECT 'edge', l.name, s.item_id, NULL, NULL, NULL, t.item_id
+        FROM {graph}._ag_label_edge e
+        JOIN labels l ON l.relid = e.tableoid
+        JOIN nodes s ON s.id = e.start_id AND s.item_type = 'requirement'
+        JOIN nodes t ON t.id = e.end_id
+        WHERE l.name = ANY($3::text[])
         """
 
-        risks_results = await self.execute_query(risks_query)
-
-        return {
-            "requirements": requirements_results,
-            "tests": tests_results,
-            "risks": risks_results,
-        }
+        rows = await self._execute_sql(
+            sql, self.graph_name, project_id, list(TRACEABILITY_RELATIONSHIPS)
+        )
+        items = (dict(row) for row in rows if row["kind"] == "node")
+        links = [
+            (row["type"], row["id"], row["target_id"])
+            for row in rows
+            if row["kind"] == "edge"
+        ]
+        matrix = build_traceability_matrix(items, links)
+        logger.debug(
+            f"Traceability: {len(matrix.requirements)} requirements, "
+            f"{len(matrix.tests)} tests, {len(matrix.risks)} risks"
+        )
+        return matrix
 
     async def get_risk_chains(
-        self, risk_id: str | None = None, max_depth: int = 5
+        self, risk_id: str | None = None, max_depth: int = 5, top_k: int = 10
     ) -> list[dict[str, Any]]:
         """
         Get FMEA failure chains showing risk propagation paths
 
+        Returns the top_k most probable chains per start risk rather than
+        every path, so the result stays bounded on dense FMEA graphs. See
+        stream_risk_chains.
+
         Args:
             risk_id: Optional starting risk ID (if None, gets all chains)
             max_depth: Maximum chain depth to traverse
+            top_k: Maximum chains per start risk
 
         Returns:
             List of risk chains with failure paths and probabilities
         """
-        if risk_id:
-            # Get chains starting from specific risk
-            query = f"""
-            MATCH path = (start:WorkItem {{id: '{risk_id}', type: 'risk'}})-[:LEADS_TO*1..{max_depth}]->(end)
-            WHERE end.type IN ['risk', 'failure']
-            RETURN path,
-                   [rel in relationships(path) | rel.probability] as probabilities,
-                   length(path) as chain_length
-            ORDER BY chain_length
-            """
-        else:
-            # Get all risk chains
-            query = f"""
-            MATCH path = (start:WorkItem {{type: 'risk'}})-[:LEADS_TO*1..{max_depth}]->(end)
-            WHERE end.type IN ['risk', 'failure']
-            RETURN path,
-                   [rel in relationships(path) | rel.probability] as probabilities,
-                   length(path) as chain_length,
-                   start.id as start_risk_id
-            ORDER BY start_risk_id, chain_length
-            """
-
-        results = await self.execute_query(query)
-
-        # Process results to extract chain information
-        chains = []
-        for result in results:
-            chain_data = {
-                "path": result.get("path", []),
-                "probabilities": result.get("probabilities", []),
-                "chain_length": result.get("chain_length", 0),
-                "total_probability": self._calculate_chain_probability(
-                    result.get("probabilities", [])
-                ),
-            }
+        chains: list[dict[str, Any]] = []
+        async for result in self.stream_risk_chains(risk_id, max_depth, top_k):
+            chains.extend(result["chains"])
+        return chains
 
-            if "start_risk_id" in result:
-                chain_data["start_risk_id"] = result["start_risk_id"]
+    async def stream_risk_chains(
+        self, risk_id: str | None = None, max_depth: int = 5, top_k: int = 10
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Propagate risks through the LEADS_TO graph one start risk at a time
 
-            chains.append(chain_data)
+        The LEADS_TO graph is loaded once (and cached like the traceability
+        matrix). For each start risk, aggregate failure probabilities and the
+        top_k chains are computed by dynamic programming over the
+        topological order (see RiskGraph.propagate), off the event loop.
 
-        return chains
+        Args:
+            risk_id: Starting risk ID, or None for every risk with outgoing
+                LEADS_TO edges
+            max_depth: Maximum chain depth to traverse
+            top_k: Maximum chains per start risk
 
-    def _calculate_chain_probability(self, probabilities: list[float]) -> float:
+        Yields:
+            {"start_risk_id", "chains", "failure_probabilities"} per start risk
         """
-        Calculate total probability for a failure chain
+        graph = await self.get_risk_graph()
+        starts = [str(risk_id)] if risk_id else graph.start_risks()
+        for start in starts:
+            yield await asyncio.to_thread(graph.propagate, start, max_depth, top_k)
 
-        Args:
-            probabilities: List of individual step probabilities
+    async def get_risk_graph(self) -> RiskGraph:
+        """
+        Get the LEADS_TO graph of all risks and failures
 
         Returns:
-            Combined probability (product of all probabilities)
+            RiskGraph, cached until a LEADS_TO relationship or node changes
+        """
+        cached = self._risk_graph_cache
+        if cached and time.monotonic() - cached[0] < _TRACEABILITY_CACHE_SECONDS:
+            return cached[1]
+
+        graph = f'"{self.graph_name}"'
+        sql = f"""
+        WITH
+        labels AS (
+            SELECT l.relation::oid AS relid, l.name
+            FROM ag_catalog.ag_label l
+            JOIN ag_catalog.ag_graph g ON l.graph = g.graphid
+            WHERE g.name = $1
+        ),
+        edges AS (
+            SELECT e.start_id, e.end_id,
+                   e.properties::text::jsonb->>'probability' AS probability
+            FROM {graph}._ag_label_edge e
+            WHERE e.tableoid IN (SELECT relid FROM labels WHERE name = 'LEADS_TO')
+        ),
+        nodes AS (
+            SELECT v.id, v.properties::text::jsonb AS p
+            FROM {graph}._ag_label_vertex v
+            WHERE v.id IN (SELECT start_id FROM edges UNION SELECT end_id FROM edges)
+        )
+        SELECT 'node' AS kind, p->>'id' AS id, NULL AS target_id, NULL AS probability,
+               p->>'type' AS type, p->>'title' AS title,
+               p->>'description' AS description,
+               p->>'severity' AS severity, p->>'rpn' AS rpn
+        FROM nodes
+        UNION ALL
+        SELECT 'edge', s.p->>'id', t.p->>'id', e.probability,
+               NULL, NULL, NULL, NULL, NULL
+        FROM edges e
+        JOIN nodes s ON s.id = e.start_id
+        JOIN nodes t ON t.id = e.end_id
         """
-        if not probabilities:
-            return 0.0
 
-        total_prob = 1.0
-        for prob in probabilities:
-            if isinstance(prob, (int, float)) and 0 <= prob <= 1:
-                total_prob *= prob
-            else:
-                # Invalid probability, return 0
-                return 0.0
+        rows = await self._execute_sql(sql, self.graph_name)
+        nodes = {
+            row["id"]: {
+                "type": row["type"],
+                "title": row["title"],
+                "description": row["description"],
+                "severity": _optional_int(row["severity"]),
+                "rpn": _optional_int(row["rpn"]),
+            }
+            for row in rows
+            if row["kind"] == "node" and row["id"]
+        }
+        edges = [
+            (row["id"], row["target_id"], row["probability"])
+            for row in rows
+            if row["kind"] == "edge" and row["id"] and row["target_id"]
+        ]
+        risk_graph = RiskGraph(nodes, edges)
+        if risk_graph.dropped_edges:
+            logger.warning(
+                f"LEADS_TO graph has cycles; ignoring "
+                f"{risk_graph.dropped_edges} edges"
+            )
 
-        return total_prob
+        self._risk_graph_cache = (time.monotonic(), risk_graph)
+        return risk_graph
 
     async def initialize_graph_schema(self) -> dict[str, list[str]]:
         """
@@ -776,11 +1535,187 @@ class GraphService:
             "WORKED_ON",  # Worked -> Task (time tracking)
         ]
 
-        # Note: AGE doesn't support CREATE INDEX in Cypher queries like Neo4j
-        # Indexes would need to be created using PostgreSQL syntax if needed
+        # Note: AGE doesn't support CREATE INDEX in Cypher queries like Neo4j.
+        # Property indexes are created with PostgreSQL syntax by ensure_indexes()
 
         return {"node_types": node_types, "relationship_types": relationship_types}
 
+    async def _execute_sql(self, sql: str, *args: Any) -> list[asyncpg.Record]:
+        """Execute plain SQL against the graph database"""
+        if not self.pool:
+            await self.connect()
+
+        await self._ensure_graph_exists()
+
+        if self.pool is None:
+            raise RuntimeError("Database pool not initialized after connect() call.")
+
+        async with self.pool.acquire() as conn:
+            if self.pool_mode != "session":
+                await self._init_connection(conn)
+            return await conn.fetch(sql, *args)
+
+    async def _stream_sql(
+        self, sql: str, *args: Any, prefetch: int = 500
+    ) -> AsyncIterator[asyncpg.Record]:
+        """Execute plain SQL and yield rows through a server-side cursor"""
+        if not self.pool:
+            await self.connect()
+
+        await self._ensure_graph_exists()
+
+        if self.pool is None:
+            raise RuntimeError("Database pool not initialized after connect() call.")
+
+        async with self.pool.acquire() as conn:
+            if self.pool_mode != "session":
+                await self._init_connection(conn)
+            # Cursors only live inside a transaction
+            async with conn.transaction():
+                async for record in conn.cursor(sql, *args, prefetch=prefetch):
+                    yield record
+
+    async def get_graph_labels(self) -> list[dict[str, str]]:
+        """
+        Get the vertex and edge labels that exist in the graph
+
+        AGE creates one table per label in the graph's schema the first time the
+        label is used.
+
+        Returns:
+            List of dicts with label name and kind ('vertex' or 'edge')
+        """
+        rows = await self._execute_sql(
+            """
+            SELECT l.name, l.kind
+            FROM ag_catalog.ag_label l
+            JOIN ag_catalog.ag_graph g ON l.graph = g.graphid
+            WHERE g.name = $1
+              AND l.name NOT IN ('_ag_label_vertex', '_ag_label_edge')
+            ORDER BY l.kind DESC, l.name
+            """,
+            self.graph_name,
+        )
+        return [
+            {"name": row["name"], "kind": "vertex" if row["kind"] == "v" else "edge"}
+            for row in rows
+        ]
+
+    def _index_definitions(self, label: str, kind: str) -> list[tuple[str, str]]:
+        """Build (index name, CREATE INDEX statement) pairs for one label table"""
+        table = f'"{self.graph_name}"."{label}"'
+        definitions = [
+            (f"{label}_graphid_idx", f"ON {table} USING btree (id)"),
+        ]
+
+        if kind == "vertex":
+            # MATCH (n {id: '...'}) is rewritten by AGE to a containment test
+            # on properties, which the GIN index serves
+            definitions.append(
+                (f"{label}_properties_gin_idx", f"ON {table} USING gin (properties)")
+            )
+            # n.id = '...' style predicates use the property access operator
+            for prop in INDEXED_VERTEX_PROPERTIES:
+                definitions.append(
+                    (
+                        f"{label}_{prop}_idx",
+                        f"ON {table} USING btree "
+                        f"(ag_catalog.agtype_access_operator("
+                        f"VARIADIC ARRAY[properties, '\"{prop}\"'::ag_catalog.agtype]))",
+                    )
+                )
+        else:
+            definitions.extend(
+                [
+                    (f"{label}_start_id_idx", f"ON {table} USING btree (start_id)"),
+                    (f"{label}_end_id_idx", f"ON {table} USING btree (end_id)"),
+                ]
+            )
+
+        return [
+            (name, f'CREATE INDEX IF NOT EXISTS "{name}" {body}')
+            for name, body in definitions
+        ]
+
+    async def list_indexes(self) -> list[dict[str, str]]:
+        """
+        List the PostgreSQL indexes on the graph's label tables
+
+        Returns:
+            List of dicts with index name, table (label) and definition
+        """
+        rows = await self._execute_sql(
+            """
+            SELECT indexname, tablename, indexdef
+            FROM pg_catalog.pg_indexes
+            WHERE schemaname = $1
+            ORDER BY tablename, indexname
+            """,
+            self.graph_name,
+        )
+        return [
+            {
+                "name": row["indexname"],
+                "label": row["tablename"],
+                "definition": row["indexdef"],
+            }
+            for row in rows
+        ]
+
+    async def ensure_indexes(self, create_labels: bool = True) -> dict[str, list[str]]:
+        """
+        Create the property and edge indexes for every label in the graph
+
+        Vertex labels get a BTREE index on the graphid column, a GIN index on
+        the properties map and BTREE expression indexes on the id, type and
+        status properties. Edge labels get BTREE indexes on id, start_id and
+        end_id so traversals can join without scanning the edge tables.
+
+        Args:
+            create_labels: Also create the label tables of the supported schema
+                types that have not been used yet, so they are indexed from the
+                first insert
+
+        Returns:
+            Dictionary with the names of 'created' and already 'existing' indexes
+        """
+        labels = await self.get_graph_labels()
+
+        if create_labels:
+            schema = await self.initialize_graph_schema()
+            existing_labels = {label["name"] for label in labels}
+            for kind, names in (
+                ("vertex", schema["node_types"]),
+                ("edge", schema["relationship_types"]),
+            ):
+                create_fn = "create_vlabel" if kind == "vertex" else "create_elabel"
+                for name in names:
+                    if name in existing_labels:
+                        continue
+                    await self._execute_sql(
+                        f"SELECT ag_catalog.{create_fn}('{self.graph_name}', '{name}')"
+                    )
+                    labels.append({"name": name, "kind": kind})
+                    existing_labels.add(name)
+
+        existing_indexes = {index["name"] for index in await self.list_indexes()}
+        created: list[str] = []
+        existing: list[str] = []
+
+        for label in labels:
+            if not _CYPHER_IDENTIFIER.match(label["name"]):
+                continue
+            for index_name, statement in self._index_definitions(
+                label["name"], label["kind"]
+            ):
+                if index_name in existing_indexes:
+                    existing.append(index_name)
+                    continue
+                await self._execute_sql(statement)
+                created.append(index_name)
+
+        return {"created": created, "existing": existing}
+
     async def link_workpackage_to_department(
         self, workpackage_id: str, department_id: str
     ) -> dict[str, Any]:
@@ -799,24 +1734,25 @@ class GraphService:
             ValueError: If workpackage or department doesn't exist, or if workpackage
                        is already linked to a different department
         """
+        params = {"workpackage_id": workpackage_id, "department_id": department_id}
         # Verify workpackage exists
-        wp_query = f"MATCH (wp:Workpackage {{id: '{workpackage_id}'}}) RETURN wp"
-        wp_results = await self.execute_query(wp_query)
+        wp_query = "MATCH (wp:Workpackage {id: $workpackage_id}) RETURN wp"
+        wp_results = await self.execute_query(wp_query, params)
         if not wp_results:
             raise ValueError(f"Workpackage {workpackage_id} not found")
 
         # Verify department exists
-        dept_query = f"MATCH (d:Department {{id: '{department_id}'}}) RETURN d"
-        dept_results = await self.execute_query(dept_query)
+        dept_query = "MATCH (d:Department {id: $department_id}) RETURN d"
+        dept_results = await self.execute_query(dept_query, params)
         if not dept_results:
             raise ValueError(f"Department {department_id} not found")
 
         # Check if workpackage is already linked to a department
-        existing_link_query = f"""
-        MATCH (wp:Workpackage {{id: '{workpackage_id}'}})-[r:LINKED_TO_DEPARTMENT]->(d:Department)
+        existing_link_query = """
+        MATCH (wp:Workpackage {id: $workpackage_id})-[r:LINKED_TO_DEPARTMENT]->(d:Department)
         RETURN d.id as dept_id
         """
-        existing_results = await self.execute_query(existing_link_query)
+        existing_results = await self.execute_query(existing_link_query, params)
 
         if existing_results:
             existing_dept_id = existing_results[0].get("dept_id")
@@ -854,27 +1790,28 @@ class GraphService:
         Raises:
             ValueError: If workpackage doesn't exist
         """
+        params = {"workpackage_id": workpackage_id, "department_id": department_id}
         # Verify workpackage exists
-        wp_query = f"MATCH (wp:Workpackage {{id: '{workpackage_id}'}}) RETURN wp"
-        wp_results = await self.execute_query(wp_query)
+        wp_query = "MATCH (wp:Workpackage {id: $workpackage_id}) RETURN wp"
+        wp_results = await self.execute_query(wp_query, params)
         if not wp_results:
             raise ValueError(f"Workpackage {workpackage_id} not found")
 
         # Build query to delete relationship
         if department_id:
-            query = f"""
-            MATCH (wp:Workpackage {{id: '{workpackage_id}'}})-[r:LINKED_TO_DEPARTMENT]->(d:Department {{id: '{department_id}'}})
+            query = """
+            MATCH (wp:Workpackage {id: $workpackage_id})-[r:LINKED_TO_DEPARTMENT]->(d:Department {id: $department_id})
             DELETE r
             RETURN count(r) as deleted_count
             """
         else:
-            query = f"""
-            MATCH (wp:Workpackage {{id: '{workpackage_id}'}})-[r:LINKED_TO_DEPARTMENT]->(d:Department)
+            query = """
+            MATCH (wp:Workpackage {id: $workpackage_id})-[r:LINKED_TO_DEPARTMENT]->(d:Department)
             DELETE r
             RETURN count(r) as deleted_count
             """
 
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
         deleted_count = results[0].get("deleted_count", 0) if results else 0
         return deleted_count > 0
 
@@ -893,18 +1830,19 @@ class GraphService:
         Raises:
             ValueError: If workpackage doesn't exist
         """
+        params = {"workpackage_id": workpackage_id}
         # Verify workpackage exists
-        wp_query = f"MATCH (wp:Workpackage {{id: '{workpackage_id}'}}) RETURN wp"
-        wp_results = await self.execute_query(wp_query)
+        wp_query = "MATCH (wp:Workpackage {id: $workpackage_id}) RETURN wp"
+        wp_results = await self.execute_query(wp_query, params)
         if not wp_results:
             raise ValueError(f"Workpackage {workpackage_id} not found")
 
         # Get linked department
-        query = f"""
-        MATCH (wp:Workpackage {{id: '{workpackage_id}'}})-[:LINKED_TO_DEPARTMENT]->(d:Department)
+        query = """
+        MATCH (wp:Workpackage {id: $workpackage_id})-[:LINKED_TO_DEPARTMENT]->(d:Department)
         RETURN d
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
 
         if not results:
             return None
@@ -931,18 +1869,19 @@ class GraphService:
         Raises:
             ValueError: If workpackage doesn't exist
         """
+        params = {"workpackage_id": workpackage_id}
         # Verify workpackage exists
-        wp_query = f"MATCH (wp:Workpackage {{id: '{workpackage_id}'}}) RETURN wp"
-        wp_results = await self.execute_query(wp_query)
+        wp_query = "MATCH (wp:Workpackage {id: $workpackage_id}) RETURN wp"
+        wp_results = await self.execute_query(wp_query, params)
         if not wp_results:
             raise ValueError(f"Workpackage {workpackage_id} not found")
 
         # Get resources from linked department
-        query = f"""
-        MATCH (wp:Workpackage {{id: '{workpackage_id}'}})-[:LINKED_TO_DEPARTMENT]->(d:Department)<-[:BELONGS_TO]-(r:Resource)
+        query = """
+        MATCH (wp:Workpackage {id: $workpackage_id})-[:LINKED_TO_DEPARTMENT]->(d:Department)<-[:BELONGS_TO]-(r:Resource)
         RETURN r
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
 
         resources = []
         for result in results:
@@ -996,15 +1935,16 @@ class GraphService:
         Raises:
             ValueError: If resource or project doesn't exist
         """
+        params = {"resource_id": resource_id, "project_id": project_id}
         # Verify resource exists
-        resource_query = f"MATCH (r:Resource {{id: '{resource_id}'}}) RETURN r"
-        resource_results = await self.execute_query(resource_query)
+        resource_query = "MATCH (r:Resource {id: $resource_id}) RETURN r"
+        resource_results = await self.execute_query(resource_query, params)
         if not resource_results:
             raise ValueError(f"Resource {resource_id} not found")
 
         # Verify project exists
-        project_query = f"MATCH (p:Project {{id: '{project_id}'}}) RETURN p"
-        project_results = await self.execute_query(project_query)
+        project_query = "MATCH (p:Project {id: $project_id}) RETURN p"
+        project_results = await self.execute_query(project_query, params)
         if not project_results:
             raise ValueError(f"Project {project_id} not found")
 
@@ -1057,17 +1997,16 @@ class GraphService:
         Raises:
             ValueError: If resource or workpackage doesn't exist
         """
+        params = {"resource_id": resource_id, "workpackage_id": workpackage_id}
         # Verify resource exists
-        resource_query = f"MATCH (r:Resource {{id: '{resource_id}'}}) RETURN r"
-        resource_results = await self.execute_query(resource_query)
+        resource_query = "MATCH (r:Resource {id: $resource_id}) RETURN r"
+        resource_results = await self.execute_query(resource_query, params)
         if not resource_results:
             raise ValueError(f"Resource {resource_id} not found")
 
         # Verify workpackage exists
-        workpackage_query = (
-            f"MATCH (wp:Workpackage {{id: '{workpackage_id}'}}) RETURN wp"
-        )
-        workpackage_results = await self.execute_query(workpackage_query)
+        workpackage_query = "MATCH (wp:Workpackage {id: $workpackage_id}) RETURN wp"
+        workpackage_results = await self.execute_query(workpackage_query, params)
         if not workpackage_results:
             raise ValueError(f"Workpackage {workpackage_id} not found")
 
@@ -1120,15 +2059,16 @@ class GraphService:
         Raises:
             ValueError: If resource or task doesn't exist
         """
+        params = {"resource_id": resource_id, "task_id": task_id}
         # Verify resource exists
-        resource_query = f"MATCH (r:Resource {{id: '{resource_id}'}}) RETURN r"
-        resource_results = await self.execute_query(resource_query)
+        resource_query = "MATCH (r:Resource {id: $resource_id}) RETURN r"
+        resource_results = await self.execute_query(resource_query, params)
         if not resource_results:
             raise ValueError(f"Resource {resource_id} not found")
 
         # Verify task exists and is of type 'task'
-        task_query = f"MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}}) RETURN t"
-        task_results = await self.execute_query(task_query)
+        task_query = "MATCH (t:WorkItem {id: $task_id, type: 'task'}) RETURN t"
+        task_results = await self.execute_query(task_query, params)
         if not task_results:
             raise ValueError(f"Task {task_id} not found or is not of type 'task'")
 
@@ -1181,44 +2121,48 @@ class GraphService:
         Raises:
             ValueError: If relationship doesn't exist
         """
+        params = {"resource_id": resource_id, "target_id": target_id}
         # Check if relationship exists
-        check_query = f"""
-        MATCH (r:Resource {{id: '{resource_id}'}})-[rel:ALLOCATED_TO]->(target {{id: '{target_id}'}})
+        check_query = """
+        MATCH (r:Resource {id: $resource_id})-[rel:ALLOCATED_TO]->(target {id: $target_id})
         RETURN rel
         """
-        check_results = await self.execute_query(check_query)
+        check_results = await self.execute_query(check_query, params)
         if not check_results:
             raise ValueError(
                 f"No ALLOCATED_TO relationship found between resource {resource_id} and target {target_id}"
             )
 
         # Build SET clauses for properties to update
-        set_clauses = []
+        updates: dict[str, Any] = {}
         if allocation_percentage is not None:
             if not 0 <= allocation_percentage <= 100:
                 raise ValueError("Allocation percentage must be between 0 and 100")
-            set_clauses.append(f"rel.allocation_percentage = {allocation_percentage}")
+            updates["allocation_percentage"] = allocation_percentage
 
         if lead is not None:
-            set_clauses.append(f"rel.lead = {str(lead).lower()}")
+            updates["lead"] = lead
 
         if start_date is not None:
-            set_clauses.append(f"rel.start_date = '{start_date}'")
+            updates["start_date"] = start_date
 
         if end_date is not None:
-            set_clauses.append(f"rel.end_date = '{end_date}'")
+            updates["end_date"] = end_date
 
-        if not set_clauses:
+        if not updates:
             # Nothing to update
             return check_results[0]
 
+        set_clauses = [f"rel.{key} = ${key}" for key in updates]
+        params.update(updates)
+
         # Update the relationship
         update_query = f"""
-        MATCH (r:Resource {{id: '{resource_id}'}})-[rel:ALLOCATED_TO]->(target {{id: '{target_id}'}})
+        MATCH (r:Resource {{id: $resource_id}})-[rel:ALLOCATED_TO]->(target {{id: $target_id}})
         SET {", ".join(set_clauses)}
         RETURN rel
         """
-        results = await self.execute_query(update_query)
+        results = await self.execute_query(update_query, params)
         return results[0] if results else {}
 
     async def remove_resource_allocation(
@@ -1234,12 +2178,13 @@ class GraphService:
         Returns:
             True if relationship was removed, False if it didn't exist
         """
-        query = f"""
-        MATCH (r:Resource {{id: '{resource_id}'}})-[rel:ALLOCATED_TO]->(target {{id: '{target_id}'}})
+        params = {"resource_id": resource_id, "target_id": target_id}
+        query = """
+        MATCH (r:Resource {id: $resource_id})-[rel:ALLOCATED_TO]->(target {id: $target_id})
         DELETE rel
         RETURN count(rel) as deleted_count
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
         deleted_count = results[0].get("deleted_count", 0) if results else 0
         return deleted_count > 0
 
@@ -1253,15 +2198,16 @@ class GraphService:
         Returns:
             List of allocations with target information
         """
-        query = f"""
-        MATCH (r:Resource {{id: '{resource_id}'}})-[rel:ALLOCATED_TO]->(target)
-        RETURN {{
+        params = {"resource_id": resource_id}
+        query = """
+        MATCH (r:Resource {id: $resource_id})-[rel:ALLOCATED_TO]->(target)
+        RETURN {
             rel: rel,
             target: target,
             target_labels: labels(target)
-        }} as result
+        } as result
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
 
         allocations = []
         for result in results:
@@ -1322,11 +2268,12 @@ class GraphService:
         Returns:
             List of lead resources
         """
-        query = f"""
-        MATCH (r:Resource)-[rel:ALLOCATED_TO {{lead: true}}]->(p:Project {{id: '{project_id}'}})
+        params = {"project_id": project_id}
+        query = """
+        MATCH (r:Resource)-[rel:ALLOCATED_TO {lead: true}]->(p:Project {id: $project_id})
         RETURN r as result
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
 
         resources = []
         for result in results:
@@ -1357,11 +2304,12 @@ class GraphService:
         Returns:
             List of lead resources
         """
-        query = f"""
-        MATCH (r:Resource)-[rel:ALLOCATED_TO {{lead: true}}]->(t:WorkItem {{id: '{task_id}', type: 'task'}})
+        params = {"task_id": task_id}
+        query = """
+        MATCH (r:Resource)-[rel:ALLOCATED_TO {lead: true}]->(t:WorkItem {id: $task_id, type: 'task'})
         RETURN r as result
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
 
         resources = []
         for result in results:
@@ -1395,25 +2343,26 @@ class GraphService:
         Raises:
             ValueError: If task doesn't exist
         """
+        params = {"task_id": task_id}
         # Verify task exists
-        task_query = f"MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}}) RETURN t"
-        task_results = await self.execute_query(task_query)
+        task_query = "MATCH (t:WorkItem {id: $task_id, type: 'task'}) RETURN t"
+        task_results = await self.execute_query(task_query, params)
         if not task_results:
             raise ValueError(f"Task {task_id} not found or is not of type 'task'")
 
         # Check for IN_BACKLOG relationship
-        backlog_query = f"""
-        MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}})-[:IN_BACKLOG]->(b:Backlog)
+        backlog_query = """
+        MATCH (t:WorkItem {id: $task_id, type: 'task'})-[:IN_BACKLOG]->(b:Backlog)
         RETURN b.id as backlog_id
         """
-        backlog_results = await self.execute_query(backlog_query)
+        backlog_results = await self.execute_query(backlog_query, params)
 
         # Check for ASSIGNED_TO_SPRINT relationship
-        sprint_query = f"""
-        MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}})-[:ASSIGNED_TO_SPRINT]->(s:Sprint)
+        sprint_query = """
+        MATCH (t:WorkItem {id: $task_id, type: 'task'})-[:ASSIGNED_TO_SPRINT]->(s:Sprint)
         RETURN s.id as sprint_id
         """
-        sprint_results = await self.execute_query(sprint_query)
+        sprint_results = await self.execute_query(sprint_query, params)
 
         # Extract IDs from results - AGE returns values directly
         backlog_id = None
@@ -1456,31 +2405,32 @@ class GraphService:
         Raises:
             ValueError: If task or backlog doesn't exist
         """
+        params = {"task_id": task_id, "backlog_id": backlog_id}
         # Verify task exists
-        task_query = f"MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}}) RETURN t"
-        task_results = await self.execute_query(task_query)
+        task_query = "MATCH (t:WorkItem {id: $task_id, type: 'task'}) RETURN t"
+        task_results = await self.execute_query(task_query, params)
         if not task_results:
             raise ValueError(f"Task {task_id} not found or is not of type 'task'")
 
         # Verify backlog exists
-        backlog_query = f"MATCH (b:Backlog {{id: '{backlog_id}'}}) RETURN b"
-        backlog_results = await self.execute_query(backlog_query)
+        backlog_query = "MATCH (b:Backlog {id: $backlog_id}) RETURN b"
+        backlog_results = await self.execute_query(backlog_query, params)
         if not backlog_results:
             raise ValueError(f"Backlog {backlog_id} not found")
 
         # Remove any existing ASSIGNED_TO_SPRINT relationship (mutual exclusivity)
-        remove_sprint_query = f"""
-        MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}})-[r:ASSIGNED_TO_SPRINT]->(:Sprint)
+        remove_sprint_query = """
+        MATCH (t:WorkItem {id: $task_id, type: 'task'})-[r:ASSIGNED_TO_SPRINT]->(:Sprint)
         DELETE r
         """
-        await self.execute_query(remove_sprint_query)
+        await self.execute_query(remove_sprint_query, params)
 
         # Remove any existing IN_BACKLOG relationship (to avoid duplicates)
-        remove_backlog_query = f"""
-        MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}})-[r:IN_BACKLOG]->(:Backlog)
+        remove_backlog_query = """
+        MATCH (t:WorkItem {id: $task_id, type: 'task'})-[r:IN_BACKLOG]->(:Backlog)
         DELETE r
         """
-        await self.execute_query(remove_backlog_query)
+        await self.execute_query(remove_backlog_query, params)
 
         # Create IN_BACKLOG relationship
         properties = {"added_at": datetime.now(UTC).isoformat()}
@@ -1511,31 +2461,32 @@ class GraphService:
         Raises:
             ValueError: If task or sprint doesn't exist
         """
+        params = {"task_id": task_id, "sprint_id": sprint_id}
         # Verify task exists
-        task_query = f"MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}}) RETURN t"
-        task_results = await self.execute_query(task_query)
+        task_query = "MATCH (t:WorkItem {id: $task_id, type: 'task'}) RETURN t"
+        task_results = await self.execute_query(task_query, params)
         if not task_results:
             raise ValueError(f"Task {task_id} not found or is not of type 'task'")
 
         # Verify sprint exists
-        sprint_query = f"MATCH (s:Sprint {{id: '{sprint_id}'}}) RETURN s"
-        sprint_results = await self.execute_query(sprint_query)
+        sprint_query = "MATCH (s:Sprint {id: $sprint_id}) RETURN s"
+        sprint_results = await self.execute_query(sprint_query, params)
         if not sprint_results:
             raise ValueError(f"Sprint {sprint_id} not found")
 
         # Remove any existing IN_BACKLOG relationship (mutual exclusivity)
-        remove_backlog_query = f"""
-        MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}})-[r:IN_BACKLOG]->(:Backlog)
+        remove_backlog_query = """
+        MATCH (t:WorkItem {id: $task_id, type: 'task'})-[r:IN_BACKLOG]->(:Backlog)
         DELETE r
         """
-        await self.execute_query(remove_backlog_query)
+        await self.execute_query(remove_backlog_query, params)
 
         # Remove any existing ASSIGNED_TO_SPRINT relationship (to avoid duplicates)
-        remove_sprint_query = f"""
-        MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}})-[r:ASSIGNED_TO_SPRINT]->(:Sprint)
+        remove_sprint_query = """
+        MATCH (t:WorkItem {id: $task_id, type: 'task'})-[r:ASSIGNED_TO_SPRINT]->(:Sprint)
         DELETE r
         """
-        await self.execute_query(remove_sprint_query)
+        await self.execute_query(remove_sprint_query, params)
 
         # Create ASSIGNED_TO_SPRINT relationship
         properties = {
@@ -1572,19 +2523,20 @@ class GraphService:
         Raises:
             ValueError: If task or sprint doesn't exist, or if return_to_backlog is True but backlog_id is None
         """
+        params = {"task_id": task_id, "sprint_id": sprint_id}
         # Verify task exists
-        task_query = f"MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}}) RETURN t"
-        task_results = await self.execute_query(task_query)
+        task_query = "MATCH (t:WorkItem {id: $task_id, type: 'task'}) RETURN t"
+        task_results = await self.execute_query(task_query, params)
         if not task_results:
             raise ValueError(f"Task {task_id} not found or is not of type 'task'")
 
         # Remove ASSIGNED_TO_SPRINT relationship
-        remove_query = f"""
-        MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}})-[r:ASSIGNED_TO_SPRINT]->(s:Sprint {{id: '{sprint_id}'}})
+        remove_query = """
+        MATCH (t:WorkItem {id: $task_id, type: 'task'})-[r:ASSIGNED_TO_SPRINT]->(s:Sprint {id: $sprint_id})
         DELETE r
         RETURN count(r) as deleted_count
         """
-        results = await self.execute_query(remove_query)
+        results = await self.execute_query(remove_query, params)
 
         # Extract deleted count - AGE may return int directly or in dict
         deleted_count = 0
@@ -1629,15 +2581,16 @@ class GraphService:
         Raises:
             ValueError: If task or risk doesn't exist
         """
+        params = {"task_id": task_id, "risk_id": risk_id}
         # Verify task exists
-        task_query = f"MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}}) RETURN t"
-        task_results = await self.execute_query(task_query)
+        task_query = "MATCH (t:WorkItem {id: $task_id, type: 'task'}) RETURN t"
+        task_results = await self.execute_query(task_query, params)
         if not task_results:
             raise ValueError(f"Task {task_id} not found or is not of type 'task'")
 
         # Verify risk exists
-        risk_query = f"MATCH (r:WorkItem {{id: '{risk_id}', type: 'risk'}}) RETURN r"
-        risk_results = await self.execute_query(risk_query)
+        risk_query = "MATCH (r:WorkItem {id: $risk_id, type: 'risk'}) RETURN r"
+        risk_results = await self.execute_query(risk_query, params)
         if not risk_results:
             raise ValueError(f"Risk {risk_id} not found or is not of type 'risk'")
 
@@ -1657,12 +2610,13 @@ class GraphService:
         Returns:
             True if relationship was removed, False if it didn't exist
         """
-        query = f"""
-        MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}})-[r:has_risk]->(risk:WorkItem {{id: '{risk_id}', type: 'risk'}})
+        params = {"task_id": task_id, "risk_id": risk_id}
+        query = """
+        MATCH (t:WorkItem {id: $task_id, type: 'task'})-[r:has_risk]->(risk:WorkItem {id: $risk_id, type: 'risk'})
         DELETE r
         RETURN count(r) as deleted_count
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
 
         # Extract deleted count - AGE may return int directly or in dict
         deleted_count = 0
@@ -1688,18 +2642,19 @@ class GraphService:
         Raises:
             ValueError: If task doesn't exist
         """
+        params = {"task_id": task_id}
         # Verify task exists
-        task_query = f"MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}}) RETURN t"
-        task_results = await self.execute_query(task_query)
+        task_query = "MATCH (t:WorkItem {id: $task_id, type: 'task'}) RETURN t"
+        task_results = await self.execute_query(task_query, params)
         if not task_results:
             raise ValueError(f"Task {task_id} not found or is not of type 'task'")
 
         # Get linked risks
-        query = f"""
-        MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}})-[:has_risk]->(r:WorkItem {{type: 'risk'}})
+        query = """
+        MATCH (t:WorkItem {id: $task_id, type: 'task'})-[:has_risk]->(r:WorkItem {type: 'risk'})
         RETURN r
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
 
         risks = []
         for result in results:
@@ -1727,15 +2682,16 @@ class GraphService:
         Raises:
             ValueError: If task or requirement doesn't exist
         """
+        params = {"task_id": task_id, "requirement_id": requirement_id}
         # Verify task exists
-        task_query = f"MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}}) RETURN t"
-        task_results = await self.execute_query(task_query)
+        task_query = "MATCH (t:WorkItem {id: $task_id, type: 'task'}) RETURN t"
+        task_results = await self.execute_query(task_query, params)
         if not task_results:
             raise ValueError(f"Task {task_id} not found or is not of type 'task'")
 
         # Verify requirement exists
-        req_query = f"MATCH (r:WorkItem {{id: '{requirement_id}', type: 'requirement'}}) RETURN r"
-        req_results = await self.execute_query(req_query)
+        req_query = "MATCH (r:WorkItem {id: $requirement_id, type: 'requirement'}) RETURN r"
+        req_results = await self.execute_query(req_query, params)
         if not req_results:
             raise ValueError(
                 f"Requirement {requirement_id} not found or is not of type 'requirement'"
@@ -1759,12 +2715,13 @@ class GraphService:
         Returns:
             True if relationship was removed, False if it didn't exist
         """
-        query = f"""
-        MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}})-[r:implements]->(req:WorkItem {{id: '{requirement_id}', type: 'requirement'}})
+        params = {"task_id": task_id, "requirement_id": requirement_id}
+        query = """
+        MATCH (t:WorkItem {id: $task_id, type: 'task'})-[r:implements]->(req:WorkItem {id: $requirement_id, type: 'requirement'})
         DELETE r
         RETURN count(r) as deleted_count
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
 
         # Extract deleted count - AGE may return int directly or in dict
         deleted_count = 0
@@ -1790,18 +2747,19 @@ class GraphService:
         Raises:
             ValueError: If task doesn't exist
         """
+        params = {"task_id": task_id}
         # Verify task exists
-        task_query = f"MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}}) RETURN t"
-        task_results = await self.execute_query(task_query)
+        task_query = "MATCH (t:WorkItem {id: $task_id, type: 'task'}) RETURN t"
+        task_results = await self.execute_query(task_query, params)
         if not task_results:
             raise ValueError(f"Task {task_id} not found or is not of type 'task'")
 
         # Get linked requirements
-        query = f"""
-        MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}})-[:implements]->(r:WorkItem {{type: 'requirement'}})
+        query = """
+        MATCH (t:WorkItem {id: $task_id, type: 'task'})-[:implements]->(r:WorkItem {type: 'requirement'})
         RETURN r
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
 
         requirements = []
         for result in results:
@@ -1841,9 +2799,10 @@ class GraphService:
         Raises:
             ValueError: If task doesn't exist or if end_time is before start_time
         """
+        params = {"task_id": task_id}
         # Verify task exists
-        task_query = f"MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}}) RETURN t"
-        task_results = await self.execute_query(task_query)
+        task_query = "MATCH (t:WorkItem {id: $task_id, type: 'task'}) RETURN t"
+        task_results = await self.execute_query(task_query, params)
         if not task_results:
             raise ValueError(f"Task {task_id} not found or is not of type 'task'")
 
@@ -1917,9 +2876,10 @@ class GraphService:
         Raises:
             ValueError: If worked node doesn't exist or if end_time is before start_time
         """
+        params = {"worked_id": worked_id}
         # Get existing worked node
-        worked_query = f"MATCH (w:Worked {{id: '{worked_id}'}}) RETURN w"
-        worked_results = await self.execute_query(worked_query)
+        worked_query = "MATCH (w:Worked {id: $worked_id}) RETURN w"
+        worked_results = await self.execute_query(worked_query, params)
         if not worked_results:
             raise ValueError(f"Worked entry {worked_id} not found")
 
@@ -1982,19 +2942,20 @@ class GraphService:
         Raises:
             ValueError: If task doesn't exist
         """
+        params = {"task_id": task_id}
         # Verify task exists
-        task_query = f"MATCH (t:WorkItem {{id: '{task_id}', type: 'task'}}) RETURN t"
-        task_results = await self.execute_query(task_query)
+        task_query = "MATCH (t:WorkItem {id: $task_id, type: 'task'}) RETURN t"
+        task_results = await self.execute_query(task_query, params)
         if not task_results:
             raise ValueError(f"Task {task_id} not found or is not of type 'task'")
 
         # Get all worked entries linked to this task
-        query = f"""
-        MATCH (w:Worked)-[:WORKED_ON]->(t:WorkItem {{id: '{task_id}', type: 'task'}})
+        query = """
+        MATCH (w:Worked)-[:WORKED_ON]->(t:WorkItem {id: $task_id, type: 'task'})
         RETURN w
         ORDER BY w.date DESC, w.from DESC
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
 
         worked_entries = []
         for result in results:
@@ -2074,12 +3035,15 @@ class GraphService:
             List of worked entry data with task information
         """
         # Build query with optional date filters
-        where_clauses = [f"w.resource = '{resource_id}'"]
+        params: dict[str, Any] = {"resource_id": resource_id}
+        where_clauses = ["w.resource = $resource_id"]
 
         if start_date:
-            where_clauses.append(f"w.date >= '{start_date}'")
+            params["start_date"] = start_date
+            where_clauses.append("w.date >= $start_date")
         if end_date:
-            where_clauses.append(f"w.date <= '{end_date}'")
+            params["end_date"] = end_date
+            where_clauses.append("w.date <= $end_date")
 
         where_clause = " AND ".join(where_clauses)
 
@@ -2089,7 +3053,7 @@ class GraphService:
         RETURN w, t
         ORDER BY w.date DESC, w.from DESC
         """
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, params)
 
         worked_entries = []
         for result in results:
@@ -2112,31 +3076,41 @@ class GraphService:
 
         return worked_entries
 
-    def _dict_to_cypher_props(self, props: dict[str, Any]) -> str:
-        """Convert Python dict to Cypher properties string"""
+    def _dict_to_cypher_props(
+        self, props: dict[str, Any], params: dict[str, Any], prefix: str = "p"
+    ) -> str:
+        """
+        Convert Python dict to a Cypher properties map bound through parameters
+
+        Values are added to ``params`` under ``{prefix}0``, ``{prefix}1``, ...
+        and referenced by name, so nothing is interpolated into the query text.
+        """
         if not props:
             return ""
 
         items = []
-        for k, v in props.items():
-            if isinstance(v, str):
-                # Escape single quotes in strings
-                escaped_v = v.replace("'", "\\'")
-                items.append(f"{k}: '{escaped_v}'")
-            elif isinstance(v, bool):
-                # Handle booleans before int/float check since bool is a subclass of int
-                items.append(f"{k}: {str(v).lower()}")
-            elif isinstance(v, (int, float)):
-                items.append(f"{k}: {v}")
-            elif v is None:
-                items.append(f"{k}: null")
-            else:
-                # For complex types, serialize to JSON string
-                escaped_json = json.dumps(v).replace("'", "\\'")
-                items.append(f"{k}: '{escaped_json}'")
+        for i, (k, v) in enumerate(props.items()):
+            param_name = f"{prefix}{i}"
+            params[param_name] = self._to_cypher_value(v)
+            items.append(f"{self._cypher_key(k)}: ${param_name}")
 
         return "{" + ", ".join(items) + "}"
 
+    def _to_cypher_value(self, value: Any) -> Any:
+        """Convert a Python value to the form stored as a node/edge property"""
+        if value is None or isinstance(value, (str, bool, int, float)):
+            return value
+        if isinstance(value, (list, dict)):
+            # Complex types are stored as JSON strings
+            return json.dumps(value, default=str)
+        return str(value)
+
+    def _cypher_key(self, key: str) -> str:
+        """Return a property key usable in Cypher, backquoting it if needed"""
+        if _CYPHER_IDENTIFIER.match(key):
+            return key
+        return "`" + key.replace("`", "``") + "`"
+
     async def get_graph_for_visualization(
         self,
         center_node_id: str | None = None,
@@ -2144,6 +3118,8 @@ class GraphService:
         node_types: list[str] | None = None,
         relationship_types: list[str] | None = None,
         limit: int = 1000,
+        layout: LayoutMode = "none",
+        output_format: GraphFormat = "json",
     ) -> dict[str, Any]:
         """
         Get graph data formatted for visualization in react-flow and R3F
@@ -2152,7 +3128,7 @@ class GraphService:
         - Limits results to prevent memory issues
         - Uses efficient graph traversal queries
         - Implements early termination when limit is reached
-        - Caches frequently accessed node data
+        - Computes node positions server-side and caches them per subgraph
 
         Args:
             center_node_id: Optional center node to start traversal from
@@ -2160,6 +3136,11 @@ class GraphService:
             node_types: Optional filter for node types
             relationship_types: Optional filter for relationship types
             limit: Maximum number of nodes to return (default 1000)
+            layout: Node placement: "none" (default) leaves nodes at the
+                origin for the client to place, "hierarchical", "force" (2D)
+                or "force3d"
+            output_format: "json" for per-node react-flow/R3F objects, or
+                "columnar" for parallel arrays (see _format_graph_columnar)
 
         Returns:
             Dictionary with nodes and edges formatted for visualization
@@ -2220,45 +3201,199 @@ class GraphService:
                 if edge.get("start_id") in node_ids and edge.get("end_id") in node_ids
             ]
 
-        # Format for visualization libraries
-        formatted_nodes = []
-        formatted_edges = []
+        if output_format == "columnar":
+            result = self._format_graph_columnar(nodes, edges, age_id_to_uuid)
+            node_ids = result["nodes"]["ids"]
+            positions = await self._compute_layout(
+                node_ids,
+                [
+                    (node_ids[source], node_ids[target])
+                    for source, target in zip(
+                        result["edges"]["source"], result["edges"]["target"]
+                    )
+                ],
+                layout,
+            )
+            dims = 3 if layout == "force3d" else 2
+            result["nodes"]["position_dims"] = dims
+            result["nodes"]["positions"] = (
+                [
+                    coordinate
+                    for node_id in node_ids
+                    for coordinate in positions.get(node_id, (0.0,) * dims)
+                ]
+                if positions
+                else None
+            )
+            total_nodes = len(node_ids)
+            total_edges = len(result["edges"]["ids"])
+        else:
+            # Format for visualization libraries
+            formatted_nodes = []
+            formatted_edges = []
+
+            # Process nodes for visualization
+            for node in nodes:
+                node_data = self._format_node_for_visualization(node)
+                if node_data is not None:  # Skip None results from defensive checks
+                    formatted_nodes.append(node_data)
+
+            # Process edges for visualization - convert AGE IDs to UUIDs
+            for edge in edges:
+                edge_data = self._format_edge_for_visualization(edge, age_id_to_uuid)
+                if edge_data is not None:  # Skip None results from defensive checks
+                    formatted_edges.append(edge_data)
+
+            positions = await self._compute_layout(
+                [node_data["id"] for node_data in formatted_nodes],
+                [
+                    (str(edge_data["source"]), str(edge_data["target"]))
+                    for edge_data in formatted_edges
+                    if edge_data.get("source") and edge_data.get("target")
+                ],
+                layout,
+            )
+            for node_data in formatted_nodes:
+                position = positions.get(node_data["id"])
+                if position is not None:
+                    self._apply_layout_position(node_data, position)
 
-        # Process nodes for visualization
-        for node in nodes:
-            node_data = self._format_node_for_visualization(node)
-            if node_data is not None:  # Skip None results from defensive checks
-                formatted_nodes.append(node_data)
+            # DEBUG: Log formatted results
+            print(
+                f"[GraphService] Formatted: {len(formatted_nodes)} nodes, {len(formatted_edges)} edges"
+            )
+            if formatted_edges:
+                print(f"[GraphService] Sample formatted edge: {formatted_edges[0]}")
+
+            result = {"nodes": formatted_nodes, "edges": formatted_edges}
+            total_nodes = len(formatted_nodes)
+            total_edges = len(formatted_edges)
+
+        result["metadata"] = {
+            "total_nodes": total_nodes,
+            "total_edges": total_edges,
+            "depth": depth,
+            "center_node": center_node_id,
+            "truncated": truncated,
+            "layout": layout,
+            "performance_stats": {
+                "query_limit_applied": limit,
+                "depth_limit_applied": depth,
+                "nodes_filtered": len(nodes) - total_nodes
+                if len(nodes) > total_nodes
+                else 0,
+            },
+        }
+        return result
 
-        # Process edges for visualization - convert AGE IDs to UUIDs
-        for edge in edges:
-            edge_data = self._format_edge_for_visualization(edge, age_id_to_uuid)
-            if edge_data is not None:  # Skip None results from defensive checks
-                formatted_edges.append(edge_data)
+    async def _compute_layout(
+        self, node_ids: list[str], edges: list[tuple[str, str]], layout: LayoutMode
+    ) -> dict[str, tuple[float, ...]]:
+        """Run the layout engine off the event loop; empty for layout "none" """
+        if layout == "none" or not node_ids:
+            return {}
+        # CPU-bound, so keep it off the event loop
+        return await asyncio.to_thread(self.layout_engine.layout, node_ids, edges, layout)
 
-        # DEBUG: Log formatted results
-        print(
-            f"[GraphService] Formatted: {len(formatted_nodes)} nodes, {len(formatted_edges)} edges"
-        )
-        if formatted_edges:
-            print(f"[GraphService] Sample formatted edge: {formatted_edges[0]}")
+    def _format_graph_columnar(
+        self,
+        nodes: list[dict[str, Any]],
+        edges: list[dict[str, Any]],
+        age_id_to_uuid: dict[Any, str],
+    ) -> dict[str, Any]:
+        """Format nodes and edges as parallel arrays for large visualizations
+
+        Node types, statuses and edge types are sent as indexes into the
+        ``dictionaries`` lists, and edges reference nodes by their index in
+        ``nodes.ids``. Colors and edge styles are sent once in ``styles``.
+        Node properties are left out; clients fetch them from
+        /graph/nodes/{id} when a node is selected.
+
+        Args:
+            nodes: Nodes as returned by the graph queries
+            edges: Edges as returned by the graph queries
+            age_id_to_uuid: Mapping from AGE internal IDs to UUIDs
+
+        Returns:
+            Dictionary with format, dictionaries, styles, nodes and edges
+        """
+        node_types: dict[str, int] = {}
+        statuses: dict[str, int] = {}
+        edge_types: dict[str, int] = {}
+        index: dict[str, int] = {}
+
+        ids: list[str] = []
+        labels: list[str] = []
+        type_codes: list[int] = []
+        status_codes: list[int] = []
+        priorities: list[int] = []
+        for node in nodes:
+            if node is None:
+                continue
+            fields = self._node_fields(node)
+            node_id = str(fields["id"])
+            if node_id in index:
+                continue
+            index[node_id] = len(ids)
+            ids.append(node_id)
+            labels.append(fields["label"])
+            type_codes.append(node_types.setdefault(fields["type"], len(node_types)))
+            status_codes.append(statuses.setdefault(fields["status"], len(statuses)))
+            priorities.append(fields["priority"])
+
+        edge_ids: list[str] = []
+        sources: list[int] = []
+        targets: list[int] = []
+        edge_type_codes: list[int] = []
+        for edge in edges:
+            if not edge:
+                continue
+            start_age_id = edge.get("start_id")
+            end_age_id = edge.get("end_id")
+            source = index.get(age_id_to_uuid.get(start_age_id, str(start_age_id)))
+            target = index.get(age_id_to_uuid.get(end_age_id, str(end_age_id)))
+            # Edges must point at nodes in the payload
+            if source is None or target is None:
+                continue
+            edge_type = edge.get("type") or "RELATED"
+            age_relationship_id = edge.get("id")
+            edge_ids.append(
+                str(age_relationship_id)
+                if age_relationship_id is not None
+                else f"{ids[source]}-{ids[target]}-{edge_type}"
+            )
+            sources.append(source)
+            targets.append(target)
+            edge_type_codes.append(edge_types.setdefault(edge_type, len(edge_types)))
 
         return {
-            "nodes": formatted_nodes,
-            "edges": formatted_edges,
-            "metadata": {
-                "total_nodes": len(formatted_nodes),
-                "total_edges": len(formatted_edges),
-                "depth": depth,
-                "center_node": center_node_id,
-                "truncated": truncated,
-                "performance_stats": {
-                    "query_limit_applied": limit,
-                    "depth_limit_applied": depth,
-                    "nodes_filtered": len(nodes) - len(formatted_nodes)
-                    if len(nodes) > len(formatted_nodes)
-                    else 0,
+            "format": "columnar",
+            "dictionaries": {
+                "node_types": list(node_types),
+                "statuses": list(statuses),
+                "edge_types": list(edge_types),
+            },
+            "styles": {
+                "node_colors": {
+                    node_type: _NODE_COLORS.get(
+                        node_type.lower(), _NODE_COLORS["entity"]
+                    )
+                    for node_type in node_types
                 },
+                "edges": {edge_type: _edge_style(edge_type) for edge_type in edge_types},
+            },
+            "nodes": {
+                "ids": ids,
+                "labels": labels,
+                "types": type_codes,
+                "statuses": status_codes,
+                "priorities": priorities,
+            },
+            "edges": {
+                "ids": edge_ids,
+                "source": sources,
+                "target": targets,
+                "types": edge_type_codes,
             },
         }
 
@@ -2270,120 +3405,134 @@ class GraphService:
         relationship_types: list[str] | None,
         limit: int,
     ) -> tuple[list[dict], list[dict]]:
-        """Get subgraph around a center node"""
+        """Get subgraph around a center node
 
-        # Build node type filter
-        node_filter = ""
-        if node_types:
-            type_conditions = " OR ".join(
-                [f"n:{node_type}" for node_type in node_types]
-            )
-            node_filter = f" AND ({type_conditions})"
-
-        # Build relationship type filter
-        rel_filter = ""
-        if relationship_types:
-            rel_types_str = "|".join(relationship_types)
-            rel_filter = f":{rel_types_str}"
-
-        # Query to get nodes within depth - return as single result map
-        node_query = f"""
-        MATCH (center {{id: '{center_node_id}'}})
-        MATCH path = (center)-[{rel_filter}*1..{depth}]-(n)
-        WHERE true {node_filter}
-        WITH DISTINCT n
-        LIMIT {limit}
-        RETURN n
+        Runs one SQL statement over the AGE label tables: the center is found
+        through the id property index, a recursive CTE walks the edge tables
+        breadth-first through their start_id/end_id indexes, and the edges
+        between the selected nodes are read from the same statement. The work
+        done grows with the size of the neighbourhood, not of the graph.
+
+        Node type filters apply to the returned nodes (the center is always
+        included); relationship type filters apply to the traversal as well.
+
+        Args:
+            center_node_id: Property id of the center node
+            depth: Maximum number of hops from the center
+            node_types: Vertex labels to return, or None for all
+            relationship_types: Edge labels to traverse, or None for all
+            limit: Maximum number of nodes besides the center
+
+        Returns:
+            Tuple of (nodes, edges) in the shape returned by Cypher queries
+        """
+        graph = f'"{self.graph_name}"'
+        sql = f"""
+        WITH RECURSIVE
+        {self._neighbourhood_ctes()},
+        selected AS (
+            SELECT v.id, v.properties, l.name AS label, n.depth
+            FROM (SELECT vid, min(depth) AS depth FROM reached GROUP BY vid) n
+            JOIN {graph}._ag_label_vertex v ON v.id = n.vid
+            JOIN labels l ON l.relid = v.tableoid
+            WHERE n.depth = 0 OR $5::text[] IS NULL OR l.name = ANY($5::text[])
+            ORDER BY n.depth, n.vid
+            LIMIT $6 + 1
+        ),
+        selected_edges AS (
+            SELECT e.id, e.start_id, e.end_id, e.properties, l.name AS label
+            FROM selected s
+            JOIN {graph}._ag_label_edge e ON e.start_id = s.id
+            JOIN labels l ON l.relid = e.tableoid
+            WHERE e.end_id IN (SELECT id FROM selected) {_EDGE_LABEL_FILTER}
+            LIMIT $6 * 2
+        )
+        SELECT 'node' AS kind, id::text::bigint AS id, label,
+               NULL::bigint AS start_id, NULL::bigint AS end_id,
+               properties::text AS properties, depth
+        FROM selected
+        UNION ALL
+        SELECT 'edge', id::text::bigint, label,
+               start_id::text::bigint, end_id::text::bigint, properties::text, NULL
+        FROM selected_edges
+        ORDER BY kind DESC, depth, id
         """
 
-        node_results = await self.execute_query(node_query)
+        rows = await self._execute_sql(
+            sql,
+            self.graph_name,
+            json.dumps(str(center_node_id)),
+            depth,
+            relationship_types or None,
+            node_types or None,
+            limit,
+        )
 
-        nodes = []
-        seen_nodes = set()
+        nodes, edges = self._parse_graph_rows(rows)
+        logger.debug(f"Subgraph: {len(nodes)} nodes, {len(edges)} edges")
+        return nodes, edges
 
-        # Add center node first
-        center_node = await self.get_node(center_node_id)
-        if center_node:
-            nodes.append(center_node)
-            seen_nodes.add(center_node_id)
+    def _neighbourhood_ctes(self) -> str:
+        """SQL CTEs shared by the neighbourhood traversals
 
-        # Process node results
-        for result in node_results:
-            if result:
-                node = result
-                if "properties" in node:
-                    node_id = node["properties"].get("id")
-                else:
-                    node_id = node.get("id")
-
-                if node_id and node_id not in seen_nodes:
-                    nodes.append(node)
-                    seen_nodes.add(node_id)
-
-        # Now get relationships between the found nodes
-        edges = []
-        if len(seen_nodes) > 1:
-            # Build a query to get relationships between the found nodes
-            node_ids_str = "', '".join(seen_nodes)
-
-            # AGE returns multiple columns as an array, so we need to return them as a map
-            # or handle the array indexing properly
-            rel_query = f"""
-            MATCH (a)-[r{rel_filter}]->(b)
-            WHERE a.id IN ['{node_ids_str}'] AND b.id IN ['{node_ids_str}']
-            RETURN r
-            LIMIT {limit * 2}
-            """
+        Defines ``labels`` (label table oids and names), ``center`` (graphid
+        of the center vertex, found through the id property index) and
+        ``reached`` (graphid and hop distance of every vertex within the
+        depth, walking edges in both directions through the start_id/end_id
+        indexes). A vertex can appear once per distance it is reached at.
 
-            print(f"[GraphService] Relationship query: {rel_query}")
-            rel_results = await self.execute_query(rel_query)
-            print(
-                f"[GraphService] Relationship query returned {len(rel_results)} results"
+        Bound parameters: $1 graph name, $2 JSON-encoded center id, $3 depth,
+        $4 relationship types (NULL for all).
+        """
+        graph = f'"{self.graph_name}"'
+        return f"""
+        labels AS (
+            SELECT l.relation::oid AS relid, l.name
+            FROM ag_catalog.ag_label l
+            JOIN ag_catalog.ag_graph g ON l.graph = g.graphid
+            WHERE g.name = $1
+        ),
+        center AS (
+            SELECT v.id
+            FROM {graph}._ag_label_vertex v
+            WHERE {_VERTEX_ID_EXPRESSION.format(alias="v")} = $2::ag_catalog.agtype
+            LIMIT 1
+        ),
+        reached(vid, depth) AS (
+            SELECT id, 0 FROM center
+            UNION
+            SELECT hop.vid, r.depth + 1
+            FROM reached r
+            CROSS JOIN LATERAL (
+                SELECT e.end_id AS vid FROM {graph}._ag_label_edge e
+                WHERE e.start_id = r.vid {_EDGE_LABEL_FILTER}
+                UNION ALL
+                SELECT e.start_id FROM {graph}._ag_label_edge e
+                WHERE e.end_id = r.vid {_EDGE_LABEL_FILTER}
+            ) hop
+            WHERE r.depth < $3
+        )"""
+
+    def _parse_graph_rows(self, rows: list[Any]) -> tuple[list[dict], list[dict]]:
+        """Convert kind/id/label/start_id/end_id/properties rows to nodes and edges"""
+        nodes: list[dict] = []
+        edges: list[dict] = []
+        for row in rows:
+            properties = (
+                self._parse_agtype(row["properties"]) if row["properties"] else {}
             )
+            if row["kind"] == "node":
+                nodes.append(
+                    {"id": row["id"], "label": row["label"], "properties": properties}
+                )
+            else:
+                edge_data = dict(properties)
+                edge_data["id"] = row["id"]
+                edge_data["start_id"] = row["start_id"]
+                edge_data["end_id"] = row["end_id"]
+                edge_data["type"] = row["label"]
+                edges.append(edge_data)
 
-            if rel_results:
-                print(f"[GraphService] First relationship result: {rel_results[0]}")
-
-            seen_edges = set()
-
-            for result in rel_results:
-                if result:
-                    print(f"[GraphService] Processing relationship result: {result}")
-
-                    # AGE returns edge as: {"id": ..., "label": "REL_TYPE", "start_id": ..., "end_id": ..., "properties": {...}}
-                    edge_data = {}
-
-                    # Extract from the edge object
-                    if isinstance(result, dict):
-                        # Copy properties if present
-                        if "properties" in result and result["properties"]:
-                            edge_data.update(result["properties"])
-
-                        # Set required fields from edge structure
-                        edge_data["id"] = result.get("id")  # AGE internal ID
-                        edge_data["start_id"] = result.get("start_id")
-                        edge_data["end_id"] = result.get("end_id")
-                        edge_data["type"] = result.get(
-                            "label", "RELATED"
-                        )  # AGE uses 'label' for relationship type
-
-                    print(f"[GraphService] Extracted edge_data: {edge_data}")
-
-                    if edge_data.get("start_id") and edge_data.get("end_id"):
-                        edge_key = f"{edge_data['start_id']}-{edge_data['end_id']}-{edge_data['type']}"
-                        if edge_key not in seen_edges:
-                            edges.append(edge_data)
-                            seen_edges.add(edge_key)
-                            print(
-                                f"[GraphService] Added edge: {edge_data['start_id']} -[{edge_data['type']}]-> {edge_data['end_id']}"
-                            )
-                    else:
-                        print(
-                            f"[GraphService] Skipped edge - missing IDs: start_id={edge_data.get('start_id')}, end_id={edge_data.get('end_id')}"
-                        )
-                        print(f"[GraphService] Full result was: {result}")
-
-        print(f"[GraphService] Returning {len(nodes)} nodes and {len(edges)} edges")
         return nodes, edges
 
     async def _get_full_graph(
@@ -2392,92 +3541,284 @@ class GraphService:
         relationship_types: list[str] | None,
         limit: int,
     ) -> tuple[list[dict], list[dict]]:
-        """Get full graph with optional filters"""
-
-        # Build node query with type filter
-        node_query = "MATCH (n)"
-        if node_types:
-            type_conditions = " OR ".join(
-                [f"n:{node_type}" for node_type in node_types]
-            )
-            node_query += f" WHERE {type_conditions}"
-        node_query += f" RETURN n LIMIT {limit}"
-
-        print(f"[GraphService] Node query: {node_query}")
-
-        # Get nodes
-        node_results = await self.execute_query(node_query)
-        nodes = [result for result in node_results if result]
+        """Get full graph with optional filters
 
-        print(f"[GraphService] Node query returned {len(nodes)} nodes")
+        Selects up to ``limit`` vertices and then only the edges whose both
+        ends are among them, so every returned edge can be drawn.
 
-        # Build relationship query - return as a single map to avoid column mismatch
-        rel_query = "MATCH (a)-[r]->(b)"
-        if relationship_types:
-            rel_types_str = "|".join(relationship_types)
-            rel_query = f"MATCH (a)-[r:{rel_types_str}]->(b)"
-        # Return as a single map/object - AGE will parse this correctly
-        rel_query += f" RETURN r LIMIT {limit * 2}"
+        Args:
+            node_types: Vertex labels to return, or None for all
+            relationship_types: Edge labels to return, or None for all
+            limit: Maximum number of nodes
 
-        print(f"[GraphService] Edge query: {rel_query}")
+        Returns:
+            Tuple of (nodes, edges) in the shape returned by Cypher queries
+        """
+        graph = f'"{self.graph_name}"'
+        sql = f"""
+        WITH
+        labels AS (
+            SELECT l.relation::oid AS relid, l.name
+            FROM ag_catalog.ag_label l
+            JOIN ag_catalog.ag_graph g ON l.graph = g.graphid
+            WHERE g.name = $1
+        ),
+        selected AS (
+            SELECT v.id, v.properties, l.name AS label
+            FROM {graph}._ag_label_vertex v
+            JOIN labels l ON l.relid = v.tableoid
+            WHERE $2::text[] IS NULL OR l.name = ANY($2::text[])
+            ORDER BY v.id
+            LIMIT $3
+        ),
+        selected_edges AS (
+            SELECT e.id, e.start_id, e.end_id, e.properties, l.name AS label
+            FROM selected s
+            JOIN {graph}._ag_label_edge e ON e.start_id = s.id
+            JOIN labels l ON l.relid = e.tableoid
+            WHERE e.end_id IN (SELECT id FROM selected) {_EDGE_LABEL_FILTER}
+            LIMIT $3 * 2
+        )
+        SELECT 'node' AS kind, id::text::bigint AS id, label,
+               NULL::bigint AS start_id, NULL::bigint AS end_id,
+               properties::text AS properties
+        FROM selected
+        UNION ALL
+        SELECT 'edge', id::text::bigint, label,
+               start_id::text::bigint, end_id::text::bigint, properties::text
+        FROM selected_edges
+        ORDER BY kind DESC, id
+        """
 
-        # Get relationships
-        rel_results = await self.execute_query(rel_query)
+        rows = await self._execute_sql(
+            sql,
+            self.graph_name,
+            node_types or None,
+            limit,
+            relationship_types or None,
+        )
 
-        print(f"[GraphService] Edge query returned {len(rel_results)} results")
+        nodes, edges = self._parse_graph_rows(rows)
+        logger.debug(f"Full graph: {len(nodes)} nodes, {len(edges)} edges")
+        return nodes, edges
 
-        edges = []
+    async def stream_graph(
+        self,
+        center_node_id: str,
+        depth: int = 2,
+        node_types: list[str] | None = None,
+        relationship_types: list[str] | None = None,
+        known_node_ids: list[str] | None = None,
+        cursor: int = 0,
+        page_size: int = 1000,
+        chunk_size: int = 200,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream the neighbourhood of a node in breadth-first order
+
+        Nodes are ranked by (hop distance, graphid) and read through a
+        server-side cursor. Every edge is sent right after the later of its
+        two ends, so each chunk only references nodes the client already
+        has. Nodes listed in ``known_node_ids`` are not sent again, but
+        edges between them and new nodes are, which makes this usable for
+        "expand node" deltas.
+
+        Yields dictionaries of two kinds:
+        - {"type": "chunk", "nodes": [...], "edges": [...]} with nodes and
+          edges formatted like get_graph_for_visualization (plus the hop
+          ``depth`` on each node)
+        - a final {"type": "end", "cursor": ..., "has_more": ...,
+          "total_nodes": ..., "total_edges": ...}; pass ``cursor`` back to
+          continue with the next page
 
-        for result in rel_results:
-            if result:
-                print(f"[GraphService] Processing edge result: {result}")
-
-                # AGE returns edges with id, label, start_id, end_id, properties
-                edge_data = {}
-
-                # Check if result has the edge structure
-                if "id" in result and "label" in result:
-                    # This is the edge itself
-                    edge_data["id"] = result.get("id")  # Store AGE relationship ID
-                    edge_data["start_id"] = result.get("start_id")
-                    edge_data["end_id"] = result.get("end_id")
-                    edge_data["type"] = result.get("label", "RELATED")
-                    if "properties" in result and result["properties"]:
-                        edge_data.update(result["properties"])
-                elif "properties" in result:
-                    # Nested structure
-                    edge_data = (
-                        result["properties"].copy() if result["properties"] else {}
-                    )
-                    edge_data["id"] = result.get("id")  # Store AGE relationship ID
-                    edge_data["start_id"] = result.get("start_id")
-                    edge_data["end_id"] = result.get("end_id")
-                    edge_data["type"] = result.get("label", "RELATED")
-                else:
-                    # Fallback - treat whole result as edge data
-                    edge_data = result.copy()
+        Args:
+            center_node_id: Node to start the traversal from
+            depth: Maximum number of hops from the center
+            node_types: Vertex labels to send, or None for all (the center
+                is always sent)
+            relationship_types: Edge labels to traverse, or None for all
+            known_node_ids: Ids of nodes the client already has
+            cursor: Rank of the last node received, 0 to start
+            page_size: Maximum number of nodes per page
+            chunk_size: Maximum number of nodes per chunk
+        """
+        # Every page repeats the traversal, so depth is capped as for
+        # get_graph_for_visualization
+        depth = min(depth, 5)
+
+        graph = f'"{self.graph_name}"'
+        sql = f"""
+        WITH RECURSIVE
+        {self._neighbourhood_ctes()},
+        ranked AS (
+            SELECT n.vid, n.depth, v.properties, l.name AS label,
+                   {_VERTEX_ID_EXPRESSION.format(alias="v")}::text AS key,
+                   row_number() OVER (ORDER BY n.depth, n.vid) AS rank
+            FROM (SELECT vid, min(depth) AS depth FROM reached GROUP BY vid) n
+            JOIN {graph}._ag_label_vertex v ON v.id = n.vid
+            JOIN labels l ON l.relid = v.tableoid
+            WHERE (n.depth = 0 OR $5::text[] IS NULL OR l.name = ANY($5::text[]))
+              AND ($6::text[] IS NULL
+                   OR {_VERTEX_ID_EXPRESSION.format(alias="v")}::text <> ALL($6::text[]))
+        ),
+        page AS (
+            SELECT * FROM ranked WHERE rank > $7 ORDER BY rank LIMIT $8
+        ),
+        page_edges AS (
+            SELECT e.id, e.properties, l.name AS label, p.rank,
+                   CASE WHEN e.start_id = p.vid THEN p.key ELSE o.key END
+                       AS start_key,
+                   CASE WHEN e.start_id = p.vid THEN o.key ELSE p.key END
+                       AS end_key
+            FROM page p
+            CROSS JOIN LATERAL (
+                SELECT e.id, e.start_id, e.properties, e.tableoid,
+                       e.end_id AS other
+                FROM {graph}._ag_label_edge e
+                WHERE e.start_id = p.vid {_EDGE_LABEL_FILTER}
+                UNION ALL
+                SELECT e.id, e.start_id, e.properties, e.tableoid,
+                       e.start_id
+                FROM {graph}._ag_label_edge e
+                WHERE e.end_id = p.vid AND e.start_id <> e.end_id
+                  {_EDGE_LABEL_FILTER}
+            ) e
+            JOIN labels l ON l.relid = e.tableoid
+            JOIN {graph}._ag_label_vertex ov ON ov.id = e.other
+            CROSS JOIN LATERAL (
+                SELECT {_VERTEX_ID_EXPRESSION.format(alias="ov")}::text AS key
+            ) o
+            LEFT JOIN ranked r ON r.vid = e.other
+            WHERE r.rank <= p.rank OR (r.rank IS NULL AND o.key = ANY($6::text[]))
+        )
+        SELECT 'node' AS kind, rank, depth, vid::text::bigint AS id, label,
+               NULL AS start_key, NULL AS end_key,
+               properties::text AS properties
+        FROM page
+        UNION ALL
+        SELECT 'edge', rank, NULL, id::text::bigint, label,
+               start_key, end_key, properties::text
+        FROM page_edges
+        ORDER BY rank, kind DESC, id
+        """
 
-                if edge_data.get("start_id") and edge_data.get("end_id"):
+        known_keys = (
+            [json.dumps(str(node_id)) for node_id in known_node_ids]
+            if known_node_ids
+            else None
+        )
+        nodes: list[dict[str, Any]] = []
+        edges: list[dict[str, Any]] = []
+        total_nodes = 0
+        total_edges = 0
+        last_rank = cursor
+        has_more = False
+
+        # One extra node tells whether another page follows
+        async for row in self._stream_sql(
+            sql,
+            self.graph_name,
+            json.dumps(str(center_node_id)),
+            depth,
+            relationship_types or None,
+            node_types or None,
+            known_keys,
+            cursor,
+            page_size + 1,
+        ):
+            if row["rank"] > cursor + page_size:
+                has_more = True
+                break
+
+            properties = (
+                self._parse_agtype(row["properties"]) if row["properties"] else {}
+            )
+            if row["kind"] == "node":
+                # Chunks end before a node, so its edges travel with it
+                if len(nodes) >= chunk_size:
+                    yield {"type": "chunk", "nodes": nodes, "edges": edges}
+                    total_nodes += len(nodes)
+                    total_edges += len(edges)
+                    nodes, edges = [], []
+                node_data = self._format_node_for_visualization(
+                    {"id": row["id"], "label": row["label"], "properties": properties}
+                )
+                if node_data is not None:
+                    node_data["depth"] = row["depth"]
+                    nodes.append(node_data)
+                last_rank = row["rank"]
+            elif row["start_key"] and row["end_key"]:
+                edge = dict(properties)
+                edge["id"] = row["id"]
+                edge["start_id"] = json.loads(row["start_key"])
+                edge["end_id"] = json.loads(row["end_key"])
+                edge["type"] = row["label"]
+                edge_data = self._format_edge_for_visualization(edge)
+                if edge_data is not None:
                     edges.append(edge_data)
-                    print(
-                        f"[GraphService] Added edge: {edge_data['start_id']} -> {edge_data['end_id']} ({edge_data.get('type', 'UNKNOWN')})"
-                    )
-                else:
-                    print(f"[GraphService] Skipped edge - missing IDs: {edge_data}")
 
-        print(f"[GraphService] Total edges collected: {len(edges)}")
+        if nodes or edges:
+            yield {"type": "chunk", "nodes": nodes, "edges": edges}
+            total_nodes += len(nodes)
+            total_edges += len(edges)
+
+        yield {
+            "type": "end",
+            "cursor": last_rank if has_more else None,
+            "has_more": has_more,
+            "total_nodes": total_nodes,
+            "total_edges": total_edges,
+        }
 
-        return nodes, edges
+    async def expand_node(
+        self,
+        node_id: str,
+        known_node_ids: list[str],
+        node_types: list[str] | None = None,
+        relationship_types: list[str] | None = None,
+        limit: int = 500,
+    ) -> dict[str, Any]:
+        """
+        Get the neighbours of a node that the client does not have yet
 
-    def _format_node_for_visualization(
-        self, node: dict[str, Any]
-    ) -> dict[str, Any] | None:
-        """Format node data for react-flow and R3F visualization with defensive checks"""
+        Args:
+            node_id: Node to expand
+            known_node_ids: Ids of nodes the client already has
+            node_types: Vertex labels to return, or None for all
+            relationship_types: Edge labels to follow, or None for all
+            limit: Maximum number of new nodes
 
-        # Defensive: Handle None node (but allow empty dict)
-        if node is None:
-            return None
+        Returns:
+            Dictionary with the new nodes, the edges connecting them to the
+            new and known nodes, and the stream's cursor/has_more
+        """
+        nodes: list[dict[str, Any]] = []
+        edges: list[dict[str, Any]] = []
+        result: dict[str, Any] = {}
+        async for message in self.stream_graph(
+            center_node_id=node_id,
+            depth=1,
+            node_types=node_types,
+            relationship_types=relationship_types,
+            known_node_ids=[node_id, *known_node_ids],
+            page_size=limit,
+            chunk_size=limit,
+        ):
+            if message["type"] == "chunk":
+                nodes.extend(message["nodes"])
+                edges.extend(message["edges"])
+            else:
+                result = message
 
+        return {
+            "nodes": nodes,
+            "edges": edges,
+            "cursor": result.get("cursor"),
+            "has_more": result.get("has_more", False),
+        }
+
+    def _node_fields(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Extract the display fields of a node with defaults for missing values"""
         # Extract node properties with fallbacks
         if "properties" in node and node["properties"]:
             props = node["properties"]
@@ -2507,59 +3848,36 @@ class GraphService:
             except (ValueError, TypeError):
                 priority = 3
 
-        # Determine node color based on type and status
-        color_map = {
-            "requirement": {
-                "active": "#3B82F6",
-                "draft": "#93C5FD",
-                "completed": "#1E40AF",
-                "archived": "#6B7280",
-            },
-            "task": {
-                "active": "#10B981",
-                "draft": "#6EE7B7",
-                "completed": "#047857",
-                "archived": "#6B7280",
-            },
-            "test": {
-                "active": "#F59E0B",
-                "draft": "#FCD34D",
-                "completed": "#D97706",
-                "archived": "#6B7280",
-            },
-            "risk": {
-                "active": "#EF4444",
-                "draft": "#FCA5A5",
-                "completed": "#DC2626",
-                "archived": "#6B7280",
-            },
-            "document": {
-                "active": "#8B5CF6",
-                "draft": "#C4B5FD",
-                "completed": "#7C3AED",
-                "archived": "#6B7280",
-            },
-            "failure": {
-                "active": "#DC2626",
-                "draft": "#FCA5A5",
-                "completed": "#991B1B",
-                "archived": "#6B7280",
-            },
-            "entity": {
-                "active": "#6B7280",
-                "draft": "#9CA3AF",
-                "completed": "#4B5563",
-                "archived": "#6B7280",
-            },
-            "user": {
-                "active": "#06B6D4",
-                "draft": "#67E8F9",
-                "completed": "#0891B2",
-                "archived": "#6B7280",
-            },
+        return {
+            "properties": props,
+            "id": node_id,
+            "type": node_type,
+            "label": title,
+            "description": description,
+            "status": status,
+            "priority": priority,
         }
 
-        node_colors = color_map.get(node_type.lower(), color_map["entity"])
+    def _format_node_for_visualization(
+        self, node: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Format node data for react-flow and R3F visualization with defensive checks"""
+
+        # Defensive: Handle None node (but allow empty dict)
+        if node is None:
+            return None
+
+        fields = self._node_fields(node)
+        props = fields["properties"]
+        node_id = fields["id"]
+        node_type = fields["type"]
+        title = fields["label"]
+        description = fields["description"]
+        status = fields["status"]
+        priority = fields["priority"]
+
+        # Determine node color based on type and status
+        node_colors = _NODE_COLORS.get(node_type.lower(), _NODE_COLORS["entity"])
         node_color = node_colors.get(status, node_colors["active"])
 
         # Calculate node size based on priority and connections
@@ -2570,20 +3888,12 @@ class GraphService:
         # Defensive: Ensure node_id is a string for formatting
         node_id_str = str(node_id)
 
-        # Generate random position for visualization (will be improved by layout algorithms)
-        import random
-
-        position_x = random.uniform(0, 800)
-        position_y = random.uniform(0, 600)
-
         # Format for react-flow (2D)
         react_flow_data = {
             "id": node_id_str,
             "type": "custom",
-            "position": {
-                "x": position_x,
-                "y": position_y,
-            },  # Random position for initial layout
+            # Placed by the server layout, if one was requested
+            "position": {"x": 0, "y": 0},
             "data": {
                 "label": title,
                 "type": node_type,
@@ -2611,11 +3921,7 @@ class GraphService:
         # Format for R3F (3D)
         r3f_data = {
             "id": node_id_str,
-            "position": [
-                position_x * 0.02,
-                0,
-                position_y * 0.02,
-            ],  # Convert to 3D space
+            "position": [0, 0, 0],
             "type": node_type,
             "label": title,
             "status": status,
@@ -2652,6 +3958,26 @@ class GraphService:
             "r3f": r3f_data,
         }
 
+    def _apply_layout_position(
+        self, node_data: dict[str, Any], position: tuple[float, ...]
+    ) -> None:
+        """Set a computed layout position on a formatted node
+
+        Args:
+            node_data: Node formatted by _format_node_for_visualization
+            position: (x, y) or (x, y, z) in react-flow pixel units
+        """
+        x, y = position[0], position[1]
+        z = position[2] if len(position) > 2 else 0.0
+
+        react_flow = node_data.get("reactFlow")
+        if isinstance(react_flow, dict):
+            react_flow["position"] = {"x": x, "y": y}
+        r3f = node_data.get("r3f")
+        if isinstance(r3f, dict):
+            # Pixels to R3F units; y is up in R3F
+            r3f["position"] = [x * 0.02, z * 0.02, y * 0.02]
+
     def _format_edge_for_visualization(
         self, edge: dict[str, Any], age_id_to_uuid: dict[int, str] | None = None
     ) -> dict[str, Any] | None:
@@ -2702,92 +4028,7 @@ class GraphService:
             edge_id = f"{start_id}-{end_id}-{edge_type}"
 
         # Determine edge color, style, and properties based on type
-        edge_styles = {
-            "TESTED_BY": {
-                "color": "#F59E0B",
-                "style": "solid",
-                "width": 2,
-                "animated": False,
-                "label": "Tested By",
-                "importance": "high",
-            },
-            "MITIGATES": {
-                "color": "#EF4444",
-                "style": "dashed",
-                "width": 3,
-                "animated": False,
-                "label": "Mitigates",
-                "importance": "critical",
-            },
-            "DEPENDS_ON": {
-                "color": "#6B7280",
-                "style": "solid",
-                "width": 2,
-                "animated": False,
-                "label": "Depends On",
-                "importance": "medium",
-            },
-            "IMPLEMENTS": {
-                "color": "#10B981",
-                "style": "solid",
-                "width": 2,
-                "animated": False,
-                "label": "Implements",
-                "importance": "high",
-            },
-            "LEADS_TO": {
-                "color": "#DC2626",
-                "style": "dotted",
-                "width": 2,
-                "animated": True,
-                "label": "Leads To",
-                "importance": "critical",
-            },
-            "RELATES_TO": {
-                "color": "#8B5CF6",
-                "style": "solid",
-                "width": 1,
-                "animated": False,
-                "label": "Relates To",
-                "importance": "low",
-            },
-            "NEXT_VERSION": {
-                "color": "#3B82F6",
-                "style": "dashed",
-                "width": 2,
-                "animated": True,
-                "label": "Next Version",
-                "importance": "medium",
-            },
-            "MENTIONED_IN": {
-                "color": "#9CA3AF",
-                "style": "dotted",
-                "width": 1,
-                "animated": False,
-                "label": "Mentioned In",
-                "importance": "low",
-            },
-            "REFERENCES": {
-                "color": "#6366F1",
-                "style": "solid",
-                "width": 1,
-                "animated": False,
-                "label": "References",
-                "importance": "medium",
-            },
-        }
-
-        style = edge_styles.get(
-            edge_type,
-            {
-                "color": "#6B7280",
-                "style": "solid",
-                "width": 1,
-                "animated": False,
-                "label": edge_type.replace("_", " ").title(),
-                "importance": "low",
-            },
-        )
+        style = _edge_style(edge_type)
 
         # Format for react-flow (2D)
         react_flow_data = {
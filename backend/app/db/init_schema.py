@@ -153,6 +153,30 @@ async def initialize_graph_schema():
     except Exception as e:
         print(f"Warning: Could not verify graph: {e}")
 
+    # Create property and edge indexes so lookups don't scan label tables
+    try:
+        indexes = await graph_service.ensure_indexes()
+        print(
+            f"Graph indexes: {len(indexes['created'])} created, "
+            f"{len(indexes['existing'])} already present"
+        )
+    except Exception as e:
+        print(f"Warning: Could not create graph indexes: {e}")
+
+    # Full-text search side table, filled from the existing vertices when it
+    # is created or its definition changed
+    try:
+        search = await graph_service.ensure_search_index()
+        indexed = (
+            f"{search['indexed']} nodes indexed" if "indexed" in search else "up to date"
+        )
+        print(
+            f"Search index: {indexed} "
+            f"(fuzzy matching {'enabled' if search['trigram'] else 'disabled'})"
+        )
+    except Exception as e:
+        print(f"Warning: Could not create search index: {e}")
+
     await graph_service.close()
 
 
@@ -44,6 +44,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             message="The application will start but graph features will be unavailable"
         )
 
+    # Queue the document jobs no live worker holds, now and periodically
+    try:
+        from app.services.document_jobs import get_document_job_queue
+        get_document_job_queue().start()
+    except Exception as e:
+        logger.warning("Could not resume document generation jobs", error=str(e))
+
     yield
 
     # Shutdown
@@ -51,6 +58,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await graph_service.close()
     logger.info("Closed graph database connection")
 
+    from app.services.audit_writer import shutdown_audit_writers
+    await shutdown_audit_writers()
+    logger.info("Flushed buffered audit log entries")
+
+    from app.services.scheduler_service import shutdown_scheduler_service
+    shutdown_scheduler_service()
+    logger.info("Stopped scheduler job workers")
+
+    from app.services.document_jobs import shutdown_document_jobs
+    shutdown_document_jobs()
+    logger.info("Stopped document generation workers")
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -69,6 +88,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # Add logging middleware
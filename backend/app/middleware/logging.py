@@ -9,6 +9,8 @@ import structlog
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.db.graph import GraphQueryStats, graph_query_stats_var
+
 logger = structlog.get_logger(__name__)
 
 # Context variable for request tracing
@@ -22,6 +24,10 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         # Generate or extract request ID
         request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
         request_id_var.set(request_id)
+
+        # Fresh graph round-trip counters for this request
+        graph_stats = GraphQueryStats()
+        graph_query_stats_var.set(graph_stats)
         
         # Bind request context to logger
         structlog.contextvars.clear_contextvars()
@@ -49,6 +55,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 "request_completed",
                 status_code=response.status_code,
                 duration_ms=round(duration_ms, 2),
+                graph_queries=graph_stats.queries,
+                age_setup_statements_avoided=graph_stats.setup_statements_avoided,
             )
             
             # Add request ID to response headers
@@ -1,8 +1,19 @@
 """SQLAlchemy database models"""
 
 from app.models.audit import AuditLog
+from app.models.document import GeneratedDocument
+from app.models.schedule import StoredSchedule, StoredScheduleJob
 from app.models.signature import DigitalSignature
 from app.models.user import User, UserRole
 from app.models.version_history import VersionHistory
 
-__all__ = ["AuditLog", "DigitalSignature", "User", "UserRole", "VersionHistory"]
+__all__ = [
+    "AuditLog",
+    "DigitalSignature",
+    "GeneratedDocument",
+    "StoredSchedule",
+    "StoredScheduleJob",
+    "User",
+    "UserRole",
+    "VersionHistory",
+]
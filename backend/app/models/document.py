@@ -0,0 +1,76 @@
+"""Generated document model"""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.session import Base
+
+
+class GeneratedDocument(Base):
+    """
+    Record of a generated compliance document.
+
+    Records are written when a document job is queued and updated as it
+    runs, so queued jobs can be resumed after a restart. The file itself is
+    stored content-addressed under UPLOAD_DIR by its SHA-256 content hash.
+
+    Attributes:
+        id: Document identifier, also the generation job ID (UUID)
+        project_id: Project the document belongs to
+        document_type: design_review, traceability_matrix, fmea or invoice
+        format: pdf, excel or word
+        status: pending, generating, completed or failed
+        owner: API worker generating the document (nullable)
+        lease_until: When the owner's claim on a generating job lapses
+            and another worker may take it over (nullable)
+        filename: Download filename
+        content_hash: SHA-256 hash of the file (set once completed)
+        file_size_bytes: File size (set once completed)
+        version: Document version
+        document_metadata: Type-specific statistics (column "metadata")
+        request: Generation request, to resume unfinished jobs
+        error_message: Failure details (nullable)
+        generated_by: User who requested the document
+        created_at: When the document was requested
+        started_at: When generation started (nullable)
+        generated_at: When generation finished (nullable)
+    """
+
+    __tablename__ = "generated_documents"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    project_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    document_type = Column(String(50), nullable=False)
+    format = Column(String(20), nullable=False)
+    status = Column(String(20), nullable=False, index=True)
+    filename = Column(String, nullable=False)
+    content_hash = Column(String(64), nullable=True, index=True)
+    file_size_bytes = Column(Integer, nullable=True)
+    version = Column(String, nullable=False, default="1.0")
+    document_metadata = Column("metadata", JSON, nullable=False, default=dict)
+    request = Column(JSON, nullable=True)
+    owner = Column(String(200), nullable=True)
+    lease_until = Column(DateTime(timezone=True), nullable=True)
+    error_message = Column(Text, nullable=True)
+    generated_by = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="RESTRICT"),
+        nullable=False,
+    )
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+        index=True,
+    )
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    generated_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<GeneratedDocument(id={self.id}, type={self.document_type}, "
+            f"status={self.status})>"
+        )
@@ -0,0 +1,81 @@
+"""Stored project schedule and schedule job models"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.session import Base
+
+
+class StoredSchedule(Base):
+    """
+    Latest calculated schedule of a project.
+
+    Schedules are shared by all API workers and survive restarts. The full
+    ProjectSchedule is kept as zlib-compressed JSON; the version is bumped on
+    every save so readers can validate cached copies with a primary-key lookup.
+
+    Attributes:
+        project_id: Project identifier (primary key)
+        version: Schedule version, incremented on every save
+        data: zlib-compressed JSON of the ProjectSchedule
+        created_at: When the first schedule of the project was stored
+        updated_at: When the schedule was last saved
+    """
+
+    __tablename__ = "project_schedules"
+
+    project_id = Column(UUID(as_uuid=True), primary_key=True)
+    version = Column(Integer, nullable=False, default=1)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<StoredSchedule(project_id={self.project_id}, version={self.version})>"
+
+
+class StoredScheduleJob(Base):
+    """
+    State of an asynchronous schedule calculation job.
+
+    Jobs run in the API worker that accepted them, but their state lives
+    here so any worker can report, return or cancel them. A cancelled job is
+    marked in this table; the worker running it sees the mark and stops its
+    solver.
+
+    Attributes:
+        job_id: Job identifier (primary key)
+        project_id: Project the schedule is calculated for
+        status: queued, running, completed, failed or cancelled
+        submitted_at: When the job was submitted
+        started_at: When solving started (nullable)
+        finished_at: When the job finished (nullable)
+        message: Error or cancellation details (nullable)
+        result_status: Status of the ScheduleResponse once completed (nullable)
+        result: zlib-compressed JSON of the ScheduleResponse (nullable)
+    """
+
+    __tablename__ = "schedule_jobs"
+
+    job_id = Column(UUID(as_uuid=True), primary_key=True)
+    project_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    status = Column(String(20), nullable=False, index=True)
+    submitted_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    message = Column(Text, nullable=True)
+    result_status = Column(String(20), nullable=True)
+    result = Column(LargeBinary, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<StoredScheduleJob(job_id={self.job_id}, status={self.status})>"
@@ -3,7 +3,7 @@
 from datetime import UTC, datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.db.session import Base
@@ -32,6 +32,14 @@ class DigitalSignature(Base):
     """
 
     __tablename__ = "digital_signatures"
+    __table_args__ = (
+        # Valid signatures only: serves signed-status lookups and invalidation
+        Index(
+            "ix_digital_signatures_workitem_valid",
+            "workitem_id",
+            postgresql_where=text("is_valid"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     workitem_id = Column(UUID(as_uuid=True), nullable=False, index=True)
@@ -3,7 +3,16 @@
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, DateTime, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -16,9 +25,18 @@ class VersionHistory(Base):
     
     Each time a WorkItem is updated, a snapshot of the previous version
     is stored in this table, allowing full version history to be retrieved.
+
+    Snapshots are numbered per WorkItem by ``sequence``. Every
+    VERSION_KEYFRAME_INTERVAL-th snapshot is a keyframe holding the full
+    ``data``; the others hold only ``delta``, a JSON Patch from the previous
+    snapshot (see VersionStore).
     """
     
     __tablename__ = "version_history"
+    __table_args__ = (
+        UniqueConstraint("workitem_id", "sequence", name="uq_version_history_workitem_sequence"),
+        Index("ix_version_history_workitem_version", "workitem_id", "version"),
+    )
     
     # Primary key
     id: Mapped[UUID] = mapped_column(
@@ -36,9 +54,12 @@ class VersionHistory(Base):
     
     # Version information
     version: Mapped[str] = mapped_column(String(20), nullable=False)
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False)
     
-    # WorkItem data snapshot (stored as JSON)
-    data: Mapped[dict] = mapped_column(JSON, nullable=False)
+    # WorkItem data: full snapshot on keyframes, JSON Patch otherwise
+    is_keyframe: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    delta: Mapped[list | None] = mapped_column(JSON, nullable=True)
     
     # Change tracking
     change_description: Mapped[str | None] = mapped_column(Text, nullable=True)
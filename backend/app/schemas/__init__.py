@@ -13,6 +13,7 @@ from app.schemas.document import (
     DocumentDownloadResponse,
     DocumentFilter,
     DocumentFormat,
+    DocumentJobStatus,
     DocumentRecord,
     DocumentStatus,
     DocumentType,
@@ -209,6 +210,7 @@ __all__ = [
     "InvoiceRequest",
     "InvoiceResponse",
     "DocumentRecord",
+    "DocumentJobStatus",
     "DocumentFilter",
     "DocumentDownloadResponse",
     # Worked (Time Tracking) Schemas
@@ -264,18 +264,38 @@ class DocumentRecord(BaseModel):
     format: DocumentFormat
     status: DocumentStatus
     filename: str
-    file_path: str
-    file_size_bytes: int
-    content_hash: str
+    file_path: str | None = None
+    file_size_bytes: int | None = None
+    content_hash: str | None = None
     version: str
     metadata: dict
-    generated_at: datetime
+    generated_at: datetime | None = None
     generated_by: UUID
     expires_at: datetime | None = None
+    submitted_at: datetime | None = None
+    started_at: datetime | None = None
+    error_message: str | None = None
 
     model_config = {"from_attributes": True}
 
 
+class DocumentJobStatus(BaseModel):
+    """Schema for a background document generation job."""
+
+    job_id: UUID = Field(..., description="Job identifier (also the document ID)")
+    project_id: UUID
+    document_type: DocumentType
+    format: DocumentFormat
+    status: DocumentStatus
+    submitted_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    message: str | None = Field(None, description="Error details of a failed job")
+    download_url: str | None = Field(
+        None, description="Download URL once the document is completed"
+    )
+
+
 class DocumentFilter(BaseModel):
     """Schema for filtering documents."""
 
@@ -113,6 +113,19 @@ class GraphVisualizationResponse(BaseModel):
     metadata: dict[str, Any] | None = Field(None, description="Graph metadata")
 
 
+class GraphExpandRequest(BaseModel):
+    """Request body for /api/v1/graph/expand"""
+    node_id: str = Field(..., description="Node to expand")
+    known_node_ids: list[str] = Field(
+        default_factory=list, description="Ids of nodes the client already has"
+    )
+    node_types: list[str] | None = Field(None, description="Filter by node types")
+    relationship_types: list[str] | None = Field(
+        None, description="Filter by relationship types"
+    )
+    limit: int = Field(500, ge=1, le=5000, description="Maximum new nodes to return")
+
+
 class SearchResponse(BaseModel):
     """
     Response format for /api/v1/graph/search endpoint.
@@ -122,8 +135,9 @@ class SearchResponse(BaseModel):
     """
     query: str = Field(..., description="Search query text")
     results: list[NodeVisualization] = Field(..., description="Matching nodes (formatted)")
-    total_found: int = Field(..., description="Number of results found")
-    truncated: bool = Field(..., description="Whether results were truncated")
+    total_found: int = Field(..., description="Number of matching nodes across all pages")
+    truncated: bool = Field(..., description="Whether more results follow this page")
+    offset: int = Field(0, description="Number of results skipped")
 
     class Config:
         json_schema_extra = {
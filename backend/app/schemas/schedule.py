@@ -96,6 +96,9 @@ class ScheduleTaskBase(BaseModel):
     sprint_end_date: datetime | None = Field(
         None, description="Sprint end date (hard constraint)"
     )
+    start_date_is: datetime | None = Field(
+        None, description="Actual start date when work began (task started/completed)"
+    )
 
     @field_validator("id")
     @classmethod
@@ -171,6 +174,16 @@ class ScheduledTask(BaseModel):
     is_critical: bool = Field(
         default=False, description="Whether this task is on the critical path"
     )
+    is_near_critical: bool = Field(
+        default=False,
+        description="Whether the task's total float is within the near-critical threshold",
+    )
+    total_float_hours: float | None = Field(
+        None, description="Hours the task can slip without delaying the project"
+    )
+    free_float_hours: float | None = Field(
+        None, description="Hours the task can slip without delaying any successor"
+    )
 
     # Skills and resource matching
     skills: list[str] = Field(
@@ -193,6 +206,49 @@ class ScheduledMilestone(BaseModel):
     status: str = Field(default="active", description="Milestone status")
 
 
+class ScheduleSolverProfile(BaseModel):
+    """Schema for CP-SAT solver tuning options"""
+
+    num_search_workers: int = Field(
+        default=8, ge=1, le=64, description="Parallel CP-SAT search workers"
+    )
+    max_time_seconds: float = Field(
+        default=60.0, gt=0, le=3600, description="Solver time limit in seconds"
+    )
+    relative_gap_limit: float = Field(
+        default=0.0,
+        ge=0,
+        le=1,
+        description="Stop once the objective is within this relative gap of the bound",
+    )
+    quick_feasible_seconds: float | None = Field(
+        None,
+        gt=0,
+        description=(
+            "Return the best schedule found within this many seconds and keep "
+            "improving it in the background"
+        ),
+    )
+
+
+class SolverStatistics(BaseModel):
+    """Schema for CP-SAT solver statistics"""
+
+    wall_time_seconds: float = Field(..., description="Solver wall time in seconds")
+    num_branches: int = Field(..., description="Search branches explored")
+    num_conflicts: int = Field(..., description="Conflicts encountered")
+    objective_value: float | None = Field(
+        None, description="Objective value (project duration in hours)"
+    )
+    best_objective_bound: float | None = Field(
+        None, description="Best proven lower bound on the objective"
+    )
+    relative_gap: float | None = Field(
+        None, description="Relative gap between objective and bound (0 = optimal)"
+    )
+    num_search_workers: int = Field(..., description="Search workers used")
+
+
 class ScheduleConstraints(BaseModel):
     """Schema for schedule constraints"""
 
@@ -205,6 +261,14 @@ class ScheduleConstraints(BaseModel):
         default=8, ge=1, le=24, description="Working hours per day"
     )
     respect_weekends: bool = Field(default=True, description="Whether to skip weekends")
+    solver_profile: ScheduleSolverProfile = Field(
+        default_factory=ScheduleSolverProfile, description="Solver tuning options"
+    )
+    near_critical_float_hours: float = Field(
+        default=8.0,
+        ge=0,
+        description="Total float (hours) at or below which a task is near-critical",
+    )
 
 
 class ScheduleConflict(BaseModel):
@@ -249,6 +313,40 @@ class ScheduleRequest(BaseModel):
         return v
 
 
+class RescheduleRequest(BaseModel):
+    """Schema for incremental re-scheduling of a stored schedule"""
+
+    tasks: list[ScheduleTaskCreate] = Field(
+        ..., min_length=1, description="Current tasks, including the edited ones"
+    )
+    resources: list[ResourceCreate] = Field(
+        default_factory=list,
+        description="Available resources (defaults to the stored schedule's resources)",
+    )
+    constraints: ScheduleConstraints | None = Field(
+        None, description="Schedule constraints (defaults to the stored constraints)"
+    )
+    changed_task_ids: list[str] | None = Field(
+        None,
+        description=(
+            "Tasks whose inputs changed; defaults to new tasks and tasks whose "
+            "estimated hours differ from the stored schedule"
+        ),
+    )
+    freeze_started: bool = Field(
+        default=True,
+        description="Keep tasks with start_date_is set at their current start",
+    )
+
+    @field_validator("tasks")
+    @classmethod
+    def validate_tasks(cls, v: list[ScheduleTaskCreate]) -> list[ScheduleTaskCreate]:
+        task_ids = [task.id for task in v]
+        if len(task_ids) != len(set(task_ids)):
+            raise ValueError("Duplicate task IDs found")
+        return v
+
+
 class ScheduleResponse(BaseModel):
     """Schema for schedule calculation response"""
 
@@ -270,15 +368,47 @@ class ScheduleResponse(BaseModel):
     critical_path: list[str] = Field(
         default_factory=list, description="Task IDs on the critical path"
     )
+    near_critical_tasks: list[str] = Field(
+        default_factory=list,
+        description="Task IDs whose total float is within the near-critical threshold",
+    )
     conflicts: list[ScheduleConflict] = Field(
         default_factory=list, description="Identified conflicts"
     )
     message: str | None = Field(None, description="Additional message or error details")
+    solver_stats: SolverStatistics | None = Field(
+        None, description="CP-SAT statistics for the returned solution"
+    )
+    optimization_in_progress: bool = Field(
+        default=False,
+        description="Whether the solver keeps improving this schedule in the background",
+    )
+    task_date_failures: dict[str, str] = Field(
+        default_factory=dict,
+        description="Task ID -> reason for tasks whose WorkItem dates were not updated",
+    )
     calculated_at: datetime = Field(
         default_factory=datetime.utcnow, description="When the schedule was calculated"
     )
 
 
+class ScheduleJobStatus(BaseModel):
+    """Schema for an asynchronous schedule calculation job"""
+
+    job_id: UUID = Field(..., description="Job identifier")
+    project_id: UUID = Field(..., description="Project identifier")
+    status: Literal["queued", "running", "completed", "failed", "cancelled"] = Field(
+        ..., description="Job status"
+    )
+    submitted_at: datetime = Field(..., description="When the job was submitted")
+    started_at: datetime | None = Field(None, description="When solving started")
+    finished_at: datetime | None = Field(None, description="When the job finished")
+    message: str | None = Field(None, description="Error or cancellation details")
+    result_status: (
+        Literal["success", "feasible", "infeasible", "error"] | None
+    ) = Field(None, description="Status of the schedule result once completed")
+
+
 class ScheduleUpdate(BaseModel):
     """Schema for manual schedule adjustments"""
 
@@ -312,6 +442,10 @@ class ProjectSchedule(BaseModel):
     critical_path: list[str] = Field(
         default_factory=list, description="Task IDs on the critical path"
     )
+    near_critical_tasks: list[str] = Field(
+        default_factory=list,
+        description="Task IDs whose total float is within the near-critical threshold",
+    )
     created_at: datetime = Field(..., description="When the schedule was created")
     updated_at: datetime = Field(..., description="When the schedule was last updated")
     version: int = Field(default=1, description="Schedule version")
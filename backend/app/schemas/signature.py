@@ -66,7 +66,9 @@ class SignatureVerificationResponse(BaseModel):
     signature_id: UUID
     is_valid: bool
     verification_timestamp: datetime
-    content_matches: bool
+    content_matches: bool | None = Field(
+        ..., description="Whether the content hash matches (None if no content was supplied)"
+    )
     signature_intact: bool
     error_message: str | None = None
 
@@ -85,3 +87,22 @@ class VerifySignatureRequest(BaseModel):
 
     current_workitem_content: dict = Field(..., description="Current WorkItem content for comparison")
     public_key_pem: str = Field(..., description="RSA public key in PEM format (base64 encoded)")
+
+
+class BulkVerifySignaturesRequest(BaseModel):
+    """Schema for verifying many signatures at once"""
+
+    signature_ids: list[UUID] = Field(default_factory=list, max_length=10000, description="Signatures to verify")
+    workitem_ids: list[UUID] = Field(
+        default_factory=list, max_length=10000, description="WorkItems whose valid signatures to verify"
+    )
+    workitem_contents: dict[UUID, dict] = Field(
+        default_factory=dict,
+        description=(
+            "Current content per WorkItem ID; signatures of omitted WorkItems "
+            "are reported as not valid (content not checked)"
+        ),
+    )
+    public_keys: dict[UUID, str] = Field(
+        ..., description="RSA public key in PEM format (base64 encoded) per signer user ID"
+    )
@@ -1,16 +1,37 @@
 """Audit service for compliance tracking and logging"""
 
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
 from datetime import UTC, datetime
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import Depends
-from sqlalchemy import and_, desc, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, desc, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from app.db.session import get_db
 from app.models.audit import AuditLog
 from app.schemas.audit import AuditLogFilter, AuditLogResponse
+from app.services.audit_writer import AuditWriter, get_audit_writer
+
+# Actions written before log() returns even when a buffered writer is used:
+# signature and authentication/authorization events
+SYNCHRONOUS_AUDIT_PREFIXES = ("SIGN", "AUTH")
+
+
+def _export_row(log: AuditLog) -> dict[str, Any]:
+    """Convert an audit log entry to its export representation"""
+    return {
+        "id": str(log.id),
+        "user_id": str(log.user_id) if log.user_id else None,
+        "action": log.action,
+        "entity_type": log.entity_type,
+        "entity_id": str(log.entity_id) if log.entity_id else None,
+        "timestamp": log.timestamp.isoformat(),
+        "ip_address": log.ip_address,
+        "details": log.details,
+    }
 
 
 class AuditService:
@@ -26,10 +47,16 @@ class AuditService:
     - Comprehensive logging of all system activities
     - Efficient querying with filtering capabilities
     - Compliance reporting support
+
+    With an AuditWriter, entries are buffered and inserted in batches off
+    the request path, except for SIGN and AUTH events, which are always
+    committed before log() returns. Queries flush the buffer first, so
+    they see every entry logged before them.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, writer: AuditWriter | None = None):
         self.db = db
+        self.writer = writer
 
     async def log(
         self,
@@ -52,7 +79,7 @@ class AuditService:
             details: Additional context as dictionary
 
         Returns:
-            Created AuditLog instance
+            Created AuditLog instance (not yet persisted when buffered)
 
         Example:
             await audit_service.log(
@@ -64,9 +91,24 @@ class AuditService:
                 details={"title": "New requirement", "type": "requirement"}
             )
         """
+        action = action.upper()
+        if self.writer is not None and not action.startswith(SYNCHRONOUS_AUDIT_PREFIXES):
+            row = {
+                "id": uuid4(),
+                "user_id": user_id,
+                "action": action,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "ip_address": ip_address,
+                "details": details,
+                "timestamp": datetime.now(UTC),
+            }
+            await self.writer.submit(row)
+            return AuditLog(**row)
+
         audit_log = AuditLog(
             user_id=user_id,
-            action=action.upper(),
+            action=action,
             entity_type=entity_type,
             entity_id=entity_id,
             ip_address=ip_address,
@@ -239,29 +281,11 @@ class AuditService:
         Returns:
             List of audit log entries matching the filters
         """
-        query = select(AuditLog)
-
-        # Apply filters
-        conditions = []
-
-        if filters.user_id:
-            conditions.append(AuditLog.user_id == filters.user_id)
-
-        if filters.action:
-            conditions.append(AuditLog.action == filters.action.upper())
-
-        if filters.entity_type:
-            conditions.append(AuditLog.entity_type == filters.entity_type)
-
-        if filters.entity_id:
-            conditions.append(AuditLog.entity_id == filters.entity_id)
+        await self.flush()
 
-        if filters.start_date:
-            conditions.append(AuditLog.timestamp >= filters.start_date)
-
-        if filters.end_date:
-            conditions.append(AuditLog.timestamp <= filters.end_date)
+        query = select(AuditLog)
 
+        conditions = self._filter_conditions(filters)
         if conditions:
             query = query.where(and_(*conditions))
 
@@ -289,29 +313,11 @@ class AuditService:
         Returns:
             Total count of matching audit log entries
         """
-        query = select(func.count(AuditLog.id))
-
-        # Apply same filters as get_audit_logs
-        conditions = []
-
-        if filters.user_id:
-            conditions.append(AuditLog.user_id == filters.user_id)
-
-        if filters.action:
-            conditions.append(AuditLog.action == filters.action.upper())
-
-        if filters.entity_type:
-            conditions.append(AuditLog.entity_type == filters.entity_type)
-
-        if filters.entity_id:
-            conditions.append(AuditLog.entity_id == filters.entity_id)
-
-        if filters.start_date:
-            conditions.append(AuditLog.timestamp >= filters.start_date)
+        await self.flush()
 
-        if filters.end_date:
-            conditions.append(AuditLog.timestamp <= filters.end_date)
+        query = select(func.count(AuditLog.id))
 
+        conditions = self._filter_conditions(filters)
         if conditions:
             query = query.where(and_(*conditions))
 
@@ -331,10 +337,83 @@ class AuditService:
         Returns:
             List of audit log entries as dictionaries for export
         """
-        # Create export filters with larger limit (bypass validation)
+        await self.flush()
+
         query = select(AuditLog)
 
-        # Apply same filters as get_audit_logs
+        conditions = self._filter_conditions(filters)
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        # Order by timestamp (newest first)
+        query = query.order_by(desc(AuditLog.timestamp))
+
+        # Apply large limit for export (no pagination)
+        query = query.limit(10000)
+
+        result = await self.db.execute(query)
+        audit_logs = result.scalars().all()
+
+        return [_export_row(log) for log in audit_logs]
+
+    async def stream_audit_logs(
+        self,
+        filters: AuditLogFilter,
+        page_size: int = 5000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream every matching audit log for export, newest first.
+
+        Unlike export_audit_logs() there is no row limit. Rows are read in
+        keyset pages on (timestamp, id), each through a server-side cursor
+        in its own short-lived session, so memory use and transaction length
+        stay bounded however many rows match.
+
+        Args:
+            filters: Filter criteria (limit and offset are ignored)
+            page_size: Rows per keyset page
+
+        Yields:
+            Audit log entries as dictionaries for export
+        """
+        await self.flush()
+
+        conditions = self._filter_conditions(filters)
+        engine = getattr(self.db, "bind", None)
+        sessions = (
+            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            if isinstance(engine, AsyncEngine)
+            else None
+        )
+
+        after: tuple[datetime, UUID] | None = None
+        while True:
+            page_conditions = list(conditions)
+            if after is not None:
+                page_conditions.append(
+                    tuple_(AuditLog.timestamp, AuditLog.id) < tuple_(*after)
+                )
+            query = select(AuditLog)
+            if page_conditions:
+                query = query.where(and_(*page_conditions))
+            query = (
+                query.order_by(desc(AuditLog.timestamp), desc(AuditLog.id))
+                .limit(page_size)
+                .execution_options(yield_per=min(page_size, 1000))
+            )
+
+            count = 0
+            async with (sessions() if sessions else nullcontext(self.db)) as db:
+                async for log in await db.stream_scalars(query):
+                    count += 1
+                    after = (log.timestamp, log.id)
+                    yield _export_row(log)
+            if count < page_size:
+                return
+
+    @staticmethod
+    def _filter_conditions(filters: AuditLogFilter) -> list[Any]:
+        """Build the WHERE conditions for audit log filters"""
         conditions = []
 
         if filters.user_id:
@@ -355,31 +434,7 @@ class AuditService:
         if filters.end_date:
             conditions.append(AuditLog.timestamp <= filters.end_date)
 
-        if conditions:
-            query = query.where(and_(*conditions))
-
-        # Order by timestamp (newest first)
-        query = query.order_by(desc(AuditLog.timestamp))
-
-        # Apply large limit for export (no pagination)
-        query = query.limit(10000)
-
-        result = await self.db.execute(query)
-        audit_logs = result.scalars().all()
-
-        return [
-            {
-                "id": str(log.id),
-                "user_id": str(log.user_id) if log.user_id else None,
-                "action": log.action,
-                "entity_type": log.entity_type,
-                "entity_id": str(log.entity_id) if log.entity_id else None,
-                "timestamp": log.timestamp.isoformat(),
-                "ip_address": log.ip_address,
-                "details": log.details,
-            }
-            for log in audit_logs
-        ]
+        return conditions
 
     async def cleanup_old_audit_logs(
         self,
@@ -425,10 +480,15 @@ class AuditService:
 
         return deleted_count
 
+    async def flush(self) -> None:
+        """Write buffered audit entries (no-op without a writer)"""
+        if self.writer is not None:
+            await self.writer.flush()
+
     # Note: No update or delete methods - audit logs are immutable
     # This ensures compliance with regulatory requirements for audit trail integrity
 
 
 async def get_audit_service(db: AsyncSession = Depends(get_db)) -> AuditService:
     """Dependency for getting AuditService instance"""
-    return AuditService(db)
+    return AuditService(db, writer=get_audit_writer(db))
@@ -0,0 +1,193 @@
+"""Buffered, batched writer for audit log entries"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.models.audit import AuditLog
+
+logger = logging.getLogger(__name__)
+
+# Attempts per batch before the entries are given up on (and logged instead)
+_MAX_WRITE_ATTEMPTS = 3
+_RETRY_DELAY_SECONDS = 0.1
+
+
+class AuditWriter:
+    """
+    Collects audit log rows in memory and inserts them in batches.
+
+    A background task flushes the buffer every ``flush_interval`` seconds,
+    or as soon as ``batch_size`` rows are waiting. Each batch is written as
+    one multi-row INSERT in its own transaction. When ``max_pending`` rows
+    are buffered, submit() flushes before accepting more, so a slow database
+    slows callers down instead of growing memory without bound.
+
+    Entries are only durable once flushed; call close() on shutdown.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        batch_size: int = 500,
+        flush_interval: float = 0.2,
+        max_pending: int = 10000,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            session_factory: Creates the sessions batches are written with
+            batch_size: Rows per INSERT, and buffered rows that trigger a flush
+            flush_interval: Seconds a row waits at most before it is flushed
+            max_pending: Buffered rows at which submit() waits for a flush
+        """
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._buffer: list[dict[str, Any]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._flush_lock: asyncio.Lock | None = None
+        self.written = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of rows waiting to be written"""
+        return len(self._buffer)
+
+    def _ensure_started(self) -> None:
+        """Start the flush task on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Primitives are bound to the loop they were created on
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def submit(self, row: dict[str, Any]) -> None:
+        """
+        Queue an audit log row.
+
+        Args:
+            row: Column values of an AuditLog, including id and timestamp
+        """
+        self._ensure_started()
+        while len(self._buffer) >= self._max_pending:
+            await self.flush()
+        self._buffer.append(row)
+        if len(self._buffer) >= self._batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """
+        Write every buffered row.
+
+        Returns:
+            Number of rows written
+        """
+        if self._flush_lock is None:
+            return 0
+        written = 0
+        async with self._flush_lock:
+            while self._buffer:
+                batch = self._buffer[: self._batch_size]
+                del self._buffer[: len(batch)]
+                if await self._write(batch):
+                    written += len(batch)
+        return written
+
+    async def close(self) -> None:
+        """Stop the flush task and write the remaining rows"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush on a timer or when a full batch is waiting"""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._buffer:
+                await self.flush()
+
+    async def _write(self, batch: list[dict[str, Any]]) -> bool:
+        """Insert one batch, retrying briefly; give up by logging the rows"""
+        for attempt in range(1, _MAX_WRITE_ATTEMPTS + 1):
+            try:
+                async with self._session_factory() as session:
+                    await session.execute(insert(AuditLog), batch)
+                    await session.commit()
+                self.written += len(batch)
+                return True
+            except Exception as e:
+                if attempt == _MAX_WRITE_ATTEMPTS:
+                    self.dropped += len(batch)
+                    logger.error(
+                        f"Could not write {len(batch)} audit log entries: {e}; "
+                        f"entries: {batch}"
+                    )
+                    return False
+                logger.warning(f"Audit log batch write failed (attempt {attempt}): {e}")
+                await asyncio.sleep(_RETRY_DELAY_SECONDS * 2 ** (attempt - 1))
+        return False
+
+
+# One writer per database engine, so entries land in the database the
+# request's session is bound to
+_audit_writers: dict[AsyncEngine, AuditWriter] = {}
+
+
+def get_audit_writer(db: AsyncSession) -> AuditWriter | None:
+    """
+    Get the buffered writer for the database behind a session.
+
+    Args:
+        db: Request database session
+
+    Returns:
+        AuditWriter, or None when AUDIT_WRITE_MODE is "sync" or the session
+        is not bound to an engine
+    """
+    if settings.AUDIT_WRITE_MODE != "buffered":
+        return None
+    engine = getattr(db, "bind", None)
+    if not isinstance(engine, AsyncEngine):
+        return None
+
+    writer = _audit_writers.get(engine)
+    if writer is None:
+        writer = AuditWriter(
+            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+            batch_size=settings.AUDIT_BATCH_SIZE,
+            flush_interval=settings.AUDIT_FLUSH_INTERVAL_MS / 1000,
+            max_pending=settings.AUDIT_MAX_PENDING,
+        )
+        _audit_writers[engine] = writer
+    return writer
+
+
+async def shutdown_audit_writers() -> None:
+    """Flush and stop all audit writers"""
+    for writer in list(_audit_writers.values()):
+        await writer.close()
+    _audit_writers.clear()
@@ -1,29 +1,77 @@
-"""Critical Path Calculation using Longest Path Algorithm"""
+"""Critical Path Method (CPM) analysis of a scheduled task network"""
 
 import logging
-from collections import defaultdict, deque
+from dataclasses import dataclass
+
+import numpy as np
 
 from app.schemas.schedule import ScheduledTask, ScheduleTaskCreate
 
 logger = logging.getLogger(__name__)
 
+# Absolute tolerance (in hours) for treating a float value as zero
+_FLOAT_TOLERANCE_HOURS = 1e-6
+
+
+@dataclass
+class CriticalPathAnalysis:
+    """
+    Result of a CPM forward/backward pass.
+
+    All arrays are indexed like ``task_ids`` and hold hours relative to the
+    project start (time zero of the network).
+    """
+
+    task_ids: list[str]
+    durations: np.ndarray
+    early_start: np.ndarray
+    early_finish: np.ndarray
+    late_start: np.ndarray
+    late_finish: np.ndarray
+    total_float: np.ndarray
+    free_float: np.ndarray
+    project_duration: float
+    critical_path: list[str]
+    near_critical_tasks: list[str]
+
+    def apply_to_schedule(
+        self,
+        scheduled_tasks: list[ScheduledTask],
+        near_critical_float_hours: float = 0.0,
+    ) -> None:
+        """
+        Copy float values and critical flags onto scheduled tasks in place.
+
+        Args:
+            scheduled_tasks: Scheduled tasks to annotate
+            near_critical_float_hours: Total float at or below which a task
+                counts as near-critical
+        """
+        index = {task_id: i for i, task_id in enumerate(self.task_ids)}
+        critical = set(self.critical_path)
+        total_float = self.total_float.tolist()
+        free_float = self.free_float.tolist()
+        threshold = near_critical_float_hours + _FLOAT_TOLERANCE_HOURS
+
+        for scheduled_task in scheduled_tasks:
+            i = index.get(scheduled_task.task_id)
+            if i is None:
+                continue
+            scheduled_task.is_critical = scheduled_task.task_id in critical
+            scheduled_task.total_float_hours = round(total_float[i], 6)
+            scheduled_task.free_float_hours = round(free_float[i], 6)
+            scheduled_task.is_near_critical = total_float[i] <= threshold
+
 
 def calculate_critical_path(
     tasks: list[ScheduleTaskCreate],
     scheduled_tasks: list[ScheduledTask],
 ) -> list[str]:
     """
-    Calculate critical path using longest path algorithm through dependency graph.
+    Calculate the critical path through the task dependency graph.
 
     The critical path is the sequence of dependent tasks that determines the minimum
-    project duration. It's calculated by finding the longest path through the task
-    dependency graph using topological sort with longest path calculation.
-
-    Algorithm:
-    1. Build adjacency list from task dependencies
-    2. Calculate task durations from scheduled results
-    3. Perform topological sort with longest path tracking
-    4. Backtrack from end task to reconstruct critical path
+    project duration. See analyze_critical_path for the full CPM analysis.
 
     Args:
         tasks: List of tasks with dependencies
@@ -35,153 +83,280 @@ def calculate_critical_path(
     Raises:
         ValueError: If circular dependencies detected or invalid task data
     """
+    analysis = analyze_critical_path(tasks, scheduled_tasks)
+    return analysis.critical_path if analysis else []
+
+
+def analyze_critical_path(
+    tasks: list[ScheduleTaskCreate],
+    scheduled_tasks: list[ScheduledTask],
+    near_critical_float_hours: float = 0.0,
+) -> CriticalPathAnalysis | None:
+    """
+    Run a CPM forward and backward pass over the task dependency graph.
+
+    Durations are taken from the scheduled dates. The graph is split into
+    topological levels (every predecessor of a task sits on a lower level),
+    and each pass processes one level at a time with NumPy scatter
+    operations, so the Python-level work is proportional to the depth of
+    the graph rather than the number of tasks.
+
+    Dependencies are applied like the solver applies them. Each edge
+    requires the successor to start at least ``offset`` hours after its
+    predecessor starts:
+
+    - finish_to_start: offset = predecessor duration + lag
+    - start_to_start: offset = lag
+    - finish_to_finish: offset = predecessor duration + lag - successor duration
+
+    Algorithm:
+    1. Map task IDs to array indices and build edge arrays with offsets
+    2. Assign topological levels (Kahn's algorithm, one level per step)
+    3. Forward pass: ES = max(ES of predecessor + offset), EF = ES + duration
+    4. Backward pass: LS = min(LS of successor - offset), LF = LS + duration
+    5. Total float = LS - ES, free float = min(slack of outgoing edges,
+       project end - EF)
+    6. Backtrack driving predecessors from the latest-finishing task
+
+    Args:
+        tasks: List of tasks with dependencies
+        scheduled_tasks: List of scheduled tasks with actual dates
+        near_critical_float_hours: Total float at or below which a task is
+            reported as near-critical
+
+    Returns:
+        CriticalPathAnalysis, or None if there are no tasks or some tasks
+        are not scheduled
+
+    Raises:
+        ValueError: If circular dependencies detected
+    """
     if not tasks or not scheduled_tasks:
         logger.warning("Cannot calculate critical path: no tasks provided")
-        return []
+        return None
 
-    # Build task lookup maps
-    task_map = {task.id: task for task in tasks}
+    task_ids = [task.id for task in tasks]
+    index = {task_id: i for i, task_id in enumerate(task_ids)}
     scheduled_map = {st.task_id: st for st in scheduled_tasks}
 
     # Validate all tasks are scheduled
-    missing_tasks = set(task_map.keys()) - set(scheduled_map.keys())
+    missing_tasks = set(task_ids) - set(scheduled_map)
     if missing_tasks:
         logger.warning(
             f"Cannot calculate critical path: tasks not scheduled: {missing_tasks}"
         )
-        return []
-
-    # Build dependency graph (adjacency list)
-    graph: dict[str, list[str]] = defaultdict(list)
-    in_degree: dict[str, int] = {task.id: 0 for task in tasks}
+        return None
+
+    n = len(task_ids)
+    durations = np.fromiter(
+        (
+            (scheduled_map[task_id].end_date - scheduled_map[task_id].start_date)
+            .total_seconds()
+            / 3600
+            for task_id in task_ids
+        ),
+        dtype=np.float64,
+        count=n,
+    )
 
+    # Build edge arrays: pred[k] -> succ[k], from the predecessor's finish
+    # (finish_to_*) or start, to the successor's finish (finish_to_finish)
+    # or start, lag[k] hours later
+    pred_list: list[int] = []
+    succ_list: list[int] = []
+    from_finish_list: list[bool] = []
+    to_finish_list: list[bool] = []
+    lag_list: list[float] = []
     for task in tasks:
         for dep in task.dependencies:
-            predecessor_id = dep.predecessor_id
-
-            # Validate predecessor exists
-            if predecessor_id not in task_map:
+            predecessor = index.get(dep.predecessor_id)
+            if predecessor is None:
                 logger.warning(
                     f"Invalid dependency: task '{task.id}' depends on "
-                    f"non-existent task '{predecessor_id}'"
+                    f"non-existent task '{dep.predecessor_id}'"
                 )
                 continue
-
-            # Add edge: predecessor -> task
-            graph[predecessor_id].append(task.id)
-            in_degree[task.id] += 1
-
-    # Detect cycles using topological sort
-    if _has_cycle(graph, in_degree):
+            pred_list.append(predecessor)
+            succ_list.append(index[task.id])
+            from_finish_list.append(dep.dependency_type != "start_to_start")
+            to_finish_list.append(dep.dependency_type == "finish_to_finish")
+            lag_list.append(dep.lag)
+
+    pred = np.asarray(pred_list, dtype=np.int64)
+    succ = np.asarray(succ_list, dtype=np.int64)
+    from_finish = np.asarray(from_finish_list, dtype=bool)
+    to_finish = np.asarray(to_finish_list, dtype=bool)
+    lag = np.asarray(lag_list, dtype=np.float64)
+
+    levels = _topological_levels(n, pred, succ)
+    if levels is None:
         logger.error("Cannot calculate critical path: circular dependencies detected")
         raise ValueError("Circular dependencies detected in task graph")
 
-    # Calculate task durations in hours
-    durations: dict[str, float] = {}
-    for task_id, scheduled_task in scheduled_map.items():
-        duration = (
-            scheduled_task.end_date - scheduled_task.start_date
-        ).total_seconds() / 3600
-        durations[task_id] = duration
-
-    # Topological sort with longest path calculation
-    longest_path: dict[str, float] = {task_id: 0.0 for task_id in task_map}
-    predecessor: dict[str, str | None] = {task_id: None for task_id in task_map}
-
-    # Queue of tasks with no dependencies (in_degree = 0)
-    queue: deque[str] = deque(
-        [task_id for task_id, degree in in_degree.items() if degree == 0]
+    # Minimum distance from predecessor start to successor start per edge
+    offset = (
+        np.where(from_finish, durations[pred], 0.0)
+        + lag
+        - np.where(to_finish, durations[succ], 0.0)
     )
 
-    processed_count = 0
-
-    while queue:
-        current = queue.popleft()
-        processed_count += 1
-
-        # Calculate path length to this task
-        current_path_length = longest_path[current] + durations[current]
-
-        # Update successors
-        for neighbor in graph[current]:
-            # Update longest path if we found a longer one
-            if current_path_length > longest_path[neighbor]:
-                longest_path[neighbor] = current_path_length
-                predecessor[neighbor] = current
-
-            # Decrease in-degree
-            in_degree[neighbor] -= 1
+    # Group edges by the level of their predecessor
+    edge_order = np.argsort(levels[pred], kind="stable")
+    pred = pred[edge_order]
+    succ = succ[edge_order]
+    offset = offset[edge_order]
+    edge_level = levels[pred]
+    num_levels = int(levels.max()) + 1
+    edge_bounds = np.searchsorted(edge_level, np.arange(num_levels + 1))
+    node_order = np.argsort(levels, kind="stable")
+    node_bounds = np.searchsorted(levels[node_order], np.arange(num_levels + 1))
+
+    # Forward pass
+    early_start = np.zeros(n)
+    early_finish = np.zeros(n)
+    for level in range(num_levels):
+        nodes = node_order[node_bounds[level] : node_bounds[level + 1]]
+        early_finish[nodes] = early_start[nodes] + durations[nodes]
+        lo, hi = edge_bounds[level], edge_bounds[level + 1]
+        np.maximum.at(
+            early_start, succ[lo:hi], early_start[pred[lo:hi]] + offset[lo:hi]
+        )
 
-            # Add to queue if all dependencies satisfied
-            if in_degree[neighbor] == 0:
-                queue.append(neighbor)
+    project_duration = float(early_finish.max())
 
-    # Verify all tasks were processed (no cycles)
-    if processed_count != len(tasks):
-        logger.error(
-            f"Critical path calculation incomplete: processed {processed_count} "
-            f"of {len(tasks)} tasks. Possible cycle detected."
+    # Backward pass
+    late_start = project_duration - durations
+    for level in range(num_levels - 1, -1, -1):
+        lo, hi = edge_bounds[level], edge_bounds[level + 1]
+        np.minimum.at(
+            late_start, pred[lo:hi], late_start[succ[lo:hi]] - offset[lo:hi]
         )
-        raise ValueError("Circular dependencies detected during topological sort")
+    late_finish = late_start + durations
 
-    # Find the task with the longest path (project end)
-    if not longest_path:
-        logger.warning("No tasks in longest path calculation")
-        return []
+    total_float = late_start - early_start
 
-    end_task = max(longest_path.keys(), key=lambda task_id: longest_path[task_id])
+    # Free float: slack before the earliest successor (or project end) moves
+    free_float = project_duration - early_finish
+    np.minimum.at(free_float, pred, early_start[succ] - early_start[pred] - offset)
 
-    logger.info(
-        f"Critical path end task: '{end_task}' with path length "
-        f"{longest_path[end_task]:.2f} hours"
+    critical_path = _backtrack_critical_path(
+        task_ids, pred, succ, edge_order, early_start[pred] + offset, early_finish, levels
     )
-
-    # Backtrack to find the critical path
-    critical_path: list[str] = []
-    current: str | None = end_task
-
-    while current is not None:
-        critical_path.insert(0, current)
-        current = predecessor[current]
+    near_critical_tasks = [
+        task_ids[i]
+        for i in np.flatnonzero(
+            total_float <= near_critical_float_hours + _FLOAT_TOLERANCE_HOURS
+        )
+    ]
 
     logger.info(
         f"Critical path calculated: {len(critical_path)} tasks, "
-        f"total duration {longest_path[end_task]:.2f} hours"
+        f"{len(near_critical_tasks)} near-critical, "
+        f"total duration {project_duration:.2f} hours"
     )
 
-    return critical_path
+    return CriticalPathAnalysis(
+        task_ids=task_ids,
+        durations=durations,
+        early_start=early_start,
+        early_finish=early_finish,
+        late_start=late_start,
+        late_finish=late_finish,
+        total_float=total_float,
+        free_float=free_float,
+        project_duration=project_duration,
+        critical_path=critical_path,
+        near_critical_tasks=near_critical_tasks,
+    )
 
 
-def _has_cycle(graph: dict[str, list[str]], in_degree: dict[str, int]) -> bool:
+def _topological_levels(
+    n: int, pred: np.ndarray, succ: np.ndarray
+) -> np.ndarray | None:
     """
-    Check if the dependency graph has cycles using Kahn's algorithm.
+    Assign each task the length of the longest edge chain leading to it.
 
     Args:
-        graph: Adjacency list representation of task dependencies
-        in_degree: In-degree count for each task
+        n: Number of tasks
+        pred: Predecessor index of each edge
+        succ: Successor index of each edge
 
     Returns:
-        True if cycle detected, False otherwise
+        Level per task, or None if the graph contains a cycle
+    """
+    levels = np.zeros(n, dtype=np.int64)
+    in_degree = np.bincount(succ, minlength=n)
+
+    # Outgoing edges of each task as a CSR structure
+    out_order = np.argsort(pred, kind="stable")
+    out_targets = succ[out_order]
+    out_ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pred, minlength=n), out=out_ptr[1:])
+
+    frontier = np.flatnonzero(in_degree == 0)
+    processed = 0
+    level = 0
+    while frontier.size:
+        levels[frontier] = level
+        processed += frontier.size
+
+        targets = out_targets[_gather_ranges(out_ptr, frontier)]
+        in_degree -= np.bincount(targets, minlength=n)
+        candidates = np.unique(targets)
+        frontier = candidates[in_degree[candidates] == 0]
+        level += 1
+
+    return levels if processed == n else None
+
+
+def _gather_ranges(ptr: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """Concatenate the CSR index ranges ptr[i]:ptr[i + 1] for the given nodes"""
+    starts = ptr[nodes]
+    counts = ptr[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return offsets + np.arange(total)
+
+
+def _backtrack_critical_path(
+    task_ids: list[str],
+    pred: np.ndarray,
+    succ: np.ndarray,
+    edge_position: np.ndarray,
+    edge_start: np.ndarray,
+    early_finish: np.ndarray,
+    levels: np.ndarray,
+) -> list[str]:
     """
-    # Create a copy of in_degree to avoid modifying original
-    in_degree_copy = in_degree.copy()
+    Follow driving predecessors back from the task that finishes last.
 
-    # Queue of tasks with no dependencies
-    queue: deque[str] = deque(
-        [task_id for task_id, degree in in_degree_copy.items() if degree == 0]
+    Of several tasks finishing last, the deepest in the dependency graph is
+    taken, so a finish_to_finish successor ends the path rather than its
+    predecessor. The driving predecessor of a task is the one whose
+    dependency allows the latest successor start (edge_start); ties go to
+    the predecessor listed first in its dependencies.
+    """
+    driver = np.full(len(task_ids), -1, dtype=np.int64)
+    if pred.size:
+        order = np.lexsort((edge_position, -edge_start, succ))
+        first = np.unique(succ[order], return_index=True)[1]
+        driver[succ[order[first]]] = pred[order[first]]
+
+    # np.argmax returns the first maximum, i.e. the earliest task in input order
+    finishes_last = early_finish >= early_finish.max() - _FLOAT_TOLERANCE_HOURS
+    current = int(np.argmax(np.where(finishes_last, levels, -1)))
+    end_task = task_ids[current]
+    logger.info(
+        f"Critical path end task: '{end_task}' with path length "
+        f"{early_finish[current]:.2f} hours"
     )
 
-    processed_count = 0
-
-    while queue:
-        current = queue.popleft()
-        processed_count += 1
-
-        # Process successors
-        for neighbor in graph[current]:
-            in_degree_copy[neighbor] -= 1
-            if in_degree_copy[neighbor] == 0:
-                queue.append(neighbor)
-
-    # If not all tasks processed, there's a cycle
-    return processed_count != len(in_degree)
+    drivers = driver.tolist()
+    path: list[str] = []
+    while current != -1:
+        path.append(task_ids[current])
+        current = drivers[current]
+    path.reverse()
+    return path
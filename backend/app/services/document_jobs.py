@@ -0,0 +1,272 @@
+"""Background document generation jobs"""
+
+import asyncio
+import logging
+import os
+import socket
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.graph import get_graph_service
+from app.db.session import AsyncSessionLocal
+from app.models.user import User
+from app.schemas.document import (
+    DocumentJobStatus,
+    DocumentRecord,
+    DocumentStatus,
+    DocumentType,
+)
+from app.services.audit_service import get_audit_service
+from app.services.document_service import (
+    DOCUMENT_FORMATS,
+    DOCUMENT_REQUESTS,
+    DocumentService,
+    document_filename,
+    shutdown_document_workers,
+)
+from app.services.document_store import DocumentStore
+from app.services.signature_service import get_signature_service
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentJobQueue:
+    """
+    Runs document generation in the background.
+
+    Every job is recorded in the document store before it is queued and its
+    record is the job status: pending, generating, completed or failed. At
+    most DOCUMENT_PROCESS_WORKERS jobs run at once, each rendering in the
+    document process pool, so large exports never block request handling.
+
+    Every API worker runs its own queue against the shared store. A job is
+    generated only by the worker that claims it, and the claim is a lease
+    the worker renews while generating. Jobs left pending, or generating
+    under a lapsed lease because their worker stopped, are queued again by
+    resume(), which start() repeats once per lease period.
+    """
+
+    def __init__(
+        self,
+        store: DocumentStore | None = None,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        """
+        Initialize the job queue.
+
+        Args:
+            store: Storage for document records and files
+            session_factory: Factory for the database sessions jobs run with
+        """
+        self.store = store or DocumentStore(session_factory)
+        self._session_factory = session_factory
+        self._slots = asyncio.Semaphore(settings.DOCUMENT_PROCESS_WORKERS)
+        self._tasks: dict[UUID, asyncio.Task] = {}
+        self._owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._lease_seconds = settings.DOCUMENT_JOB_LEASE_SECONDS
+        self._recovery: asyncio.Task | None = None
+
+    async def submit(
+        self,
+        document_type: DocumentType,
+        request: Any,
+        user: User,
+    ) -> DocumentJobStatus:
+        """
+        Queue a document for background generation.
+
+        Args:
+            document_type: Type of document to generate
+            request: Generation request matching the document type
+            user: User requesting the document
+
+        Returns:
+            DocumentJobStatus of the queued job
+        """
+        now = datetime.now(UTC)
+        record = DocumentRecord(
+            id=uuid4(),
+            project_id=request.project_id,
+            document_type=document_type,
+            format=DOCUMENT_FORMATS[document_type],
+            status=DocumentStatus.PENDING,
+            filename=document_filename(document_type, request.project_id, now),
+            version="1.0",
+            metadata={},
+            generated_by=user.id,
+            submitted_at=now,
+        )
+        record = await self.store.save(record, request=request.model_dump(mode="json"))
+        self._start(record, request, user)
+
+        logger.info(f"Queued {document_type.value} document job {record.id}")
+        return self.job_status(record)
+
+    async def get(self, job_id: UUID) -> DocumentJobStatus | None:
+        """
+        Get the status of a document job.
+
+        Args:
+            job_id: Job identifier (the document ID)
+
+        Returns:
+            DocumentJobStatus, or None if the job is unknown
+        """
+        record = await self.store.get(job_id)
+        if record is None:
+            return None
+        return self.job_status(record)
+
+    def start(self) -> None:
+        """Resume unfinished jobs now and then once per lease period"""
+        if self._recovery is None or self._recovery.done():
+            self._recovery = asyncio.create_task(self._recover())
+
+    async def resume(self) -> int:
+        """
+        Queue the jobs no live worker holds.
+
+        Returns:
+            Number of jobs queued again
+        """
+        resumed = 0
+        for record, request_data in await self.store.unfinished():
+            if record.id in self._tasks:
+                continue
+            try:
+                request = DOCUMENT_REQUESTS[record.document_type].model_validate(
+                    request_data or {}
+                )
+                async with self._session_factory() as session:
+                    user = await session.get(User, record.generated_by)
+                if user is None:
+                    raise ValueError(f"User {record.generated_by} not found")
+            except Exception as e:
+                logger.error(f"Cannot resume document job {record.id}: {e}")
+                await self._fail(record, f"Cannot resume job: {e}")
+                continue
+
+            self._start(record, request, user)
+            resumed += 1
+
+        if resumed:
+            logger.info(f"Resumed {resumed} document jobs")
+        return resumed
+
+    def shutdown(self) -> None:
+        """Stop running jobs; their records stay unfinished for resume()"""
+        if self._recovery is not None:
+            self._recovery.cancel()
+            self._recovery = None
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+    @staticmethod
+    def job_status(record: DocumentRecord) -> DocumentJobStatus:
+        """Build the public status of a job from its document record"""
+        completed = record.status == DocumentStatus.COMPLETED
+        return DocumentJobStatus(
+            job_id=record.id,
+            project_id=record.project_id,
+            document_type=record.document_type,
+            format=record.format,
+            status=record.status,
+            submitted_at=record.submitted_at,
+            started_at=record.started_at,
+            finished_at=(
+                record.generated_at
+                if record.status in (DocumentStatus.COMPLETED, DocumentStatus.FAILED)
+                else None
+            ),
+            message=record.error_message,
+            download_url=f"/api/v1/documents/{record.id}/download" if completed else None,
+        )
+
+    def _start(self, record: DocumentRecord, request: Any, user: User) -> None:
+        """Run a job in a background task"""
+        task = asyncio.create_task(self._run(record, request, user))
+        self._tasks[record.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(record.id, None))
+
+    async def _recover(self) -> None:
+        """Resume unfinished jobs once per lease period"""
+        while True:
+            try:
+                await self.resume()
+            except Exception as e:
+                logger.warning(f"Could not resume document jobs: {e}")
+            await asyncio.sleep(self._lease_seconds)
+
+    async def _keep_lease(self, document_id: UUID) -> None:
+        """Renew the lease of a claimed job until cancelled"""
+        while True:
+            await asyncio.sleep(self._lease_seconds / 3)
+            if not await self.store.renew(document_id, self._owner, self._lease_seconds):
+                logger.warning(f"Lost the lease of document job {document_id}")
+                return
+
+    async def _run(self, record: DocumentRecord, request: Any, user: User) -> None:
+        """Generate the document of a job once a slot is free and it is claimed"""
+        try:
+            async with self._slots:
+                claimed = await self.store.claim(record, self._owner, self._lease_seconds)
+                if claimed is None:
+                    logger.info(f"Document job {record.id} is held by another worker")
+                    return
+                record = claimed
+                heartbeat = asyncio.create_task(self._keep_lease(record.id))
+                try:
+                    await self._generate(record, request, user)
+                finally:
+                    heartbeat.cancel()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Document job {record.id} failed: {e}")
+            await self._fail(record, str(e))
+
+    async def _generate(self, record: DocumentRecord, request: Any, user: User) -> None:
+        """Generate and store the document of a claimed job"""
+        async with self._session_factory() as db:
+            service = DocumentService(
+                graph_service=await get_graph_service(),
+                audit_service=await get_audit_service(db),
+                signature_service=await get_signature_service(db),
+                document_store=self.store,
+            )
+            await service.generate(
+                record.document_type, request, user, document_id=record.id
+            )
+            await db.commit()
+
+    async def _fail(self, record: DocumentRecord, message: str) -> None:
+        """Record a job as failed"""
+        await self.store.save(record.model_copy(update={
+            "status": DocumentStatus.FAILED,
+            "error_message": message,
+            "generated_at": datetime.now(UTC),
+        }))
+
+
+_document_job_queue: DocumentJobQueue | None = None
+
+
+def get_document_job_queue() -> DocumentJobQueue:
+    """Dependency for getting the document job queue"""
+    global _document_job_queue
+    if _document_job_queue is None:
+        _document_job_queue = DocumentJobQueue()
+    return _document_job_queue
+
+
+def shutdown_document_jobs() -> None:
+    """Stop document jobs and release the document worker processes"""
+    if _document_job_queue is not None:
+        _document_job_queue.shutdown()
+    shutdown_document_workers()
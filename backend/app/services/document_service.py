@@ -7,11 +7,17 @@ This service handles generation of various document types including:
 - FMEA Excel files (openpyxl)
 - Invoice Word documents (python-docx-template)
 
+Rendering is CPU-bound and runs in a process pool; generated files are
+stored content-addressed and their records persisted (see DocumentStore).
+
 Implements Requirement 8 (Document Generation).
 """
 
+import asyncio
 import hashlib
 import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -34,6 +40,7 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+from app.core.config import settings
 from app.db.graph import GraphService
 from app.models.user import User
 from app.schemas.document import (
@@ -52,11 +59,40 @@ from app.schemas.document import (
     TraceabilityMatrixResponse,
 )
 from app.services.audit_service import AuditService
+from app.services.document_store import DocumentStore, artifact_path, write_artifact
 from app.services.signature_service import SignatureService
 
 # Default template directory
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 
+# Output format of each document type
+DOCUMENT_FORMATS = {
+    DocumentType.DESIGN_REVIEW: DocumentFormat.PDF,
+    DocumentType.TRACEABILITY_MATRIX: DocumentFormat.PDF,
+    DocumentType.FMEA: DocumentFormat.EXCEL,
+    DocumentType.INVOICE: DocumentFormat.WORD,
+}
+
+# Generation request schema of each document type
+DOCUMENT_REQUESTS = {
+    DocumentType.DESIGN_REVIEW: DesignReviewRequest,
+    DocumentType.TRACEABILITY_MATRIX: TraceabilityMatrixRequest,
+    DocumentType.FMEA: FMEARequest,
+    DocumentType.INVOICE: InvoiceRequest,
+}
+
+_FILE_EXTENSIONS = {
+    DocumentFormat.PDF: "pdf",
+    DocumentFormat.EXCEL: "xlsx",
+    DocumentFormat.WORD: "docx",
+}
+
+
+def document_filename(document_type: DocumentType, project_id: UUID, now: datetime) -> str:
+    """Download filename of a document generated at a given time"""
+    extension = _FILE_EXTENSIONS[DOCUMENT_FORMATS[document_type]]
+    return f"{document_type.value}_{project_id}_{now.strftime('%Y%m%d_%H%M%S')}.{extension}"
+
 
 class DocumentService:
     """
@@ -72,6 +108,7 @@ class DocumentService:
         audit_service: AuditService,
         signature_service: SignatureService,
         template_dir: Path | None = None,
+        document_store: DocumentStore | None = None,
     ):
         """
         Initialize DocumentService.
@@ -81,20 +118,20 @@ class DocumentService:
             audit_service: Service for audit logging
             signature_service: Service for digital signature operations
             template_dir: Directory containing document templates
+            document_store: Storage for document records and files
         """
         self.graph_service = graph_service
         self.audit_service = audit_service
         self.signature_service = signature_service
         self.template_dir = template_dir or TEMPLATE_DIR
-
-        # Document storage (in production, use proper storage service)
-        self._document_store: dict[UUID, DocumentRecord] = {}
+        self.document_store = document_store or DocumentStore()
 
     # ========================================================================
     # Helper Methods
     # ========================================================================
 
-    def _get_styles(self) -> dict[str, ParagraphStyle]:
+    @staticmethod
+    def _get_styles() -> dict[str, ParagraphStyle]:
         """Get custom paragraph styles for PDF generation."""
         styles = getSampleStyleSheet()
 
@@ -128,7 +165,8 @@ class DocumentService:
 
         return styles
 
-    def _create_header_table_style(self) -> TableStyle:
+    @staticmethod
+    def _create_header_table_style() -> TableStyle:
         """Create standard table style with header formatting."""
         return TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
@@ -161,13 +199,12 @@ class DocumentService:
         document_type: DocumentType,
         format: DocumentFormat,
         filename: str,
-        content: bytes,
+        content_hash: str,
+        file_size_bytes: int,
         user: User,
         metadata: dict[str, Any],
     ) -> DocumentRecord:
-        """Store generated document and create record."""
-        content_hash = self._calculate_content_hash(content)
-
+        """Create the record of a generated document file."""
         record = DocumentRecord(
             id=document_id,
             project_id=project_id,
@@ -175,8 +212,8 @@ class DocumentService:
             format=format,
             status=DocumentStatus.COMPLETED,
             filename=filename,
-            file_path=f"/documents/{document_id}/{filename}",
-            file_size_bytes=len(content),
+            file_path=str(artifact_path(self.document_store.artifact_dir, content_hash)),
+            file_size_bytes=file_size_bytes,
             content_hash=content_hash,
             version="1.0",
             metadata=metadata,
@@ -184,10 +221,48 @@ class DocumentService:
             generated_by=user.id,
         )
 
-        # Store document (in production, use proper storage)
-        self._document_store[document_id] = record
+        return await self.document_store.save(record)
 
-        return record
+    async def _render(
+        self,
+        document_type: DocumentType,
+        payload: dict[str, Any],
+    ) -> tuple[str, int]:
+        """Render a document in the process pool and store its file."""
+        future = _get_process_pool().submit(
+            _render_document_in_process,
+            document_type.value,
+            payload,
+            str(self.document_store.artifact_dir),
+        )
+        return await asyncio.wrap_future(future)
+
+    async def generate(
+        self,
+        document_type: DocumentType,
+        request: Any,
+        user: User,
+        document_id: UUID | None = None,
+    ) -> Any:
+        """
+        Generate a document of any type.
+
+        Args:
+            document_type: Type of document to generate
+            request: Generation request matching the document type
+            user: User generating the document
+            document_id: ID of a queued document job (a new ID when None)
+
+        Returns:
+            Generation response of the document type
+        """
+        generators = {
+            DocumentType.DESIGN_REVIEW: self.generate_design_review_pdf,
+            DocumentType.TRACEABILITY_MATRIX: self.generate_traceability_matrix_pdf,
+            DocumentType.FMEA: self.generate_fmea_excel,
+            DocumentType.INVOICE: self.generate_invoice_word,
+        }
+        return await generators[document_type](request, user, document_id=document_id)
 
     async def _get_requirements_for_project(
         self,
@@ -214,6 +289,22 @@ class DocumentService:
     ) -> list[dict[str, Any]]:
         """Get signatures for a workitem."""
         signatures = await self.signature_service.get_workitem_signatures(workitem_id)
+        return self._format_signatures(signatures)
+
+    async def _get_signatures_for_workitems(
+        self,
+        workitem_ids: list[UUID],
+    ) -> dict[UUID, list[dict[str, Any]]]:
+        """Get signatures for many workitems with one query."""
+        signatures = await self.signature_service.get_signatures_for_workitems(workitem_ids)
+        return {
+            workitem_id: self._format_signatures(workitem_signatures)
+            for workitem_id, workitem_signatures in signatures.items()
+        }
+
+    @staticmethod
+    def _format_signatures(signatures: list[Any]) -> list[dict[str, Any]]:
+        """Format signatures for PDF output."""
         return [
             {
                 'signer_name': sig.user_name if hasattr(sig, 'user_name') else 'Unknown',
@@ -232,6 +323,7 @@ class DocumentService:
         self,
         request: DesignReviewRequest,
         user: User,
+        document_id: UUID | None = None,
     ) -> DesignReviewResponse:
         """
         Generate a design phase review PDF document.
@@ -239,11 +331,12 @@ class DocumentService:
         Args:
             request: Design review generation request
             user: User generating the document
+            document_id: ID of a queued document job (a new ID when None)
 
         Returns:
             Design review response with document details
         """
-        document_id = uuid4()
+        document_id = document_id or uuid4()
         now = datetime.now(UTC)
 
         # Get requirements
@@ -252,7 +345,85 @@ class DocumentService:
             request.requirement_ids,
         )
 
-        # Create PDF
+        # Load the signatures of all requirements at once
+        signatures_by_requirement: dict[UUID, list[dict[str, Any]]] = {}
+        if request.include_signatures:
+            try:
+                signatures_by_requirement = await self._get_signatures_for_workitems([
+                    UUID(str(req['id'])) for req in requirements if req.get('id')
+                ])
+            except Exception:
+                pass  # Skip signatures if error
+
+        signatures: list[list[dict[str, Any]]] = []
+        for req in requirements:
+            try:
+                signatures.append(
+                    signatures_by_requirement.get(UUID(str(req.get('id', 'N/A'))), [])
+                )
+            except Exception:
+                signatures.append([])  # Skip signatures if error
+        total_signatures = sum(len(sigs) for sigs in signatures)
+
+        content_hash, file_size = await self._render(DocumentType.DESIGN_REVIEW, {
+            'title': request.title or "Design Phase Review",
+            'project_id': str(request.project_id),
+            'generated': now.strftime('%Y-%m-%d %H:%M:%S UTC'),
+            'generated_by': user.full_name,
+            'include_signatures': request.include_signatures,
+            'requirements': requirements,
+            'signatures': signatures,
+        })
+
+        # Generate filename
+        filename = document_filename(DocumentType.DESIGN_REVIEW, request.project_id, now)
+
+        # Store document
+        await self._store_document(
+            document_id=document_id,
+            project_id=request.project_id,
+            document_type=DocumentType.DESIGN_REVIEW,
+            format=DocumentFormat.PDF,
+            filename=filename,
+            content_hash=content_hash,
+            file_size_bytes=file_size,
+            user=user,
+            metadata={
+                'requirement_count': len(requirements),
+                'signature_count': total_signatures,
+                'include_signatures': request.include_signatures,
+            },
+        )
+
+        # Log audit event
+        await self.audit_service.log(
+            user_id=user.id,
+            action="GENERATE",
+            entity_type="Document",
+            entity_id=document_id,
+            details={
+                'document_type': DocumentType.DESIGN_REVIEW.value,
+                'project_id': str(request.project_id),
+                'requirement_count': len(requirements),
+            },
+        )
+
+        return DesignReviewResponse(
+            document_id=document_id,
+            project_id=request.project_id,
+            status=DocumentStatus.COMPLETED,
+            filename=filename,
+            file_size_bytes=file_size,
+            requirement_count=len(requirements),
+            signature_count=total_signatures,
+            generated_at=now,
+            generated_by=user.id,
+            download_url=f"/api/v1/documents/{document_id}",
+        )
+
+    @classmethod
+    def _render_design_review(cls, payload: dict[str, Any]) -> bytes:
+        """Build the design review PDF (runs in a document worker process)."""
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(
             buffer,
@@ -263,25 +434,23 @@ class DocumentService:
             bottomMargin=72,
         )
 
-        styles = self._get_styles()
+        styles = cls._get_styles()
         story = []
+        requirements = payload['requirements']
 
         # Title
-        title = request.title or "Design Phase Review"
-        story.append(Paragraph(title, styles['CustomTitle']))
+        story.append(Paragraph(payload['title'], styles['CustomTitle']))
         story.append(Spacer(1, 12))
 
         # Metadata section
-        story.append(Paragraph(f"Project ID: {request.project_id}", styles['CustomBody']))
-        story.append(Paragraph(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}", styles['CustomBody']))
-        story.append(Paragraph(f"Generated By: {user.full_name}", styles['CustomBody']))
+        story.append(Paragraph(f"Project ID: {payload['project_id']}", styles['CustomBody']))
+        story.append(Paragraph(f"Generated: {payload['generated']}", styles['CustomBody']))
+        story.append(Paragraph(f"Generated By: {payload['generated_by']}", styles['CustomBody']))
         story.append(Paragraph(f"Total Requirements: {len(requirements)}", styles['CustomBody']))
         story.append(Spacer(1, 24))
 
         # Requirements section
-        total_signatures = 0
-
-        for i, req in enumerate(requirements, 1):
+        for i, (req, signatures) in enumerate(zip(requirements, payload['signatures'], strict=True), 1):
             # Requirement header
             req_title = req.get('title', 'Untitled Requirement')
             req_id = req.get('id', 'N/A')
@@ -300,7 +469,7 @@ class DocumentService:
             ]
 
             details_table = Table(details_data, colWidths=[2*inch, 4*inch])
-            details_table.setStyle(self._create_header_table_style())
+            details_table.setStyle(cls._create_header_table_style())
             story.append(details_table)
             story.append(Spacer(1, 12))
 
@@ -311,49 +480,103 @@ class DocumentService:
             story.append(Spacer(1, 12))
 
             # Signatures section
-            if request.include_signatures:
-                try:
-                    signatures = await self._get_signatures_for_workitem(UUID(str(req_id)))
-                    if signatures:
-                        total_signatures += len(signatures)
-                        sig_data = [['Signer', 'Date', 'Version', 'Status']]
-                        for sig in signatures:
-                            sig_data.append([
-                                sig['signer_name'],
-                                sig['signed_at'][:19] if sig['signed_at'] else 'N/A',
-                                sig['version'],
-                                'Valid' if sig['is_valid'] else 'Invalid',
-                            ])
-
-                        sig_table = Table(sig_data, colWidths=[1.5*inch, 2*inch, 1*inch, 1*inch])
-                        sig_table.setStyle(self._create_header_table_style())
-                        story.append(Paragraph("Digital Signatures:", styles['CustomBody']))
-                        story.append(sig_table)
-                except Exception:
-                    pass  # Skip signatures if error
+            if payload['include_signatures'] and signatures:
+                sig_data = [['Signer', 'Date', 'Version', 'Status']]
+                for sig in signatures:
+                    sig_data.append([
+                        sig['signer_name'],
+                        sig['signed_at'][:19] if sig['signed_at'] else 'N/A',
+                        sig['version'],
+                        'Valid' if sig['is_valid'] else 'Invalid',
+                    ])
+
+                sig_table = Table(sig_data, colWidths=[1.5*inch, 2*inch, 1*inch, 1*inch])
+                sig_table.setStyle(cls._create_header_table_style())
+                story.append(Paragraph("Digital Signatures:", styles['CustomBody']))
+                story.append(sig_table)
 
             story.append(Spacer(1, 24))
 
         # Build PDF
         doc.build(story)
-        content = buffer.getvalue()
+        return buffer.getvalue()
+
+    # ========================================================================
+    # Traceability Matrix PDF Generation
+    # ========================================================================
+
+    async def generate_traceability_matrix_pdf(
+        self,
+        request: TraceabilityMatrixRequest,
+        user: User,
+        document_id: UUID | None = None,
+    ) -> TraceabilityMatrixResponse:
+        """
+        Generate a requirements traceability matrix PDF.
+
+        Args:
+            request: Traceability matrix generation request
+            user: User generating the document
+            document_id: ID of a queued document job (a new ID when None)
+
+        Returns:
+            Traceability matrix response with document details
+        """
+        document_id = document_id or uuid4()
+        now = datetime.now(UTC)
+
+        # Get traceability data from graph
+        matrix = await self.graph_service.get_traceability(str(request.project_id))
+        requirement_ids = (
+            [str(rid) for rid in request.requirement_ids]
+            if request.requirement_ids
+            else None
+        )
+        matrix_data = matrix.rows(requirement_ids)
+        stats = matrix.coverage_stats(requirement_ids)
+
+        content_hash, file_size = await self._render(DocumentType.TRACEABILITY_MATRIX, {
+            'project_id': str(request.project_id),
+            'generated': now.strftime('%Y-%m-%d %H:%M:%S UTC'),
+            'generated_by': user.full_name,
+            'include_tests': request.include_tests,
+            'include_risks': request.include_risks,
+            'include_signatures': request.include_signatures,
+            'rows': [
+                {
+                    'requirement_title': row.get('requirement_title', 'Unknown'),
+                    'test_ids': row.get('test_ids', []),
+                    'risk_ids': row.get('risk_ids', []),
+                    'is_signed': row.get('is_signed', False),
+                }
+                for row in matrix_data
+            ],
+            'stats': stats,
+        })
+
+        total_requirements = stats['total_requirements']
+        coverage = stats['test_coverage_percentage']
+        test_count = stats['total_tests']
+        risk_count = stats['total_risks']
 
         # Generate filename
-        filename = f"design_review_{request.project_id}_{now.strftime('%Y%m%d_%H%M%S')}.pdf"
+        filename = document_filename(DocumentType.TRACEABILITY_MATRIX, request.project_id, now)
 
         # Store document
         await self._store_document(
             document_id=document_id,
             project_id=request.project_id,
-            document_type=DocumentType.DESIGN_REVIEW,
+            document_type=DocumentType.TRACEABILITY_MATRIX,
             format=DocumentFormat.PDF,
             filename=filename,
-            content=content,
+            content_hash=content_hash,
+            file_size_bytes=file_size,
             user=user,
             metadata={
-                'requirement_count': len(requirements),
-                'signature_count': total_signatures,
-                'include_signatures': request.include_signatures,
+                'requirement_count': total_requirements,
+                'test_count': test_count,
+                'risk_count': risk_count,
+                'coverage_percentage': coverage,
             },
         )
 
@@ -364,56 +587,30 @@ class DocumentService:
             entity_type="Document",
             entity_id=document_id,
             details={
-                'document_type': DocumentType.DESIGN_REVIEW.value,
+                'document_type': DocumentType.TRACEABILITY_MATRIX.value,
                 'project_id': str(request.project_id),
-                'requirement_count': len(requirements),
+                'requirement_count': total_requirements,
             },
         )
 
-        return DesignReviewResponse(
+        return TraceabilityMatrixResponse(
             document_id=document_id,
             project_id=request.project_id,
             status=DocumentStatus.COMPLETED,
             filename=filename,
-            file_size_bytes=len(content),
-            requirement_count=len(requirements),
-            signature_count=total_signatures,
+            file_size_bytes=file_size,
+            requirement_count=total_requirements,
+            test_count=test_count,
+            risk_count=risk_count,
+            coverage_percentage=coverage,
             generated_at=now,
             generated_by=user.id,
             download_url=f"/api/v1/documents/{document_id}",
         )
 
-    # ========================================================================
-    # Traceability Matrix PDF Generation
-    # ========================================================================
-
-    async def generate_traceability_matrix_pdf(
-        self,
-        request: TraceabilityMatrixRequest,
-        user: User,
-    ) -> TraceabilityMatrixResponse:
-        """
-        Generate a requirements traceability matrix PDF.
-
-        Args:
-            request: Traceability matrix generation request
-            user: User generating the document
-
-        Returns:
-            Traceability matrix response with document details
-        """
-        document_id = uuid4()
-        now = datetime.now(UTC)
-
-        # Get traceability data from graph
-        matrix_data = await self.graph_service.get_traceability_matrix(str(request.project_id))
-
-        # Filter by specific requirement IDs if provided
-        if request.requirement_ids:
-            id_set = {str(rid) for rid in request.requirement_ids}
-            matrix_data = [row for row in matrix_data if row.get('requirement_id') in id_set]
-
-        # Create PDF
+    @classmethod
+    def _render_traceability_matrix(cls, payload: dict[str, Any]) -> bytes:
+        """Build the traceability matrix PDF (runs in a document worker process)."""
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(
             buffer,
@@ -424,7 +621,7 @@ class DocumentService:
             bottomMargin=72,
         )
 
-        styles = self._get_styles()
+        styles = cls._get_styles()
         story = []
 
         # Title
@@ -432,44 +629,35 @@ class DocumentService:
         story.append(Spacer(1, 12))
 
         # Metadata
-        story.append(Paragraph(f"Project ID: {request.project_id}", styles['CustomBody']))
-        story.append(Paragraph(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}", styles['CustomBody']))
-        story.append(Paragraph(f"Generated By: {user.full_name}", styles['CustomBody']))
+        story.append(Paragraph(f"Project ID: {payload['project_id']}", styles['CustomBody']))
+        story.append(Paragraph(f"Generated: {payload['generated']}", styles['CustomBody']))
+        story.append(Paragraph(f"Generated By: {payload['generated_by']}", styles['CustomBody']))
         story.append(Spacer(1, 24))
 
         # Build table data
         headers = ['Requirement']
-        if request.include_tests:
+        if payload['include_tests']:
             headers.append('Tests')
-        if request.include_risks:
+        if payload['include_risks']:
             headers.append('Risks')
-        if request.include_signatures:
+        if payload['include_signatures']:
             headers.append('Signed')
 
         table_data = [headers]
 
-        test_count = 0
-        risk_count = 0
-        covered_count = 0
-
-        for row in matrix_data:
-            row_data = [row.get('requirement_title', 'Unknown')[:50]]
+        for row in payload['rows']:
+            row_data = [row['requirement_title'][:50]]
 
-            if request.include_tests:
-                tests = row.get('test_ids', [])
-                test_count += len(tests)
-                if tests:
-                    covered_count += 1
+            if payload['include_tests']:
+                tests = row['test_ids']
                 row_data.append(', '.join(tests[:3]) + ('...' if len(tests) > 3 else '') if tests else 'None')
 
-            if request.include_risks:
-                risks = row.get('risk_ids', [])
-                risk_count += len(risks)
+            if payload['include_risks']:
+                risks = row['risk_ids']
                 row_data.append(', '.join(risks[:3]) + ('...' if len(risks) > 3 else '') if risks else 'None')
 
-            if request.include_signatures:
-                is_signed = row.get('is_signed', False)
-                row_data.append('Yes' if is_signed else 'No')
+            if payload['include_signatures']:
+                row_data.append('Yes' if row['is_signed'] else 'No')
 
             table_data.append(row_data)
 
@@ -480,78 +668,28 @@ class DocumentService:
 
         # Create table
         table = Table(table_data, colWidths=col_widths)
-        table.setStyle(self._create_header_table_style())
+        table.setStyle(cls._create_header_table_style())
         story.append(table)
         story.append(Spacer(1, 24))
 
         # Summary section
-        total_requirements = len(matrix_data)
-        coverage = (covered_count / total_requirements * 100) if total_requirements > 0 else 0
-
+        stats = payload['stats']
         story.append(Paragraph("Summary", styles['CustomHeading']))
         summary_data = [
             ['Metric', 'Value'],
-            ['Total Requirements', str(total_requirements)],
-            ['Requirements with Tests', str(covered_count)],
-            ['Test Coverage', f"{coverage:.1f}%"],
-            ['Total Tests', str(test_count)],
-            ['Total Risks', str(risk_count)],
+            ['Total Requirements', str(stats['total_requirements'])],
+            ['Requirements with Tests', str(stats['requirements_with_tests'])],
+            ['Test Coverage', f"{stats['test_coverage_percentage']:.1f}%"],
+            ['Total Tests', str(stats['total_tests'])],
+            ['Total Risks', str(stats['total_risks'])],
         ]
         summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-        summary_table.setStyle(self._create_header_table_style())
+        summary_table.setStyle(cls._create_header_table_style())
         story.append(summary_table)
 
         # Build PDF
         doc.build(story)
-        content = buffer.getvalue()
-
-        # Generate filename
-        filename = f"traceability_matrix_{request.project_id}_{now.strftime('%Y%m%d_%H%M%S')}.pdf"
-
-        # Store document
-        await self._store_document(
-            document_id=document_id,
-            project_id=request.project_id,
-            document_type=DocumentType.TRACEABILITY_MATRIX,
-            format=DocumentFormat.PDF,
-            filename=filename,
-            content=content,
-            user=user,
-            metadata={
-                'requirement_count': total_requirements,
-                'test_count': test_count,
-                'risk_count': risk_count,
-                'coverage_percentage': coverage,
-            },
-        )
-
-        # Log audit event
-        await self.audit_service.log(
-            user_id=user.id,
-            action="GENERATE",
-            entity_type="Document",
-            entity_id=document_id,
-            details={
-                'document_type': DocumentType.TRACEABILITY_MATRIX.value,
-                'project_id': str(request.project_id),
-                'requirement_count': total_requirements,
-            },
-        )
-
-        return TraceabilityMatrixResponse(
-            document_id=document_id,
-            project_id=request.project_id,
-            status=DocumentStatus.COMPLETED,
-            filename=filename,
-            file_size_bytes=len(content),
-            requirement_count=total_requirements,
-            test_count=test_count,
-            risk_count=risk_count,
-            coverage_percentage=coverage,
-            generated_at=now,
-            generated_by=user.id,
-            download_url=f"/api/v1/documents/{document_id}",
-        )
+        return buffer.getvalue()
 
     # ========================================================================
     # FMEA Excel Generation
@@ -561,6 +699,7 @@ class DocumentService:
         self,
         request: FMEARequest,
         user: User,
+        document_id: UUID | None = None,
     ) -> FMEAResponse:
         """
         Generate an FMEA Excel document with risk chains.
@@ -568,11 +707,12 @@ class DocumentService:
         Args:
             request: FMEA generation request
             user: User generating the document
+            document_id: ID of a queued document job (a new ID when None)
 
         Returns:
             FMEA response with document details
         """
-        document_id = uuid4()
+        document_id = document_id or uuid4()
         now = datetime.now(UTC)
 
         # Get all risks from graph
@@ -587,24 +727,6 @@ class DocumentService:
         if request.min_rpn:
             risks = [r for r in risks if r.get('rpn', 0) >= request.min_rpn]
 
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "FMEA Analysis"
-
-        # Define styles
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="2C5282", end_color="2C5282", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        cell_alignment = Alignment(vertical="top", wrap_text=True)
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin'),
-        )
-
         # Headers
         headers = [
             'Risk ID',
@@ -627,44 +749,15 @@ class DocumentService:
         if request.include_mitigations:
             headers.extend(['Mitigation Actions', 'Mitigation Status'])
 
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-
-        # Set column widths
-        column_widths = {
-            'A': 15,  # Risk ID
-            'B': 25,  # Title
-            'C': 40,  # Description
-            'D': 25,  # Failure Mode
-            'E': 25,  # Failure Effect
-            'F': 25,  # Failure Cause
-            'G': 12,  # Severity
-            'H': 12,  # Occurrence
-            'I': 12,  # Detection
-            'J': 10,  # RPN
-            'K': 12,  # Risk Level
-            'L': 30,  # Current Controls
-            'M': 40,  # Failure Chain
-            'N': 40,  # Mitigation Actions
-            'O': 15,  # Mitigation Status
-        }
-
-        for col_letter, width in column_widths.items():
-            ws.column_dimensions[col_letter].width = width
-
         # Track statistics
         failure_count = 0
         mitigation_count = 0
         total_rpn = 0
         max_rpn = 0
 
-        # Write risk data
-        for row_idx, risk in enumerate(risks, 2):
+        # Collect risk rows
+        rows: list[list[Any]] = []
+        for risk in risks:
             rpn = risk.get('rpn', 0)
             total_rpn += rpn
             max_rpn = max(max_rpn, rpn)
@@ -728,57 +821,29 @@ class DocumentService:
                 else:
                     row_data.extend(['None', 'N/A'])
 
-            # Write row
-            for col, value in enumerate(row_data, 1):
-                cell = ws.cell(row=row_idx, column=col, value=value)
-                cell.alignment = cell_alignment
-                cell.border = thin_border
-
-                # Color code RPN column
-                if col == 10:  # RPN column
-                    if value >= 200:
-                        cell.fill = PatternFill(start_color="FC8181", end_color="FC8181", fill_type="solid")
-                    elif value >= 100:
-                        cell.fill = PatternFill(start_color="F6AD55", end_color="F6AD55", fill_type="solid")
-                    elif value >= 50:
-                        cell.fill = PatternFill(start_color="FAF089", end_color="FAF089", fill_type="solid")
-                    else:
-                        cell.fill = PatternFill(start_color="9AE6B4", end_color="9AE6B4", fill_type="solid")
-
-        # Freeze header row
-        ws.freeze_panes = 'A2'
-
-        # Add summary sheet
-        summary_ws = wb.create_sheet(title="Summary")
-        summary_data = [
-            ['FMEA Summary Report', ''],
-            ['', ''],
-            ['Project ID', str(request.project_id)],
-            ['Generated', now.strftime('%Y-%m-%d %H:%M:%S UTC')],
-            ['Generated By', user.full_name],
-            ['', ''],
-            ['Statistics', ''],
-            ['Total Risks', len(risks)],
-            ['Total Failures', failure_count],
-            ['Total Mitigations', mitigation_count],
-            ['Average RPN', f"{total_rpn / len(risks):.1f}" if risks else "0"],
-            ['Maximum RPN', max_rpn],
-        ]
-
-        for row_idx, (label, value) in enumerate(summary_data, 1):
-            summary_ws.cell(row=row_idx, column=1, value=label)
-            summary_ws.cell(row=row_idx, column=2, value=value)
-
-        summary_ws.column_dimensions['A'].width = 20
-        summary_ws.column_dimensions['B'].width = 40
-
-        # Save to buffer
-        buffer = io.BytesIO()
-        wb.save(buffer)
-        content = buffer.getvalue()
+            rows.append(row_data)
+
+        content_hash, file_size = await self._render(DocumentType.FMEA, {
+            'headers': headers,
+            'rows': rows,
+            'summary': [
+                ['FMEA Summary Report', ''],
+                ['', ''],
+                ['Project ID', str(request.project_id)],
+                ['Generated', now.strftime('%Y-%m-%d %H:%M:%S UTC')],
+                ['Generated By', user.full_name],
+                ['', ''],
+                ['Statistics', ''],
+                ['Total Risks', len(risks)],
+                ['Total Failures', failure_count],
+                ['Total Mitigations', mitigation_count],
+                ['Average RPN', f"{total_rpn / len(risks):.1f}" if risks else "0"],
+                ['Maximum RPN', max_rpn],
+            ],
+        })
 
         # Generate filename
-        filename = f"fmea_{request.project_id}_{now.strftime('%Y%m%d_%H%M%S')}.xlsx"
+        filename = document_filename(DocumentType.FMEA, request.project_id, now)
 
         # Store document
         await self._store_document(
@@ -787,7 +852,8 @@ class DocumentService:
             document_type=DocumentType.FMEA,
             format=DocumentFormat.EXCEL,
             filename=filename,
-            content=content,
+            content_hash=content_hash,
+            file_size_bytes=file_size,
             user=user,
             metadata={
                 'risk_count': len(risks),
@@ -816,7 +882,7 @@ class DocumentService:
             project_id=request.project_id,
             status=DocumentStatus.COMPLETED,
             filename=filename,
-            file_size_bytes=len(content),
+            file_size_bytes=file_size,
             risk_count=len(risks),
             failure_count=failure_count,
             mitigation_count=mitigation_count,
@@ -827,6 +893,92 @@ class DocumentService:
             download_url=f"/api/v1/documents/{document_id}",
         )
 
+    @staticmethod
+    def _render_fmea(payload: dict[str, Any]) -> bytes:
+        """Build the FMEA workbook (runs in a document worker process)."""
+        # Create workbook
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "FMEA Analysis"
+
+        # Define styles
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="2C5282", end_color="2C5282", fill_type="solid")
+        header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+        cell_alignment = Alignment(vertical="top", wrap_text=True)
+        thin_border = Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin'),
+        )
+
+        # Write headers
+        for col, header in enumerate(payload['headers'], 1):
+            cell = ws.cell(row=1, column=col, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
+            cell.border = thin_border
+
+        # Set column widths
+        column_widths = {
+            'A': 15,  # Risk ID
+            'B': 25,  # Title
+            'C': 40,  # Description
+            'D': 25,  # Failure Mode
+            'E': 25,  # Failure Effect
+            'F': 25,  # Failure Cause
+            'G': 12,  # Severity
+            'H': 12,  # Occurrence
+            'I': 12,  # Detection
+            'J': 10,  # RPN
+            'K': 12,  # Risk Level
+            'L': 30,  # Current Controls
+            'M': 40,  # Failure Chain
+            'N': 40,  # Mitigation Actions
+            'O': 15,  # Mitigation Status
+        }
+
+        for col_letter, width in column_widths.items():
+            ws.column_dimensions[col_letter].width = width
+
+        # Write risk data
+        for row_idx, row_data in enumerate(payload['rows'], 2):
+            for col, value in enumerate(row_data, 1):
+                cell = ws.cell(row=row_idx, column=col, value=value)
+                cell.alignment = cell_alignment
+                cell.border = thin_border
+
+                # Color code RPN column
+                if col == 10:  # RPN column
+                    if value >= 200:
+                        cell.fill = PatternFill(start_color="FC8181", end_color="FC8181", fill_type="solid")
+                    elif value >= 100:
+                        cell.fill = PatternFill(start_color="F6AD55", end_color="F6AD55", fill_type="solid")
+                    elif value >= 50:
+                        cell.fill = PatternFill(start_color="FAF089", end_color="FAF089", fill_type="solid")
+                    else:
+                        cell.fill = PatternFill(start_color="9AE6B4", end_color="9AE6B4", fill_type="solid")
+
+        # Freeze header row
+        ws.freeze_panes = 'A2'
+
+        # Add summary sheet
+        summary_ws = wb.create_sheet(title="Summary")
+        for row_idx, (label, value) in enumerate(payload['summary'], 1):
+            summary_ws.cell(row=row_idx, column=1, value=label)
+            summary_ws.cell(row=row_idx, column=2, value=value)
+
+        summary_ws.column_dimensions['A'].width = 20
+        summary_ws.column_dimensions['B'].width = 40
+
+        # Save to buffer
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        return buffer.getvalue()
+
     # ========================================================================
     # Invoice Word Document Generation
     # ========================================================================
@@ -835,6 +987,7 @@ class DocumentService:
         self,
         request: InvoiceRequest,
         user: User,
+        document_id: UUID | None = None,
     ) -> InvoiceResponse:
         """
         Generate an invoice Word document using a template.
@@ -842,11 +995,12 @@ class DocumentService:
         Args:
             request: Invoice generation request
             user: User generating the document
+            document_id: ID of a queued document job (a new ID when None)
 
         Returns:
             Invoice response with document details
         """
-        document_id = uuid4()
+        document_id = document_id or uuid4()
         now = datetime.now(UTC)
 
         # Get time entries for the billing period
@@ -889,160 +1043,37 @@ class DocumentService:
         tax_amount = subtotal * request.tax_rate
         total_amount = subtotal + tax_amount
 
-        # Try to load template, or create simple document
-        try:
-            template_path = self.template_dir / f"{request.template_name}.docx"
-            if template_path.exists():
-                doc = DocxTemplate(str(template_path))
-            else:
-                # Create a simple document without template
-                content = self._create_simple_invoice_content(
-                    request=request,
-                    line_items=line_items,
-                    subtotal=subtotal,
-                    tax_amount=tax_amount,
-                    total_amount=total_amount,
-                    total_hours=total_hours,
-                    user=user,
-                    now=now,
-                )
-                filename = f"invoice_{request.project_id}_{now.strftime('%Y%m%d_%H%M%S')}.docx"
-
-                await self._store_document(
-                    document_id=document_id,
-                    project_id=request.project_id,
-                    document_type=DocumentType.INVOICE,
-                    format=DocumentFormat.WORD,
-                    filename=filename,
-                    content=content,
-                    user=user,
-                    metadata={
-                        'billing_period_start': request.billing_period.start_date.isoformat(),
-                        'billing_period_end': request.billing_period.end_date.isoformat(),
-                        'total_hours': total_hours,
-                        'subtotal': subtotal,
-                        'tax_amount': tax_amount,
-                        'total_amount': total_amount,
-                    },
-                )
-
-                await self.audit_service.log(
-                    user_id=user.id,
-                    action="GENERATE",
-                    entity_type="Document",
-                    entity_id=document_id,
-                    details={
-                        'document_type': DocumentType.INVOICE.value,
-                        'project_id': str(request.project_id),
-                        'total_amount': total_amount,
-                    },
-                )
-
-                return InvoiceResponse(
-                    document_id=document_id,
-                    project_id=request.project_id,
-                    status=DocumentStatus.COMPLETED,
-                    filename=filename,
-                    file_size_bytes=len(content),
-                    billing_period_start=request.billing_period.start_date,
-                    billing_period_end=request.billing_period.end_date,
-                    total_hours=total_hours,
-                    subtotal=subtotal,
-                    tax_amount=tax_amount,
-                    total_amount=total_amount,
-                    line_item_count=len(line_items),
-                    generated_at=now,
-                    generated_by=user.id,
-                    download_url=f"/api/v1/documents/{document_id}",
-                )
-        except Exception:
-            # Fall back to simple document
-            content = self._create_simple_invoice_content(
-                request=request,
-                line_items=line_items,
-                subtotal=subtotal,
-                tax_amount=tax_amount,
-                total_amount=total_amount,
-                total_hours=total_hours,
-                user=user,
-                now=now,
-            )
-            filename = f"invoice_{request.project_id}_{now.strftime('%Y%m%d_%H%M%S')}.docx"
-
-            await self._store_document(
-                document_id=document_id,
-                project_id=request.project_id,
-                document_type=DocumentType.INVOICE,
-                format=DocumentFormat.WORD,
-                filename=filename,
-                content=content,
-                user=user,
-                metadata={
-                    'billing_period_start': request.billing_period.start_date.isoformat(),
-                    'billing_period_end': request.billing_period.end_date.isoformat(),
-                    'total_hours': total_hours,
-                    'subtotal': subtotal,
-                    'tax_amount': tax_amount,
-                    'total_amount': total_amount,
-                },
-            )
-
-            await self.audit_service.log(
-                user_id=user.id,
-                action="GENERATE",
-                entity_type="Document",
-                entity_id=document_id,
-                details={
-                    'document_type': DocumentType.INVOICE.value,
-                    'project_id': str(request.project_id),
-                    'total_amount': total_amount,
-                },
-            )
-
-            return InvoiceResponse(
-                document_id=document_id,
-                project_id=request.project_id,
-                status=DocumentStatus.COMPLETED,
-                filename=filename,
-                file_size_bytes=len(content),
-                billing_period_start=request.billing_period.start_date,
-                billing_period_end=request.billing_period.end_date,
-                total_hours=total_hours,
-                subtotal=subtotal,
-                tax_amount=tax_amount,
-                total_amount=total_amount,
-                line_item_count=len(line_items),
-                generated_at=now,
-                generated_by=user.id,
-                download_url=f"/api/v1/documents/{document_id}",
-            )
-
-        # Render template with context
-        context = {
-            'invoice_number': f"INV-{now.strftime('%Y%m%d')}-{str(document_id)[:8].upper()}",
-            'invoice_date': now.strftime('%Y-%m-%d'),
-            'billing_period': f"{request.billing_period.start_date} to {request.billing_period.end_date}",
-            'client_name': request.client_name or 'Client',
-            'client_address': request.client_address or '',
-            'project_id': str(request.project_id),
-            'line_items': [item.model_dump() for item in line_items],
-            'subtotal': f"{subtotal:.2f}",
-            'tax_rate': f"{request.tax_rate * 100:.0f}%",
-            'tax_amount': f"{tax_amount:.2f}",
-            'total': f"{total_amount:.2f}",
-            'currency': request.currency,
-            'notes': request.notes or '',
-            'generated_by': user.full_name,
-        }
-        doc.render(context)
-
-        # Save to buffer
-        buffer = io.BytesIO()
-        doc.save(buffer)
-        content = buffer.getvalue()
+        # Use the template if it exists, or create a simple document
+        template_path = self.template_dir / f"{request.template_name}.docx"
+
+        content_hash, file_size = await self._render(DocumentType.INVOICE, {
+            'template_path': str(template_path) if template_path.exists() else None,
+            'context': {
+                'invoice_number': f"INV-{now.strftime('%Y%m%d')}-{str(document_id)[:8].upper()}",
+                'invoice_date': now.strftime('%Y-%m-%d'),
+                'billing_period': f"{request.billing_period.start_date} to {request.billing_period.end_date}",
+                'client_name': request.client_name or 'Client',
+                'client_address': request.client_address or '',
+                'project_id': str(request.project_id),
+                'line_items': [item.model_dump() for item in line_items],
+                'subtotal': f"{subtotal:.2f}",
+                'tax_rate': f"{request.tax_rate * 100:.0f}%",
+                'tax_amount': f"{tax_amount:.2f}",
+                'total': f"{total_amount:.2f}",
+                'currency': request.currency,
+                'notes': request.notes or '',
+                'generated_by': user.full_name,
+            },
+            'request': request,
+            'line_items': line_items,
+            'subtotal': subtotal,
+            'tax_amount': tax_amount,
+            'total_amount': total_amount,
+            'now': now,
+        })
 
         # Generate filename
-        filename = f"invoice_{request.project_id}_{now.strftime('%Y%m%d_%H%M%S')}.docx"
+        filename = document_filename(DocumentType.INVOICE, request.project_id, now)
 
         # Store document
         await self._store_document(
@@ -1051,7 +1082,8 @@ class DocumentService:
             document_type=DocumentType.INVOICE,
             format=DocumentFormat.WORD,
             filename=filename,
-            content=content,
+            content_hash=content_hash,
+            file_size_bytes=file_size,
             user=user,
             metadata={
                 'billing_period_start': request.billing_period.start_date.isoformat(),
@@ -1081,7 +1113,7 @@ class DocumentService:
             project_id=request.project_id,
             status=DocumentStatus.COMPLETED,
             filename=filename,
-            file_size_bytes=len(content),
+            file_size_bytes=file_size,
             billing_period_start=request.billing_period.start_date,
             billing_period_end=request.billing_period.end_date,
             total_hours=total_hours,
@@ -1094,15 +1126,38 @@ class DocumentService:
             download_url=f"/api/v1/documents/{document_id}",
         )
 
+    @classmethod
+    def _render_invoice(cls, payload: dict[str, Any]) -> bytes:
+        """Build the invoice document (runs in a document worker process)."""
+        if payload['template_path']:
+            try:
+                # Render template with context
+                doc = DocxTemplate(payload['template_path'])
+                doc.render(payload['context'])
+
+                # Save to buffer
+                buffer = io.BytesIO()
+                doc.save(buffer)
+                return buffer.getvalue()
+            except Exception:
+                pass  # Fall back to simple document
+
+        return cls._create_simple_invoice_content(
+            request=payload['request'],
+            line_items=payload['line_items'],
+            subtotal=payload['subtotal'],
+            tax_amount=payload['tax_amount'],
+            total_amount=payload['total_amount'],
+            now=payload['now'],
+        )
+
+    @staticmethod
     def _create_simple_invoice_content(
-        self,
         request: InvoiceRequest,
         line_items: list[InvoiceLineItem],
         subtotal: float,
         tax_amount: float,
         total_amount: float,
-        total_hours: float,
-        user: User,
         now: datetime,
     ) -> bytes:
         """Create a simple invoice document without template."""
@@ -1191,7 +1246,7 @@ class DocumentService:
         Returns:
             Document record if found, None otherwise
         """
-        record = self._document_store.get(document_id)
+        record = await self.document_store.get(document_id)
 
         if record:
             # Log access
@@ -1220,14 +1275,11 @@ class DocumentService:
         Returns:
             Document content bytes if found, None otherwise
         """
-        # In production, this would retrieve from storage service
-        # For now, return None as we don't persist content in memory
         record = await self.get_document(document_id, user)
-        if not record:
+        if not record or not record.content_hash:
             return None
 
-        # In production implementation, retrieve from file storage
-        return None
+        return await self.document_store.read_artifact(record.content_hash)
 
     async def list_documents(
         self,
@@ -1248,20 +1300,54 @@ class DocumentService:
         Returns:
             List of document records
         """
-        records = list(self._document_store.values())
+        return await self.document_store.list_records(
+            project_id=project_id,
+            document_type=document_type,
+            limit=limit,
+            offset=offset,
+        )
+
 
-        # Apply filters
-        if project_id:
-            records = [r for r in records if r.project_id == project_id]
+# ============================================================================
+# Document Worker Processes
+# ============================================================================
 
-        if document_type:
-            records = [r for r in records if r.document_type == document_type]
+_process_pool: ProcessPoolExecutor | None = None
 
-        # Sort by generated_at descending
-        records.sort(key=lambda r: r.generated_at, reverse=True)
 
-        # Apply pagination
-        return records[offset:offset + limit]
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Create the document rendering process pool on first use"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.DOCUMENT_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_document_workers() -> None:
+    """Release the document rendering process pool"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _render_document_in_process(
+    document_type: str,
+    payload: dict[str, Any],
+    artifact_dir: str,
+) -> tuple[str, int]:
+    """Process pool entry point: render a document and store its file"""
+    renderers = {
+        DocumentType.DESIGN_REVIEW.value: DocumentService._render_design_review,
+        DocumentType.TRACEABILITY_MATRIX.value: DocumentService._render_traceability_matrix,
+        DocumentType.FMEA.value: DocumentService._render_fmea,
+        DocumentType.INVOICE.value: DocumentService._render_invoice,
+    }
+    content = renderers[document_type](payload)
+    return write_artifact(Path(artifact_dir), content), len(content)
 
 
 # ============================================================================
@@ -0,0 +1,405 @@
+"""PostgreSQL records and content-addressed files for generated documents"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.document import GeneratedDocument
+from app.schemas.document import (
+    DocumentFormat,
+    DocumentRecord,
+    DocumentStatus,
+    DocumentType,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _claimable():
+    """Jobs no live worker holds: pending, or generating under a lapsed lease"""
+    return or_(
+        GeneratedDocument.status == DocumentStatus.PENDING.value,
+        and_(
+            GeneratedDocument.status == DocumentStatus.GENERATING.value,
+            or_(
+                GeneratedDocument.lease_until.is_(None),
+                GeneratedDocument.lease_until < func.now(),
+            ),
+        ),
+    )
+
+
+def artifact_path(artifact_dir: Path, content_hash: str) -> Path:
+    """Location of a stored document file: <dir>/<hash[:2]>/<hash>"""
+    return artifact_dir / content_hash[:2] / content_hash
+
+
+def write_artifact(artifact_dir: Path, content: bytes) -> str:
+    """
+    Store document content under its SHA-256 hash.
+
+    Identical content is stored once. The file is written under a temporary
+    name and renamed into place, so readers never see a partial file. Safe
+    to call from document worker processes.
+
+    Args:
+        artifact_dir: Root directory of stored documents
+        content: Document content
+
+    Returns:
+        SHA-256 hex digest of the content
+    """
+    content_hash = hashlib.sha256(content).hexdigest()
+    path = artifact_path(artifact_dir, content_hash)
+    if path.exists():
+        return content_hash
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+    return content_hash
+
+
+class DocumentStore:
+    """
+    Generated document records in PostgreSQL, files on disk.
+
+    Records live in the generated_documents table, so every API worker sees
+    the same documents and queued jobs survive restarts. A worker claims a
+    job with claim() before generating it, which takes the job under a
+    lease only if no other worker holds it. Files are stored
+    content-addressed under UPLOAD_DIR/documents. Records that cannot be
+    written because the database is unreachable are kept in memory and
+    still served.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] | None = AsyncSessionLocal,
+        artifact_dir: Path | None = None,
+    ):
+        """
+        Initialize the document store.
+
+        Args:
+            session_factory: Factory for database sessions (None keeps records
+                in memory only)
+            artifact_dir: Root directory of stored documents (defaults to
+                UPLOAD_DIR/documents)
+        """
+        self._session_factory = session_factory
+        self.artifact_dir = artifact_dir or Path(settings.UPLOAD_DIR) / "documents"
+        self._records: dict[UUID, DocumentRecord] = {}
+
+    async def save(
+        self, record: DocumentRecord, request: dict[str, Any] | None = None
+    ) -> DocumentRecord:
+        """
+        Insert or update a document record.
+
+        Submission and start times already stored are kept when the record
+        does not carry them.
+
+        Args:
+            record: Document record
+            request: Generation request to store with a queued job
+
+        Returns:
+            The saved record
+        """
+        if self._session_factory is not None:
+            table = GeneratedDocument.__table__
+            values = {
+                "id": record.id,
+                "project_id": record.project_id,
+                "document_type": record.document_type.value,
+                "format": record.format.value,
+                "status": record.status.value,
+                "filename": record.filename,
+                "content_hash": record.content_hash,
+                "file_size_bytes": record.file_size_bytes,
+                "version": record.version,
+                "metadata": record.metadata,
+                "error_message": record.error_message,
+                "generated_by": record.generated_by,
+                "started_at": record.started_at,
+                "generated_at": record.generated_at,
+            }
+            if record.submitted_at is not None:
+                values["created_at"] = record.submitted_at
+            if request is not None:
+                values["request"] = request
+
+            try:
+                async with self._session_factory() as session:
+                    statement = insert(table).values(**values)
+                    updates = {
+                        name: statement.excluded[name]
+                        for name in values
+                        if name not in ("id", "created_at", "request", "started_at")
+                    }
+                    updates["started_at"] = func.coalesce(
+                        statement.excluded.started_at, table.c.started_at
+                    )
+                    await session.execute(
+                        statement.on_conflict_do_update(
+                            index_elements=[table.c.id], set_=updates
+                        )
+                    )
+                    await session.commit()
+                self._records.pop(record.id, None)
+                return record
+            except Exception as e:
+                logger.warning(
+                    f"Failed to save document record {record.id}: {e}. "
+                    "Keeping it in memory."
+                )
+
+        previous = self._records.get(record.id)
+        if previous is not None:
+            record = record.model_copy(update={
+                "submitted_at": record.submitted_at or previous.submitted_at,
+                "started_at": record.started_at or previous.started_at,
+            })
+        self._records[record.id] = record
+        return record
+
+    async def claim(
+        self, record: DocumentRecord, owner: str, lease_seconds: float
+    ) -> DocumentRecord | None:
+        """
+        Take a job for generation.
+
+        The job is marked generating by a single conditional UPDATE, which
+        only matches while it is pending or its previous owner's lease has
+        lapsed, so exactly one worker wins it. If the database is
+        unreachable the job is claimed in memory.
+
+        Args:
+            record: Document record of the job
+            owner: Identifier of the claiming worker
+            lease_seconds: How long the claim holds without renew()
+
+        Returns:
+            The claimed record, or None if another worker holds the job or
+            it has finished
+        """
+        if self._session_factory is not None and record.id not in self._records:
+            try:
+                async with self._session_factory() as session:
+                    result = await session.execute(
+                        update(GeneratedDocument)
+                        .where(GeneratedDocument.id == record.id, _claimable())
+                        .values(
+                            status=DocumentStatus.GENERATING.value,
+                            owner=owner,
+                            lease_until=func.now() + timedelta(seconds=lease_seconds),
+                            started_at=func.now(),
+                        )
+                        .returning(GeneratedDocument)
+                    )
+                    row = result.scalar_one_or_none()
+                    claimed = self._to_record(row) if row is not None else None
+                    await session.commit()
+                return claimed
+            except Exception as e:
+                logger.warning(
+                    f"Failed to claim document job {record.id}: {e}. "
+                    "Claiming it in memory."
+                )
+
+        current = self._records.get(record.id, record)
+        if current.status != DocumentStatus.PENDING:
+            return None
+        claimed = current.model_copy(update={
+            "status": DocumentStatus.GENERATING,
+            "started_at": datetime.now(UTC),
+        })
+        self._records[record.id] = claimed
+        return claimed
+
+    async def renew(self, document_id: UUID, owner: str, lease_seconds: float) -> bool:
+        """
+        Extend the lease of a claimed job.
+
+        Args:
+            document_id: Document identifier
+            owner: Identifier of the worker holding the job
+            lease_seconds: New lease length from now
+
+        Returns:
+            False if the job is no longer generating under this owner
+        """
+        if self._session_factory is None or document_id in self._records:
+            return True
+        try:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    update(GeneratedDocument)
+                    .where(
+                        GeneratedDocument.id == document_id,
+                        GeneratedDocument.owner == owner,
+                        GeneratedDocument.status == DocumentStatus.GENERATING.value,
+                    )
+                    .values(lease_until=func.now() + timedelta(seconds=lease_seconds))
+                    .returning(GeneratedDocument.id)
+                )
+                renewed = result.scalar_one_or_none() is not None
+                await session.commit()
+            return renewed
+        except Exception as e:
+            logger.warning(f"Failed to renew lease of document job {document_id}: {e}")
+            return True
+
+    async def get(self, document_id: UUID) -> DocumentRecord | None:
+        """
+        Get a document record.
+
+        Args:
+            document_id: Document identifier
+
+        Returns:
+            DocumentRecord if found, None otherwise
+        """
+        if self._session_factory is not None and document_id not in self._records:
+            try:
+                async with self._session_factory() as session:
+                    row = await session.get(GeneratedDocument, document_id)
+                return self._to_record(row) if row is not None else None
+            except Exception as e:
+                logger.warning(f"Failed to load document record {document_id}: {e}")
+        return self._records.get(document_id)
+
+    async def list_records(
+        self,
+        project_id: UUID | None = None,
+        document_type: DocumentType | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[DocumentRecord]:
+        """
+        List document records, newest first.
+
+        Args:
+            project_id: Filter by project ID
+            document_type: Filter by document type
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            List of document records
+        """
+        records = [
+            record
+            for record in self._records.values()
+            if (project_id is None or record.project_id == project_id)
+            and (document_type is None or record.document_type == document_type)
+        ]
+
+        if self._session_factory is not None:
+            query = select(GeneratedDocument)
+            if project_id is not None:
+                query = query.where(GeneratedDocument.project_id == project_id)
+            if document_type is not None:
+                query = query.where(GeneratedDocument.document_type == document_type.value)
+            query = query.order_by(GeneratedDocument.created_at.desc()).limit(
+                offset + limit
+            )
+            try:
+                async with self._session_factory() as session:
+                    result = await session.execute(query)
+                    records.extend(
+                        self._to_record(row)
+                        for row in result.scalars().all()
+                        if row.id not in self._records
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to list document records: {e}")
+
+        records.sort(
+            key=lambda r: r.submitted_at or r.generated_at or r.started_at,
+            reverse=True,
+        )
+        return records[offset:offset + limit]
+
+    async def unfinished(self) -> list[tuple[DocumentRecord, dict[str, Any] | None]]:
+        """
+        Get the recorded jobs no live worker holds.
+
+        These are pending jobs and generating jobs whose owner's lease has
+        lapsed, e.g. because that worker stopped.
+
+        Returns:
+            (record, stored generation request) pairs, oldest first
+        """
+        if self._session_factory is None:
+            return []
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(GeneratedDocument)
+                .where(_claimable())
+                .order_by(GeneratedDocument.created_at)
+            )
+            return [(self._to_record(row), row.request) for row in result.scalars().all()]
+
+    async def read_artifact(self, content_hash: str) -> bytes | None:
+        """
+        Read a stored document file.
+
+        Args:
+            content_hash: SHA-256 hash of the document
+
+        Returns:
+            File content, or None if the file does not exist
+        """
+        try:
+            return await asyncio.to_thread(
+                artifact_path(self.artifact_dir, content_hash).read_bytes
+            )
+        except FileNotFoundError:
+            return None
+
+    def _to_record(self, row: GeneratedDocument) -> DocumentRecord:
+        """Build the API record of a stored row"""
+        return DocumentRecord(
+            id=row.id,
+            project_id=row.project_id,
+            document_type=DocumentType(row.document_type),
+            format=DocumentFormat(row.format),
+            status=DocumentStatus(row.status),
+            filename=row.filename,
+            file_path=(
+                str(artifact_path(self.artifact_dir, row.content_hash))
+                if row.content_hash
+                else None
+            ),
+            file_size_bytes=row.file_size_bytes,
+            content_hash=row.content_hash,
+            version=row.version,
+            metadata=row.document_metadata or {},
+            generated_at=row.generated_at,
+            generated_by=row.generated_by,
+            submitted_at=row.created_at,
+            started_at=row.started_at,
+            error_message=row.error_message,
+        )
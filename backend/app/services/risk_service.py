@@ -613,6 +613,7 @@ class RiskService:
         self,
         risk_id: UUID | None = None,
         max_depth: int = 5,
+        top_k: int = 10,
     ) -> list[RiskChainResponse]:
         """
         Get failure chains showing risk propagation paths.
@@ -620,6 +621,7 @@ class RiskService:
         Args:
             risk_id: Optional starting risk ID (if None, gets all chains)
             max_depth: Maximum chain depth to traverse
+            top_k: Maximum chains per start risk, most probable first
 
         Returns:
             List of risk chains with failure paths and probabilities
@@ -627,7 +629,8 @@ class RiskService:
         # Use graph service to get chains
         raw_chains = await self.graph_service.get_risk_chains(
             risk_id=str(risk_id) if risk_id else None,
-            max_depth=max_depth
+            max_depth=max_depth,
+            top_k=top_k
         )
 
         chains = []
@@ -1013,7 +1016,7 @@ class RiskService:
             limit=limit + offset  # Get extra to handle offset
         )
 
-        risks = []
+        candidates = []
         for result in results:
             props = result.get('properties', result)
 
@@ -1030,10 +1033,18 @@ class RiskService:
             if risk_owner and props.get('risk_owner') != str(risk_owner):
                 continue
 
+            candidates.append(props)
+
+        # Signed status of all listed risks with one query
+        signed = await self.signature_service.signed_status_for(
+            UUID(props.get('id')) for props in candidates
+        )
+
+        risks = []
+        for props in candidates:
             # Get additional data
             risk_id = UUID(props.get('id'))
-            signatures = await self.signature_service.get_workitem_signatures(risk_id)
-            props['is_signed'] = any(sig.is_valid for sig in signatures)
+            props['is_signed'] = signed.get(risk_id, False)
 
             mitigations = await self._get_risk_mitigations(risk_id)
             props['mitigation_count'] = len(mitigations)
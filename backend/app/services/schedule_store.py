@@ -0,0 +1,394 @@
+"""PostgreSQL-backed store for calculated project schedules and schedule jobs"""
+
+import logging
+import zlib
+from collections.abc import Callable
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import AsyncSessionLocal
+from app.models.schedule import StoredSchedule, StoredScheduleJob
+from app.schemas.schedule import ProjectSchedule, ScheduleJobStatus, ScheduleResponse
+
+logger = logging.getLogger(__name__)
+
+_UNFINISHED_JOB_STATES = ("queued", "running")
+
+
+def schedule_etag(schedule: ProjectSchedule) -> str:
+    """Entity tag identifying a stored schedule version"""
+    return f'"{schedule.project_id}-{schedule.version}"'
+
+
+class ScheduleStore:
+    """
+    Versioned schedule storage with a read-through in-memory cache.
+
+    PostgreSQL is the source of truth, so every API worker sees the same
+    schedule. Reads check the stored version with a primary-key lookup and
+    only fetch and decompress the payload when the cached copy is stale. If the
+    database is unreachable the cache keeps serving (and accepting) schedules.
+    """
+
+    def __init__(
+        self, session_factory: Callable[[], AsyncSession] = AsyncSessionLocal
+    ):
+        """
+        Initialize the schedule store.
+
+        Args:
+            session_factory: Factory for database sessions
+        """
+        self._session_factory = session_factory
+        self._cache: dict[UUID, ProjectSchedule] = {}
+
+    async def get(self, project_id: UUID) -> ProjectSchedule | None:
+        """
+        Get the latest schedule of a project.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            ProjectSchedule if found, None otherwise
+        """
+        cached = self._cache.get(project_id)
+
+        try:
+            async with self._session_factory() as session:
+                if cached is not None:
+                    result = await session.execute(
+                        select(StoredSchedule.version).where(
+                            StoredSchedule.project_id == project_id
+                        )
+                    )
+                    version = result.scalar_one_or_none()
+                    if version is None or version == cached.version:
+                        return cached
+
+                row = await session.get(StoredSchedule, project_id)
+                if row is None:
+                    return cached
+
+                schedule = self._decode(row)
+        except Exception as e:
+            logger.warning(
+                f"Failed to load schedule for project {project_id}: {e}. "
+                "Serving cached schedule."
+            )
+            return cached
+
+        self._cache[project_id] = schedule
+        return schedule
+
+    async def save(
+        self, schedule: ProjectSchedule, expected_version: int | None = None
+    ) -> ProjectSchedule | None:
+        """
+        Save a project's schedule as its next version.
+
+        Args:
+            schedule: Schedule to save
+            expected_version: Only save if this is still the stored version
+
+        Returns:
+            The saved schedule with the version and created_at assigned by
+            the database, or None if the stored version is not expected_version
+        """
+        data = self._encode(schedule)
+
+        try:
+            async with self._session_factory() as session:
+                statement = insert(StoredSchedule).values(
+                    project_id=schedule.project_id,
+                    version=schedule.version,
+                    data=data,
+                    created_at=schedule.created_at,
+                    updated_at=schedule.updated_at,
+                )
+                statement = statement.on_conflict_do_update(
+                    index_elements=[StoredSchedule.project_id],
+                    set_={
+                        "version": StoredSchedule.version + 1,
+                        "data": statement.excluded.data,
+                        "updated_at": statement.excluded.updated_at,
+                    },
+                    where=(
+                        StoredSchedule.version == expected_version
+                        if expected_version is not None
+                        else None
+                    ),
+                ).returning(StoredSchedule.version, StoredSchedule.created_at)
+
+                result = await session.execute(statement)
+                row = result.one_or_none()
+                await session.commit()
+            if row is None:
+                return None
+            version, created_at = row
+
+            schedule = schedule.model_copy(
+                update={"version": version, "created_at": created_at}
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to persist schedule for project {schedule.project_id}: {e}. "
+                "Schedule kept in memory only."
+            )
+            cached = self._cache.get(schedule.project_id)
+            if expected_version is not None and (
+                cached is None or cached.version != expected_version
+            ):
+                return None
+
+        self._cache[schedule.project_id] = schedule
+        return schedule
+
+    @staticmethod
+    def _encode(schedule: ProjectSchedule) -> bytes:
+        """Serialize a schedule to compressed JSON"""
+        return zlib.compress(schedule.model_dump_json().encode())
+
+    @staticmethod
+    def _decode(row: StoredSchedule) -> ProjectSchedule:
+        """Deserialize a stored row; the row's columns win over the payload"""
+        schedule = ProjectSchedule.model_validate_json(zlib.decompress(row.data))
+        return schedule.model_copy(
+            update={"version": row.version, "created_at": row.created_at}
+        )
+
+
+class ScheduleJobStore:
+    """
+    Schedule job state shared by all API workers.
+
+    Status and results of every job are kept in the schedule_jobs table, so
+    a job can be polled, fetched and cancelled through any worker. Once a
+    job has finished its row is never changed again: a cancellation marks
+    the row first, and the worker running the job can no longer overwrite
+    it. Jobs that cannot be written because the database is unreachable are
+    kept in memory and still served by this worker.
+    """
+
+    def __init__(
+        self, session_factory: Callable[[], AsyncSession] = AsyncSessionLocal
+    ):
+        """
+        Initialize the job store.
+
+        Args:
+            session_factory: Factory for database sessions
+        """
+        self._session_factory = session_factory
+        self._jobs: dict[UUID, tuple[ScheduleJobStatus, ScheduleResponse | None]] = {}
+
+    async def create(self, job: ScheduleJobStatus) -> None:
+        """
+        Record a newly queued job.
+
+        Args:
+            job: Status of the queued job
+        """
+        try:
+            async with self._session_factory() as session:
+                session.add(StoredScheduleJob(**job.model_dump()))
+                await session.commit()
+        except Exception as e:
+            logger.warning(
+                f"Failed to persist schedule job {job.job_id}: {e}. "
+                "Job kept in memory only."
+            )
+            self._jobs[job.job_id] = (job, None)
+
+    async def update(
+        self, job: ScheduleJobStatus, result: ScheduleResponse | None = None
+    ) -> bool:
+        """
+        Record the new state of a job that has not finished yet.
+
+        Args:
+            job: New status of the job
+            result: Calculated schedule, once completed
+
+        Returns:
+            False if the stored job had already finished (e.g. it was
+            cancelled through another worker) and was left unchanged
+        """
+        if job.job_id not in self._jobs:
+            try:
+                async with self._session_factory() as session:
+                    values = job.model_dump(exclude={"job_id", "project_id"})
+                    values["result"] = self._encode(result) if result else None
+                    row = await session.execute(
+                        update(StoredScheduleJob)
+                        .where(
+                            StoredScheduleJob.job_id == job.job_id,
+                            StoredScheduleJob.status.in_(_UNFINISHED_JOB_STATES),
+                        )
+                        .values(**values)
+                        .returning(StoredScheduleJob.job_id)
+                    )
+                    updated = row.one_or_none() is not None
+                    await session.commit()
+                return updated
+            except Exception as e:
+                logger.warning(
+                    f"Failed to persist schedule job {job.job_id}: {e}. "
+                    "Job kept in memory only."
+                )
+                self._jobs[job.job_id] = (job, result)
+                return True
+
+        stored, _ = self._jobs[job.job_id]
+        if stored.status not in _UNFINISHED_JOB_STATES:
+            return False
+        self._jobs[job.job_id] = (job, result)
+        return True
+
+    async def get(self, job_id: UUID) -> ScheduleJobStatus | None:
+        """
+        Get the status of a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            ScheduleJobStatus, or None if the job is unknown
+        """
+        if job_id in self._jobs:
+            return self._jobs[job_id][0]
+
+        try:
+            async with self._session_factory() as session:
+                row = await session.get(StoredScheduleJob, job_id)
+        except Exception as e:
+            logger.warning(f"Failed to load schedule job {job_id}: {e}")
+            return None
+        return self._to_status(row) if row is not None else None
+
+    async def get_result(self, job_id: UUID) -> ScheduleResponse | None:
+        """
+        Get the schedule calculated by a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            ScheduleResponse, or None if the job is unknown or has no result
+        """
+        if job_id in self._jobs:
+            return self._jobs[job_id][1]
+
+        try:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    select(StoredScheduleJob.result).where(
+                        StoredScheduleJob.job_id == job_id
+                    )
+                )
+                data = result.scalar_one_or_none()
+        except Exception as e:
+            logger.warning(f"Failed to load schedule job result {job_id}: {e}")
+            return None
+        return self._decode(data) if data is not None else None
+
+    async def cancel(self, job_id: UUID, message: str) -> ScheduleJobStatus | None:
+        """
+        Mark a job cancelled unless it has already finished.
+
+        Args:
+            job_id: Job identifier
+            message: Cancellation details
+
+        Returns:
+            Status of the job afterwards, or None if the job is unknown
+        """
+        now = datetime.now(UTC)
+        if job_id in self._jobs:
+            job, result = self._jobs[job_id]
+            if job.status in _UNFINISHED_JOB_STATES:
+                job = job.model_copy(
+                    update={"status": "cancelled", "message": message, "finished_at": now}
+                )
+                self._jobs[job_id] = (job, result)
+            return job
+
+        try:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    update(StoredScheduleJob)
+                    .where(
+                        StoredScheduleJob.job_id == job_id,
+                        StoredScheduleJob.status.in_(_UNFINISHED_JOB_STATES),
+                    )
+                    .values(status="cancelled", message=message, finished_at=now)
+                    .returning(StoredScheduleJob)
+                )
+                row = result.scalar_one_or_none()
+                await session.commit()
+                if row is None:
+                    row = await session.get(StoredScheduleJob, job_id)
+        except Exception as e:
+            logger.warning(f"Failed to cancel schedule job {job_id}: {e}")
+            return None
+        return self._to_status(row) if row is not None else None
+
+    async def prune(self, keep: int) -> None:
+        """
+        Forget the oldest finished jobs.
+
+        Args:
+            keep: Finished jobs to keep
+        """
+        finished = sorted(
+            (job for job, _ in self._jobs.values() if job.status not in _UNFINISHED_JOB_STATES),
+            key=lambda job: job.finished_at or job.submitted_at,
+        )
+        for job in finished[: max(len(finished) - keep, 0)]:
+            del self._jobs[job.job_id]
+
+        newest = (
+            select(StoredScheduleJob.job_id)
+            .where(StoredScheduleJob.status.not_in(_UNFINISHED_JOB_STATES))
+            .order_by(StoredScheduleJob.finished_at.desc())
+            .limit(keep)
+        )
+        try:
+            async with self._session_factory() as session:
+                await session.execute(
+                    delete(StoredScheduleJob).where(
+                        StoredScheduleJob.status.not_in(_UNFINISHED_JOB_STATES),
+                        StoredScheduleJob.job_id.not_in(newest),
+                    )
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to prune schedule jobs: {e}")
+
+    @staticmethod
+    def _encode(result: ScheduleResponse) -> bytes:
+        """Serialize a job result to compressed JSON"""
+        return zlib.compress(result.model_dump_json().encode())
+
+    @staticmethod
+    def _decode(data: bytes) -> ScheduleResponse:
+        """Deserialize a stored job result"""
+        return ScheduleResponse.model_validate_json(zlib.decompress(data))
+
+    @staticmethod
+    def _to_status(row: StoredScheduleJob) -> ScheduleJobStatus:
+        """Build the public status of a stored job"""
+        return ScheduleJobStatus(
+            job_id=row.job_id,
+            project_id=row.project_id,
+            status=row.status,
+            submitted_at=row.submitted_at,
+            started_at=row.started_at,
+            finished_at=row.finished_at,
+            message=row.message,
+            result_status=row.result_status,
+        )
@@ -1,26 +1,134 @@
 """Project Scheduler Service using Google OR-Tools for constraint-based scheduling"""
 
+import asyncio
 import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from ortools.sat.python import cp_model
 
+from app.core.config import settings
 from app.schemas.schedule import (
+    GanttChartData,
     ProjectSchedule,
     ResourceCreate,
     ScheduleConflict,
     ScheduleConstraints,
     ScheduledMilestone,
     ScheduledTask,
+    ScheduleJobStatus,
     ScheduleResponse,
     ScheduleTaskCreate,
     ScheduleUpdate,
+    SolverStatistics,
 )
+from app.services.schedule_store import ScheduleJobStore, ScheduleStore
 
 logger = logging.getLogger(__name__)
 
+_FINISHED_JOB_STATES = ("completed", "failed", "cancelled")
+
+# How often a running job checks whether it was cancelled through another worker
+_JOB_CANCEL_POLL_SECONDS = 1.0
+
+# Tasks per UNWIND statement when writing calculated dates back to the graph
+_TASK_DATE_BATCH_SIZE = 500
+
+# How long cached Gantt data may reflect stale task progress from the graph
+_GANTT_CACHE_TTL_SECONDS = 30.0
+
+
+@dataclass
+class _ScheduleJob:
+    """Bookkeeping for an asynchronous schedule calculation"""
+
+    job_id: UUID
+    project_id: UUID
+    submitted_at: datetime
+    status: str = "queued"
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    message: str | None = None
+    result: ScheduleResponse | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+    future: Future | None = field(default=None, repr=False)
+    stop_event: Any = field(default=None, repr=False)
+
+
+def _solver_statistics(source: Any, num_search_workers: int) -> SolverStatistics:
+    """Collect statistics from a CpSolver or a solution callback"""
+    objective = source.ObjectiveValue()
+    bound = source.BestObjectiveBound()
+    return SolverStatistics(
+        wall_time_seconds=source.WallTime(),
+        num_branches=source.NumBranches(),
+        num_conflicts=source.NumConflicts(),
+        objective_value=objective,
+        best_objective_bound=bound,
+        # Same definition CP-SAT uses for relative_gap_limit
+        relative_gap=abs(objective - bound) / max(1.0, abs(objective)),
+        num_search_workers=num_search_workers,
+    )
+
+
+class _RecordedSolution:
+    """Variable values of one intermediate solution, readable like a solver"""
+
+    def __init__(self, values: dict[int, int]):
+        self._values = values
+
+    def Value(self, var: cp_model.IntVar) -> int:  # noqa: N802 - mirrors CpSolver
+        return self._values[var.Index()]
+
+
+class _SolveProgress(cp_model.CpSolverSolutionCallback):
+    """
+    Records the incumbent solution of a running solve.
+
+    Lets the caller return the best schedule found so far while the solver
+    keeps searching in its thread.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.first_solution = threading.Event()
+        self._lock = threading.Lock()
+        self._variables: list[cp_model.IntVar] = []
+        self._build: Any = None
+        self._num_search_workers = 1
+        self._incumbent: tuple[_RecordedSolution, SolverStatistics] | None = None
+
+    def track(
+        self, variables: list[cp_model.IntVar], build: Any, num_search_workers: int
+    ) -> None:
+        """Set the variables to record and how to turn them into a response"""
+        self._variables = variables
+        self._build = build
+        self._num_search_workers = num_search_workers
+
+    def on_solution_callback(self) -> None:
+        solution = _RecordedSolution(
+            {var.Index(): self.Value(var) for var in self._variables}
+        )
+        stats = _solver_statistics(self, self._num_search_workers)
+        with self._lock:
+            self._incumbent = (solution, stats)
+        self.first_solution.set()
+
+    def snapshot(self) -> ScheduleResponse | None:
+        """Build a response from the best solution found so far"""
+        with self._lock:
+            incumbent = self._incumbent
+        if incumbent is None or self._build is None:
+            return None
+        return self._build(*incumbent)
+
 
 class SchedulerService:
     """
@@ -35,9 +143,20 @@ class SchedulerService:
 
     def __init__(self):
         """Initialize the scheduler service"""
-        self._schedules: dict[
-            str, ProjectSchedule
-        ] = {}  # In-memory storage for schedules
+        self._store = ScheduleStore()
+        self._job_store = ScheduleJobStore()
+        # Unfinished jobs of this worker; their shared state is in _job_store
+        self._jobs: dict[UUID, _ScheduleJob] = {}
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._job_manager: Any = None
+        # One slot per pool worker: a job holding a slot is running, not queued
+        self._job_slots = asyncio.Semaphore(settings.SCHEDULER_PROCESS_WORKERS)
+        # Project ID -> (task storing the final schedule, its solver stop event)
+        self._background_solves: dict[UUID, tuple[asyncio.Task, threading.Event]] = {}
+        # Project ID -> (schedule version key, monotonic time cached, data)
+        self._gantt_cache: dict[
+            UUID, tuple[tuple[int, datetime], float, GanttChartData]
+        ] = {}
 
     def get_matching_resources_for_task(
         self, task: ScheduleTaskCreate, resources: list[ResourceCreate]
@@ -186,6 +305,378 @@ class SchedulerService:
                 message="No tasks provided for scheduling",
             )
 
+        department_resources, milestone_dependencies = (
+            await self._load_scheduling_context(workpackage_id, milestones)
+        )
+        self._stop_background_solve(project_id)
+
+        if constraints.solver_profile.quick_feasible_seconds:
+            return await self._schedule_quick_feasible_first(
+                project_id,
+                tasks,
+                resources,
+                constraints,
+                department_resources,
+                milestones,
+                milestone_dependencies,
+            )
+
+        # CP-SAT releases the GIL while searching, so solving in a thread keeps
+        # the event loop serving other requests
+        response = await asyncio.to_thread(
+            self._solve_schedule,
+            project_id,
+            tasks,
+            resources,
+            constraints,
+            department_resources,
+            milestones,
+            milestone_dependencies,
+        )
+
+        return await self._finalize_schedule(
+            response, tasks, resources, constraints, milestones, milestone_dependencies
+        )
+
+    async def _schedule_quick_feasible_first(
+        self,
+        project_id: UUID,
+        tasks: list[ScheduleTaskCreate],
+        resources: list[ResourceCreate],
+        constraints: ScheduleConstraints,
+        department_resources: list[ResourceCreate],
+        milestones: list[dict] | None,
+        milestone_dependencies: dict[str, list[str]],
+    ) -> ScheduleResponse:
+        """
+        Return the best schedule found within quick_feasible_seconds.
+
+        If the solver has not finished by then, the incumbent solution is
+        returned (waiting for the first one if needed) and the search keeps
+        running; its final schedule replaces the stored one when done, unless
+        the project's schedule has been saved again in the meantime.
+        """
+        progress = _SolveProgress()
+        stop_event = threading.Event()
+        solve = asyncio.create_task(
+            asyncio.to_thread(
+                self._solve_schedule,
+                project_id,
+                tasks,
+                resources,
+                constraints,
+                department_resources,
+                milestones,
+                milestone_dependencies,
+                stop_event,
+                progress,
+            )
+        )
+
+        await asyncio.wait(
+            {solve}, timeout=constraints.solver_profile.quick_feasible_seconds
+        )
+        while not solve.done() and not progress.first_solution.is_set():
+            await asyncio.sleep(0.05)
+
+        if solve.done():
+            return await self._finalize_schedule(
+                solve.result(),
+                tasks,
+                resources,
+                constraints,
+                milestones,
+                milestone_dependencies,
+            )
+
+        response = progress.snapshot()
+        response.optimization_in_progress = True
+        response = self._complete_schedule(
+            response, tasks, constraints, milestones, milestone_dependencies
+        )
+        stored = await self._store_schedule(project_id, response, resources, constraints)
+
+        background = asyncio.create_task(
+            self._finish_background_solve(
+                solve,
+                stored.version,
+                tasks,
+                resources,
+                constraints,
+                milestones,
+                milestone_dependencies,
+            )
+        )
+        self._stop_background_solve(project_id)
+        self._background_solves[project_id] = (background, stop_event)
+        background.add_done_callback(
+            lambda task: self._forget_background_solve(project_id, task)
+        )
+
+        logger.info(
+            f"Returned feasible schedule for project {project_id} after "
+            f"{response.solver_stats.wall_time_seconds:.1f}s; optimization continues"
+        )
+        return response
+
+    async def _finish_background_solve(
+        self,
+        solve: asyncio.Task,
+        base_version: int,
+        tasks: list[ScheduleTaskCreate],
+        resources: list[ResourceCreate],
+        constraints: ScheduleConstraints,
+        milestones: list[dict] | None,
+        milestone_dependencies: dict[str, list[str]],
+    ) -> None:
+        """
+        Store the final schedule of a solve that outlived its request.
+
+        The schedule is only stored if the project's stored schedule is still
+        base_version, the one saved from this solve's feasible solution.
+        """
+        try:
+            response = await solve
+            await self._finalize_schedule(
+                response,
+                tasks,
+                resources,
+                constraints,
+                milestones,
+                milestone_dependencies,
+                expected_version=base_version,
+            )
+            logger.info(
+                f"Background optimization for project {response.project_id} "
+                f"finished: {response.message}"
+            )
+        except Exception as e:
+            logger.error(f"Background schedule optimization failed: {e}")
+
+    def _stop_background_solve(self, project_id: UUID) -> None:
+        """Stop a project's background solve; a newer schedule supersedes it"""
+        background = self._background_solves.pop(project_id, None)
+        if background is not None:
+            task, stop_event = background
+            stop_event.set()
+            task.cancel()
+
+    def _forget_background_solve(self, project_id: UUID, task: asyncio.Task) -> None:
+        """Drop a finished background solve unless it was already replaced"""
+        background = self._background_solves.get(project_id)
+        if background is not None and background[0] is task:
+            del self._background_solves[project_id]
+
+    async def reschedule_project(
+        self,
+        project_id: UUID,
+        tasks: list[ScheduleTaskCreate],
+        resources: list[ResourceCreate] | None = None,
+        constraints: ScheduleConstraints | None = None,
+        changed_task_ids: list[str] | None = None,
+        freeze_started: bool = True,
+        workpackage_id: str | None = None,
+        milestones: list[dict] | None = None,
+    ) -> ScheduleResponse | None:
+        """
+        Re-schedule a project incrementally from its stored schedule.
+
+        Only the changed tasks and their downstream dependency cone are
+        re-optimized; every other task stays at its stored start. Stored starts
+        are passed to CP-SAT as hints, so small edits re-plan in a fraction of
+        a full solve. If pinning the unaffected tasks makes the model
+        infeasible, all non-frozen tasks are re-optimized with hints only.
+
+        Args:
+            project_id: Unique project identifier
+            tasks: Current tasks, including the edited ones
+            resources: Available resources (defaults to the stored ones)
+            constraints: Project constraints (defaults to the stored ones)
+            changed_task_ids: Tasks whose inputs changed; defaults to new tasks
+                and tasks whose estimated hours differ from the stored schedule
+            freeze_started: Keep tasks with start_date_is set at their start
+            workpackage_id: Optional workpackage ID for department-based resource allocation
+            milestones: Optional list of milestone dictionaries
+
+        Returns:
+            ScheduleResponse, or None if the project has no stored schedule
+        """
+        previous = await self._store.get(project_id)
+        if previous is None:
+            return None
+        self._stop_background_solve(project_id)
+
+        constraints = constraints or previous.constraints
+        if constraints.project_start is None:
+            # Keep hour offsets comparable with the stored schedule
+            constraints = constraints.model_copy(
+                update={"project_start": previous.project_start_date}
+            )
+        if not resources:
+            resources = [ResourceCreate(**r.model_dump()) for r in previous.resources]
+
+        previous_starts = {
+            t.task_id: self._working_hours_from_start(
+                t.start_date, constraints.project_start, constraints
+            )
+            for t in previous.schedule
+        }
+        previous_durations = {t.task_id: t.duration_hours for t in previous.schedule}
+
+        if changed_task_ids is None:
+            changed_task_ids = [
+                t.id
+                for t in tasks
+                if previous_durations.get(t.id) != t.estimated_hours
+            ]
+        cone = self._downstream_cone(tasks, changed_task_ids)
+
+        frozen_starts: dict[str, int] = {}
+        if freeze_started:
+            for task in tasks:
+                if task.start_date_is is None:
+                    continue
+                frozen_starts[task.id] = previous_starts.get(
+                    task.id,
+                    self._working_hours_from_start(
+                        task.start_date_is, constraints.project_start, constraints
+                    ),
+                )
+
+        fixed_starts = {
+            task.id: previous_starts[task.id]
+            for task in tasks
+            if task.id in previous_starts and task.id not in cone
+        }
+        fixed_starts.update(frozen_starts)
+
+        department_resources, milestone_dependencies = (
+            await self._load_scheduling_context(workpackage_id, milestones)
+        )
+
+        def solve(pinned: dict[str, int]) -> Any:
+            return asyncio.to_thread(
+                self._solve_schedule,
+                project_id,
+                tasks,
+                resources,
+                constraints,
+                department_resources,
+                milestones,
+                milestone_dependencies,
+                hints=previous_starts,
+                fixed_starts=pinned,
+            )
+
+        response = await solve(fixed_starts)
+        reoptimized = len(tasks) - len(fixed_starts)
+        if response.status == "infeasible" and len(fixed_starts) > len(frozen_starts):
+            logger.info(
+                f"Incremental re-schedule of project {project_id} infeasible with "
+                f"unaffected tasks pinned; re-optimizing all non-frozen tasks"
+            )
+            response = await solve(frozen_starts)
+            reoptimized = len(tasks) - len(frozen_starts)
+
+        if response.status in ("success", "feasible"):
+            response.message = (
+                f"{response.message} (incremental: re-optimized {reoptimized} "
+                f"of {len(tasks)} tasks)"
+            )
+
+        return await self._finalize_schedule(
+            response, tasks, resources, constraints, milestones, milestone_dependencies
+        )
+
+    def _downstream_cone(
+        self, tasks: list[ScheduleTaskCreate], changed_task_ids: list[str]
+    ) -> set[str]:
+        """Return the changed tasks plus all their transitive successors"""
+        successors: dict[str, list[str]] = {}
+        for task in tasks:
+            for dep in task.dependencies:
+                successors.setdefault(dep.predecessor_id, []).append(task.id)
+
+        cone = set(changed_task_ids)
+        queue = list(cone)
+        while queue:
+            for successor_id in successors.get(queue.pop(), []):
+                if successor_id not in cone:
+                    cone.add(successor_id)
+                    queue.append(successor_id)
+
+        return cone
+
+    async def _load_scheduling_context(
+        self,
+        workpackage_id: str | None,
+        milestones: list[dict] | None,
+    ) -> tuple[list[ResourceCreate], dict[str, list[str]]]:
+        """
+        Load the graph data the CP model needs before it is built.
+
+        Fetching it up front keeps model building and solving free of I/O, so
+        the solve can run in a worker thread or process.
+
+        Args:
+            workpackage_id: Optional workpackage ID for department-based resource allocation
+            milestones: Optional list of milestone dictionaries
+
+        Returns:
+            Tuple of (department resources, milestone_id -> blocking task IDs)
+        """
+        department_resources: list[ResourceCreate] = []
+        if workpackage_id:
+            department_resources = await self.get_department_resources(workpackage_id)
+            logger.info(
+                f"Found {len(department_resources)} department resources for workpackage '{workpackage_id}'"
+            )
+
+        milestone_dependencies: dict[str, list[str]] = {}
+        for milestone in milestones or []:
+            milestone_id = str(milestone["id"])
+            milestone_dependencies[
+                milestone_id
+            ] = await self._get_milestone_dependencies(UUID(milestone_id))
+
+        return department_resources, milestone_dependencies
+
+    def _solve_schedule(
+        self,
+        project_id: UUID,
+        tasks: list[ScheduleTaskCreate],
+        resources: list[ResourceCreate],
+        constraints: ScheduleConstraints,
+        department_resources: list[ResourceCreate],
+        milestones: list[dict] | None,
+        milestone_dependencies: dict[str, list[str]],
+        stop_event: Any = None,
+        progress: "_SolveProgress | None" = None,
+        hints: dict[str, int] | None = None,
+        fixed_starts: dict[str, int] | None = None,
+    ) -> ScheduleResponse:
+        """
+        Build the CP model and solve it.
+
+        Performs no I/O, so it can run in a thread or in a worker process.
+
+        Args:
+            project_id: Unique project identifier
+            tasks: List of tasks to schedule
+            resources: List of available resources
+            constraints: Project constraints
+            department_resources: Resources of the workpackage's linked department
+            milestones: Optional list of milestone dictionaries
+            milestone_dependencies: Milestone ID -> IDs of tasks blocking it
+            stop_event: Optional event; setting it stops the search early
+            progress: Optional recorder exposing intermediate solutions
+            hints: Optional task ID -> start hour used as solution hint
+            fixed_starts: Optional task ID -> start hour the task is pinned to
+
+        Returns:
+            ScheduleResponse with the schedule (without critical path and
+            milestones) or with conflicts
+        """
         # Create the constraint programming model
         model = cp_model.CpModel()
 
@@ -195,6 +686,10 @@ class SchedulerService:
         # Create task variables
         task_vars = self._create_task_variables(model, tasks, horizon)
 
+        # Warm start from a previous schedule (incremental re-scheduling)
+        if hints or fixed_starts:
+            self._add_previous_solution(model, task_vars, hints or {}, fixed_starts or {})
+
         # Add dependency constraints
         dependency_conflicts = self._add_dependency_constraints(model, tasks, task_vars)
         if dependency_conflicts:
@@ -206,8 +701,8 @@ class SchedulerService:
             )
 
         # Add resource constraints (with optional department-based allocation)
-        resource_conflicts = await self._add_resource_constraints(
-            model, tasks, resources, task_vars, workpackage_id
+        resource_conflicts = self._add_resource_constraints(
+            model, tasks, resources, task_vars, department_resources
         )
         if resource_conflicts:
             return ScheduleResponse(
@@ -234,8 +729,8 @@ class SchedulerService:
 
         # Add milestone constraints (manual mode only)
         if milestones:
-            milestone_conflicts = await self._add_milestone_constraints(
-                model, tasks, task_vars, constraints, milestones
+            milestone_conflicts = self._add_milestone_constraints(
+                model, tasks, task_vars, constraints, milestones, milestone_dependencies
             )
             if milestone_conflicts:
                 return ScheduleResponse(
@@ -249,131 +744,514 @@ class SchedulerService:
         project_end = self._add_optimization_objective(model, tasks, task_vars, horizon)
 
         # Solve the model
+        profile = constraints.solver_profile
         solver = cp_model.CpSolver()
-        solver.parameters.max_time_in_seconds = 60.0  # Timeout after 60 seconds
+        solver.parameters.max_time_in_seconds = profile.max_time_seconds
+        solver.parameters.num_workers = profile.num_search_workers
+        solver.parameters.relative_gap_limit = profile.relative_gap_limit
+
+        if progress is not None:
+            progress.track(
+                [project_end]
+                + [var for tv in task_vars.values() for var in (tv["start"], tv["end"])],
+                lambda solution, stats: self._solution_response(
+                    project_id,
+                    solution,
+                    tasks,
+                    task_vars,
+                    constraints,
+                    project_end,
+                    status="feasible",
+                    message="Feasible schedule found - optimization continues in background",
+                    stats=stats,
+                ),
+                profile.num_search_workers,
+            )
 
-        status = solver.Solve(model)
+        status = self._run_solver(solver, model, stop_event, progress)
 
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-            schedule = self._extract_schedule(solver, tasks, task_vars, constraints)
-            project_duration = solver.Value(project_end)
+            return self._solution_response(
+                project_id,
+                solver,
+                tasks,
+                task_vars,
+                constraints,
+                project_end,
+                status="success" if status == cp_model.OPTIMAL else "feasible",
+                message="Optimal schedule found"
+                if status == cp_model.OPTIMAL
+                else "Feasible schedule found",
+                stats=_solver_statistics(solver, profile.num_search_workers),
+            )
+        elif status == cp_model.INFEASIBLE:
+            # Identify conflicts
+            conflicts = self._identify_conflicts(tasks, resources, constraints)
+            return ScheduleResponse(
+                status="infeasible",
+                project_id=project_id,
+                conflicts=conflicts,
+                message="No feasible schedule found - constraints cannot be satisfied",
+            )
+        else:
+            return ScheduleResponse(
+                status="error",
+                project_id=project_id,
+                message=f"Solver returned status: {solver.StatusName(status)}",
+            )
+
+    def _solution_response(
+        self,
+        project_id: UUID,
+        solution: Any,
+        tasks: list[ScheduleTaskCreate],
+        task_vars: dict[str, dict[str, Any]],
+        constraints: ScheduleConstraints,
+        project_end: cp_model.IntVar,
+        status: str,
+        message: str,
+        stats: SolverStatistics,
+    ) -> ScheduleResponse:
+        """Build a ScheduleResponse from a solver or a recorded solution"""
+        schedule = self._extract_schedule(solution, tasks, task_vars, constraints)
+        project_duration = solution.Value(project_end)
+
+        # Calculate project dates
+        project_start_date = constraints.project_start or datetime.now(UTC)
+        project_end_date = self._hours_to_datetime(
+            project_duration, project_start_date, constraints
+        )
 
-            # Calculate project dates
-            project_start_date = constraints.project_start or datetime.now(UTC)
-            project_end_date = self._hours_to_datetime(
-                project_duration, project_start_date, constraints
+        return ScheduleResponse(
+            status=status,
+            project_id=project_id,
+            schedule=schedule,
+            project_duration_hours=project_duration,
+            project_start_date=project_start_date,
+            project_end_date=project_end_date,
+            message=message,
+            solver_stats=stats,
+        )
+
+    def _run_solver(
+        self,
+        solver: cp_model.CpSolver,
+        model: cp_model.CpModel,
+        stop_event: Any = None,
+        callback: cp_model.CpSolverSolutionCallback | None = None,
+    ) -> int:
+        """Solve the model, stopping the search early once stop_event is set"""
+        if stop_event is None:
+            return solver.Solve(model, callback)
+
+        finished = threading.Event()
+
+        def watch_stop_event() -> None:
+            while not finished.is_set():
+                if stop_event.wait(0.2):
+                    solver.StopSearch()
+                    return
+
+        watcher = threading.Thread(target=watch_stop_event, daemon=True)
+        watcher.start()
+        try:
+            return solver.Solve(model, callback)
+        finally:
+            finished.set()
+            watcher.join()
+
+    async def _finalize_schedule(
+        self,
+        response: ScheduleResponse,
+        tasks: list[ScheduleTaskCreate],
+        resources: list[ResourceCreate],
+        constraints: ScheduleConstraints,
+        milestones: list[dict] | None,
+        milestone_dependencies: dict[str, list[str]],
+        expected_version: int | None = None,
+    ) -> ScheduleResponse:
+        """
+        Add critical path and milestone dates to a solved schedule and store it.
+
+        Args:
+            response: Response returned by _solve_schedule
+            tasks: Scheduled tasks
+            resources: Available resources
+            constraints: Project constraints
+            milestones: Optional list of milestone dictionaries
+            milestone_dependencies: Milestone ID -> IDs of tasks blocking it
+            expected_version: Only store the schedule if this is still the
+                stored version
+
+        Returns:
+            The completed ScheduleResponse
+        """
+        if response.status not in ("success", "feasible"):
+            return response
+
+        response = self._complete_schedule(
+            response, tasks, constraints, milestones, milestone_dependencies
+        )
+        await self._store_schedule(
+            response.project_id,
+            response,
+            resources,
+            constraints,
+            expected_version=expected_version,
+        )
+        return response
+
+    def _complete_schedule(
+        self,
+        response: ScheduleResponse,
+        tasks: list[ScheduleTaskCreate],
+        constraints: ScheduleConstraints,
+        milestones: list[dict] | None,
+        milestone_dependencies: dict[str, list[str]],
+    ) -> ScheduleResponse:
+        """Add critical path and milestone dates to a solved schedule"""
+
+        project_id = response.project_id
+        schedule = response.schedule
+
+        # Calculate critical path and float values
+        critical_path = []
+        near_critical_tasks = []
+        try:
+            from app.services.critical_path import analyze_critical_path
+
+            analysis = analyze_critical_path(
+                tasks, schedule, constraints.near_critical_float_hours
+            )
+            if analysis is not None:
+                critical_path = analysis.critical_path
+                near_critical_tasks = analysis.near_critical_tasks
+                analysis.apply_to_schedule(
+                    schedule, constraints.near_critical_float_hours
+                )
+
+            logger.info(
+                f"Critical path calculated for project {project_id}: "
+                f"{len(critical_path)} tasks, "
+                f"{len(near_critical_tasks)} near-critical"
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to calculate critical path for project {project_id}: {e}"
             )
+            # Continue without critical path - it's not a fatal error
 
-            # Calculate critical path
-            critical_path = []
+        # Calculate milestone dates
+        scheduled_milestones = []
+        if milestones:
             try:
-                from app.services.critical_path import calculate_critical_path
+                # Calculate automatic milestone dates
+                milestone_dates = self._calculate_automatic_milestone_dates(
+                    milestones, schedule, milestone_dependencies
+                )
 
-                critical_path = calculate_critical_path(tasks, schedule)
+                # Create ScheduledMilestone objects
+                for milestone in milestones:
+                    milestone_id = str(milestone["id"])
+                    is_manual = milestone.get("is_manual_constraint", False)
 
-                # Mark critical path tasks in schedule
-                critical_path_set = set(critical_path)
-                for scheduled_task in schedule:
-                    scheduled_task.is_critical = (
-                        scheduled_task.task_id in critical_path_set
+                    # Use calculated date for automatic milestones, target_date for manual
+                    if is_manual:
+                        date = milestone["target_date"]
+                    else:
+                        date = milestone_dates.get(
+                            milestone_id, milestone.get("target_date")
+                        )
+
+                    scheduled_milestones.append(
+                        ScheduledMilestone(
+                            milestone_id=milestone_id,
+                            title=milestone.get("title", f"Milestone {milestone_id}"),
+                            date=date,
+                            is_manual=is_manual,
+                            status=milestone.get("status", "active"),
+                        )
                     )
 
                 logger.info(
-                    f"Critical path calculated for project {project_id}: "
-                    f"{len(critical_path)} tasks"
+                    f"Calculated dates for {len(scheduled_milestones)} milestones "
+                    f"(manual: {sum(1 for m in scheduled_milestones if m.is_manual)}, "
+                    f"automatic: {sum(1 for m in scheduled_milestones if not m.is_manual)})"
                 )
             except Exception as e:
                 logger.error(
-                    f"Failed to calculate critical path for project {project_id}: {e}"
+                    f"Failed to calculate milestone dates for project {project_id}: {e}"
                 )
-                # Continue without critical path - it's not a fatal error
-
-            # Calculate milestone dates
-            scheduled_milestones = []
-            if milestones:
-                try:
-                    # Get milestone dependencies
-                    milestone_dependencies = {}
-                    for milestone in milestones:
-                        milestone_id = str(milestone["id"])
-                        milestone_dependencies[
-                            milestone_id
-                        ] = await self._get_milestone_dependencies(UUID(milestone_id))
-
-                    # Calculate automatic milestone dates
-                    milestone_dates = self._calculate_automatic_milestone_dates(
-                        milestones, schedule, milestone_dependencies
-                    )
+                # Continue without milestones - it's not a fatal error
 
-                    # Create ScheduledMilestone objects
-                    for milestone in milestones:
-                        milestone_id = str(milestone["id"])
-                        is_manual = milestone.get("is_manual_constraint", False)
+        response.critical_path = critical_path
+        response.near_critical_tasks = near_critical_tasks
+        response.milestones = scheduled_milestones
+        return response
 
-                        # Use calculated date for automatic milestones, target_date for manual
-                        if is_manual:
-                            date = milestone["target_date"]
-                        else:
-                            date = milestone_dates.get(
-                                milestone_id, milestone.get("target_date")
-                            )
+    # ------------------------------------------------------------------
+    # Asynchronous schedule jobs
+    # ------------------------------------------------------------------
 
-                        scheduled_milestones.append(
-                            ScheduledMilestone(
-                                milestone_id=milestone_id,
-                                title=milestone.get(
-                                    "title", f"Milestone {milestone_id}"
-                                ),
-                                date=date,
-                                is_manual=is_manual,
-                                status=milestone.get("status", "active"),
-                            )
-                        )
+    async def submit_schedule_job(
+        self,
+        project_id: UUID,
+        tasks: list[ScheduleTaskCreate],
+        resources: list[ResourceCreate],
+        constraints: ScheduleConstraints,
+        workpackage_id: str | None = None,
+        milestones: list[dict] | None = None,
+    ) -> ScheduleJobStatus:
+        """
+        Queue a schedule calculation to run in the scheduler process pool.
 
-                    logger.info(
-                        f"Calculated dates for {len(scheduled_milestones)} milestones "
-                        f"(manual: {sum(1 for m in scheduled_milestones if m.is_manual)}, "
-                        f"automatic: {sum(1 for m in scheduled_milestones if not m.is_manual)})"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to calculate milestone dates for project {project_id}: {e}"
-                    )
-                    # Continue without milestones - it's not a fatal error
+        The CP model is solved in a worker process, so long searches neither
+        block the event loop nor compete with request handling for the GIL.
+        Poll get_schedule_job() for progress and get_schedule_job_result() for
+        the ScheduleResponse. Jobs always solve to completion, so the profile's
+        quick_feasible_seconds does not apply. The job runs in this worker;
+        its state is stored in the database, so any worker can report it.
 
-            response = ScheduleResponse(
-                status="success" if status == cp_model.OPTIMAL else "feasible",
-                project_id=project_id,
-                schedule=schedule,
-                milestones=scheduled_milestones,
-                project_duration_hours=project_duration,
-                project_start_date=project_start_date,
-                project_end_date=project_end_date,
-                critical_path=critical_path,
-                message="Optimal schedule found"
-                if status == cp_model.OPTIMAL
-                else "Feasible schedule found",
+        Args:
+            project_id: Unique project identifier
+            tasks: List of tasks to schedule
+            resources: List of available resources
+            constraints: Project constraints
+            workpackage_id: Optional workpackage ID for department-based resource allocation
+            milestones: Optional list of milestone dictionaries
+
+        Returns:
+            ScheduleJobStatus of the queued job
+        """
+        await self._job_store.prune(settings.SCHEDULER_MAX_RETAINED_JOBS)
+
+        job = _ScheduleJob(
+            job_id=uuid4(),
+            project_id=project_id,
+            submitted_at=datetime.now(UTC),
+        )
+        await self._job_store.create(self._job_status(job))
+        self._jobs[job.job_id] = job
+        job.task = asyncio.create_task(
+            self._run_schedule_job(
+                job, tasks, resources, constraints, workpackage_id, milestones
             )
+        )
 
-            # Store the schedule
-            await self._store_schedule(project_id, response, resources, constraints)
+        logger.info(f"Queued schedule job {job.job_id} for project {project_id}")
+        return self._job_status(job)
 
-            return response
-        elif status == cp_model.INFEASIBLE:
-            # Identify conflicts
-            conflicts = self._identify_conflicts(tasks, resources, constraints)
-            return ScheduleResponse(
-                status="infeasible",
-                project_id=project_id,
-                conflicts=conflicts,
-                message="No feasible schedule found - constraints cannot be satisfied",
+    async def get_schedule_job(self, job_id: UUID) -> ScheduleJobStatus | None:
+        """
+        Get the status of a schedule job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            ScheduleJobStatus, or None if the job is unknown
+        """
+        return await self._job_store.get(job_id)
+
+    async def get_schedule_job_result(self, job_id: UUID) -> ScheduleResponse | None:
+        """
+        Get the schedule calculated by a completed job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            ScheduleResponse, or None if the job is unknown or has no result yet
+        """
+        return await self._job_store.get_result(job_id)
+
+    async def cancel_schedule_job(self, job_id: UUID) -> ScheduleJobStatus | None:
+        """
+        Cancel a schedule job.
+
+        Queued jobs are dropped before they reach a worker; running jobs have
+        their solver search stopped. Finished jobs are left unchanged. The
+        job is marked cancelled in the job store, so a job running in another
+        worker stops once that worker next checks its state.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            ScheduleJobStatus after cancellation, or None if the job is unknown
+        """
+        status = await self._job_store.cancel(job_id, "Cancelled by user")
+        job = self._jobs.get(job_id)
+        if status is None or status.status != "cancelled" or job is None:
+            return status
+
+        if job.status not in _FINISHED_JOB_STATES:
+            job.status = "cancelled"
+            job.message = status.message
+            job.finished_at = status.finished_at
+
+            if job.future is None:
+                # Loading scheduling context or waiting for a worker - nothing reached the pool
+                if job.task is not None:
+                    job.task.cancel()
+            elif not job.future.cancel() and job.stop_event is not None:
+                job.stop_event.set()
+
+            logger.info(f"Cancelled schedule job {job_id}")
+
+        return status
+
+    async def _run_schedule_job(
+        self,
+        job: _ScheduleJob,
+        tasks: list[ScheduleTaskCreate],
+        resources: list[ResourceCreate],
+        constraints: ScheduleConstraints,
+        workpackage_id: str | None,
+        milestones: list[dict] | None,
+    ) -> None:
+        """Load context, solve in the process pool and finalize a schedule job"""
+        try:
+            if not tasks:
+                job.result = ScheduleResponse(
+                    status="error",
+                    project_id=job.project_id,
+                    message="No tasks provided for scheduling",
+                )
+                job.status = "completed"
+                return
+
+            department_resources, milestone_dependencies = (
+                await self._load_scheduling_context(workpackage_id, milestones)
             )
-        else:
-            return ScheduleResponse(
-                status="error",
-                project_id=project_id,
-                message=f"Solver returned status: {solver.StatusName(status)}",
+            if job.status == "cancelled":
+                return
+
+            async with self._job_slots:
+                if job.status == "cancelled":
+                    return
+
+                job.status = "running"
+                job.started_at = datetime.now(UTC)
+                if not await self._save_job(job):
+                    return
+
+                job.stop_event = self._get_job_manager().Event()
+                job.future = self._get_process_pool().submit(
+                    _solve_schedule_in_process,
+                    job.project_id,
+                    tasks,
+                    resources,
+                    constraints,
+                    department_resources,
+                    milestones,
+                    milestone_dependencies,
+                    job.stop_event,
+                )
+                response = await self._wait_for_solve(job)
+            if job.status == "cancelled":
+                return
+
+            job.result = await self._finalize_schedule(
+                response,
+                tasks,
+                resources,
+                constraints,
+                milestones,
+                milestone_dependencies,
+            )
+            job.status = "completed"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+        except Exception as e:
+            logger.error(f"Schedule job {job.job_id} failed: {e}")
+            job.status = "failed"
+            job.message = str(e)
+        finally:
+            job.finished_at = job.finished_at or datetime.now(UTC)
+            job.stop_event = None
+            await self._save_job(job)
+            self._jobs.pop(job.job_id, None)
+
+    async def _wait_for_solve(self, job: _ScheduleJob) -> ScheduleResponse:
+        """Wait for a job's solve, stopping it if the job is cancelled elsewhere"""
+        solve = asyncio.wrap_future(job.future)
+        while True:
+            done, _ = await asyncio.wait({solve}, timeout=_JOB_CANCEL_POLL_SECONDS)
+            if done:
+                return solve.result()
+
+            stored = await self._job_store.get(job.job_id)
+            if job.status != "cancelled" and stored is not None and stored.status == "cancelled":
+                logger.info(f"Schedule job {job.job_id} was cancelled by another worker")
+                job.status = "cancelled"
+                job.message = stored.message
+                job.finished_at = stored.finished_at
+                if not job.future.cancel() and job.stop_event is not None:
+                    job.stop_event.set()
+
+    async def _save_job(self, job: _ScheduleJob) -> bool:
+        """
+        Store the state of a job run by this worker.
+
+        Returns:
+            False if the stored job had already finished, i.e. it was
+            cancelled through another worker; the job is then marked cancelled
+        """
+        saved = await self._job_store.update(self._job_status(job), job.result)
+        if not saved and job.status not in _FINISHED_JOB_STATES:
+            job.status = "cancelled"
+            job.finished_at = datetime.now(UTC)
+        return saved
+
+    def _job_status(self, job: _ScheduleJob) -> ScheduleJobStatus:
+        """Build the public status of a job"""
+        return ScheduleJobStatus(
+            job_id=job.job_id,
+            project_id=job.project_id,
+            status=job.status,
+            submitted_at=job.submitted_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            message=job.message,
+            result_status=job.result.status if job.result else None,
+        )
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Create the solver process pool on first use"""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=settings.SCHEDULER_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
             )
+        return self._process_pool
+
+    def _get_job_manager(self) -> Any:
+        """Create the manager providing cross-process cancellation events"""
+        if self._job_manager is None:
+            self._job_manager = multiprocessing.get_context("spawn").Manager()
+        return self._job_manager
+
+    def shutdown(self) -> None:
+        """Stop running jobs and background solves, release the process pool"""
+        for _, stop_event in self._background_solves.values():
+            stop_event.set()
+
+        for job in self._jobs.values():
+            if job.status not in _FINISHED_JOB_STATES:
+                job.status = "cancelled"
+                job.message = "Scheduler shut down"
+                if job.stop_event is not None:
+                    job.stop_event.set()
+                if job.task is not None:
+                    job.task.cancel()
+
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        if self._job_manager is not None:
+            self._job_manager.shutdown()
+            self._job_manager = None
 
     def _create_task_variables(
         self, model: cp_model.CpModel, tasks: list[ScheduleTaskCreate], horizon: int
@@ -398,6 +1276,22 @@ class SchedulerService:
 
         return task_vars
 
+    def _add_previous_solution(
+        self,
+        model: cp_model.CpModel,
+        task_vars: dict[str, dict[str, Any]],
+        hints: dict[str, int],
+        fixed_starts: dict[str, int],
+    ) -> None:
+        """Hint task starts from a previous solution and pin fixed tasks"""
+        for task_id, start in hints.items():
+            if task_id in task_vars and task_id not in fixed_starts:
+                model.AddHint(task_vars[task_id]["start"], start)
+
+        for task_id, start in fixed_starts.items():
+            if task_id in task_vars:
+                model.Add(task_vars[task_id]["start"] == start)
+
     def _add_dependency_constraints(
         self,
         model: cp_model.CpModel,
@@ -449,13 +1343,13 @@ class SchedulerService:
 
         return conflicts
 
-    async def _add_resource_constraints(
+    def _add_resource_constraints(
         self,
         model: cp_model.CpModel,
         tasks: list[ScheduleTaskCreate],
         resources: list[ResourceCreate],
         task_vars: dict[str, dict[str, Any]],
-        workpackage_id: str | None = None,
+        department_resources: list[ResourceCreate] | None = None,
     ) -> list[ScheduleConflict]:
         """
         Add resource capacity constraints using cumulative constraints with skill-based matching.
@@ -468,21 +1362,14 @@ class SchedulerService:
             tasks: List of tasks to schedule
             resources: Available resources
             task_vars: Task variables
-            workpackage_id: Optional workpackage ID for department-based allocation
+            department_resources: Resources of the workpackage's linked department
 
         Returns:
             List of conflicts
         """
         conflicts = []
         resource_map = {r.id: r for r in resources}
-
-        # Get department resources if workpackage_id is provided
-        department_resources = []
-        if workpackage_id:
-            department_resources = await self.get_department_resources(workpackage_id)
-            logger.info(
-                f"Found {len(department_resources)} department resources for workpackage '{workpackage_id}'"
-            )
+        department_resources = department_resources or []
 
         # For each task, match resources based on skills
         for task in tasks:
@@ -739,12 +1626,12 @@ class SchedulerService:
 
     def _extract_schedule(
         self,
-        solver: cp_model.CpSolver,
+        solver: Any,
         tasks: list[ScheduleTaskCreate],
         task_vars: dict[str, dict[str, Any]],
         constraints: ScheduleConstraints,
     ) -> list[ScheduledTask]:
-        """Extract the schedule from the solved model"""
+        """Extract the schedule from the solved model (or a recorded solution)"""
         schedule = []
         project_start = constraints.project_start or datetime.now(UTC)
 
@@ -774,6 +1661,7 @@ class SchedulerService:
                     end_date=end_date,
                     duration_hours=task.estimated_hours,
                     assigned_resources=task.required_resources,
+                    start_date_is=task.start_date_is,
                 )
             )
 
@@ -996,6 +1884,49 @@ class SchedulerService:
 
         return total_hours
 
+    def _working_hours_from_start(
+        self, target: datetime, start: datetime, constraints: ScheduleConstraints
+    ) -> int:
+        """
+        Convert a calendar datetime back to working hours from project start.
+
+        Exact inverse of _hours_to_datetime for datetimes it produces; earlier
+        datetimes map to 0.
+        """
+        if target.tzinfo is None:
+            target = target.replace(tzinfo=UTC)
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=UTC)
+
+        if not constraints.respect_weekends:
+            return max(0, int((target - start).total_seconds() // 3600))
+
+        # Same first working day as _hours_to_datetime
+        while start.weekday() >= 5:
+            start += timedelta(days=1)
+
+        # Working days start at the project start's time of day; shifting by
+        # that offset puts the target on the date of its working day
+        time_of_day = start - start.replace(hour=0, minute=0, second=0, microsecond=0)
+        shifted = target - time_of_day
+        days = (shifted.date() - start.date()).days
+        if days < 0:
+            return 0
+
+        weeks, remaining_days = divmod(days, 7)
+        working_days = weeks * 5 + sum(
+            1
+            for offset in range(1, remaining_days + 1)
+            if (start + timedelta(days=offset)).weekday() < 5
+        )
+        remaining_hours = int(
+            (shifted - shifted.replace(hour=0, minute=0, second=0, microsecond=0))
+            .total_seconds()
+            // 3600
+        )
+
+        return working_days * constraints.working_hours_per_day + remaining_hours
+
     def _hours_to_datetime(
         self, hours: int, start: datetime, constraints: ScheduleConstraints
     ) -> datetime:
@@ -1047,10 +1978,25 @@ class SchedulerService:
         response: ScheduleResponse,
         resources: list[ResourceCreate],
         constraints: ScheduleConstraints,
-    ) -> None:
-        """Store the calculated schedule and update WorkItem task dates"""
+        expected_version: int | None = None,
+    ) -> ProjectSchedule | None:
+        """
+        Store the calculated schedule and update WorkItem task dates.
+
+        Args:
+            project_id: Project identifier
+            response: Completed schedule response
+            resources: Available resources
+            constraints: Project constraints
+            expected_version: Only store if this is still the stored version
+
+        Returns:
+            The stored schedule, or None if a newer schedule was stored since
+            expected_version
+        """
         from app.schemas.schedule import ResourceResponse
 
+        previous = await self._store.get(project_id)
         schedule = ProjectSchedule(
             project_id=project_id,
             schedule=response.schedule,
@@ -1060,17 +2006,26 @@ class SchedulerService:
             project_start_date=response.project_start_date or datetime.now(UTC),
             project_end_date=response.project_end_date or datetime.now(UTC),
             critical_path=response.critical_path,
-            created_at=datetime.now(UTC),
+            near_critical_tasks=response.near_critical_tasks,
+            created_at=previous.created_at if previous else datetime.now(UTC),
             updated_at=datetime.now(UTC),
-            version=1,
+            version=previous.version + 1 if previous else 1,
         )
 
-        self._schedules[str(project_id)] = schedule
+        saved = await self._store.save(schedule, expected_version=expected_version)
+        if saved is None:
+            logger.info(
+                f"Discarded schedule for project {project_id}: superseded by "
+                f"a schedule saved after version {expected_version}"
+            )
+            return None
 
         # Update WorkItem nodes with calculated dates
         if response.schedule:
             try:
-                await self.update_workitem_task_dates(response.schedule)
+                response.task_date_failures = await self.update_workitem_task_dates(
+                    response.schedule
+                )
             except Exception as e:
                 # Log error but don't fail schedule storage
                 # This allows tests to run without database connection
@@ -1078,6 +2033,7 @@ class SchedulerService:
                     f"Failed to update WorkItem task dates: {e}. "
                     "Schedule stored successfully but task dates not updated in graph."
                 )
+        return saved
 
     async def get_schedule(self, project_id: UUID) -> ProjectSchedule | None:
         """
@@ -1089,7 +2045,7 @@ class SchedulerService:
         Returns:
             ProjectSchedule if found, None otherwise
         """
-        return self._schedules.get(str(project_id))
+        return await self._store.get(project_id)
 
     async def update_schedule(
         self, project_id: UUID, updates: ScheduleUpdate
@@ -1104,9 +2060,11 @@ class SchedulerService:
         Returns:
             Updated ScheduleResponse or None if schedule not found
         """
-        schedule = self._schedules.get(str(project_id))
+        schedule = await self._store.get(project_id)
         if not schedule:
             return None
+        # The stored instance is shared with the cache - edit a copy
+        schedule = schedule.model_copy(deep=True)
 
         # Apply task adjustments
         updated_tasks = []
@@ -1154,7 +2112,7 @@ class SchedulerService:
                 / 3600
             )
 
-        self._schedules[str(project_id)] = schedule
+        schedule = await self._store.save(schedule)
 
         return ScheduleResponse(
             status="success",
@@ -1188,11 +2146,13 @@ class SchedulerService:
         graph_service = await get_graph_service()
 
         # Build query to get WorkItem nodes with type='task'
+        params: dict[str, Any] = {}
         if workpackage_id:
-            query = f"""
-            MATCH (w:WorkItem {{type: 'task'}})-[:BELONGS_TO]->(wp:Workpackage {{id: '{str(workpackage_id)}'}})
+            query = """
+            MATCH (w:WorkItem {type: 'task'})-[:BELONGS_TO]->(wp:Workpackage {id: $workpackage_id})
             RETURN w
             """
+            params["workpackage_id"] = str(workpackage_id)
         else:
             # For now, get all tasks (in future, could filter by project)
             query = """
@@ -1201,7 +2161,7 @@ class SchedulerService:
             """
 
         try:
-            results = await graph_service.execute_query(query)
+            results = await graph_service.execute_query(query, params)
 
             tasks = []
             for result in results:
@@ -1245,6 +2205,18 @@ class SchedulerService:
                     except (ValueError, AttributeError) as e:
                         logger.warning(f"Failed to parse due_date for task {task_id}: {e}")
 
+                start_date_is = workitem.get("start_date_is")  # Actual start
+                if isinstance(start_date_is, str):
+                    try:
+                        start_date_is = datetime.fromisoformat(
+                            start_date_is.replace('Z', '+00:00')
+                        )
+                    except ValueError as e:
+                        logger.warning(f"Failed to parse start_date_is for task {task_id}: {e}")
+                        start_date_is = None
+                elif not isinstance(start_date_is, datetime):
+                    start_date_is = None
+
                 # Get dependencies (if any) - for now, empty list
                 # In future, could query DEPENDS_ON relationships
                 dependencies = []
@@ -1259,6 +2231,7 @@ class SchedulerService:
                     skills_needed=skills_needed,
                     earliest_start=earliest_start,  # Manual start_date as constraint
                     deadline=deadline,  # Manual due_date as constraint
+                    start_date_is=start_date_is,
                 )
 
                 tasks.append(task)
@@ -1274,7 +2247,7 @@ class SchedulerService:
 
     async def update_workitem_task_dates(
         self, scheduled_tasks: list[ScheduledTask]
-    ) -> None:
+    ) -> dict[str, str]:
         """
         Update WorkItem nodes (type='task') with calculated schedule dates.
         
@@ -1284,41 +2257,78 @@ class SchedulerService:
         - start_date: Manual user-specified start (preserved, not overwritten)
         - due_date: Manual user-specified deadline (preserved, not overwritten)
 
+        All dates are written with one UNWIND statement per chunk of
+        _TASK_DATE_BATCH_SIZE tasks, inside a single transaction.
+
         Args:
             scheduled_tasks: List of scheduled tasks with calculated dates
+
+        Returns:
+            Task ID -> failure reason for tasks that were not updated
         """
         from app.db.graph import get_graph_service
 
+        if not scheduled_tasks:
+            return {}
+
         graph_service = await get_graph_service()
 
-        for task in scheduled_tasks:
-            try:
-                # Update WorkItem node with calculated dates only
-                # Do NOT overwrite manual start_date or due_date
-                query = f"""
-                MATCH (w:WorkItem {{id: '{task.task_id}', type: 'task'}})
-                SET w.calculated_start_date = '{task.start_date.isoformat()}',
-                    w.calculated_end_date = '{task.end_date.isoformat()}',
-                    w.updated_at = '{datetime.now(UTC).isoformat()}'
-                RETURN w
-                """
-
-                result = await graph_service.execute_query(query)
+        # Do NOT overwrite manual start_date or due_date
+        query = """
+        UNWIND $rows AS row
+        MATCH (w:WorkItem)
+        WHERE w.id = row.id AND w.type = 'task'
+        SET w.calculated_start_date = row.start,
+            w.calculated_end_date = row.end,
+            w.updated_at = $updated_at
+        RETURN w.id
+        """
+        updated_at = datetime.now(UTC).isoformat()
+        chunks = [
+            scheduled_tasks[i : i + _TASK_DATE_BATCH_SIZE]
+            for i in range(0, len(scheduled_tasks), _TASK_DATE_BATCH_SIZE)
+        ]
+        param_sets = [
+            {
+                "rows": [
+                    {
+                        "id": task.task_id,
+                        "start": task.start_date.isoformat(),
+                        "end": task.end_date.isoformat(),
+                    }
+                    for task in chunk
+                ],
+                "updated_at": updated_at,
+            }
+            for chunk in chunks
+        ]
 
-                if result:
-                    logger.info(
-                        f"Updated WorkItem task {task.task_id} with calculated dates: "
-                        f"{task.start_date} to {task.end_date}"
-                    )
-                else:
-                    logger.warning(
-                        f"WorkItem task {task.task_id} not found for date update"
-                    )
+        try:
+            results = await graph_service.execute_batched(query, param_sets)
+        except Exception as e:
+            logger.error(f"Failed to update WorkItem task dates: {e}")
+            results = [e] * len(chunks)
+
+        failures: dict[str, str] = {}
+        for chunk, result in zip(chunks, results, strict=True):
+            if isinstance(result, Exception):
+                for task in chunk:
+                    failures[task.task_id] = f"Update failed: {result}"
+                continue
 
-            except Exception as e:
-                logger.error(
-                    f"Failed to update WorkItem task {task.task_id} dates: {e}"
-                )
+            updated_ids = {str(task_id) for task_id in result}
+            for task in chunk:
+                if task.task_id not in updated_ids:
+                    failures[task.task_id] = "WorkItem task not found"
+
+        logger.info(
+            f"Updated calculated dates of {len(scheduled_tasks) - len(failures)} "
+            f"WorkItem tasks in {len(chunks)} batch(es)"
+        )
+        for task_id, reason in failures.items():
+            logger.warning(f"WorkItem task {task_id} dates not updated: {reason}")
+
+        return failures
 
     async def _get_milestone_dependencies(self, milestone_id: UUID) -> list[str]:
         """
@@ -1343,13 +2353,14 @@ class SchedulerService:
             logger.error(f"Failed to get milestone dependencies: {e}")
             return []
 
-    async def _add_milestone_constraints(
+    def _add_milestone_constraints(
         self,
         model: cp_model.CpModel,
         tasks: list[ScheduleTaskCreate],
         task_vars: dict,
         constraints: ScheduleConstraints,
         milestones: list[dict],
+        milestone_dependencies: dict[str, list[str]],
     ) -> list[ScheduleConflict]:
         """
         Add milestone constraints to the scheduling model (manual mode only).
@@ -1363,6 +2374,7 @@ class SchedulerService:
             task_vars: Task variable dictionary
             constraints: Schedule constraints
             milestones: List of milestone dictionaries with id, target_date, is_manual_constraint
+            milestone_dependencies: Milestone ID -> IDs of tasks blocking it
 
         Returns:
             List of conflicts if any milestone constraints cannot be satisfied
@@ -1385,7 +2397,7 @@ class SchedulerService:
             milestone_title = milestone.get("title", f"Milestone {milestone_id}")
 
             # Get tasks that block this milestone
-            blocking_task_ids = await self._get_milestone_dependencies(milestone_id)
+            blocking_task_ids = milestone_dependencies.get(str(milestone_id), [])
 
             if not blocking_task_ids:
                 logger.warning(f"Milestone '{milestone_title}' has no dependent tasks")
@@ -1509,6 +2521,9 @@ class SchedulerService:
         - Sprint boundaries with dates
         - Project completion percentage
 
+        Results are cached per project until the stored schedule version
+        changes or _GANTT_CACHE_TTL_SECONDS pass.
+
         Args:
             project_id: Project identifier
 
@@ -1521,17 +2536,59 @@ class SchedulerService:
         # Get the stored schedule for critical path data
         schedule = await self.get_schedule(project_id)
         if not schedule:
+            self._gantt_cache.pop(project_id, None)
             return None
 
+        # updated_at covers saves that could not reach the database and so
+        # kept the previous version number
+        version_key = (schedule.version, schedule.updated_at)
+        cached = self._gantt_cache.get(project_id)
+        if (
+            cached is not None
+            and cached[0] == version_key
+            and time.monotonic() - cached[1] < _GANTT_CACHE_TTL_SECONDS
+        ):
+            return cached[2]
+
         graph_service = await get_graph_service()
 
         # Prepare schedule data for gantt_utils
         schedule_data = {
             "critical_path": schedule.critical_path,
+            "task_floats": {
+                task.task_id: task
+                for task in schedule.schedule
+                if task.total_float_hours is not None
+            },
         }
 
         # Use the new prepare_gantt_data function
-        return await prepare_gantt_data(project_id, graph_service, schedule_data)
+        gantt_data = await prepare_gantt_data(project_id, graph_service, schedule_data)
+        self._gantt_cache[project_id] = (version_key, time.monotonic(), gantt_data)
+        return gantt_data
+
+
+def _solve_schedule_in_process(
+    project_id: UUID,
+    tasks: list[ScheduleTaskCreate],
+    resources: list[ResourceCreate],
+    constraints: ScheduleConstraints,
+    department_resources: list[ResourceCreate],
+    milestones: list[dict] | None,
+    milestone_dependencies: dict[str, list[str]],
+    stop_event: Any = None,
+) -> ScheduleResponse:
+    """Process pool entry point: solve a schedule in a worker process"""
+    return SchedulerService()._solve_schedule(
+        project_id,
+        tasks,
+        resources,
+        constraints,
+        department_resources,
+        milestones,
+        milestone_dependencies,
+        stop_event,
+    )
 
 
 # Singleton instance
@@ -1544,3 +2601,9 @@ async def get_scheduler_service() -> SchedulerService:
     if _scheduler_service is None:
         _scheduler_service = SchedulerService()
     return _scheduler_service
+
+
+def shutdown_scheduler_service() -> None:
+    """Shut down the scheduler service's background job workers"""
+    if _scheduler_service is not None:
+        _scheduler_service.shutdown()
@@ -1,13 +1,19 @@
 """Digital signature service for cryptographic document signing and verification"""
 
+import asyncio
 import hashlib
 import json
+import os
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime
 from uuid import UUID
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
-from sqlalchemy import select
+from sqlalchemy import any_, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.signature import DigitalSignature
@@ -18,6 +24,100 @@ from app.schemas.signature import (
     SignatureVerificationResponse,
 )
 
+# Signatures verified per worker thread task in bulk verification
+_VERIFY_CHUNK_SIZE = 64
+
+
+class PublicKeyRegistry:
+    """
+    LRU cache of parsed RSA public keys.
+
+    Keys are cached per signer and key fingerprint (SHA-256 of the PEM), so
+    a signer's key is parsed once however many signatures it verifies, and a
+    rotated key never resolves to the old one.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize the registry.
+
+        Args:
+            maxsize: Maximum number of parsed keys kept
+        """
+        self._maxsize = maxsize
+        self._keys: OrderedDict[tuple[UUID | None, str], rsa.RSAPublicKey] = OrderedDict()
+
+    def get(self, user_id: UUID | None, public_key_pem: bytes) -> rsa.RSAPublicKey:
+        """
+        Get the parsed public key of a signer.
+
+        Args:
+            user_id: Signer the key belongs to (None if unknown)
+            public_key_pem: RSA public key in PEM format
+
+        Returns:
+            Parsed RSA public key
+
+        Raises:
+            ValueError: If the key cannot be parsed or is not an RSA key
+        """
+        cache_key = (user_id, hashlib.sha256(public_key_pem).hexdigest())
+        public_key = self._keys.get(cache_key)
+        if public_key is not None:
+            self._keys.move_to_end(cache_key)
+            return public_key
+
+        public_key = serialization.load_pem_public_key(public_key_pem)
+        if not isinstance(public_key, rsa.RSAPublicKey):
+            raise ValueError("Public key must be an RSA key")
+
+        self._keys[cache_key] = public_key
+        if len(self._keys) > self._maxsize:
+            self._keys.popitem(last=False)
+        return public_key
+
+    def clear(self) -> None:
+        """Forget all parsed keys"""
+        self._keys.clear()
+
+
+public_key_registry = PublicKeyRegistry()
+
+
+def _uuid_in(column, ids: list[UUID]):
+    """column = ANY(:ids) with the IDs bound as one array parameter"""
+    return column == any_(literal(ids, ARRAY(PGUUID(as_uuid=True))))
+
+
+def _workitem_in(workitem_ids: list[UUID]):
+    """workitem_id = ANY(:ids) with the IDs bound as one array parameter"""
+    return _uuid_in(DigitalSignature.workitem_id, workitem_ids)
+
+
+def _verify_pss(public_key: rsa.RSAPublicKey, content_hash: str, signature_hash: str) -> bool:
+    """Check an RSA-PSS/SHA-256 signature of a content hash"""
+    try:
+        public_key.verify(
+            bytes.fromhex(signature_hash),
+            content_hash.encode("utf-8"),
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.MAX_LENGTH,
+            ),
+            hashes.SHA256(),
+        )
+        return True
+    except Exception:
+        # Any exception during verification means the signature is invalid
+        return False
+
+
+def _verify_pss_batch(
+    batch: list[tuple[rsa.RSAPublicKey, str, str]],
+) -> list[bool]:
+    """Verify a batch of (key, content hash, signature) in a worker thread"""
+    return [_verify_pss(*item) for item in batch]
+
 
 class SignatureService:
     """
@@ -174,6 +274,141 @@ class SignatureService:
             error_message=None if is_valid else "Signature verification failed",
         )
 
+    async def verify_signatures(
+        self,
+        public_keys: Mapping[UUID, bytes],
+        signature_ids: Iterable[UUID] = (),
+        workitem_ids: Iterable[UUID] = (),
+        workitem_contents: Mapping[UUID, dict] | None = None,
+    ) -> list[SignatureVerificationResponse]:
+        """
+        Verify many signatures at once.
+
+        All signature rows are loaded with one query, each WorkItem's
+        content is hashed once, each signer's public key is parsed once
+        (and cached across calls), and the RSA-PSS checks run in worker
+        threads, as the cryptography library releases the GIL while
+        verifying.
+
+        Args:
+            public_keys: RSA public key in PEM format per signer user ID
+            signature_ids: Signatures to verify
+            workitem_ids: WorkItems whose valid signatures to verify
+            workitem_contents: Current content per WorkItem. Signatures of
+                WorkItems without content only get the cryptographic check,
+                report content_matches as None and are not valid
+
+        Returns:
+            One SignatureVerificationResponse per signature: the requested
+            signature IDs first, in order, then the WorkItems' signatures
+        """
+        signature_ids = list(dict.fromkeys(signature_ids))
+        workitem_ids = list(dict.fromkeys(workitem_ids))
+        workitem_contents = workitem_contents or {}
+
+        signatures: dict[UUID, DigitalSignature] = {}
+        if signature_ids or workitem_ids:
+            conditions = []
+            if signature_ids:
+                conditions.append(_uuid_in(DigitalSignature.id, signature_ids))
+            if workitem_ids:
+                conditions.append(
+                    _workitem_in(workitem_ids) & (DigitalSignature.is_valid == True)
+                )
+            result = await self.db.execute(
+                select(DigitalSignature)
+                .where(or_(*conditions))
+                .order_by(DigitalSignature.workitem_id, DigitalSignature.signed_at)
+            )
+            signatures = {signature.id: signature for signature in result.scalars().all()}
+
+        requested = set(signature_ids)
+        ordered = signature_ids + [
+            signature_id for signature_id in signatures if signature_id not in requested
+        ]
+
+        now = datetime.now(UTC)
+        content_hashes = {
+            workitem_id: self._generate_content_hash(content)
+            for workitem_id, content in workitem_contents.items()
+        }
+
+        responses: dict[UUID, SignatureVerificationResponse] = {}
+        pending: list[tuple[DigitalSignature, rsa.RSAPublicKey]] = []
+        for signature_id in ordered:
+            signature = signatures.get(signature_id)
+            error = None
+            public_key = None
+            if signature is None:
+                error = "Signature not found"
+            elif not signature.is_valid:
+                error = f"Signature invalidated: {signature.invalidation_reason}"
+            elif signature.user_id not in public_keys:
+                error = "No public key supplied for the signer"
+            else:
+                try:
+                    public_key = public_key_registry.get(
+                        signature.user_id, public_keys[signature.user_id]
+                    )
+                except Exception as e:
+                    error = f"Invalid public key: {e}"
+
+            if public_key is None:
+                responses[signature_id] = SignatureVerificationResponse(
+                    signature_id=signature_id,
+                    is_valid=False,
+                    verification_timestamp=now,
+                    content_matches=False,
+                    signature_intact=False,
+                    error_message=error,
+                )
+            else:
+                pending.append((signature, public_key))
+
+        # Verify in worker threads: at most one task per CPU, each with at
+        # least _VERIFY_CHUNK_SIZE signatures
+        chunks: list[list[tuple[DigitalSignature, rsa.RSAPublicKey]]] = []
+        if pending:
+            tasks = min(os.cpu_count() or 1, -(-len(pending) // _VERIFY_CHUNK_SIZE))
+            size = -(-len(pending) // tasks)
+            chunks = [pending[i: i + size] for i in range(0, len(pending), size)]
+        results = await asyncio.gather(*(
+            asyncio.to_thread(
+                _verify_pss_batch,
+                [
+                    (public_key, signature.content_hash, signature.signature_hash)
+                    for signature, public_key in chunk
+                ],
+            )
+            for chunk in chunks
+        ))
+
+        for (signature, _), signature_intact in zip(
+            pending, (intact for chunk in results for intact in chunk), strict=True
+        ):
+            content_hash = content_hashes.get(signature.workitem_id)
+            content_matches = (
+                None if content_hash is None else content_hash == signature.content_hash
+            )
+            # A signature only vouches for content it was checked against
+            is_valid = signature_intact and content_matches is True
+            if is_valid:
+                error = None
+            elif signature_intact and content_matches is None:
+                error = "Content not checked: no current content supplied for the WorkItem"
+            else:
+                error = "Signature verification failed"
+            responses[signature.id] = SignatureVerificationResponse(
+                signature_id=signature.id,
+                is_valid=is_valid,
+                verification_timestamp=now,
+                content_matches=content_matches,
+                signature_intact=signature_intact,
+                error_message=error,
+            )
+
+        return [responses[signature_id] for signature_id in ordered]
+
     async def invalidate_signatures(
         self, workitem_id: UUID, reason: str
     ) -> list[DigitalSignatureResponse]:
@@ -191,25 +426,41 @@ class SignatureService:
         Returns:
             List of invalidated signatures
         """
-        # Get all valid signatures for the WorkItem
-        result = await self.db.execute(
-            select(DigitalSignature).where(
-                DigitalSignature.workitem_id == workitem_id,
-                DigitalSignature.is_valid == True,
-            )
-        )
-        signatures = result.scalars().all()
+        return await self.invalidate_signatures_for([workitem_id], reason)
+
+    async def invalidate_signatures_for(
+        self, workitem_ids: Iterable[UUID], reason: str
+    ) -> list[DigitalSignatureResponse]:
+        """
+        Invalidate all valid signatures of many WorkItems with one UPDATE.
 
-        invalidated_signatures = []
+        Args:
+            workitem_ids: UUIDs of the WorkItems whose signatures should be
+                invalidated
+            reason: Reason for invalidation (e.g., "WorkItem modified")
 
-        for signature in signatures:
-            signature.is_valid = False
-            signature.invalidated_at = datetime.now(UTC)
-            signature.invalidation_reason = reason
+        Returns:
+            List of invalidated signatures
+        """
+        workitem_ids = list(dict.fromkeys(workitem_ids))
+        if not workitem_ids:
+            return []
 
-            invalidated_signatures.append(
-                DigitalSignatureResponse.model_validate(signature)
+        result = await self.db.execute(
+            update(DigitalSignature)
+            .where(_workitem_in(workitem_ids), DigitalSignature.is_valid == True)
+            .values(
+                is_valid=False,
+                invalidated_at=datetime.now(UTC),
+                invalidation_reason=reason,
             )
+            .returning(DigitalSignature)
+            .execution_options(synchronize_session="fetch")
+        )
+        invalidated_signatures = [
+            DigitalSignatureResponse.model_validate(signature)
+            for signature in result.scalars().all()
+        ]
 
         await self.db.commit()
 
@@ -245,6 +496,42 @@ class SignatureService:
             for signature in signatures
         ]
 
+    async def get_signatures_for_workitems(
+        self, workitem_ids: Iterable[UUID], include_invalid: bool = False
+    ) -> dict[UUID, list[DigitalSignatureResponse]]:
+        """
+        Get the signatures of many WorkItems with one query.
+
+        Args:
+            workitem_ids: UUIDs of the WorkItems
+            include_invalid: Whether to include invalidated signatures
+
+        Returns:
+            Signatures per WorkItem ID (newest first); WorkItems without
+            signatures are omitted
+        """
+        workitem_ids = list(dict.fromkeys(workitem_ids))
+        if not workitem_ids:
+            return {}
+
+        query = select(DigitalSignature).where(
+            DigitalSignature.workitem_id.in_(workitem_ids)
+        )
+
+        if not include_invalid:
+            query = query.where(DigitalSignature.is_valid == True)
+
+        query = query.order_by(DigitalSignature.signed_at.desc())
+
+        result = await self.db.execute(query)
+
+        signatures: dict[UUID, list[DigitalSignatureResponse]] = {}
+        for signature in result.scalars().all():
+            signatures.setdefault(signature.workitem_id, []).append(
+                DigitalSignatureResponse.model_validate(signature)
+            )
+        return signatures
+
     async def is_workitem_signed(self, workitem_id: UUID) -> bool:
         """
         Check if a WorkItem has any valid signatures.
@@ -256,14 +543,39 @@ class SignatureService:
             True if the WorkItem has valid signatures, False otherwise
         """
         result = await self.db.execute(
-            select(DigitalSignature).where(
+            select(DigitalSignature.id)
+            .where(
                 DigitalSignature.workitem_id == workitem_id,
                 DigitalSignature.is_valid == True,
             )
+            .limit(1)
         )
 
         return result.scalar_one_or_none() is not None
 
+    async def signed_status_for(self, workitem_ids: Iterable[UUID]) -> dict[UUID, bool]:
+        """
+        Check which of many WorkItems have valid signatures, with one query.
+
+        Args:
+            workitem_ids: UUIDs of the WorkItems
+
+        Returns:
+            Whether each WorkItem has valid signatures, per WorkItem ID
+        """
+        workitem_ids = list(dict.fromkeys(workitem_ids))
+        if not workitem_ids:
+            return {}
+
+        result = await self.db.execute(
+            select(DigitalSignature.workitem_id)
+            .where(_workitem_in(workitem_ids), DigitalSignature.is_valid == True)
+            .group_by(DigitalSignature.workitem_id)
+        )
+        signed = set(result.scalars().all())
+
+        return {workitem_id: workitem_id in signed for workitem_id in workitem_ids}
+
     def _generate_content_hash(self, content: dict) -> str:
         """
         Generate SHA-256 hash of WorkItem content.
@@ -342,35 +654,14 @@ class SignatureService:
             True if signature is valid, False otherwise
         """
         try:
-            # Load public key
-            public_key_raw = serialization.load_pem_public_key(public_key_pem)
-
-            # Ensure it's an RSA public key
-            if not isinstance(public_key_raw, rsa.RSAPublicKey):
-                raise ValueError("Public key must be an RSA key")
-
-            public_key = public_key_raw
-
-            # Convert signature from hex to bytes
-            signature_bytes = bytes.fromhex(signature_hash)
-
-            # Verify signature using RSA-PSS with SHA-256
-            public_key.verify(
-                signature_bytes,
-                content_hash.encode("utf-8"),
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH,
-                ),
-                hashes.SHA256(),
-            )
-
-            return True
-
+            # Load public key (parsed keys are cached)
+            public_key = public_key_registry.get(None, public_key_pem)
         except Exception:
-            # Any exception during verification means the signature is invalid
             return False
 
+        # Verify signature using RSA-PSS with SHA-256
+        return _verify_pss(public_key, content_hash, signature_hash)
+
 
 async def get_signature_service(db: AsyncSession) -> SignatureService:
     """
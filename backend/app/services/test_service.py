@@ -413,15 +413,15 @@ class TestService:
             }
         )
 
+        # Check for valid signatures of all runs with one query
+        signed = await self.signature_service.signed_status_for(
+            UUID(result['tr']['id']) for result in results
+        )
+
         test_runs = []
         for result in results:
             test_run_data = result['tr']
-
-            # Check for valid signatures
-            signatures = await self.signature_service.get_workitem_signatures(
-                UUID(test_run_data['id'])
-            )
-            test_run_data['is_signed'] = any(sig.is_valid for sig in signatures)
+            test_run_data['is_signed'] = signed.get(UUID(test_run_data['id']), False)
 
             test_runs.append(TestRunResponse(**test_run_data))
 
@@ -574,15 +574,21 @@ class TestService:
         if results:
             print(f"[TestService] First result: {results[0]}")
 
-        test_specs = []
-        for result in results:
-            # Extract properties from the AGE node structure
-            # Result format: {'id': <internal_id>, 'label': 'Test', 'properties': {...}}
-            if isinstance(result, dict) and 'properties' in result:
-                test_spec_data = result['properties']
-            else:
-                test_spec_data = result
+        # Extract properties from the AGE node structure
+        # Result format: {'id': <internal_id>, 'label': 'Test', 'properties': {...}}
+        specs_data = [
+            result['properties'] if isinstance(result, dict) and 'properties' in result
+            else result
+            for result in results
+        ]
+
+        # Check for valid signatures of all specs with one query
+        signed = await self.signature_service.signed_status_for(
+            UUID(test_spec_data['id']) for test_spec_data in specs_data
+        )
 
+        test_specs = []
+        for test_spec_data in specs_data:
             # Transform test_steps from string to list if needed
             if isinstance(test_spec_data.get('test_steps'), str):
                 # Parse string test steps into list format
@@ -615,11 +621,7 @@ class TestService:
             if 'linked_requirements' not in test_spec_data:
                 test_spec_data['linked_requirements'] = []
 
-            # Check for valid signatures
-            signatures = await self.signature_service.get_workitem_signatures(
-                UUID(test_spec_data['id'])
-            )
-            test_spec_data['is_signed'] = any(sig.is_valid for sig in signatures)
+            test_spec_data['is_signed'] = signed.get(UUID(test_spec_data['id']), False)
 
             test_specs.append(TestSpecResponse(**test_spec_data))
 
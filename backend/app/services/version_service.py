@@ -1,17 +1,45 @@
 """Version control service for WorkItem versioning"""
 
+import base64
+import binascii
+import json
+from collections import OrderedDict
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.graph import GraphService, get_graph_service
 from app.db.session import get_db
 from app.models.user import User
-from app.models.version_history import VersionHistory
 from app.services.audit_service import AuditService, get_audit_service
+from app.services.version_store import VersionStore
+from app.utils.version_diff import diff_snapshots
+
+# Version diffs kept in memory, keyed by (WorkItem, version1, version2, fields,
+# updated_at of the current version if it is one of the two)
+_DIFF_CACHE_SIZE = 256
+_diff_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+
+
+def _encode_history_cursor(before: int | None) -> str:
+    """Encode the history position to continue below (None: newest snapshot)"""
+    raw = json.dumps({"s": before}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_history_cursor(cursor: str) -> int | None:
+    """Decode a cursor created by _encode_history_cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(raw)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    before = position.get("s", 0) if isinstance(position, dict) else 0
+    if before is not None and (not isinstance(before, int) or before < 2):
+        raise ValueError("Invalid pagination cursor")
+    return before
 
 
 class VersionService:
@@ -20,7 +48,9 @@ class VersionService:
 
     This service handles creating new versions of WorkItems, maintaining version history,
     and managing version relationships. It stores version snapshots in PostgreSQL for
-    efficient querying and integrates with the audit service.
+    efficient querying and integrates with the audit service. Snapshots are kept
+    as periodic keyframes plus JSON Patch deltas (see VersionStore), so every
+    historical version can be rebuilt, compared and restored.
 
     Key features:
     - Automatic version number calculation (major.minor format)
@@ -38,6 +68,7 @@ class VersionService:
         self.graph_service = graph_service
         self.audit_service = audit_service
         self.db_session = db_session
+        self.version_store = VersionStore(db_session)
 
     async def create_version(
         self,
@@ -78,15 +109,13 @@ class VersionService:
         new_version = self._calculate_next_version(current_version)
 
         # Store snapshot of current version in PostgreSQL before updating
-        version_snapshot = VersionHistory(
+        await self.version_store.append(
             workitem_id=workitem_id,
             version=current_version,
             data=current_workitem,
             change_description=f"Version {current_version} before update to {new_version}",
             created_by=UUID(current_workitem.get("created_by", str(user.id)))
         )
-        self.db_session.add(version_snapshot)
-        await self.db_session.flush()
 
         # Merge current data with updates
         new_workitem_data = {**current_workitem}
@@ -180,24 +209,19 @@ class VersionService:
         """
         Get complete version history for a WorkItem from PostgreSQL.
 
-        This method retrieves all version snapshots from the database,
+        This method rebuilds all version snapshots stored in the database,
         plus the current version from the graph.
 
         Args:
             workitem_id: UUID of the WorkItem
 
         Returns:
-            List of WorkItem versions ordered by version number (newest first)
+            List of WorkItem versions, newest first
         """
         print(f"[VersionService] Getting history for workitem: {workitem_id}")
         
         # Get historical versions from PostgreSQL
-        result = await self.db_session.execute(
-            select(VersionHistory)
-            .where(VersionHistory.workitem_id == workitem_id)
-            .order_by(VersionHistory.created_at.desc())
-        )
-        history_records = result.scalars().all()
+        history_records = await self.version_store.history(workitem_id)
         print(f"[VersionService] Found {len(history_records)} historical versions in DB")
 
         # Get current version from graph
@@ -212,20 +236,73 @@ class VersionService:
             versions.append(current_workitem)
             print(f"[VersionService] Added current version {current_workitem.get('version')}")
         
-        # Add historical versions
-        for record in history_records:
-            versions.append(record.data)
-            print(f"[VersionService] Added historical version {record.version}")
-
-        # Sort by version number (newest first)
-        versions.sort(
-            key=lambda v: self._version_sort_key(v.get('version', '1.0')),
-            reverse=True
-        )
+        # Add historical versions in the order they were stored (newest first),
+        # which holds for any version numbering
+        versions.extend(reversed(history_records))
 
         print(f"[VersionService] Returning {len(versions)} total versions")
         return versions
 
+    async def get_version_history_page(
+        self,
+        workitem_id: UUID,
+        limit: int = 20,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Get one page of a WorkItem's version history, newest first.
+
+        The first page starts with the current version from the graph.
+        Each page rebuilds only its own snapshots from the version store.
+
+        Args:
+            workitem_id: UUID of the WorkItem
+            limit: Maximum number of versions on the page
+            cursor: Cursor returned with the previous page
+            fields: Fields to return per version ("version" is always
+                included; None returns every field)
+
+        Returns:
+            Tuple of (versions, cursor of the next page or None)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        entries: list[tuple[int | None, dict[str, Any]]] = []
+        if cursor:
+            before = _decode_history_cursor(cursor)
+            entries.extend(
+                await self.version_store.history_page(workitem_id, limit, before=before)
+            )
+        else:
+            current_workitem = await self.graph_service.get_workitem(str(workitem_id))
+            if current_workitem:
+                entries.append((None, current_workitem))
+            entries.extend(
+                await self.version_store.history_page(workitem_id, limit - len(entries))
+            )
+            if not entries:
+                return [], None
+
+        next_cursor = None
+        sequences = [sequence for sequence, _ in entries if sequence is not None]
+        if sequences and min(sequences) > 1:
+            next_cursor = _encode_history_cursor(min(sequences))
+        elif not cursor and not sequences and len(entries) == limit:
+            # Only the current version fitted; the stored history may follow
+            if await self.version_store.history_page(workitem_id, 1):
+                next_cursor = _encode_history_cursor(None)
+
+        versions = [data for _, data in entries]
+        if fields is not None:
+            wanted = ["version", *(field for field in fields if field != "version")]
+            versions = [
+                {field: data[field] for field in wanted if field in data}
+                for data in versions
+            ]
+        return versions, next_cursor
+
     def _version_sort_key(self, version: str) -> tuple:
         """
         Generate sort key for version strings.
@@ -253,6 +330,9 @@ class VersionService:
         """
         Get a specific version of a WorkItem by version number.
 
+        The current version comes from the graph; earlier versions are
+        rebuilt from the stored keyframe and deltas.
+
         Args:
             workitem_id: UUID of the WorkItem
             version: Version string (e.g., "1.2")
@@ -260,7 +340,82 @@ class VersionService:
         Returns:
             WorkItem data for the specified version, or None if not found
         """
-        return await self.graph_service.get_workitem_version(str(workitem_id), version)
+        current_workitem = await self.graph_service.get_workitem(str(workitem_id))
+        if current_workitem and current_workitem.get("version", "1.0") == version:
+            return current_workitem
+        return await self.version_store.reconstruct(workitem_id, version)
+
+    async def diff_versions(
+        self,
+        workitem_id: UUID,
+        version1: str,
+        version2: str,
+        fields: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Compute a compact structural diff between two versions.
+
+        Unlike compare_versions(), unchanged fields are only counted and long
+        text fields carry a word-level diff instead of both full values.
+        Stored versions never change, so results are cached per version pair;
+        a diff against the current version is only reused until the WorkItem
+        is updated again.
+
+        Args:
+            workitem_id: UUID of the WorkItem
+            version1: Earlier version
+            version2: Later version
+            fields: Fields to compare (None compares all)
+
+        Returns:
+            Dictionary with version1, version2, added_fields, removed_fields,
+            changed_fields and unchanged_count
+
+        Raises:
+            ValueError: If either version does not exist
+        """
+        current_workitem = await self.graph_service.get_workitem(str(workitem_id))
+        current_version = (
+            current_workitem.get("version", "1.0") if current_workitem else None
+        )
+
+        # The current version lives in the graph and can change in place, so
+        # a diff against it is keyed by its last update as well
+        updated_at = None
+        if current_version in (version1, version2):
+            updated_at = current_workitem.get("updated_at")
+        cacheable = current_version not in (version1, version2) or updated_at is not None
+        key = (
+            str(workitem_id),
+            version1,
+            version2,
+            tuple(fields) if fields is not None else None,
+            updated_at,
+        )
+        cached = _diff_cache.get(key) if cacheable else None
+        if cached is not None:
+            _diff_cache.move_to_end(key)
+            return cached
+
+        v1_data, v2_data = [
+            current_workitem
+            if version == current_version
+            else await self.version_store.reconstruct(workitem_id, version)
+            for version in (version1, version2)
+        ]
+        if not v1_data or not v2_data:
+            raise ValueError("One or both versions not found")
+
+        diff = {
+            "version1": version1,
+            "version2": version2,
+            **diff_snapshots(v1_data, v2_data, fields),
+        }
+        if cacheable:
+            _diff_cache[key] = diff
+            if len(_diff_cache) > _DIFF_CACHE_SIZE:
+                _diff_cache.popitem(last=False)
+        return diff
 
     async def compare_versions(
         self,
@@ -0,0 +1,249 @@
+"""Keyframe + delta storage of WorkItem version snapshots"""
+
+import copy
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.version_history import VersionHistory
+from app.utils.json_patch import apply_patch, make_patch
+
+
+class VersionStore:
+    """
+    Stores WorkItem version snapshots in the version_history table.
+
+    Snapshots of a WorkItem are numbered by sequence. Every
+    ``keyframe_interval``-th snapshot is stored in full; the snapshots in
+    between are stored as a JSON Patch against the previous one. Any
+    version is rebuilt from its nearest preceding keyframe, reading and
+    applying at most ``keyframe_interval`` rows, with a single query.
+    """
+
+    def __init__(self, db_session: AsyncSession, keyframe_interval: int | None = None):
+        """
+        Initialize the store.
+
+        Args:
+            db_session: Database session snapshots are read and written with
+            keyframe_interval: Snapshots per keyframe (defaults to
+                VERSION_KEYFRAME_INTERVAL)
+        """
+        self.db_session = db_session
+        self.keyframe_interval = keyframe_interval or settings.VERSION_KEYFRAME_INTERVAL
+
+    async def append(
+        self,
+        workitem_id: UUID,
+        version: str,
+        data: dict[str, Any],
+        created_by: UUID,
+        change_description: str | None = None,
+    ) -> VersionHistory:
+        """
+        Store the snapshot of a version (flushed, not committed).
+
+        Args:
+            workitem_id: UUID of the WorkItem
+            version: Version string of the snapshot
+            data: Full WorkItem data of that version
+            created_by: User the snapshot is attributed to
+            change_description: Description stored with the snapshot
+
+        Returns:
+            The stored VersionHistory row
+        """
+        # Concurrent appends would read the same chain and take the same
+        # sequence, so they wait for each other until the transaction ends
+        await self.db_session.execute(
+            select(func.pg_advisory_xact_lock(func.hashtext(str(workitem_id))))
+        )
+
+        # The rows since the latest keyframe are the delta base and tell
+        # whether this snapshot starts a new keyframe
+        latest_keyframe = (
+            select(func.max(VersionHistory.sequence))
+            .where(
+                VersionHistory.workitem_id == workitem_id,
+                VersionHistory.is_keyframe.is_(True),
+            )
+            .scalar_subquery()
+        )
+        result = await self.db_session.execute(
+            select(VersionHistory)
+            .where(
+                VersionHistory.workitem_id == workitem_id,
+                VersionHistory.sequence >= latest_keyframe,
+            )
+            .order_by(VersionHistory.sequence)
+        )
+        chain = list(result.scalars().all())
+
+        record = VersionHistory(
+            workitem_id=workitem_id,
+            version=version,
+            sequence=chain[-1].sequence + 1 if chain else 1,
+            change_description=change_description,
+            created_by=created_by,
+        )
+        if not chain or len(chain) >= self.keyframe_interval:
+            record.is_keyframe = True
+            record.data = data
+        else:
+            record.is_keyframe = False
+            record.delta = make_patch(self._replay(chain), data)
+
+        self.db_session.add(record)
+        await self.db_session.flush()
+        return record
+
+    async def reconstruct(self, workitem_id: UUID, version: str) -> dict[str, Any] | None:
+        """
+        Rebuild the stored snapshot of a version.
+
+        Args:
+            workitem_id: UUID of the WorkItem
+            version: Version string (e.g., "1.2")
+
+        Returns:
+            WorkItem data of that version, or None if it is not stored
+        """
+        target = (
+            select(func.max(VersionHistory.sequence))
+            .where(
+                VersionHistory.workitem_id == workitem_id,
+                VersionHistory.version == version,
+            )
+            .scalar_subquery()
+        )
+        keyframe = (
+            select(func.max(VersionHistory.sequence))
+            .where(
+                VersionHistory.workitem_id == workitem_id,
+                VersionHistory.is_keyframe.is_(True),
+                VersionHistory.sequence <= target,
+            )
+            .scalar_subquery()
+        )
+        result = await self.db_session.execute(
+            select(VersionHistory)
+            .where(
+                and_(
+                    VersionHistory.workitem_id == workitem_id,
+                    VersionHistory.sequence >= keyframe,
+                    VersionHistory.sequence <= target,
+                )
+            )
+            .order_by(VersionHistory.sequence)
+        )
+        rows = result.scalars().all()
+        if not rows:
+            return None
+        return self._replay(rows)
+
+    async def history(self, workitem_id: UUID) -> list[dict[str, Any]]:
+        """
+        Rebuild every stored snapshot of a WorkItem in one pass.
+
+        Args:
+            workitem_id: UUID of the WorkItem
+
+        Returns:
+            WorkItem data of each stored version, oldest first
+        """
+        result = await self.db_session.execute(
+            select(VersionHistory)
+            .where(VersionHistory.workitem_id == workitem_id)
+            .order_by(VersionHistory.sequence)
+        )
+        snapshots: list[dict[str, Any]] = []
+        data: dict[str, Any] | None = None
+        for row in result.scalars().all():
+            data = self._step(data, row)
+            snapshots.append(copy.deepcopy(data))
+        return snapshots
+
+    async def history_page(
+        self,
+        workitem_id: UUID,
+        limit: int,
+        before: int | None = None,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """
+        Rebuild one page of stored snapshots, newest first.
+
+        Only the page and the deltas back to its keyframe are read, so the
+        cost of a page does not grow with the length of the history.
+
+        Args:
+            workitem_id: UUID of the WorkItem
+            limit: Maximum number of snapshots
+            before: Only snapshots with a lower sequence (None: the newest)
+
+        Returns:
+            (sequence, WorkItem data) pairs
+        """
+        if limit < 1:
+            return []
+        if before is None:
+            top = (
+                select(func.max(VersionHistory.sequence))
+                .where(VersionHistory.workitem_id == workitem_id)
+                .scalar_subquery()
+            )
+        else:
+            top = literal(before - 1)
+        keyframe = (
+            select(func.max(VersionHistory.sequence))
+            .where(
+                VersionHistory.workitem_id == workitem_id,
+                VersionHistory.is_keyframe.is_(True),
+                VersionHistory.sequence <= func.greatest(top - limit + 1, 1),
+            )
+            .scalar_subquery()
+        )
+        result = await self.db_session.execute(
+            select(VersionHistory)
+            .where(
+                and_(
+                    VersionHistory.workitem_id == workitem_id,
+                    VersionHistory.sequence >= keyframe,
+                    VersionHistory.sequence <= top,
+                )
+            )
+            .order_by(VersionHistory.sequence)
+        )
+        rows = result.scalars().all()
+
+        page: list[tuple[int, dict[str, Any]]] = []
+        data: dict[str, Any] | None = None
+        first_on_page = len(rows) - limit
+        for i, row in enumerate(rows):
+            data = self._step(data, row)
+            if i >= first_on_page:
+                page.append((row.sequence, copy.deepcopy(data)))
+        page.reverse()
+        return page
+
+    @classmethod
+    def _replay(cls, rows: Sequence[VersionHistory]) -> dict[str, Any]:
+        """Apply a keyframe and the deltas following it"""
+        data: dict[str, Any] | None = None
+        for row in rows:
+            data = cls._step(data, row)
+        return data or {}
+
+    @staticmethod
+    def _step(data: dict[str, Any] | None, row: VersionHistory) -> dict[str, Any]:
+        """Advance a snapshot by one row"""
+        if row.is_keyframe or row.delta is None:
+            return copy.deepcopy(row.data or {})
+        if data is None:
+            raise ValueError(
+                f"Version {row.version} of WorkItem {row.workitem_id} has no keyframe"
+            )
+        return apply_patch(data, row.delta)
@@ -1,5 +1,8 @@
 """WorkItem service for CRUD operations and business logic"""
 
+import base64
+import binascii
+import json
 import logging
 import uuid
 from datetime import UTC, datetime
@@ -17,6 +20,27 @@ from app.schemas.workitem import (
 from app.services.version_service import VersionService, get_version_service
 
 
+def _encode_cursor(position: dict[str, Any]) -> str:
+    """Encode a page position as an opaque URL-safe cursor"""
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> dict[str, Any]:
+    """Decode a cursor created by _encode_cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(raw)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    if not isinstance(position, dict) or not (
+        {"u", "i"} <= position.keys()
+        or isinstance(position.get("o"), int) and position["o"] >= 0
+    ):
+        raise ValueError("Invalid pagination cursor")
+    return position
+
+
 class WorkItemService:
     """Service for managing WorkItems with graph database storage"""
 
@@ -645,30 +669,97 @@ class WorkItemService:
         Returns:
             List of matching WorkItems
         """
-        # Use graph service search with filters
+        workitems, _ = await self.search_workitems_page(
+            search_text=search_text,
+            workitem_type=workitem_type,
+            status=status,
+            assigned_to=assigned_to,
+            created_by=created_by,
+            priority=priority,
+            limit=limit,
+            offset=offset,
+        )
+        return workitems
+
+    async def search_workitems_page(
+        self,
+        search_text: str | None = None,
+        workitem_type: str | None = None,
+        status: str | None = None,
+        assigned_to: UUID | None = None,
+        created_by: UUID | None = None,
+        priority: int | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str | None = None
+    ) -> tuple[list[WorkItemResponse], str | None]:
+        """
+        Search one page of WorkItems and return the cursor of the next page
+
+        Listings are ordered newest first by (updated_at, id) and paged with
+        a keyset cursor, so each page costs the same however deep it is.
+        Text searches are ranked by relevance and paged by offset; their
+        cursor carries the offset of the next page instead.
+
+        Args:
+            search_text: Text to search in title and description
+            workitem_type: Filter by WorkItem type
+            status: Filter by status
+            assigned_to: Filter by assigned user
+            created_by: Filter by creator
+            priority: Filter by priority level
+            limit: Maximum number of results
+            offset: Number of results to skip (after the cursor, if given)
+            cursor: Opaque cursor returned with the previous page
+
+        Returns:
+            Tuple of (WorkItems, cursor of the next page or None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        text_search = bool(search_text and search_text.strip())
+        after = None
+        if cursor:
+            position = _decode_cursor(cursor)
+            if "o" in position:
+                offset += int(position["o"])
+            elif not text_search:
+                after = (str(position["u"]), str(position["i"]))
+
+        # Fetch one extra row to learn whether another page follows
         results = await self.graph_service.search_workitems(
             search_text=search_text,
             workitem_type=workitem_type,
             status=status,
             assigned_to=str(assigned_to) if assigned_to else None,
-            limit=limit
+            created_by=str(created_by) if created_by else None,
+            priority=priority,
+            limit=limit + 1,
+            offset=offset,
+            after=after,
         )
 
-        # Convert results to WorkItemResponse objects
+        has_more = len(results) > limit
+        results = results[:limit]
+
+        next_cursor = None
+        if has_more and results:
+            last = results[-1]
+            if text_search or not last.get("updated_at") or not last.get("id"):
+                next_cursor = _encode_cursor({"o": offset + len(results)})
+            else:
+                next_cursor = _encode_cursor(
+                    {"u": str(last["updated_at"]), "i": str(last["id"])}
+                )
+
         workitems = []
         for result in results:
             workitem = self._graph_data_to_response(result)
             if workitem:
-                # Apply additional filters not handled by graph service
-                if created_by and workitem.created_by != created_by:
-                    continue
-                if priority and workitem.priority != priority:
-                    continue
-
                 workitems.append(workitem)
 
-        # Apply offset and limit
-        return workitems[offset:offset + limit]
+        return workitems, next_cursor
 
     async def get_workitem_history(
         self,
@@ -711,6 +802,63 @@ class WorkItemService:
         current = await self.get_workitem(workitem_id)
         return [current] if current else []
 
+    async def get_workitem_history_page(
+        self,
+        workitem_id: UUID,
+        limit: int = 20,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None] | None:
+        """
+        Get one page of version history using VersionService
+
+        Args:
+            workitem_id: WorkItem UUID
+            limit: Maximum number of versions on the page
+            cursor: Cursor returned with the previous page
+            fields: Fields to return per version (None returns all)
+
+        Returns:
+            Tuple of (versions newest first, next cursor), or None if
+            VersionService unavailable
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        if not self.version_service:
+            return None
+        return await self.version_service.get_version_history_page(
+            workitem_id, limit=limit, cursor=cursor, fields=fields
+        )
+
+    async def diff_workitem_versions(
+        self,
+        workitem_id: UUID,
+        version1: str,
+        version2: str,
+        fields: list[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Compute a compact diff between two versions using VersionService
+
+        Args:
+            workitem_id: WorkItem UUID
+            version1: Earlier version
+            version2: Later version
+            fields: Fields to compare (None compares all)
+
+        Returns:
+            Dictionary with the differences, or None if VersionService unavailable
+
+        Raises:
+            ValueError: If either version does not exist
+        """
+        if not self.version_service:
+            return None
+        return await self.version_service.diff_versions(
+            workitem_id, version1, version2, fields=fields
+        )
+
     async def bulk_update(
         self,
         workitem_ids: list[UUID],
@@ -6,6 +6,7 @@ progress tracking, and variance calculation for all entity types (tasks, workpac
 Requirements: 16A.32-16A.36, 3.1-3.13
 """
 
+import asyncio
 from datetime import datetime
 from uuid import UUID
 
@@ -48,13 +49,23 @@ async def prepare_gantt_data(
     
     Requirements: 16A.32-16A.36, 3.1-3.13
     """
-    # Get all entities for the project
-    tasks = await _get_project_tasks(project_id, graph_service, schedule_data)
-    workpackages = await _get_project_workpackages(project_id, graph_service)
-    phases = await _get_project_phases(project_id, graph_service)
-    milestones = await _get_project_milestones(project_id, graph_service)
-    sprints = await _get_project_sprints(project_id, graph_service)
-    dependencies = await _get_task_dependencies(project_id, graph_service)
+    # Get all entities for the project; the fetches are independent, so they
+    # share the connection pool concurrently instead of running back to back
+    (
+        tasks,
+        workpackages,
+        phases,
+        milestones,
+        sprints,
+        dependencies,
+    ) = await asyncio.gather(
+        _get_project_tasks(project_id, graph_service, schedule_data),
+        _get_project_workpackages(project_id, graph_service),
+        _get_project_phases(project_id, graph_service),
+        _get_project_milestones(project_id, graph_service),
+        _get_project_sprints(project_id, graph_service),
+        _get_task_dependencies(project_id, graph_service),
+    )
     
     # Get critical path from schedule data
     critical_path = schedule_data.get("critical_path", []) if schedule_data else []
@@ -87,9 +98,13 @@ async def _get_project_tasks(
     """Get all tasks for a project with date priority and progress tracking."""
     # For now, get all tasks since we're using a placeholder project ID
     # TODO: Filter by actual project when project structure is implemented
+    # Resource allocations are collected in the same query to avoid one
+    # round trip per task
     query = f"""
     MATCH (w:WorkItem {{type: 'task'}})
     WHERE w.calculated_start_date IS NOT NULL AND w.calculated_end_date IS NOT NULL
+    OPTIONAL MATCH (r:Resource)-[:ALLOCATED_TO]->(w)
+    WITH w, collect(r.id) AS resource_ids
     RETURN {{
         id: w.id,
         title: w.title,
@@ -102,12 +117,15 @@ async def _get_project_tasks(
         duration: w.duration,
         effort: w.effort,
         skills: w.skills,
-        is_critical: w.is_critical
+        is_critical: w.is_critical,
+        resource_ids: resource_ids
     }} as result
     """
     
     results = await graph_service.execute_query(query)
     tasks = []
+    # Float values computed by the last schedule run, keyed by task ID
+    task_floats = schedule_data.get("task_floats", {}) if schedule_data else {}
     
     for row in results:
         # Parse dates
@@ -133,19 +151,13 @@ async def _get_project_tasks(
             calculated_start_date=calc_start,
         )
         
-        # Get resource allocations
-        resource_query = f"""
-        MATCH (r:Resource)-[:ALLOCATED_TO]->(w:WorkItem {{id: '{row["id"]}', type: 'task'}})
-        RETURN {{resource_id: r.id}} as result
-        """
-        resource_results = await graph_service.execute_query(resource_query)
-        assigned_resources = [r["resource_id"] for r in resource_results]
-        
         # Calculate duration in hours
         duration = row.get("duration", 0) or 0
         effort = row.get("effort", 0) or 0
         duration_hours = effort if effort > 0 else duration * 8  # Assume 8 hours/day
         
+        scheduled = task_floats.get(row["id"])
+        
         tasks.append(
             ScheduledTask(
                 task_id=row["id"],
@@ -161,8 +173,13 @@ async def _get_project_tasks(
                 variance_days=progress_indicator["variance_days"],
                 is_delayed=progress_indicator["is_delayed"],
                 duration_hours=int(duration_hours),
-                assigned_resources=assigned_resources,
+                assigned_resources=[
+                    str(resource_id) for resource_id in row.get("resource_ids") or []
+                ],
                 is_critical=row.get("is_critical", False) or False,
+                is_near_critical=scheduled.is_near_critical if scheduled else False,
+                total_float_hours=scheduled.total_float_hours if scheduled else None,
+                free_float_hours=scheduled.free_float_hours if scheduled else None,
                 skills=row.get("skills", []) or [],
             )
         )
@@ -0,0 +1,517 @@
+"""Server-side node placement for the graph visualization endpoint"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+LayoutMode = Literal["force", "force3d", "hierarchical", "none"]
+
+# Ideal edge length in react-flow pixels
+_EDGE_LENGTH = 80.0
+
+# Spacing of the hierarchical layout in react-flow pixels
+_LAYER_SPACING = 150.0
+_NODE_SPACING = 120.0
+
+# Below this node count repulsion is computed exactly for every pair
+_EXACT_REPULSION_LIMIT = 400
+
+# Average nodes per grid cell of the Barnes-Hut approximation
+_NODES_PER_CELL = 8
+
+# Iterations between rebuilding the grid (nodes move little per step)
+_GRID_REFRESH_ITERATIONS = 5
+
+# Pairwise interactions evaluated per NumPy block (bounds peak memory)
+_PAIR_BLOCK_SIZE = 2_000_000
+
+_COLD_ITERATIONS = 60
+_WARM_ITERATIONS = 15
+
+# Share of nodes that must have a previous position for a warm start
+_WARM_START_RATIO = 0.5
+
+# Constant pull towards the centroid that keeps components together
+_GRAVITY = 0.1
+
+_BARYCENTER_SWEEPS = 4
+
+
+def subgraph_hash(
+    node_ids: list[str], edges: list[tuple[str, str]], mode: str
+) -> str:
+    """
+    Hash a subgraph's structure independent of node and edge order.
+
+    Args:
+        node_ids: Node identifiers
+        edges: (source, target) node identifier pairs
+        mode: Layout mode
+
+    Returns:
+        Hex digest identifying the subgraph and layout mode
+    """
+    digest = hashlib.sha1(mode.encode())
+    for node_id in sorted(node_ids):
+        digest.update(b"n" + node_id.encode())
+    for source, target in sorted(edges):
+        digest.update(b"e" + source.encode() + b"\0" + target.encode())
+    return digest.hexdigest()
+
+
+class GraphLayoutEngine:
+    """
+    Computes node positions and keeps them stable between requests.
+
+    Finished layouts are cached per subgraph hash. Positions of every placed
+    node are remembered as well, so a subgraph that overlaps an earlier one
+    starts from the earlier positions and only needs a short refinement.
+    """
+
+    def __init__(
+        self, max_cached_layouts: int = 64, max_remembered_positions: int = 100_000
+    ):
+        """
+        Initialize the layout engine.
+
+        Args:
+            max_cached_layouts: Finished layouts kept per subgraph hash
+            max_remembered_positions: Node positions kept for warm starts
+        """
+        self._max_cached_layouts = max_cached_layouts
+        self._max_remembered_positions = max_remembered_positions
+        self._layouts: OrderedDict[str, dict[str, tuple[float, ...]]] = OrderedDict()
+        self._positions: OrderedDict[tuple[int, str], tuple[float, ...]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def layout(
+        self,
+        node_ids: list[str],
+        edges: list[tuple[str, str]],
+        mode: LayoutMode = "force",
+    ) -> dict[str, tuple[float, ...]]:
+        """
+        Get positions for the nodes of a subgraph.
+
+        Args:
+            node_ids: Node identifiers
+            edges: (source, target) node identifier pairs; edges touching
+                unknown nodes are ignored
+            mode: "force" (2D), "force3d" or "hierarchical" (2D layers)
+
+        Returns:
+            Node ID -> (x, y) or (x, y, z) in react-flow pixel units
+        """
+        if mode == "none" or not node_ids:
+            return {}
+
+        key = subgraph_hash(node_ids, edges, mode)
+        with self._lock:
+            cached = self._layouts.get(key)
+            if cached is not None:
+                self._layouts.move_to_end(key)
+                return cached
+
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        pairs = [
+            (index[source], index[target])
+            for source, target in edges
+            if source in index and target in index and source != target
+        ]
+        edge_array = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        src, dst = edge_array[:, 0], edge_array[:, 1]
+        seed = int(key[:8], 16)
+
+        if mode == "hierarchical":
+            positions = hierarchical_layout(len(node_ids), src, dst)
+        else:
+            dim = 3 if mode == "force3d" else 2
+            initial, warm = self._initial_positions(node_ids, src, dst, dim, seed)
+            positions = force_directed_layout(
+                len(node_ids), src, dst, dim=dim, initial=initial, warm=warm, seed=seed
+            )
+
+        result = {
+            node_id: tuple(round(float(v), 2) for v in positions[i])
+            for i, node_id in enumerate(node_ids)
+        }
+
+        with self._lock:
+            self._layouts[key] = result
+            while len(self._layouts) > self._max_cached_layouts:
+                self._layouts.popitem(last=False)
+            if mode != "hierarchical":
+                for node_id, position in result.items():
+                    self._positions[(positions.shape[1], node_id)] = position
+                    self._positions.move_to_end((positions.shape[1], node_id))
+                while len(self._positions) > self._max_remembered_positions:
+                    self._positions.popitem(last=False)
+
+        return result
+
+    def _initial_positions(
+        self,
+        node_ids: list[str],
+        src: np.ndarray,
+        dst: np.ndarray,
+        dim: int,
+        seed: int,
+    ) -> tuple[np.ndarray | None, bool]:
+        """
+        Seed positions from earlier layouts.
+
+        Nodes without a remembered position start at the mean position of
+        their placed neighbours (or the centroid), plus a little jitter.
+
+        Returns:
+            (initial positions or None, whether enough nodes were known for
+            a warm start)
+        """
+        with self._lock:
+            remembered = [self._positions.get((dim, node_id)) for node_id in node_ids]
+
+        known = np.array([p is not None for p in remembered])
+        if not known.any():
+            return None, False
+
+        n = len(node_ids)
+        positions = np.zeros((n, dim))
+        positions[known] = [p for p in remembered if p is not None]
+
+        unknown = ~known
+        if unknown.any():
+            # Mean of known neighbours, in both edge directions
+            a = np.concatenate([src, dst])
+            b = np.concatenate([dst, src])
+            mask = known[b] & unknown[a]
+            counts = np.bincount(a[mask], minlength=n)
+            sums = np.stack(
+                [
+                    np.bincount(a[mask], weights=positions[b[mask], d], minlength=n)
+                    for d in range(dim)
+                ],
+                axis=1,
+            )
+            centroid = positions[known].mean(axis=0)
+            anchored = unknown & (counts > 0)
+            positions[anchored] = sums[anchored] / counts[anchored, None]
+            positions[unknown & (counts == 0)] = centroid
+
+            rng = np.random.default_rng(seed)
+            positions[unknown] += rng.normal(
+                scale=_EDGE_LENGTH / 2, size=(int(unknown.sum()), dim)
+            )
+
+        return positions, known.mean() >= _WARM_START_RATIO
+
+
+def force_directed_layout(
+    n: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    dim: int = 2,
+    initial: np.ndarray | None = None,
+    warm: bool = False,
+    seed: int = 0,
+    iterations: int | None = None,
+) -> np.ndarray:
+    """
+    Fruchterman-Reingold placement with Barnes-Hut style repulsion.
+
+    Edges pull their endpoints together (d^2 / k) and all nodes push each
+    other apart (k^2 / d). For large graphs, the repulsion from nodes outside
+    a node's neighbouring grid cells is approximated by the cells' centres of
+    mass. This keeps each iteration close to linear in the node count.
+
+    Args:
+        n: Number of nodes
+        src: Source node index of each edge
+        dst: Target node index of each edge
+        dim: 2 or 3
+        initial: Optional starting positions (n x dim)
+        warm: Whether the starting positions are already a good layout, in
+            which case fewer, smaller steps are taken
+        seed: Random seed for the cold-start positions
+        iterations: Override the number of iterations
+
+    Returns:
+        Positions (n x dim), centred on the origin
+    """
+    k = _EDGE_LENGTH
+    rng = np.random.default_rng(seed)
+    if initial is None:
+        positions = rng.normal(scale=k * np.sqrt(n) / 2, size=(n, dim))
+        warm = False
+    else:
+        positions = np.array(initial, dtype=np.float64)
+
+    if n == 1:
+        return np.zeros((1, dim))
+
+    if iterations is None:
+        iterations = _WARM_ITERATIONS if warm else _COLD_ITERATIONS
+    start_temperature = k * 0.1 if warm else k * np.sqrt(n) / 4
+    temperatures = np.linspace(start_temperature, start_temperature * 0.05, iterations)
+
+    grid = None
+    for iteration, temperature in enumerate(temperatures):
+        if n > _EXACT_REPULSION_LIMIT and iteration % _GRID_REFRESH_ITERATIONS == 0:
+            grid = _build_grid(positions)
+        displacement = _repulsion(positions, k, grid)
+
+        if src.size:
+            delta = positions[src] - positions[dst]
+            distance = np.sqrt((delta**2).sum(axis=1)) + 1e-9
+            pull = delta * (distance / k)[:, None]
+            for d in range(dim):
+                displacement[:, d] -= np.bincount(src, weights=pull[:, d], minlength=n)
+                displacement[:, d] += np.bincount(dst, weights=pull[:, d], minlength=n)
+
+        offset = positions - positions.mean(axis=0)
+        offset_length = np.sqrt((offset**2).sum(axis=1)) + 1e-9
+        displacement -= offset / offset_length[:, None] * (_GRAVITY * k)
+
+        length = np.sqrt((displacement**2).sum(axis=1)) + 1e-9
+        positions += displacement * (np.minimum(length, temperature) / length)[:, None]
+
+    return positions - positions.mean(axis=0)
+
+
+@dataclass
+class _RepulsionGrid:
+    """Grid bucketing of the nodes, reused for a few iterations"""
+
+    inverse: np.ndarray  # Occupied-cell index of each node
+    counts: np.ndarray  # Nodes per occupied cell
+    far: np.ndarray  # Occupied cells x occupied cells: not adjacent
+    rows: np.ndarray  # Near-field pairs: node receiving the force
+    cols: np.ndarray  # Near-field pairs: node exerting the force
+
+
+def _build_grid(positions: np.ndarray) -> _RepulsionGrid:
+    """
+    Bucket nodes into grid cells and list the exact near-field pairs.
+
+    Cell boundaries sit at per-axis quantiles, which keeps the occupancy
+    even when nodes bunch up and so bounds the number of near-field pairs.
+    """
+    n, dim = positions.shape
+    grid = max(2, int(np.ceil((n / _NODES_PER_CELL) ** (1 / dim))))
+    quantiles = np.linspace(0, 1, grid + 1)[1:-1]
+    coords = np.stack(
+        [
+            np.searchsorted(
+                np.quantile(positions[:, d], quantiles), positions[:, d], side="right"
+            )
+            for d in range(dim)
+        ],
+        axis=1,
+    )
+    shape = (grid,) * dim
+    cells = np.ravel_multi_index(coords.T, shape)
+
+    occupied, inverse, counts = np.unique(
+        cells, return_inverse=True, return_counts=True
+    )
+    occupied_coords = np.stack(np.unravel_index(occupied, shape), axis=1).astype(
+        np.int16
+    )
+    far = np.zeros((occupied.size, occupied.size), dtype=bool)
+    for d in range(dim):
+        far |= np.abs(occupied_coords[:, None, d] - occupied_coords[None, :, d]) > 1
+
+    # Pairs of nodes in the same or an adjacent cell
+    order = np.argsort(cells, kind="stable")
+    sorted_cells = cells[order]
+    offsets = np.stack(
+        np.meshgrid(*([np.arange(-1, 2)] * dim), indexing="ij"), axis=-1
+    ).reshape(-1, dim)
+    all_rows = []
+    all_cols = []
+    for offset in offsets:
+        neighbour = coords + offset
+        valid = ((neighbour >= 0) & (neighbour < grid)).all(axis=1)
+        nodes = np.flatnonzero(valid)
+        neighbour_cells = np.ravel_multi_index(neighbour[valid].T, shape)
+        starts = np.searchsorted(sorted_cells, neighbour_cells, side="left")
+        lengths = np.searchsorted(sorted_cells, neighbour_cells, side="right") - starts
+        total = int(lengths.sum())
+        if total == 0:
+            continue
+        all_rows.append(np.repeat(nodes, lengths))
+        all_cols.append(
+            order[
+                np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+                + np.arange(total)
+            ]
+        )
+    rows = np.concatenate(all_rows)
+    cols = np.concatenate(all_cols)
+    keep = rows != cols
+
+    return _RepulsionGrid(inverse, counts, far, rows[keep], cols[keep])
+
+
+def _repulsion(
+    positions: np.ndarray, k: float, grid: _RepulsionGrid | None
+) -> np.ndarray:
+    """
+    Repulsive displacement of every node.
+
+    Without a grid, forces are exact for every pair. With a grid, nodes in
+    the same or an adjacent cell repel each other exactly, and farther cells
+    act through their centre of mass (a single-level Barnes-Hut
+    approximation evaluated cell to cell).
+    """
+    n, dim = positions.shape
+    if grid is None:
+        rows = np.repeat(np.arange(n), n)
+        cols = np.tile(np.arange(n), n)
+        keep = rows != cols
+        return _pair_forces(positions, rows[keep], positions[cols[keep]], k)
+
+    centres = np.stack(
+        [
+            np.bincount(grid.inverse, weights=positions[:, d]) / grid.counts
+            for d in range(dim)
+        ],
+        axis=1,
+    )
+
+    # Far field: each cell receives the push of every non-adjacent cell's
+    # centre of mass, and its nodes share that displacement
+    cell_displacement = np.zeros_like(centres)
+    block = max(1, _PAIR_BLOCK_SIZE // centres.shape[0])
+    for start in range(0, centres.shape[0], block):
+        stop = min(start + block, centres.shape[0])
+        delta = centres[start:stop, None, :] - centres[None, :, :]
+        distance2 = np.einsum("ijk,ijk->ij", delta, delta) + 1e-9
+        weight = np.where(grid.far[start:stop], grid.counts * (k * k) / distance2, 0.0)
+        cell_displacement[start:stop] = np.einsum("ijk,ij->ik", delta, weight)
+
+    displacement = cell_displacement[grid.inverse]
+    displacement += _pair_forces(positions, grid.rows, positions[grid.cols], k)
+    return displacement
+
+
+def _pair_forces(
+    positions: np.ndarray, rows: np.ndarray, sources: np.ndarray, k: float
+) -> np.ndarray:
+    """Sum the repulsion of each source point onto the node in rows"""
+    n, dim = positions.shape
+    displacement = np.zeros((n, dim))
+    for start in range(0, rows.size, _PAIR_BLOCK_SIZE):
+        r = rows[start : start + _PAIR_BLOCK_SIZE]
+        delta = positions[r] - sources[start : start + _PAIR_BLOCK_SIZE]
+        distance2 = np.einsum("ij,ij->i", delta, delta) + 1e-9
+        push = delta * (k * k / distance2)[:, None]
+        for d in range(dim):
+            displacement[:, d] += np.bincount(r, weights=push[:, d], minlength=n)
+    return displacement
+
+
+def hierarchical_layout(n: int, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """
+    Layered placement for trees and DAGs such as requirement hierarchies.
+
+    Edges point down: every node sits one layer below its deepest parent.
+    Edges that close a cycle are ignored. Within a layer, nodes are ordered
+    by the mean position of their neighbours (barycenter heuristic), with
+    alternating downward and upward sweeps.
+
+    Args:
+        n: Number of nodes
+        src: Source (parent) node index of each edge
+        dst: Target (child) node index of each edge
+
+    Returns:
+        Positions (n x 2), with layer 0 at y = 0 and x centred per layer
+    """
+    src, dst = _acyclic_edges(n, src, dst)
+
+    # Longest-path layering; converges after (depth + 1) relaxations
+    layers = np.zeros(n, dtype=np.int64)
+    for _ in range(n):
+        candidate = layers.copy()
+        if src.size:
+            np.maximum.at(candidate, dst, layers[src] + 1)
+        if np.array_equal(candidate, layers):
+            break
+        layers = candidate
+
+    x = _layer_ranks(layers, np.arange(n, dtype=np.float64))
+    for sweep in range(_BARYCENTER_SWEEPS):
+        a, b = (dst, src) if sweep % 2 == 0 else (src, dst)
+        counts = np.bincount(a, minlength=n)
+        sums = np.bincount(a, weights=x[b], minlength=n)
+        key = np.where(counts > 0, sums / np.maximum(counts, 1), x)
+        x = _layer_ranks(layers, key)
+
+    layer_sizes = np.bincount(layers)
+    positions = np.zeros((n, 2))
+    positions[:, 0] = (x - (layer_sizes[layers] - 1) / 2) * _NODE_SPACING
+    positions[:, 1] = layers * _LAYER_SPACING
+    return positions
+
+
+def _layer_ranks(layers: np.ndarray, key: np.ndarray) -> np.ndarray:
+    """Rank of each node within its layer when ordered by key"""
+    order = np.lexsort((key, layers))
+    sorted_layers = layers[order]
+    layer_starts = np.searchsorted(sorted_layers, sorted_layers, side="left")
+    ranks = np.empty(layers.size, dtype=np.float64)
+    ranks[order] = np.arange(layers.size) - layer_starts
+    return ranks
+
+
+def _acyclic_edges(
+    n: int, src: np.ndarray, dst: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Drop the edges that close a cycle.
+
+    Nodes are ordered topologically (Kahn's algorithm). When only cycles are
+    left, the lowest-indexed unvisited node is released next. Edges pointing
+    backwards in that order are removed.
+    """
+    if not src.size:
+        return src, dst
+
+    children: list[list[int]] = [[] for _ in range(n)]
+    for s, d in zip(src.tolist(), dst.tolist()):
+        children[s].append(d)
+    in_degree = np.bincount(dst, minlength=n).tolist()
+
+    rank = [-1] * n
+    next_rank = 0
+    queue = [node for node in range(n) if in_degree[node] == 0]
+    head = 0
+    fallback = 0
+    while next_rank < n:
+        if head == len(queue):
+            while rank[fallback] >= 0:
+                fallback += 1
+            queue.append(fallback)
+        node = queue[head]
+        head += 1
+        if rank[node] >= 0:
+            continue
+        rank[node] = next_rank
+        next_rank += 1
+        for child in children[node]:
+            in_degree[child] -= 1
+            if in_degree[child] == 0 and rank[child] < 0:
+                queue.append(child)
+
+    ranks = np.asarray(rank)
+    forward = ranks[src] < ranks[dst]
+    return src[forward], dst[forward]
@@ -0,0 +1,93 @@
+"""Minimal JSON Patch (RFC 6902) diff and apply for JSON objects"""
+
+import copy
+from typing import Any
+
+_MISSING = object()
+
+
+def _escape(key: str) -> str:
+    """Escape an object key as a JSON Pointer reference token"""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    """Decode a JSON Pointer reference token"""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _same(a: Any, b: Any) -> bool:
+    """JSON equality: unlike ==, 1, 1.0 and True are different values"""
+    return type(a) is type(b) and a == b
+
+
+def make_patch(
+    source: dict[str, Any], target: dict[str, Any], path: str = ""
+) -> list[dict[str, Any]]:
+    """
+    Compute a JSON Patch that turns source into target.
+
+    Nested objects are diffed member by member; any other changed value,
+    including arrays, is replaced as a whole.
+
+    Args:
+        source: Original object
+        target: Updated object
+        path: JSON Pointer of source within the document
+
+    Returns:
+        List of "add", "remove" and "replace" operations
+    """
+    operations: list[dict[str, Any]] = []
+    for key in source:
+        if key not in target:
+            operations.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+    for key, value in target.items():
+        pointer = f"{path}/{_escape(key)}"
+        if key not in source:
+            operations.append({"op": "add", "path": pointer, "value": value})
+        elif isinstance(value, dict) and isinstance(source[key], dict):
+            operations.extend(make_patch(source[key], value, pointer))
+        elif not _same(source[key], value):
+            operations.append({"op": "replace", "path": pointer, "value": value})
+    return operations
+
+
+def apply_patch(document: dict[str, Any], patch: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Apply a patch produced by make_patch() in place.
+
+    Args:
+        document: Object to modify
+        patch: "add", "remove" and "replace" operations on object members
+
+    Returns:
+        The modified document
+
+    Raises:
+        ValueError: If an operation is unsupported or its path does not exist
+    """
+    for operation in patch:
+        op = operation.get("op")
+        tokens = [_unescape(token) for token in operation.get("path", "").split("/")[1:]]
+        if not tokens:
+            raise ValueError(f"Cannot apply '{op}' to the document root")
+
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent.get(token) if isinstance(parent, dict) else None
+        if not isinstance(parent, dict):
+            raise ValueError(f"Path {operation.get('path')} does not exist")
+
+        key = tokens[-1]
+        if op in ("add", "replace"):
+            if op == "replace" and key not in parent:
+                raise ValueError(f"Path {operation['path']} does not exist")
+            parent[key] = copy.deepcopy(operation["value"])
+        elif op == "remove":
+            if parent.pop(key, _MISSING) is _MISSING:
+                raise ValueError(f"Path {operation['path']} does not exist")
+        else:
+            raise ValueError(f"Unsupported patch operation: {op}")
+    return document
+
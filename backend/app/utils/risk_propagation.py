@@ -0,0 +1,211 @@
+"""Failure propagation over the FMEA LEADS_TO graph"""
+
+import heapq
+from collections import deque
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+# Node types a failure chain may end at
+CHAIN_END_TYPES = ("risk", "failure")
+
+
+def edge_probability(value: Any) -> float:
+    """
+    Parse a LEADS_TO probability.
+
+    Args:
+        value: Stored probability
+
+    Returns:
+        The probability, or 0.0 if it is missing, not numeric or outside [0, 1]
+    """
+    if isinstance(value, str):
+        try:
+            value = float(value)
+        except ValueError:
+            return 0.0
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return 0.0
+    return float(value) if 0.0 <= value <= 1.0 else 0.0
+
+
+class RiskGraph:
+    """
+    LEADS_TO edges between risks and failures, ordered topologically.
+
+    The graph is meant to be acyclic. Edges that would close a cycle are
+    dropped (counted in ``dropped_edges``) so the propagation below always
+    runs over a DAG: nodes are ordered with Kahn's algorithm, nodes left on
+    cycles are appended, and edges pointing backwards in that order are
+    removed.
+    """
+
+    def __init__(
+        self,
+        nodes: Mapping[str, Mapping[str, Any]],
+        edges: Iterable[tuple[str, str, Any]],
+    ):
+        """
+        Index the graph.
+
+        Args:
+            nodes: Node ID -> summary with at least "type"; endpoints missing
+                here are kept with an empty summary
+            edges: (source ID, target ID, probability) triples; a repeated
+                pair keeps its highest probability
+        """
+        best: dict[tuple[str, str], float] = {}
+        for source, target, probability in edges:
+            if source == target:
+                continue
+            key = (str(source), str(target))
+            best[key] = max(best.get(key, 0.0), edge_probability(probability))
+
+        ids = list(dict.fromkeys([str(node_id) for node_id in nodes] + [
+            node_id for pair in best for node_id in pair
+        ]))
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        self.ids = ids
+        self.nodes = [dict(nodes.get(node_id, {}), id=node_id) for node_id in ids]
+        self._index = index
+
+        successors: list[list[tuple[int, float]]] = [[] for _ in ids]
+        in_degree = [0] * len(ids)
+        for (source, target), probability in best.items():
+            successors[index[source]].append((index[target], probability))
+            in_degree[index[target]] += 1
+
+        order: list[int] = []
+        queue = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            for v, _ in successors[u]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    queue.append(v)
+        placed = set(order)
+        order.extend(i for i in range(len(ids)) if i not in placed)
+
+        position = [0] * len(ids)
+        for rank, u in enumerate(order):
+            position[u] = rank
+        self.dropped_edges = 0
+        for u, targets in enumerate(successors):
+            kept = [(v, p) for v, p in targets if position[v] > position[u]]
+            self.dropped_edges += len(targets) - len(kept)
+            successors[u] = kept
+
+        self._successors = successors
+        self._position = position
+
+    def start_risks(self) -> list[str]:
+        """IDs of risks with at least one outgoing LEADS_TO edge"""
+        return [
+            node_id
+            for i, node_id in enumerate(self.ids)
+            if self._successors[i] and self.nodes[i].get("type") == "risk"
+        ]
+
+    def propagate(
+        self, start_id: str, max_depth: int = 5, top_k: int = 10
+    ) -> dict[str, Any]:
+        """
+        Propagate a risk through the nodes within max_depth hops.
+
+        Both results are dynamic programs over the topological order, so
+        no path is enumerated beyond the top_k best per (node, length):
+
+        - failure_probabilities: chance that each reached node occurs when
+          the start risk does, treating edges as independent causes
+          (noisy-OR: P(v) = 1 - prod(1 - P(u) * p(u, v)))
+        - chains: the top_k most probable chains of at most max_depth edges
+          from the start risk to a risk or failure
+
+        Args:
+            start_id: Starting risk ID
+            max_depth: Maximum number of edges per chain
+            top_k: Number of chains to return
+
+        Returns:
+            Dictionary with start_risk_id, chains (most probable first) and
+            failure_probabilities (node ID -> probability)
+        """
+        result: dict[str, Any] = {
+            "start_risk_id": start_id,
+            "chains": [],
+            "failure_probabilities": {},
+        }
+        start = self._index.get(str(start_id))
+        if start is None or max_depth < 1 or top_k < 1:
+            return result
+
+        # Nodes within max_depth hops
+        hops = {start: 0}
+        queue = deque([start])
+        while queue:
+            u = queue.popleft()
+            if hops[u] == max_depth:
+                continue
+            for v, _ in self._successors[u]:
+                if v not in hops:
+                    hops[v] = hops[u] + 1
+                    queue.append(v)
+
+        # buckets[v][length] holds (probability, path) candidates
+        buckets: dict[int, dict[int, list[tuple[float, tuple[int, ...]]]]] = {
+            start: {0: [(1.0, (start,))]}
+        }
+        miss = dict.fromkeys(hops, 1.0)
+        reached: dict[int, float] = {}
+        candidates: list[tuple[float, tuple[int, ...]]] = []
+
+        for u in sorted(hops, key=self._position.__getitem__):
+            probability_u = 1.0 if u == start else 1.0 - miss[u]
+            reached[u] = probability_u
+            by_length = buckets.pop(u, {})
+            for length, chains in by_length.items():
+                best = heapq.nlargest(top_k, chains, key=_chain_rank)
+                by_length[length] = best
+                if u != start and self.nodes[u].get("type") in CHAIN_END_TYPES:
+                    candidates.extend(best)
+
+            for v, p in self._successors[u]:
+                if v not in hops:
+                    continue
+                miss[v] *= 1.0 - probability_u * p
+                target = buckets.setdefault(v, {})
+                for length, chains in by_length.items():
+                    if length < max_depth:
+                        target.setdefault(length + 1, []).extend(
+                            (probability * p, path + (v,)) for probability, path in chains
+                        )
+
+        result["chains"] = [
+            self._chain(path, probability)
+            for probability, path in heapq.nlargest(top_k, candidates, key=_chain_rank)
+        ]
+        result["failure_probabilities"] = {
+            self.ids[v]: probability for v, probability in reached.items() if v != start
+        }
+        return result
+
+    def _chain(self, path: tuple[int, ...], probability: float) -> dict[str, Any]:
+        """Format a chain of node indices"""
+        probabilities = [
+            next(p for v, p in self._successors[u] if v == w)
+            for u, w in zip(path, path[1:], strict=False)
+        ]
+        return {
+            "start_risk_id": self.ids[path[0]],
+            "path": [self.nodes[i] for i in path],
+            "probabilities": probabilities,
+            "chain_length": len(path) - 1,
+            "total_probability": probability,
+        }
+
+
+def _chain_rank(chain: tuple[float, tuple[int, ...]]) -> tuple[float, int, tuple[int, ...]]:
+    """Sort key for nlargest: higher probability, then shorter, then lower indices"""
+    probability, path = chain
+    return probability, -len(path), tuple(-i for i in path)
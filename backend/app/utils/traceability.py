@@ -0,0 +1,258 @@
+"""Requirement-test-risk traceability on compact index arrays"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+# Traceability relationships and the WorkItem type each one points to; the
+# source of both is always a requirement
+TRACEABILITY_RELATIONSHIPS = {"TESTED_BY": "test", "MITIGATES": "risk"}
+
+
+def _adjacency(
+    sources: np.ndarray, targets: np.ndarray, size: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Group edge targets by source as a CSR structure.
+
+    Args:
+        sources: Source index of each edge
+        targets: Target index of each edge
+        size: Number of source items
+
+    Returns:
+        Tuple of (ptr, targets) where the targets of source i are
+        targets[ptr[i]:ptr[i + 1]], in ascending order
+    """
+    order = np.lexsort((targets, sources))
+    ptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=size), out=ptr[1:])
+    return ptr, targets[order]
+
+
+@dataclass
+class TraceabilityMatrix:
+    """
+    Bipartite requirement-test and requirement-risk links of a project.
+
+    Items are held as lists of {"id", "title", "status", "is_signed"}
+    summaries, and the links as (E, 2) arrays of (requirement index,
+    test or risk index) pairs. Adjacency in both directions is built once,
+    so rows and coverage statistics never touch the graph again.
+    """
+
+    requirements: list[dict[str, Any]]
+    tests: list[dict[str, Any]]
+    risks: list[dict[str, Any]]
+    tested_by: np.ndarray
+    mitigates: np.ndarray
+    _index: dict[str, int] = field(init=False, repr=False)
+    _req_tests: tuple[np.ndarray, np.ndarray] = field(init=False, repr=False)
+    _req_risks: tuple[np.ndarray, np.ndarray] = field(init=False, repr=False)
+    _test_reqs: tuple[np.ndarray, np.ndarray] = field(init=False, repr=False)
+    _risk_reqs: tuple[np.ndarray, np.ndarray] = field(init=False, repr=False)
+    _signed: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        n_req = len(self.requirements)
+        self._index = {item["id"]: i for i, item in enumerate(self.requirements)}
+        self._req_tests = _adjacency(self.tested_by[:, 0], self.tested_by[:, 1], n_req)
+        self._req_risks = _adjacency(self.mitigates[:, 0], self.mitigates[:, 1], n_req)
+        self._test_reqs = _adjacency(
+            self.tested_by[:, 1], self.tested_by[:, 0], len(self.tests)
+        )
+        self._risk_reqs = _adjacency(
+            self.mitigates[:, 1], self.mitigates[:, 0], len(self.risks)
+        )
+        self._signed = np.fromiter(
+            (bool(item.get("is_signed")) for item in self.requirements),
+            dtype=bool,
+            count=n_req,
+        )
+
+    def _requirement_indices(self, requirement_ids: Iterable[str] | None) -> np.ndarray:
+        """Indices of the given requirements (all when None), unknown IDs skipped"""
+        if requirement_ids is None:
+            return np.arange(len(self.requirements), dtype=np.int64)
+        wanted = {str(requirement_id) for requirement_id in requirement_ids}
+        return np.fromiter(
+            sorted(self._index[rid] for rid in wanted if rid in self._index),
+            dtype=np.int64,
+        )
+
+    def rows(self, requirement_ids: Iterable[str] | None = None) -> list[dict[str, Any]]:
+        """
+        One row per requirement with the IDs of its tests and risks.
+
+        Args:
+            requirement_ids: Requirements to include, or None for all
+
+        Returns:
+            List of {"requirement_id", "requirement_title", "status",
+            "is_signed", "test_ids", "risk_ids"} in requirement order
+        """
+        test_ptr, test_targets = self._req_tests
+        risk_ptr, risk_targets = self._req_risks
+        test_ids = [item["id"] for item in self.tests]
+        risk_ids = [item["id"] for item in self.risks]
+        tp, tt = test_ptr.tolist(), test_targets.tolist()
+        rp, rt = risk_ptr.tolist(), risk_targets.tolist()
+
+        rows = []
+        for i in self._requirement_indices(requirement_ids).tolist():
+            requirement = self.requirements[i]
+            rows.append(
+                {
+                    "requirement_id": requirement["id"],
+                    "requirement_title": requirement.get("title") or "",
+                    "status": requirement.get("status"),
+                    "is_signed": bool(requirement.get("is_signed")),
+                    "test_ids": [test_ids[j] for j in tt[tp[i] : tp[i + 1]]],
+                    "risk_ids": [risk_ids[j] for j in rt[rp[i] : rp[i + 1]]],
+                }
+            )
+        return rows
+
+    def coverage_stats(
+        self, requirement_ids: Iterable[str] | None = None
+    ) -> dict[str, Any]:
+        """
+        Coverage and orphan counts.
+
+        Test and risk counts refer to the distinct items linked to the
+        selected requirements; orphan tests and unmitigated risks are only
+        reported for the whole project.
+
+        Args:
+            requirement_ids: Requirements to count, or None for all
+
+        Returns:
+            Dictionary of counts and the test coverage percentage
+        """
+        selected = self._requirement_indices(requirement_ids)
+        tests_per_req = np.diff(self._req_tests[0])[selected]
+        risks_per_req = np.diff(self._req_risks[0])[selected]
+        total = int(selected.size)
+        with_tests = int(np.count_nonzero(tests_per_req))
+
+        if requirement_ids is None:
+            tested_by, mitigates = self.tested_by, self.mitigates
+        else:
+            mask = np.zeros(len(self.requirements), dtype=bool)
+            mask[selected] = True
+            tested_by = self.tested_by[mask[self.tested_by[:, 0]]]
+            mitigates = self.mitigates[mask[self.mitigates[:, 0]]]
+
+        stats: dict[str, Any] = {
+            "total_requirements": total,
+            "requirements_with_tests": with_tests,
+            "requirements_without_tests": total - with_tests,
+            "requirements_with_risks": int(np.count_nonzero(risks_per_req)),
+            "signed_requirements": int(np.count_nonzero(self._signed[selected])),
+            "test_coverage_percentage": round(with_tests / total * 100, 1)
+            if total
+            else 0.0,
+            "total_tests": int(np.unique(tested_by[:, 1]).size),
+            "total_risks": int(np.unique(mitigates[:, 1]).size),
+            "test_links": int(tested_by.shape[0]),
+            "risk_links": int(mitigates.shape[0]),
+        }
+        if requirement_ids is None:
+            stats["total_tests"] = len(self.tests)
+            stats["total_risks"] = len(self.risks)
+            stats["orphan_tests"] = int(
+                np.count_nonzero(np.diff(self._test_reqs[0]) == 0)
+            )
+            stats["unmitigated_risks"] = int(
+                np.count_nonzero(np.diff(self._risk_reqs[0]) == 0)
+            )
+        return stats
+
+    def to_response(self) -> dict[str, Any]:
+        """
+        Matrix in the shape of the /graph/traceability response.
+
+        Returns:
+            Dictionary with requirement rows, tests and risks with the IDs
+            of their requirements, and coverage statistics
+        """
+        requirement_ids = [item["id"] for item in self.requirements]
+
+        def linked(items: list[dict[str, Any]], adjacency) -> list[dict[str, Any]]:
+            ptr, targets = (a.tolist() for a in adjacency)
+            return [
+                {
+                    **item,
+                    "requirement_ids": [
+                        requirement_ids[j] for j in targets[ptr[i] : ptr[i + 1]]
+                    ],
+                }
+                for i, item in enumerate(items)
+            ]
+
+        return {
+            "requirements": self.rows(),
+            "tests": linked(self.tests, self._test_reqs),
+            "risks": linked(self.risks, self._risk_reqs),
+            "coverage_stats": self.coverage_stats(),
+        }
+
+
+def build_traceability_matrix(
+    items: Iterable[Mapping[str, Any]],
+    links: Iterable[tuple[str, str, str]],
+) -> TraceabilityMatrix:
+    """
+    Index WorkItems and their traceability links.
+
+    Args:
+        items: WorkItem summaries with "id", "type", "title", "status" and
+            "is_signed"; types other than requirement, test and risk are
+            ignored
+        links: (relationship type, source ID, target ID) triples; links that
+            are not a requirement TESTED_BY a test or a requirement
+            MITIGATES a risk are ignored, duplicates are counted once
+
+    Returns:
+        TraceabilityMatrix over the given items
+    """
+    groups: dict[str, list[dict[str, Any]]] = {"requirement": [], "test": [], "risk": []}
+    for item in items:
+        group = groups.get(item.get("type"))
+        if group is not None and item.get("id") is not None:
+            group.append(
+                {
+                    "id": str(item["id"]),
+                    "title": item.get("title"),
+                    "status": item.get("status"),
+                    "is_signed": bool(item.get("is_signed")),
+                }
+            )
+
+    index = {
+        kind: {item["id"]: i for i, item in enumerate(group)}
+        for kind, group in groups.items()
+    }
+    pairs: dict[str, list[tuple[int, int]]] = {"test": [], "risk": []}
+    for rel_type, source_id, target_id in links:
+        kind = TRACEABILITY_RELATIONSHIPS.get(rel_type)
+        if kind is None:
+            continue
+        source = index["requirement"].get(str(source_id))
+        target = index[kind].get(str(target_id))
+        if source is not None and target is not None:
+            pairs[kind].append((source, target))
+
+    def edge_array(kind: str) -> np.ndarray:
+        edges = np.asarray(pairs[kind], dtype=np.int64).reshape(-1, 2)
+        return np.unique(edges, axis=0) if edges.size else edges
+
+    return TraceabilityMatrix(
+        requirements=groups["requirement"],
+        tests=groups["test"],
+        risks=groups["risk"],
+        tested_by=edge_array("test"),
+        mitigates=edge_array("risk"),
+    )
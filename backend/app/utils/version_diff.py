@@ -0,0 +1,97 @@
+"""Structural diff of WorkItem version snapshots"""
+
+import difflib
+import re
+from collections.abc import Iterable
+from typing import Any
+
+# Fields that change with every version and are not compared
+VERSION_METADATA_FIELDS = ("version", "updated_at", "updated_by", "change_description")
+
+# Strings at least this long are diffed instead of returned in full
+LONG_TEXT_LENGTH = 200
+
+_TOKEN = re.compile(r"\s+|\S+")
+
+
+def diff_text(old: str, new: str) -> list[dict[str, Any]]:
+    """
+    Word-level diff of two texts.
+
+    Unchanged runs are reported by length only, so the result stays small
+    when a few words of a long text change. Applying the hunks in order to
+    old yields new.
+
+    Args:
+        old: Text of the earlier version
+        new: Text of the later version
+
+    Returns:
+        Hunks: {"op": "equal", "length"}, {"op": "delete", "text"},
+        {"op": "insert", "text"} or {"op": "replace", "from", "to"}
+    """
+    a = _TOKEN.findall(old)
+    b = _TOKEN.findall(new)
+    hunks: list[dict[str, Any]] = []
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        removed = "".join(a[i1:i2])
+        added = "".join(b[j1:j2])
+        if tag == "equal":
+            hunks.append({"op": "equal", "length": len(removed)})
+        elif tag == "delete":
+            hunks.append({"op": "delete", "text": removed})
+        elif tag == "insert":
+            hunks.append({"op": "insert", "text": added})
+        else:
+            hunks.append({"op": "replace", "from": removed, "to": added})
+    return hunks
+
+
+def diff_snapshots(
+    old: dict[str, Any],
+    new: dict[str, Any],
+    fields: Iterable[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Compare two version snapshots field by field.
+
+    Only differing fields are reported. Long strings carry a word-level
+    diff instead of both full values.
+
+    Args:
+        old: Snapshot of the earlier version
+        new: Snapshot of the later version
+        fields: Fields to compare (all non-metadata fields when None)
+
+    Returns:
+        Dictionary with added_fields, removed_fields, changed_fields
+        (field -> {"from", "to"} or {"diff": hunks}) and unchanged_count
+    """
+    keys = list(fields) if fields is not None else sorted(set(old) | set(new))
+    result: dict[str, Any] = {
+        "added_fields": {},
+        "removed_fields": {},
+        "changed_fields": {},
+        "unchanged_count": 0,
+    }
+    for key in keys:
+        if key in VERSION_METADATA_FIELDS:
+            continue
+        if key not in old and key not in new:
+            continue
+        if key not in old:
+            result["added_fields"][key] = new[key]
+        elif key not in new:
+            result["removed_fields"][key] = old[key]
+        elif old[key] == new[key]:
+            result["unchanged_count"] += 1
+        elif (
+            isinstance(old[key], str)
+            and isinstance(new[key], str)
+            and max(len(old[key]), len(new[key])) >= LONG_TEXT_LENGTH
+        ):
+            result["changed_fields"][key] = {"diff": diff_text(old[key], new[key])}
+        else:
+            result["changed_fields"][key] = {"from": old[key], "to": new[key]}
+    return result
@@ -0,0 +1,60 @@
+"""
+Migration script to add the partial index on valid digital signatures.
+
+This script:
+- Creates ix_digital_signatures_workitem_valid on digital_signatures
+  (workitem_id) WHERE is_valid, used by signed-status lookups and
+  set-based signature invalidation
+
+Run this script before starting the updated service code. It is safe to run
+more than once.
+
+Usage:
+    uv run python migrations/add_signature_valid_index.py
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from app.db.session import AsyncSessionLocal
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INDEX_STATEMENT = """
+CREATE INDEX IF NOT EXISTS ix_digital_signatures_workitem_valid
+ON digital_signatures (workitem_id)
+WHERE is_valid
+"""
+
+
+async def main():
+    """Run the migration"""
+    logger.info("Starting migration: add_signature_valid_index")
+    logger.info("=" * 60)
+
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(text(INDEX_STATEMENT))
+            await session.commit()
+
+        logger.info("Migration successful!")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    sys.exit(exit_code)
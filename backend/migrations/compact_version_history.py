@@ -0,0 +1,145 @@
+"""
+Migration script to convert version_history to keyframe + delta storage.
+
+This script:
+- Adds the sequence, is_keyframe and delta columns and makes data nullable
+- Numbers existing snapshots per WorkItem in creation order
+- Creates the (workitem_id, sequence) and (workitem_id, version) indexes
+- Rewrites every snapshot that is not a keyframe (one in
+  VERSION_KEYFRAME_INTERVAL) as a JSON Patch against the previous snapshot
+
+Run this script before starting the updated service code. It is safe to run
+more than once; already compacted snapshots are left as they are.
+
+Usage:
+    uv run python migrations/compact_version_history.py
+"""
+
+import asyncio
+import copy
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, text
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.version_history import VersionHistory
+from app.utils.json_patch import apply_patch, make_patch
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SCHEMA_STATEMENTS = [
+    "ALTER TABLE version_history ADD COLUMN IF NOT EXISTS sequence INTEGER",
+    "ALTER TABLE version_history ADD COLUMN IF NOT EXISTS is_keyframe BOOLEAN NOT NULL DEFAULT TRUE",
+    "ALTER TABLE version_history ADD COLUMN IF NOT EXISTS delta JSON",
+    "ALTER TABLE version_history ALTER COLUMN data DROP NOT NULL",
+    """
+    WITH numbered AS (
+        SELECT id, row_number() OVER (
+            PARTITION BY workitem_id ORDER BY created_at, id
+        ) AS n
+        FROM version_history
+    )
+    UPDATE version_history v SET sequence = numbered.n
+    FROM numbered
+    WHERE v.id = numbered.id AND v.sequence IS NULL
+    """,
+    "ALTER TABLE version_history ALTER COLUMN sequence SET NOT NULL",
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_version_history_workitem_sequence
+    ON version_history (workitem_id, sequence)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_version_history_workitem_version
+    ON version_history (workitem_id, version)
+    """,
+]
+
+
+async def migrate_schema(session):
+    """Add the keyframe/delta columns and indexes"""
+    logger.info("Migrating version_history schema...")
+    for statement in SCHEMA_STATEMENTS:
+        await session.execute(text(statement))
+    await session.commit()
+
+
+async def compact_workitem(session, workitem_id, interval: int) -> int:
+    """Rewrite the snapshots of one WorkItem as keyframes and deltas"""
+    result = await session.execute(
+        select(VersionHistory)
+        .where(VersionHistory.workitem_id == workitem_id)
+        .order_by(VersionHistory.sequence)
+    )
+    rows = result.scalars().all()
+
+    compacted = 0
+    previous = None
+    # Snapshots since (and including) the last keyframe, as VersionStore counts
+    since_keyframe = 0
+    for row in rows:
+        if row.is_keyframe:
+            data = copy.deepcopy(row.data or {})
+        else:
+            data = apply_patch(copy.deepcopy(previous or {}), row.delta or [])
+
+        if row.is_keyframe and previous is not None and since_keyframe < interval:
+            row.delta = make_patch(previous, data)
+            row.data = None
+            row.is_keyframe = False
+            compacted += 1
+        since_keyframe = 1 if row.is_keyframe else since_keyframe + 1
+        previous = data
+
+    await session.commit()
+    return compacted
+
+
+async def compact_snapshots(session) -> int:
+    """Convert full snapshots between keyframes to deltas"""
+    logger.info("Compacting version snapshots...")
+    result = await session.execute(select(VersionHistory.workitem_id).distinct())
+    workitem_ids = result.scalars().all()
+
+    total = 0
+    for workitem_id in workitem_ids:
+        try:
+            total += await compact_workitem(
+                session, workitem_id, settings.VERSION_KEYFRAME_INTERVAL
+            )
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Failed to compact versions of WorkItem {workitem_id}: {e}")
+    logger.info(f"Compacted {total} snapshots of {len(workitem_ids)} WorkItems")
+    return total
+
+
+async def main():
+    """Run the migration"""
+    logger.info("Starting migration: compact_version_history")
+    logger.info("=" * 60)
+
+    try:
+        async with AsyncSessionLocal() as session:
+            await migrate_schema(session)
+            await compact_snapshots(session)
+
+        logger.info("Migration successful!")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    sys.exit(exit_code)
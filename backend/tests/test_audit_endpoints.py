@@ -1,5 +1,7 @@
 """Integration tests for audit API endpoints"""
 
+import gzip
+import json
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
@@ -476,6 +478,54 @@ class TestAuditEndpoints:
 
         assert response.status_code == 422  # Validation error
 
+    async def test_stream_audit_export_csv(
+        self,
+        client: AsyncClient,
+        admin_token: str,
+        sample_audit_logs: list[AuditLog]
+    ):
+        """Test streaming the complete audit log as CSV"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+
+        response = await client.get(
+            "/api/v1/audit/export/stream",
+            headers=headers,
+            params={"format": "csv"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers.get("content-disposition", "")
+        lines = response.text.strip().splitlines()
+        assert lines[0].startswith("id,user_id,action,entity_type")
+        assert len(lines) - 1 >= len(sample_audit_logs)
+
+    async def test_stream_audit_export_ndjson_gzip(
+        self,
+        client: AsyncClient,
+        admin_token: str,
+        sample_audit_logs: list[AuditLog]
+    ):
+        """Test streaming a gzipped NDJSON export"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+
+        response = await client.get(
+            "/api/v1/audit/export/stream",
+            headers=headers,
+            params={"format": "ndjson", "compress": "true"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert ".ndjson.gz" in response.headers["content-disposition"]
+        rows = [
+            json.loads(line)
+            for line in gzip.decompress(response.content).decode().splitlines()
+        ]
+        assert len(rows) >= len(sample_audit_logs)
+        timestamps = [row["timestamp"] for row in rows]
+        assert timestamps == sorted(timestamps, reverse=True)
+
     async def test_export_audit_logs_regular_user_denied(
         self,
         client: AsyncClient,
@@ -1,6 +1,6 @@
 """Unit tests for AuditService"""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -338,3 +338,41 @@ class TestAuditServiceFiltering:
         # Verify query was executed
         mock_db.execute.assert_called_once()
         assert isinstance(result, list)
+
+    @pytest.mark.asyncio
+    async def test_stream_audit_logs_pages_by_keyset(self, audit_service, mock_db):
+        """Test that streaming continues after the last (timestamp, id) of each page"""
+        logs = [
+            AuditLog(
+                id=uuid4(),
+                action="READ",
+                entity_type="WorkItem",
+                timestamp=datetime(2024, 1, 1, tzinfo=UTC) - timedelta(minutes=i),
+            )
+            for i in range(5)
+        ]
+        pages = [logs[:2], logs[2:4], logs[4:]]
+        queries = []
+
+        async def stream_scalars(query):
+            queries.append(query)
+
+            async def rows():
+                for log in pages[len(queries) - 1]:
+                    yield log
+
+            return rows()
+
+        mock_db.stream_scalars = stream_scalars
+
+        rows = [
+            row
+            async for row in audit_service.stream_audit_logs(AuditLogFilter(), page_size=2)
+        ]
+
+        assert [row["id"] for row in rows] == [str(log.id) for log in logs]
+        assert len(queries) == 3
+        assert "WHERE" not in str(queries[0])
+        params = queries[2].compile().params
+        assert logs[3].timestamp in params.values()
+        assert logs[3].id in params.values()
@@ -0,0 +1,185 @@
+"""Tests for the buffered audit log writer"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.audit import AuditLog
+from app.schemas.audit import AuditLogFilter
+from app.services.audit_service import AuditService
+from app.services.audit_writer import AuditWriter, get_audit_writer
+
+
+class FakeSessionFactory:
+    """Records the batches written through its sessions"""
+
+    def __init__(self, failures: int = 0):
+        self.batches: list[list[dict]] = []
+        self.failures = failures
+
+    def __call__(self):
+        factory = self
+
+        class Session:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, statement, rows):
+                if factory.failures:
+                    factory.failures -= 1
+                    raise RuntimeError("database unavailable")
+                factory.batches.append(list(rows))
+
+            async def commit(self):
+                pass
+
+        return Session()
+
+    @property
+    def rows(self) -> list[dict]:
+        return [row for batch in self.batches for row in batch]
+
+
+def _row(i: int = 0) -> dict:
+    return {"id": uuid4(), "action": "READ", "entity_type": "WorkItem", "details": {"i": i}}
+
+
+class TestAuditWriter:
+    @pytest.mark.asyncio
+    async def test_flushes_after_interval(self):
+        sessions = FakeSessionFactory()
+        writer = AuditWriter(sessions, batch_size=100, flush_interval=0.01)
+
+        await writer.submit(_row(1))
+        await writer.submit(_row(2))
+        assert sessions.rows == []
+
+        await asyncio.sleep(0.05)
+
+        assert [row["details"]["i"] for row in sessions.rows] == [1, 2]
+        assert len(sessions.batches) == 1
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self):
+        sessions = FakeSessionFactory()
+        writer = AuditWriter(sessions, batch_size=3, flush_interval=60)
+
+        for i in range(7):
+            await writer.submit(_row(i))
+        for _ in range(100):
+            if sessions.batches:
+                break
+            await asyncio.sleep(0.001)
+
+        # Written long before the 60 s interval
+        assert sessions.batches and len(sessions.batches[0]) == 3
+        await writer.close()
+        assert len(sessions.rows) == 7
+        assert all(len(batch) <= 3 for batch in sessions.batches)
+
+    @pytest.mark.asyncio
+    async def test_close_writes_remaining_rows(self):
+        sessions = FakeSessionFactory()
+        writer = AuditWriter(sessions, batch_size=100, flush_interval=60)
+
+        for i in range(5):
+            await writer.submit(_row(i))
+        await writer.close()
+
+        assert len(sessions.rows) == 5
+        assert writer.pending == 0
+        assert writer.written == 5
+
+    @pytest.mark.asyncio
+    async def test_backpressure_flushes_when_full(self):
+        sessions = FakeSessionFactory()
+        writer = AuditWriter(sessions, batch_size=100, flush_interval=60, max_pending=4)
+
+        for i in range(6):
+            await writer.submit(_row(i))
+
+        assert len(sessions.rows) == 4
+        assert writer.pending == 2
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self):
+        sessions = FakeSessionFactory(failures=1)
+        writer = AuditWriter(sessions, flush_interval=60)
+
+        await writer.submit(_row())
+        assert await writer.flush() == 1
+        assert writer.dropped == 0
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_dropped_after_repeated_failures(self):
+        sessions = FakeSessionFactory(failures=10)
+        writer = AuditWriter(sessions, flush_interval=60)
+
+        await writer.submit(_row())
+        assert await writer.flush() == 0
+        assert writer.dropped == 1
+        assert writer.pending == 0
+        await writer.close()
+
+    def test_no_writer_for_unbound_session(self):
+        assert get_audit_writer(AsyncMock()) is None
+
+
+class TestBufferedAuditService:
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock()
+        db.add = MagicMock()
+        return db
+
+    @pytest.fixture
+    def writer(self):
+        writer = AsyncMock(spec=AuditWriter)
+        return writer
+
+    @pytest.mark.asyncio
+    async def test_read_events_are_buffered(self, mock_db, writer):
+        service = AuditService(mock_db, writer=writer)
+
+        result = await service.log(action="read", entity_type="WorkItem", details={"n": 1})
+
+        mock_db.add.assert_not_called()
+        mock_db.commit.assert_not_called()
+        row = writer.submit.call_args[0][0]
+        assert row["action"] == "READ"
+        assert row["details"] == {"n": 1}
+        assert row["id"] is not None and row["timestamp"] is not None
+        assert isinstance(result, AuditLog)
+        assert result.id == row["id"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "action", ["SIGN", "SIGNATURE_SIGN", "AUTH_SUCCESS", "AUTH_FAILURE", "AUTHZ_DENIED"]
+    )
+    async def test_sign_and_auth_events_are_synchronous(self, mock_db, writer, action):
+        service = AuditService(mock_db, writer=writer)
+
+        await service.log(action=action, entity_type="User")
+
+        writer.submit.assert_not_called()
+        mock_db.add.assert_called_once()
+        mock_db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_queries_flush_buffer_first(self, mock_db, writer):
+        service = AuditService(mock_db, writer=writer)
+        result = MagicMock()
+        result.scalar.return_value = 3
+        mock_db.execute.return_value = result
+
+        assert await service.get_audit_log_count(AuditLogFilter()) == 3
+
+        writer.flush.assert_called_once()
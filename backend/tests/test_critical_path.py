@@ -1,11 +1,12 @@
 """Unit tests for critical path calculation"""
 
+import time
 from datetime import UTC, datetime, timedelta
 
 import pytest
 
 from app.schemas.schedule import ScheduledTask, ScheduleTaskCreate, TaskDependency
-from app.services.critical_path import calculate_critical_path
+from app.services.critical_path import analyze_critical_path, calculate_critical_path
 
 
 def test_calculate_critical_path_simple_linear():
@@ -474,3 +475,222 @@ def test_calculate_critical_path_multiple_start_tasks():
 
     # Critical path should be A -> C (longest path)
     assert critical_path == ["task_a", "task_c"]
+
+
+def _chain_fixture(
+    durations: dict[str, int], edges: list[tuple[str, str]]
+) -> tuple[list[ScheduleTaskCreate], list[ScheduledTask]]:
+    """Build tasks and an as-early-as-possible schedule from durations and edges"""
+    tasks = [
+        ScheduleTaskCreate(
+            id=task_id,
+            title=task_id,
+            estimated_hours=hours,
+            dependencies=[
+                TaskDependency(predecessor_id=pred, dependency_type="finish_to_start")
+                for pred, succ in edges
+                if succ == task_id
+            ],
+        )
+        for task_id, hours in durations.items()
+    ]
+    start_date = datetime(2024, 1, 1, 9, 0, tzinfo=UTC)
+    finish: dict[str, int] = {}
+    for task_id, hours in durations.items():
+        start = max((finish[p] for p, s in edges if s == task_id), default=0)
+        finish[task_id] = start + hours
+    scheduled_tasks = [
+        ScheduledTask(
+            task_id=task_id,
+            task_title=task_id,
+            start_date=start_date + timedelta(hours=finish[task_id] - hours),
+            end_date=start_date + timedelta(hours=finish[task_id]),
+            duration_hours=hours,
+        )
+        for task_id, hours in durations.items()
+    ]
+    return tasks, scheduled_tasks
+
+
+def test_analyze_critical_path_float_values():
+    """Test ES/EF/LS/LF and float values for A -> B -> D, A -> C -> D"""
+    tasks, scheduled_tasks = _chain_fixture(
+        {"a": 8, "b": 4, "c": 16, "d": 8},
+        [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")],
+    )
+
+    analysis = analyze_critical_path(tasks, scheduled_tasks)
+
+    assert analysis.critical_path == ["a", "c", "d"]
+    assert analysis.project_duration == 32
+    assert analysis.early_start.tolist() == [0, 8, 8, 24]
+    assert analysis.early_finish.tolist() == [8, 12, 24, 32]
+    assert analysis.late_start.tolist() == [0, 20, 8, 24]
+    assert analysis.late_finish.tolist() == [8, 24, 24, 32]
+    assert analysis.total_float.tolist() == [0, 12, 0, 0]
+    assert analysis.free_float.tolist() == [0, 12, 0, 0]
+    assert analysis.near_critical_tasks == ["a", "c", "d"]
+
+
+def test_analyze_critical_path_free_float_differs_from_total_float():
+    """Test free float on a chain B -> C that runs parallel to the critical A"""
+    tasks, scheduled_tasks = _chain_fixture(
+        {"a": 20, "b": 4, "c": 4},
+        [("b", "c")],
+    )
+
+    analysis = analyze_critical_path(tasks, scheduled_tasks)
+
+    assert analysis.critical_path == ["a"]
+    # B can only slip as far as C's slack allows, but slipping it delays C
+    assert analysis.total_float.tolist() == [0, 12, 12]
+    assert analysis.free_float.tolist() == [0, 0, 12]
+
+
+def test_analyze_critical_path_near_critical_threshold():
+    """Test that tasks within the float threshold are reported as near-critical"""
+    tasks, scheduled_tasks = _chain_fixture(
+        {"a": 16, "b": 12, "c": 4},
+        [],
+    )
+
+    assert analyze_critical_path(tasks, scheduled_tasks).near_critical_tasks == ["a"]
+    analysis = analyze_critical_path(tasks, scheduled_tasks, near_critical_float_hours=4)
+    assert analysis.near_critical_tasks == ["a", "b"]
+
+    analysis.apply_to_schedule(scheduled_tasks, near_critical_float_hours=4)
+    by_id = {task.task_id: task for task in scheduled_tasks}
+    assert by_id["a"].is_critical and by_id["a"].is_near_critical
+    assert not by_id["b"].is_critical and by_id["b"].is_near_critical
+    assert by_id["b"].total_float_hours == 4
+    assert not by_id["c"].is_near_critical
+    assert by_id["c"].free_float_hours == 12
+
+
+def _typed_fixture(
+    durations: dict[str, int], dependencies: list[tuple[str, str, str, int]]
+) -> tuple[list[ScheduleTaskCreate], list[ScheduledTask]]:
+    """Build tasks from (predecessor, successor, type, lag) dependencies"""
+    tasks = [
+        ScheduleTaskCreate(
+            id=task_id,
+            title=task_id,
+            estimated_hours=hours,
+            dependencies=[
+                TaskDependency(predecessor_id=pred, dependency_type=kind, lag=lag)
+                for pred, succ, kind, lag in dependencies
+                if succ == task_id
+            ],
+        )
+        for task_id, hours in durations.items()
+    ]
+    # Only the durations of the scheduled tasks enter the analysis
+    start_date = datetime(2024, 1, 1, 9, 0, tzinfo=UTC)
+    scheduled_tasks = [
+        ScheduledTask(
+            task_id=task_id,
+            task_title=task_id,
+            start_date=start_date,
+            end_date=start_date + timedelta(hours=hours),
+            duration_hours=hours,
+        )
+        for task_id, hours in durations.items()
+    ]
+    return tasks, scheduled_tasks
+
+
+def test_analyze_critical_path_start_to_start_with_lag():
+    """Test B starts 2h after A starts, C follows B: A || B -> C"""
+    tasks, scheduled_tasks = _typed_fixture(
+        {"a": 10, "b": 4, "c": 6},
+        [("a", "b", "start_to_start", 2), ("b", "c", "finish_to_start", 0)],
+    )
+
+    analysis = analyze_critical_path(tasks, scheduled_tasks)
+
+    assert analysis.project_duration == 12
+    assert analysis.early_start.tolist() == [0, 2, 6]
+    assert analysis.late_start.tolist() == [0, 2, 6]
+    assert analysis.total_float.tolist() == [0, 0, 0]
+    # A could finish 2h later without moving anything, but not start later
+    assert analysis.free_float.tolist() == [0, 0, 0]
+    assert analysis.critical_path == ["a", "b", "c"]
+
+
+def test_analyze_critical_path_finish_to_finish_with_lag():
+    """Test B finishes 2h after A finishes, parallel to the longer C"""
+    tasks, scheduled_tasks = _typed_fixture(
+        {"a": 8, "b": 4, "c": 12},
+        [("a", "b", "finish_to_finish", 2)],
+    )
+
+    analysis = analyze_critical_path(tasks, scheduled_tasks)
+
+    assert analysis.project_duration == 12
+    assert analysis.early_start.tolist() == [0, 6, 0]
+    assert analysis.early_finish.tolist() == [8, 10, 12]
+    assert analysis.late_start.tolist() == [2, 8, 0]
+    assert analysis.total_float.tolist() == [2, 2, 0]
+    assert analysis.free_float.tolist() == [0, 2, 0]
+    assert analysis.critical_path == ["c"]
+    assert analysis.near_critical_tasks == ["c"]
+    assert analyze_critical_path(
+        tasks, scheduled_tasks, near_critical_float_hours=2
+    ).near_critical_tasks == ["a", "b", "c"]
+
+
+def test_analyze_critical_path_finish_to_start_lag():
+    """Test a lag on a finish_to_start dependency delays the successor"""
+    tasks, scheduled_tasks = _typed_fixture(
+        {"a": 4, "b": 4, "c": 10},
+        [("a", "b", "finish_to_start", 3)],
+    )
+
+    analysis = analyze_critical_path(tasks, scheduled_tasks)
+
+    assert analysis.project_duration == 11
+    assert analysis.early_start.tolist() == [0, 7, 0]
+    assert analysis.total_float.tolist() == [0, 0, 1]
+    assert analysis.critical_path == ["a", "b"]
+
+
+def test_analyze_critical_path_large_graph_performance():
+    """Test that the CPM passes handle 50,000 tasks quickly"""
+    n = 50_000
+    start_date = datetime(2024, 1, 1, 9, 0, tzinfo=UTC)
+    tasks = []
+    scheduled_tasks = []
+    for i in range(n):
+        # Layered graph: each task depends on two tasks of the previous layer
+        dependencies = (
+            [
+                TaskDependency(predecessor_id=f"t{i - 100}"),
+                TaskDependency(predecessor_id=f"t{i - 100 + (i % 7) - 3}"),
+            ]
+            if i >= 103
+            else []
+        )
+        tasks.append(
+            ScheduleTaskCreate(
+                id=f"t{i}", title=f"T{i}", estimated_hours=1 + i % 5,
+                dependencies=dependencies,
+            )
+        )
+        scheduled_tasks.append(
+            ScheduledTask(
+                task_id=f"t{i}",
+                task_title=f"T{i}",
+                start_date=start_date,
+                end_date=start_date + timedelta(hours=1 + i % 5),
+                duration_hours=1 + i % 5,
+            )
+        )
+
+    started = time.perf_counter()
+    analysis = analyze_critical_path(tasks, scheduled_tasks, near_critical_float_hours=8)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 2.0
+    assert len(analysis.critical_path) > 1
+    assert (analysis.total_float >= -1e-9).all()
+    assert (analysis.free_float <= analysis.total_float + 1e-9).all()
@@ -345,13 +345,18 @@ class TestCriticalPathProperties:
             f"All path durations: {all_path_durations}"
         )
         
-        # Additionally, the critical path should end at the task with the longest path
+        # Additionally, the critical path should end at the task that finishes last
+        finish_times = {
+            task_id: all_path_durations[task_id] + durations[task_id]
+            for task_id in all_path_durations
+        }
         end_task = critical_path[-1]
-        assert all_path_durations[end_task] == max_path_duration, (
-            f"Critical path should end at task with longest path. "
-            f"End task: {end_task}, duration: {all_path_durations[end_task]}, "
-            f"Max duration: {max_path_duration}"
+        assert finish_times[end_task] == max(finish_times.values()), (
+            f"Critical path should end at task that finishes last. "
+            f"End task: {end_task}, finish: {finish_times[end_task]}, "
+            f"Latest finish: {max(finish_times.values())}"
         )
+        assert critical_path_duration == finish_times[end_task]
 
     @given(dag_data=dag_tasks_strategy(min_tasks=2, max_tasks=10))
     @settings(max_examples=100, deadline=None)
@@ -8,24 +8,31 @@ Tests document generation functionality including:
 - Invoice Word document generation
 """
 
+import asyncio
 from datetime import UTC, date, datetime
 from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.models.user import User
 from app.schemas.document import (
     BillingPeriod,
     DesignReviewRequest,
     DocumentFormat,
+    DocumentRecord,
     DocumentStatus,
     DocumentType,
     FMEARequest,
     InvoiceRequest,
     TraceabilityMatrixRequest,
 )
+from app.services import document_jobs
+from app.services.document_jobs import DocumentJobQueue
 from app.services.document_service import DocumentService
+from app.services.document_store import DocumentStore, artifact_path
+from app.utils.traceability import build_traceability_matrix
 
 # ============================================================================
 # Fixtures
@@ -36,7 +43,7 @@ def mock_graph_service():
     """Create a mock graph service."""
     service = AsyncMock()
     service.get_workitems_by_type = AsyncMock(return_value=[])
-    service.get_traceability_matrix = AsyncMock(return_value=[])
+    service.get_traceability = AsyncMock(return_value=build_traceability_matrix([], []))
     service.get_all_risks = AsyncMock(return_value=[])
     service.get_risk_chains = AsyncMock(return_value=[])
     return service
@@ -55,16 +62,26 @@ def mock_signature_service():
     """Create a mock signature service."""
     service = AsyncMock()
     service.get_workitem_signatures = AsyncMock(return_value=[])
+    service.get_signatures_for_workitems = AsyncMock(return_value={})
     return service
 
 
 @pytest.fixture
-def document_service(mock_graph_service, mock_audit_service, mock_signature_service):
+def document_store(tmp_path):
+    """Create an in-memory document store writing files to a temp directory."""
+    return DocumentStore(session_factory=None, artifact_dir=tmp_path)
+
+
+@pytest.fixture
+def document_service(
+    mock_graph_service, mock_audit_service, mock_signature_service, document_store
+):
     """Create a DocumentService instance with mocked dependencies."""
     return DocumentService(
         graph_service=mock_graph_service,
         audit_service=mock_audit_service,
         signature_service=mock_signature_service,
+        document_store=document_store,
     )
 
 
@@ -105,22 +122,24 @@ def sample_requirements():
 @pytest.fixture
 def sample_traceability_data():
     """Create sample traceability matrix data."""
-    return [
-        {
-            'requirement_id': str(uuid4()),
-            'requirement_title': 'User Authentication',
-            'test_ids': ['TEST-001', 'TEST-002'],
-            'risk_ids': ['RISK-001'],
-            'is_signed': True,
-        },
-        {
-            'requirement_id': str(uuid4()),
-            'requirement_title': 'Data Encryption',
-            'test_ids': [],
-            'risk_ids': ['RISK-002', 'RISK-003'],
-            'is_signed': False,
-        },
+    auth_id, encryption_id = str(uuid4()), str(uuid4())
+    items = [
+        {'id': auth_id, 'type': 'requirement', 'title': 'User Authentication', 'is_signed': True},
+        {'id': encryption_id, 'type': 'requirement', 'title': 'Data Encryption', 'is_signed': False},
+        {'id': 'TEST-001', 'type': 'test', 'title': 'Login test'},
+        {'id': 'TEST-002', 'type': 'test', 'title': 'Logout test'},
+        {'id': 'RISK-001', 'type': 'risk', 'title': 'Credential leak'},
+        {'id': 'RISK-002', 'type': 'risk', 'title': 'Weak cipher'},
+        {'id': 'RISK-003', 'type': 'risk', 'title': 'Key loss'},
+    ]
+    links = [
+        ('TESTED_BY', auth_id, 'TEST-001'),
+        ('TESTED_BY', auth_id, 'TEST-002'),
+        ('MITIGATES', auth_id, 'RISK-001'),
+        ('MITIGATES', encryption_id, 'RISK-002'),
+        ('MITIGATES', encryption_id, 'RISK-003'),
     ]
+    return build_traceability_matrix(items, links)
 
 
 @pytest.fixture
@@ -233,7 +252,9 @@ class TestDesignReviewPDF:
         mock_sig.signed_at = datetime.now(UTC)
         mock_sig.is_valid = True
         mock_sig.workitem_version = "1.0"
-        mock_signature_service.get_workitem_signatures.return_value = [mock_sig]
+        mock_signature_service.get_signatures_for_workitems.return_value = {
+            UUID(req["id"]): [mock_sig] for req in sample_requirements
+        }
 
         request = DesignReviewRequest(
             project_id=uuid4(),
@@ -243,7 +264,10 @@ class TestDesignReviewPDF:
         response = await document_service.generate_design_review_pdf(request, test_user)
 
         assert response.requirement_count == 2
-        assert response.signature_count >= 0  # May vary based on implementation
+        assert response.signature_count == 2
+        # All signatures are loaded with a single query
+        mock_signature_service.get_signatures_for_workitems.assert_awaited_once()
+        mock_signature_service.get_workitem_signatures.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_generate_design_review_pdf_audit_logging(
@@ -281,7 +305,7 @@ class TestTraceabilityMatrixPDF:
         test_user,
     ):
         """Test generating traceability matrix with no data."""
-        mock_graph_service.get_traceability_matrix.return_value = []
+        mock_graph_service.get_traceability.return_value = build_traceability_matrix([], [])
 
         request = TraceabilityMatrixRequest(
             project_id=uuid4(),
@@ -306,7 +330,7 @@ class TestTraceabilityMatrixPDF:
         sample_traceability_data,
     ):
         """Test generating traceability matrix with data."""
-        mock_graph_service.get_traceability_matrix.return_value = sample_traceability_data
+        mock_graph_service.get_traceability.return_value = sample_traceability_data
 
         request = TraceabilityMatrixRequest(
             project_id=uuid4(),
@@ -331,10 +355,10 @@ class TestTraceabilityMatrixPDF:
         sample_traceability_data,
     ):
         """Test generating traceability matrix with requirement filter."""
-        mock_graph_service.get_traceability_matrix.return_value = sample_traceability_data
+        mock_graph_service.get_traceability.return_value = sample_traceability_data
 
         # Filter to only first requirement
-        first_req_id = sample_traceability_data[0]['requirement_id']
+        first_req_id = sample_traceability_data.requirements[0]['id']
 
         request = TraceabilityMatrixRequest(
             project_id=uuid4(),
@@ -344,6 +368,9 @@ class TestTraceabilityMatrixPDF:
         response = await document_service.generate_traceability_matrix_pdf(request, test_user)
 
         assert response.requirement_count == 1
+        assert response.test_count == 2
+        assert response.risk_count == 1
+        assert response.coverage_percentage == 100.0
 
 
 # ============================================================================
@@ -574,6 +601,182 @@ class TestDocumentRetrieval:
         assert len(result) == 1
         assert result[0].document_type == DocumentType.DESIGN_REVIEW
 
+    @pytest.mark.asyncio
+    async def test_document_content_is_content_addressed(
+        self,
+        document_service,
+        document_store,
+        test_user,
+    ):
+        """Test that the generated file is stored under its content hash."""
+        request = DesignReviewRequest(project_id=uuid4())
+        response = await document_service.generate_design_review_pdf(request, test_user)
+
+        record = await document_service.get_document(response.document_id, test_user)
+        content = await document_service.get_document_content(response.document_id, test_user)
+
+        assert content.startswith(b"%PDF")
+        assert document_service._calculate_content_hash(content) == record.content_hash
+        assert artifact_path(document_store.artifact_dir, record.content_hash).exists()
+        assert record.file_size_bytes == len(content)
+
+
+# ============================================================================
+# Document Job Tests
+# ============================================================================
+
+class TestDocumentJobQueue:
+    """Tests for background document generation jobs."""
+
+    @pytest.fixture
+    def job_queue(
+        self,
+        monkeypatch,
+        mock_graph_service,
+        mock_audit_service,
+        mock_signature_service,
+        document_store,
+    ):
+        """Create a job queue running with mocked services."""
+        monkeypatch.setattr(
+            document_jobs, "get_graph_service", AsyncMock(return_value=mock_graph_service)
+        )
+        monkeypatch.setattr(
+            document_jobs, "get_audit_service", AsyncMock(return_value=mock_audit_service)
+        )
+        monkeypatch.setattr(
+            document_jobs,
+            "get_signature_service",
+            AsyncMock(return_value=mock_signature_service),
+        )
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = AsyncMock()
+        return DocumentJobQueue(store=document_store, session_factory=session_factory)
+
+    @staticmethod
+    async def _wait(job_queue):
+        await asyncio.gather(*list(job_queue._tasks.values()))
+
+    @pytest.mark.asyncio
+    async def test_job_runs_to_completion(self, job_queue, test_user):
+        """Test that a queued job generates its document."""
+        request = TraceabilityMatrixRequest(project_id=uuid4())
+
+        job = await job_queue.submit(DocumentType.TRACEABILITY_MATRIX, request, test_user)
+        assert job.status == DocumentStatus.PENDING
+        assert job.download_url is None
+
+        await self._wait(job_queue)
+        job = await job_queue.get(job.job_id)
+
+        assert job.status == DocumentStatus.COMPLETED
+        assert job.started_at is not None
+        assert job.finished_at is not None
+        assert job.download_url == f"/api/v1/documents/{job.job_id}/download"
+        record = await job_queue.store.get(job.job_id)
+        assert (await job_queue.store.read_artifact(record.content_hash)).startswith(b"%PDF")
+
+    @pytest.mark.asyncio
+    async def test_job_failure_is_recorded(self, job_queue, mock_graph_service, test_user):
+        """Test that a failing job reports its error."""
+        mock_graph_service.get_all_risks.side_effect = RuntimeError("graph unavailable")
+
+        job = await job_queue.submit(DocumentType.FMEA, FMEARequest(project_id=uuid4()), test_user)
+        await self._wait(job_queue)
+        job = await job_queue.get(job.job_id)
+
+        assert job.status == DocumentStatus.FAILED
+        assert "graph unavailable" in job.message
+        assert job.download_url is None
+
+    @pytest.mark.asyncio
+    async def test_resume_fails_job_of_unknown_user(self, job_queue, document_store):
+        """Test that an unfinished job that cannot be restored is marked failed."""
+        record = DocumentRecord(
+            id=uuid4(),
+            project_id=uuid4(),
+            document_type=DocumentType.FMEA,
+            format=DocumentFormat.EXCEL,
+            status=DocumentStatus.GENERATING,
+            filename="fmea.xlsx",
+            version="1.0",
+            metadata={},
+            generated_by=uuid4(),
+            submitted_at=datetime.now(UTC),
+        )
+        await document_store.save(record)
+        document_store.unfinished = AsyncMock(
+            return_value=[(record, {"project_id": str(record.project_id)})]
+        )
+        session = job_queue._session_factory.return_value.__aenter__.return_value
+        session.get.return_value = None
+
+        assert await job_queue.resume() == 0
+        job = await job_queue.get(record.id)
+        assert job.status == DocumentStatus.FAILED
+        assert "not found" in job.message
+
+    @staticmethod
+    def _pending_record():
+        return DocumentRecord(
+            id=uuid4(),
+            project_id=uuid4(),
+            document_type=DocumentType.FMEA,
+            format=DocumentFormat.EXCEL,
+            status=DocumentStatus.PENDING,
+            filename="fmea.xlsx",
+            version="1.0",
+            metadata={},
+            generated_by=uuid4(),
+            submitted_at=datetime.now(UTC),
+        )
+
+    @pytest.mark.asyncio
+    async def test_job_is_claimed_once(self, document_store):
+        """Test that only one worker can claim a pending job."""
+        record = await document_store.save(self._pending_record())
+
+        claimed = await document_store.claim(record, "worker-a", 60)
+        assert claimed.status == DocumentStatus.GENERATING
+        assert claimed.started_at is not None
+        assert await document_store.claim(record, "worker-b", 60) is None
+
+    @pytest.mark.asyncio
+    async def test_job_held_by_another_worker_is_skipped(
+        self, job_queue, document_store, mock_graph_service, test_user
+    ):
+        """Test that a job claimed elsewhere is not generated again."""
+        document_store.claim = AsyncMock(return_value=None)
+
+        job = await job_queue.submit(DocumentType.FMEA, FMEARequest(project_id=uuid4()), test_user)
+        await self._wait(job_queue)
+
+        assert (await job_queue.get(job.job_id)).status == DocumentStatus.PENDING
+        mock_graph_service.get_all_risks.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_claim_is_a_conditional_update(self, tmp_path):
+        """Test that a database claim only matches jobs no live worker holds."""
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(
+            scalar_one_or_none=MagicMock(return_value=None)
+        )
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = session
+        store = DocumentStore(session_factory=session_factory, artifact_dir=tmp_path)
+
+        assert await store.claim(self._pending_record(), "worker-a", 60) is None
+
+        statement = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert statement.startswith("UPDATE generated_documents SET")
+        assert "generated_documents.lease_until < now()" in statement
+        assert "RETURNING" in statement
+
+    @pytest.mark.asyncio
+    async def test_get_unknown_job(self, job_queue):
+        """Test that an unknown job has no status."""
+        assert await job_queue.get(uuid4()) is None
+
 
 # ============================================================================
 # Helper Method Tests
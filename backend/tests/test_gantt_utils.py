@@ -5,6 +5,7 @@ Requirements: 16A.32-16A.36, 3.1-3.13
 
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 from app.utils.gantt_utils import (
@@ -12,6 +13,7 @@ from app.utils.gantt_utils import (
     _calculate_project_end,
     _calculate_project_start,
     _parse_datetime,
+    prepare_gantt_data,
 )
 from app.schemas.schedule import GanttPhase, GanttWorkpackage, ScheduledTask
 
@@ -243,3 +245,65 @@ class TestCalculateProjectCompletion:
         result = _calculate_project_completion(tasks, [], [])
         # (33 + 33 + 34) / 3 = 33.333... -> 33.33
         assert result == 33.33
+
+
+class TestPrepareGanttData:
+    """Test Gantt data assembly against a mocked graph service."""
+
+    @pytest.mark.asyncio
+    async def test_tasks_and_resources_loaded_in_one_query(self):
+        """Test that resource IDs come from the task query, not one query per task."""
+        rows = [
+            {
+                "id": f"task{i}",
+                "title": f"Task {i}",
+                "calculated_start_date": "2024-01-01T09:00:00+00:00",
+                "calculated_end_date": "2024-01-02T09:00:00+00:00",
+                "progress": 50,
+                "effort": 8,
+                "resource_ids": [f"res{i}", "shared"],
+            }
+            for i in range(50)
+        ]
+        graph_service = AsyncMock()
+        graph_service.execute_query.return_value = rows
+
+        result = await prepare_gantt_data(uuid4(), graph_service, {"critical_path": []})
+
+        assert graph_service.execute_query.await_count == 1
+        assert len(result.tasks) == 50
+        assert result.tasks[7].assigned_resources == ["res7", "shared"]
+        assert result.completion_percentage == 50.0
+
+    @pytest.mark.asyncio
+    async def test_float_values_copied_from_schedule(self):
+        """Test that float values of the stored schedule reach the Gantt tasks."""
+        graph_service = AsyncMock()
+        graph_service.execute_query.return_value = [
+            {
+                "id": "task1",
+                "title": "Task 1",
+                "calculated_start_date": "2024-01-01T09:00:00+00:00",
+                "calculated_end_date": "2024-01-02T09:00:00+00:00",
+                "resource_ids": [],
+            }
+        ]
+        scheduled = ScheduledTask(
+            task_id="task1",
+            task_title="Task 1",
+            start_date=datetime(2024, 1, 1, 9),
+            end_date=datetime(2024, 1, 2, 9),
+            duration_hours=8,
+            is_near_critical=True,
+            total_float_hours=4.0,
+            free_float_hours=2.0,
+        )
+
+        result = await prepare_gantt_data(
+            uuid4(), graph_service, {"task_floats": {"task1": scheduled}}
+        )
+
+        assert result.tasks[0].is_near_critical
+        assert result.tasks[0].total_float_hours == 4.0
+        assert result.tasks[0].free_float_hours == 2.0
+        assert result.tasks[0].assigned_resources == []
@@ -1,5 +1,6 @@
 """Integration tests for graph API endpoints"""
 
+import json
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
@@ -119,6 +120,41 @@ class TestGraphVisualizationEndpoint:
         finally:
             app.dependency_overrides.clear()
 
+    def test_get_graph_visualization_columnar_format(self, client, mock_user):
+        """Test format=columnar is passed through to the graph service"""
+        mock_service = AsyncMock()
+        mock_service.get_graph_for_visualization.return_value = {
+            "format": "columnar",
+            "nodes": {"ids": ["a"], "labels": ["A"], "types": [0], "statuses": [0]},
+            "edges": {"ids": [], "source": [], "target": [], "types": []},
+            "metadata": {"total_nodes": 1, "total_edges": 0},
+        }
+
+        from app.api import deps
+        from app.db import graph
+
+        app.dependency_overrides[deps.get_current_user] = lambda: mock_user
+        app.dependency_overrides[graph.get_graph_service] = lambda: mock_service
+
+        try:
+            response = client.get(
+                "/api/v1/graph/visualization",
+                params={"format": "columnar", "layout": "none"},
+            )
+
+            assert response.status_code == 200
+            assert response.json()["nodes"]["ids"] == ["a"]
+            kwargs = mock_service.get_graph_for_visualization.call_args.kwargs
+            assert kwargs["output_format"] == "columnar"
+            assert kwargs["layout"] == "none"
+
+            response = client.get(
+                "/api/v1/graph/visualization", params={"format": "arrow"}
+            )
+            assert response.status_code == 422
+        finally:
+            app.dependency_overrides.clear()
+
     def test_get_graph_visualization_with_all_parameters(self, client, mock_user):
         """Test graph visualization with all query parameters"""
         mock_service = AsyncMock()
@@ -171,7 +207,9 @@ class TestGraphVisualizationEndpoint:
                 depth=3,
                 node_types=["WorkItem", "Test"],
                 relationship_types=["TESTED_BY", "DEPENDS_ON"],
-                limit=500
+                limit=500,
+                layout="none",
+                output_format="json",
             )
 
         finally:
@@ -290,6 +328,107 @@ class TestGraphVisualizationEndpoint:
             app.dependency_overrides.clear()
 
 
+class TestGraphStreamingEndpoints:
+    """Test /api/v1/graph/stream and /api/v1/graph/expand endpoints"""
+
+    def test_stream_graph_returns_ndjson(self, client, mock_user):
+        """Test each streamed message becomes one NDJSON line"""
+        messages = [
+            {"type": "chunk", "nodes": [{"id": "center"}], "edges": []},
+            {"type": "end", "cursor": 1, "has_more": True,
+             "total_nodes": 1, "total_edges": 0},
+        ]
+        calls = []
+
+        async def stream_graph(**kwargs):
+            calls.append(kwargs)
+            for message in messages:
+                yield message
+
+        mock_service = AsyncMock()
+        mock_service.stream_graph = stream_graph
+
+        from app.api import deps
+        from app.db import graph
+
+        app.dependency_overrides[deps.get_current_user] = lambda: mock_user
+        app.dependency_overrides[graph.get_graph_service] = lambda: mock_service
+
+        try:
+            response = client.get(
+                "/api/v1/graph/stream",
+                params={"center_node_id": "center", "cursor": 0, "page_size": 100},
+            )
+
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            lines = [json.loads(line) for line in response.text.splitlines()]
+            assert lines == messages
+            assert calls[0]["center_node_id"] == "center"
+            assert calls[0]["page_size"] == 100
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_stream_graph_depth_is_capped(self, client, mock_user):
+        """Test the stream rejects traversals deeper than the visualization"""
+        from app.api import deps
+        from app.db import graph
+
+        app.dependency_overrides[deps.get_current_user] = lambda: mock_user
+        app.dependency_overrides[graph.get_graph_service] = lambda: AsyncMock()
+        try:
+            response = client.get(
+                "/api/v1/graph/stream", params={"center_node_id": "center", "depth": 6}
+            )
+            assert response.status_code == 422
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_stream_graph_requires_center(self, client, mock_user):
+        """Test the stream needs a center node"""
+        from app.api import deps
+        from app.db import graph
+
+        app.dependency_overrides[deps.get_current_user] = lambda: mock_user
+        app.dependency_overrides[graph.get_graph_service] = lambda: AsyncMock()
+        try:
+            response = client.get("/api/v1/graph/stream")
+            assert response.status_code == 422
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_expand_node(self, client, mock_user):
+        """Test expand passes the known ids to the service"""
+        mock_service = AsyncMock()
+        mock_service.expand_node.return_value = {
+            "nodes": [{"id": "new-1"}], "edges": [], "cursor": None, "has_more": False
+        }
+
+        from app.api import deps
+        from app.db import graph
+
+        app.dependency_overrides[deps.get_current_user] = lambda: mock_user
+        app.dependency_overrides[graph.get_graph_service] = lambda: mock_service
+
+        try:
+            response = client.post(
+                "/api/v1/graph/expand",
+                json={"node_id": "center", "known_node_ids": ["a", "b"]},
+            )
+
+            assert response.status_code == 200
+            assert response.json()["nodes"] == [{"id": "new-1"}]
+            mock_service.expand_node.assert_called_once_with(
+                node_id="center",
+                known_node_ids=["a", "b"],
+                node_types=None,
+                relationship_types=None,
+                limit=500,
+            )
+        finally:
+            app.dependency_overrides.clear()
+
+
 class TestGraphVisualizationFormats:
     """Test specific formatting for react-flow and R3F"""
 
@@ -1147,3 +1286,84 @@ class TestGraphSchemaEndpoint:
 
         finally:
             app.dependency_overrides.clear()
+
+    def test_get_schema_with_indexes(self, client, mock_user):
+        """Test schema retrieval including label table indexes"""
+        mock_service = AsyncMock()
+        mock_service.initialize_graph_schema.return_value = {
+            "node_types": ["WorkItem"],
+            "relationship_types": ["TESTED_BY"],
+        }
+        mock_service.list_indexes.return_value = [
+            {
+                "name": "WorkItem_id_idx",
+                "label": "WorkItem",
+                "definition": "CREATE INDEX ...",
+            }
+        ]
+
+        from app.api import deps
+        from app.db import graph
+
+        app.dependency_overrides[deps.get_current_user] = lambda: mock_user
+        app.dependency_overrides[graph.get_graph_service] = lambda: mock_service
+
+        try:
+            response = client.get("/api/v1/graph/schema?include_indexes=true")
+
+            assert response.status_code == 200
+            assert response.json()["indexes"][0]["name"] == "WorkItem_id_idx"
+
+            response = client.get("/api/v1/graph/schema")
+            assert "indexes" not in response.json()
+
+        finally:
+            app.dependency_overrides.clear()
+
+
+class TestGraphIndexesEndpoint:
+    """Test /api/v1/graph/schema/indexes endpoint"""
+
+    def test_ensure_indexes_requires_admin(self, client, mock_user):
+        """Test that regular users cannot create indexes"""
+        mock_service = AsyncMock()
+
+        from app.api import deps
+        from app.db import graph
+
+        app.dependency_overrides[deps.get_current_user] = lambda: mock_user
+        app.dependency_overrides[graph.get_graph_service] = lambda: mock_service
+
+        try:
+            response = client.post("/api/v1/graph/schema/indexes")
+
+            assert response.status_code == 403
+            mock_service.ensure_indexes.assert_not_called()
+
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_ensure_indexes_success(self, client, mock_user):
+        """Test index creation by an admin"""
+        mock_user.role = UserRole.ADMIN
+        mock_service = AsyncMock()
+        mock_service.ensure_indexes.return_value = {
+            "created": ["WorkItem_id_idx"],
+            "existing": ["WorkItem_graphid_idx"],
+        }
+
+        from app.api import deps
+        from app.db import graph
+
+        app.dependency_overrides[deps.get_current_user] = lambda: mock_user
+        app.dependency_overrides[graph.get_graph_service] = lambda: mock_service
+
+        try:
+            response = client.post("/api/v1/graph/schema/indexes?create_labels=false")
+
+            assert response.status_code == 200
+            assert response.json()["created"] == ["WorkItem_id_idx"]
+            mock_service.ensure_indexes.assert_called_once_with(create_labels=False)
+
+        finally:
+            app.dependency_overrides.clear()
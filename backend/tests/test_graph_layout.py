@@ -0,0 +1,126 @@
+"""Tests for server-side graph layout"""
+
+import numpy as np
+import pytest
+
+from app.utils.graph_layout import (
+    GraphLayoutEngine,
+    force_directed_layout,
+    hierarchical_layout,
+    subgraph_hash,
+)
+
+
+def _random_tree(n: int, seed: int = 0) -> tuple[list[str], list[tuple[str, str]]]:
+    rng = np.random.default_rng(seed)
+    node_ids = [f"n{i}" for i in range(n)]
+    edges = [(f"n{rng.integers(0, i)}", f"n{i}") for i in range(1, n)]
+    return node_ids, edges
+
+
+class TestSubgraphHash:
+    def test_hash_ignores_order(self):
+        assert subgraph_hash(["a", "b"], [("a", "b"), ("b", "c")], "force") == (
+            subgraph_hash(["b", "a"], [("b", "c"), ("a", "b")], "force")
+        )
+
+    def test_hash_depends_on_mode_and_edges(self):
+        base = subgraph_hash(["a", "b"], [("a", "b")], "force")
+        assert base != subgraph_hash(["a", "b"], [("a", "b")], "force3d")
+        assert base != subgraph_hash(["a", "b"], [("b", "a")], "force")
+
+
+class TestForceDirectedLayout:
+    @pytest.mark.parametrize("dim", [2, 3])
+    def test_positions_are_finite_and_centred(self, dim):
+        src = np.arange(1, 30)
+        dst = np.zeros(29, dtype=np.int64)
+        positions = force_directed_layout(30, src, dst, dim=dim)
+
+        assert positions.shape == (30, dim)
+        assert np.isfinite(positions).all()
+        assert np.allclose(positions.mean(axis=0), 0, atol=1e-6)
+
+    def test_connected_nodes_end_up_closer(self):
+        # Two triangles joined by nothing: nodes within a triangle stay close
+        src = np.array([0, 1, 2, 3, 4, 5])
+        dst = np.array([1, 2, 0, 4, 5, 3])
+        positions = force_directed_layout(6, src, dst)
+
+        within = np.linalg.norm(positions[0] - positions[1])
+        across = np.linalg.norm(positions[0] - positions[3])
+        assert within < across
+
+    def test_grid_approximation_matches_exact_repulsion(self, monkeypatch):
+        import app.utils.graph_layout as graph_layout
+
+        _, edges = _random_tree(600)
+        src = np.array([int(a[1:]) for a, _ in edges])
+        dst = np.array([int(b[1:]) for _, b in edges])
+
+        approximate = force_directed_layout(600, src, dst, iterations=30)
+        monkeypatch.setattr(graph_layout, "_EXACT_REPULSION_LIMIT", 10_000)
+        exact = force_directed_layout(600, src, dst, iterations=30)
+
+        # Same overall extent within a few percent
+        assert np.allclose(approximate.std(axis=0), exact.std(axis=0), rtol=0.1)
+
+
+class TestHierarchicalLayout:
+    def test_children_sit_below_parents(self):
+        # 0 -> 1, 0 -> 2, 1 -> 3, 2 -> 3
+        src = np.array([0, 0, 1, 2])
+        dst = np.array([1, 2, 3, 3])
+        positions = hierarchical_layout(4, src, dst)
+
+        assert positions[0, 1] < positions[1, 1] == positions[2, 1] < positions[3, 1]
+        assert positions[1, 0] != positions[2, 0]
+
+    def test_cycles_do_not_break_layering(self):
+        src = np.array([0, 1, 2])
+        dst = np.array([1, 2, 0])
+        positions = hierarchical_layout(3, src, dst)
+
+        assert np.isfinite(positions).all()
+        assert sorted(positions[:, 1].tolist()) == [0.0, 150.0, 300.0]
+
+
+class TestGraphLayoutEngine:
+    def test_layout_is_cached_per_subgraph(self):
+        engine = GraphLayoutEngine()
+        node_ids, edges = _random_tree(50)
+
+        first = engine.layout(node_ids, edges, "force")
+        second = engine.layout(list(reversed(node_ids)), edges, "force")
+
+        assert first is second
+        assert set(first) == set(node_ids)
+        assert all(len(position) == 2 for position in first.values())
+
+    def test_3d_layout_has_three_coordinates(self):
+        engine = GraphLayoutEngine()
+        node_ids, edges = _random_tree(20)
+
+        positions = engine.layout(node_ids, edges, "force3d")
+
+        assert all(len(position) == 3 for position in positions.values())
+
+    def test_warm_start_keeps_positions_stable(self):
+        engine = GraphLayoutEngine()
+        node_ids, edges = _random_tree(200)
+
+        before = engine.layout(node_ids, edges, "force")
+        after = engine.layout(node_ids + ["extra"], edges + [("n0", "extra")], "force")
+
+        shift = np.mean(
+            [np.linalg.norm(np.subtract(after[n], before[n])) for n in node_ids]
+        )
+        spread = np.std([before[n] for n in node_ids], axis=0).mean()
+        assert shift < spread * 0.1
+
+    def test_none_mode_and_unknown_edges(self):
+        engine = GraphLayoutEngine()
+
+        assert engine.layout(["a", "b"], [("a", "b")], "none") == {}
+        positions = engine.layout(["a", "b"], [("a", "missing")], "hierarchical")
+        assert set(positions) == {"a", "b"}
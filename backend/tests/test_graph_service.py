@@ -1,11 +1,12 @@
 """Tests for GraphService"""
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 
-from app.db.graph import GraphService
+from app.db.graph import _SEARCH_INDEX_VERSION, GraphService
 
 
 @pytest.fixture
@@ -102,7 +103,8 @@ class TestGraphService:
 
         assert result == expected_workitem
         graph_service.execute_query.assert_called_once_with(
-            "MATCH (w:WorkItem {id: 'test-id'}) RETURN w"
+            "MATCH (w:WorkItem {id: $workitem_id}) RETURN w",
+            {"workitem_id": "test-id"},
         )
 
     @pytest.mark.asyncio
@@ -129,7 +131,8 @@ class TestGraphService:
 
         assert result == expected_workitem
         graph_service.execute_query.assert_called_once_with(
-            "MATCH (w:WorkItem {id: 'test-id', version: '1.2'}) RETURN w"
+            "MATCH (w:WorkItem {id: $workitem_id, version: $version}) RETURN w",
+            {"workitem_id": "test-id", "version": "1.2"},
         )
 
     @pytest.mark.asyncio
@@ -176,19 +179,12 @@ class TestGraphService:
             properties={"created_at": "2024-01-01"}
         )
 
-        expected_query = """
-        MATCH (a {id: 'req-1'}), (b {id: 'test-1'})
-        CREATE (a)-[r:TESTED_BY {created_at: '2024-01-01'}]->(b)
-        RETURN r
-        """
-
         graph_service.execute_query.assert_called_once()
         # Check that the query contains the essential parts
-        actual_query = graph_service.execute_query.call_args[0][0]
-        assert "req-1" in actual_query
-        assert "test-1" in actual_query
-        assert "TESTED_BY" in actual_query
-        assert "created_at" in actual_query
+        actual_query, params = graph_service.execute_query.call_args[0]
+        assert "MATCH (a {id: $from_id}), (b {id: $to_id})" in actual_query
+        assert "TESTED_BY {created_at: $p0}" in actual_query
+        assert params == {"from_id": "req-1", "to_id": "test-1", "p0": "2024-01-01"}
 
     @pytest.mark.asyncio
     async def test_initialize_graph_schema(self, graph_service):
@@ -215,32 +211,43 @@ class TestGraphService:
         assert graph_service.execute_query.call_count == 0
 
     def test_dict_to_cypher_props(self, graph_service):
-        """Test converting Python dict to Cypher properties"""
+        """Test converting Python dict to parameterized Cypher properties"""
         # Test empty dict
-        assert graph_service._dict_to_cypher_props({}) == ""
+        assert graph_service._dict_to_cypher_props({}, {}) == ""
 
         # Test string values
+        params = {}
         props = {"name": "test", "status": "active"}
-        result = graph_service._dict_to_cypher_props(props)
-        assert "name: 'test'" in result
-        assert "status: 'active'" in result
-
-        # Test numeric values
-        props = {"priority": 1, "score": 3.14}
-        result = graph_service._dict_to_cypher_props(props)
-        assert "priority: 1" in result
-        assert "score: 3.14" in result
-
-        # Test boolean values
-        props = {"is_active": True, "is_deleted": False}
-        result = graph_service._dict_to_cypher_props(props)
-        assert "is_active: true" in result
-        assert "is_deleted: false" in result
+        result = graph_service._dict_to_cypher_props(props, params)
+        assert result == "{name: $p0, status: $p1}"
+        assert params == {"p0": "test", "p1": "active"}
+
+        # Test numeric and boolean values keep their types
+        params = {}
+        props = {"priority": 1, "score": 3.14, "is_active": True}
+        graph_service._dict_to_cypher_props(props, params)
+        assert params == {"p0": 1, "p1": 3.14, "p2": True}
 
         # Test null values
-        props = {"description": None}
-        result = graph_service._dict_to_cypher_props(props)
-        assert "description: null" in result
+        params = {}
+        graph_service._dict_to_cypher_props({"description": None}, params)
+        assert params == {"p0": None}
+
+        # Test complex values are serialized to JSON strings
+        params = {}
+        graph_service._dict_to_cypher_props({"skills": ["python", "sql"]}, params)
+        assert params == {"p0": '["python", "sql"]'}
+
+        # Test quotes never reach the query text
+        params = {}
+        result = graph_service._dict_to_cypher_props({"title": "it's $$ here"}, params)
+        assert "it's" not in result
+        assert params == {"p0": "it's $$ here"}
+
+        # Test non-identifier keys are backquoted
+        params = {}
+        result = graph_service._dict_to_cypher_props({"my-key": 1}, params, "x")
+        assert result == "{`my-key`: $x0}"
 
     def test_parse_agtype(self, graph_service):
         """Test parsing AGE agtype values"""
@@ -265,22 +272,26 @@ class TestGraphQueryMethods:
 
     @pytest.mark.asyncio
     async def test_search_workitems_by_text(self, graph_service):
-        """Test searching WorkItems by text"""
-        expected_results = [
-            {"id": "1", "title": "Test Requirement", "type": "requirement"},
-            {"id": "2", "title": "Another Test", "type": "task"}
-        ]
-
-        graph_service.execute_query = AsyncMock(return_value=expected_results)
+        """Test searching WorkItems by text uses the search index"""
+        graph_service.full_text_search = AsyncMock(return_value=(
+            [
+                {"id": "1", "label": "WorkItem", "properties": {"id": "1", "title": "Test Requirement"}},
+                {"id": "2", "label": "WorkItem", "properties": {"id": "2", "title": "Another Test"}},
+            ],
+            2,
+        ))
+        graph_service.execute_query = AsyncMock()
 
         result = await graph_service.search_workitems(search_text="test")
 
-        assert result == expected_results
-
-        # Verify query was called with correct parameters
-        call_args = graph_service.execute_query.call_args[0][0]
-        assert "toLower(w.title) CONTAINS 'test'" in call_args
-        assert "toLower(w.description) CONTAINS 'test'" in call_args
+        assert result == [
+            {"id": "1", "title": "Test Requirement"},
+            {"id": "2", "title": "Another Test"},
+        ]
+        graph_service.full_text_search.assert_called_once_with(
+            "test", labels=["WorkItem"], property_filters={}, limit=100, offset=0
+        )
+        graph_service.execute_query.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_search_workitems_by_type(self, graph_service):
@@ -295,17 +306,14 @@ class TestGraphQueryMethods:
 
         assert result == expected_results
 
-        call_args = graph_service.execute_query.call_args[0][0]
-        assert "w.type = 'requirement'" in call_args
+        call_args, params = graph_service.execute_query.call_args[0]
+        assert "w.type = $workitem_type" in call_args
+        assert params == {"workitem_type": "requirement"}
 
     @pytest.mark.asyncio
     async def test_search_workitems_multiple_filters(self, graph_service):
-        """Test searching WorkItems with multiple filters"""
-        expected_results = [
-            {"id": "1", "title": "Active Requirement", "type": "requirement", "status": "active"}
-        ]
-
-        graph_service.execute_query = AsyncMock(return_value=expected_results)
+        """Test searching WorkItems with text and filters"""
+        graph_service.full_text_search = AsyncMock(return_value=([], 0))
 
         result = await graph_service.search_workitems(
             search_text="requirement",
@@ -314,139 +322,264 @@ class TestGraphQueryMethods:
             assigned_to="user-123"
         )
 
-        assert result == expected_results
-
-        call_args = graph_service.execute_query.call_args[0][0]
-        assert "w.type = 'requirement'" in call_args
-        assert "w.status = 'active'" in call_args
-        assert "w.assigned_to = 'user-123'" in call_args
-        assert "toLower(w.title) CONTAINS 'requirement'" in call_args
+        assert result == []
+        graph_service.full_text_search.assert_called_once_with(
+            "requirement",
+            labels=["WorkItem"],
+            property_filters={
+                "type": "requirement",
+                "status": "active",
+                "assigned_to": "user-123",
+            },
+            limit=100,
+            offset=0,
+        )
 
     @pytest.mark.asyncio
-    async def test_get_traceability_matrix(self, graph_service):
-        """Test getting traceability matrix"""
-        # Mock the three separate queries
-        requirements_result = [
-            {
-                "r": {"id": "req-1", "title": "Requirement 1"},
-                "tests": [{"id": "test-1", "title": "Test 1"}],
-                "risks": [{"id": "risk-1", "title": "Risk 1"}]
-            }
-        ]
+    async def test_search_workitems_pages_in_query(self, graph_service):
+        """Test filters, offset and keyset cursor are applied in Cypher"""
+        graph_service.execute_query = AsyncMock(return_value=[])
 
-        tests_result = [
-            {
-                "t": {"id": "test-1", "title": "Test 1"},
-                "requirements": [{"id": "req-1", "title": "Requirement 1"}]
-            }
-        ]
+        await graph_service.search_workitems(
+            created_by="user-1",
+            priority=2,
+            limit=50,
+            offset=100,
+            after=("2024-01-02T00:00:00+00:00", "wi-9"),
+        )
 
-        risks_result = [
-            {
-                "risk": {"id": "risk-1", "title": "Risk 1"},
-                "requirements": [{"id": "req-1", "title": "Requirement 1"}]
-            }
+        query, params = graph_service.execute_query.call_args[0]
+        assert "w.created_by = $created_by" in query
+        assert "w.priority = $priority" in query
+        assert "w.updated_at < $after_updated_at" in query
+        assert "w.id < $after_id" in query
+        assert "ORDER BY w.updated_at DESC, w.id DESC" in query
+        assert "SKIP 100" in query
+        assert "LIMIT 50" in query
+        assert params == {
+            "created_by": "user-1",
+            "priority": 2,
+            "after_updated_at": "2024-01-02T00:00:00+00:00",
+            "after_id": "wi-9",
+        }
+
+    @staticmethod
+    def _traceability_rows():
+        def node(item_id, item_type, title):
+            return {"kind": "node", "type": item_type, "id": item_id, "title": title,
+                    "status": "active", "is_signed": False, "target_id": None}
+
+        def edge(rel_type, source, target):
+            return {"kind": "edge", "type": rel_type, "id": source, "title": None,
+                    "status": None, "is_signed": None, "target_id": target}
+
+        return [
+            node("req-1", "requirement", "Requirement 1"),
+            node("req-2", "requirement", "Requirement 2"),
+            node("test-1", "test", "Test 1"),
+            node("risk-1", "risk", "Risk 1"),
+            edge("TESTED_BY", "req-1", "test-1"),
+            edge("MITIGATES", "req-1", "risk-1"),
         ]
 
-        # Mock execute_query to return different results for each call
-        graph_service.execute_query = AsyncMock(side_effect=[
-            requirements_result,
-            tests_result,
-            risks_result
-        ])
+    @pytest.mark.asyncio
+    async def test_get_traceability_matrix(self, graph_service):
+        """Test getting traceability matrix from a single statement"""
+        graph_service._execute_sql = AsyncMock(return_value=self._traceability_rows())
+        graph_service.execute_query = AsyncMock()
 
         result = await graph_service.get_traceability_matrix()
 
-        assert "requirements" in result
-        assert "tests" in result
-        assert "risks" in result
-        assert result["requirements"] == requirements_result
-        assert result["tests"] == tests_result
-        assert result["risks"] == risks_result
+        assert [r["requirement_id"] for r in result["requirements"]] == ["req-1", "req-2"]
+        assert result["requirements"][0]["test_ids"] == ["test-1"]
+        assert result["requirements"][0]["risk_ids"] == ["risk-1"]
+        assert result["tests"][0]["requirement_ids"] == ["req-1"]
+        assert result["risks"][0]["requirement_ids"] == ["req-1"]
+        assert result["coverage_stats"]["requirements_with_tests"] == 1
+        assert result["coverage_stats"]["test_coverage_percentage"] == 50.0
 
-        # Verify three queries were made
-        assert graph_service.execute_query.call_count == 3
+        graph_service._execute_sql.assert_called_once()
+        graph_service.execute_query.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_traceability_matrix_with_project_filter(self, graph_service):
         """Test getting traceability matrix with project filter"""
-        graph_service.execute_query = AsyncMock(return_value=[])
+        graph_service._execute_sql = AsyncMock(return_value=[])
 
         await graph_service.get_traceability_matrix(project_id="proj-123")
 
-        # Verify all queries include project filter
-        for call in graph_service.execute_query.call_args_list:
-            query = call[0][0]
-            assert "project_id = 'proj-123'" in query
+        sql, *args = graph_service._execute_sql.call_args[0]
+        assert "p->>'project_id' = $2" in sql
+        assert args == [graph_service.graph_name, "proj-123", ["TESTED_BY", "MITIGATES"]]
 
     @pytest.mark.asyncio
-    async def test_get_risk_chains_specific_risk(self, graph_service):
-        """Test getting risk chains for specific risk"""
-        expected_chains = [
-            {
-                "path": ["risk-1", "failure-1", "failure-2"],
-                "probabilities": [0.3, 0.2],
-                "chain_length": 2
-            }
+    async def test_traceability_cached_per_project(self, graph_service):
+        """Test matrices are cached per project until an edge changes"""
+        graph_service._execute_sql = AsyncMock(return_value=self._traceability_rows())
+        graph_service.execute_query = AsyncMock(return_value=[{"r": {}}])
+
+        first = await graph_service.get_traceability("proj-1")
+        assert await graph_service.get_traceability("proj-1") is first
+        await graph_service.get_traceability("proj-2")
+        assert graph_service._execute_sql.call_count == 2
+
+        # Relationships outside the matrix keep the cache
+        await graph_service.create_relationship("a", "b", "ASSIGNED_TO")
+        assert await graph_service.get_traceability("proj-1") is first
+
+        await graph_service.create_relationship("req-2", "test-1", "TESTED_BY")
+        assert await graph_service.get_traceability("proj-1") is not first
+        assert graph_service._execute_sql.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_traceability_invalidated_by_delete_relationship(self, graph_service):
+        """Test deleting a relationship drops cached matrices"""
+        graph_service._execute_sql = AsyncMock(return_value=[])
+        graph_service.execute_query = AsyncMock(return_value=[{"deleted_count": 1}])
+
+        first = await graph_service.get_traceability()
+        await graph_service.delete_relationship("42")
+
+        assert await graph_service.get_traceability() is not first
+
+    @staticmethod
+    def _risk_graph_rows(edges):
+        def node(node_id, node_type):
+            return {"kind": "node", "id": node_id, "target_id": None, "probability": None,
+                    "type": node_type, "title": node_id, "description": f"{node_id} effect",
+                    "severity": "7", "rpn": None}
+
+        node_ids = dict.fromkeys(n for edge in edges for n in edge[:2])
+        rows = [node(n, "risk" if n.startswith("risk") else "failure") for n in node_ids]
+        rows += [
+            {"kind": "edge", "id": source, "target_id": target, "probability": str(p),
+             "type": None, "title": None, "description": None, "severity": None, "rpn": None}
+            for source, target, p in edges
         ]
+        return rows
 
-        graph_service.execute_query = AsyncMock(return_value=expected_chains)
+    @pytest.mark.asyncio
+    async def test_get_risk_chains_specific_risk(self, graph_service):
+        """Test getting risk chains for specific risk"""
+        graph_service._execute_sql = AsyncMock(return_value=self._risk_graph_rows([
+            ("risk-1", "failure-1", 0.3), ("failure-1", "failure-2", 0.2),
+        ]))
 
         result = await graph_service.get_risk_chains(risk_id="risk-1")
 
-        assert len(result) == 1
-        assert result[0]["total_probability"] == 0.06  # 0.3 * 0.2
+        assert len(result) == 2
+        assert result[1]["total_probability"] == pytest.approx(0.06)  # 0.3 * 0.2
+        assert [n["id"] for n in result[1]["path"]] == ["risk-1", "failure-1", "failure-2"]
+        assert result[1]["path"][0]["severity"] == 7
 
-        call_args = graph_service.execute_query.call_args[0][0]
-        assert "id: 'risk-1'" in call_args
-        assert "LEADS_TO" in call_args
+        sql, graph_name = graph_service._execute_sql.call_args[0]
+        assert "'LEADS_TO'" in sql
+        assert graph_name == graph_service.graph_name
 
     @pytest.mark.asyncio
     async def test_get_risk_chains_all_risks(self, graph_service):
         """Test getting all risk chains"""
-        expected_chains = [
-            {
-                "path": ["risk-1", "failure-1"],
-                "probabilities": [0.5],
-                "chain_length": 1,
-                "start_risk_id": "risk-1"
-            }
+        graph_service._execute_sql = AsyncMock(return_value=self._risk_graph_rows([
+            ("risk-1", "failure-1", 0.5), ("risk-2", "failure-1", 0.25),
+        ]))
+
+        result = await graph_service.get_risk_chains()
+
+        assert sorted((c["start_risk_id"], c["total_probability"]) for c in result) == [
+            ("risk-1", 0.5), ("risk-2", 0.25)
         ]
 
-        graph_service.execute_query = AsyncMock(return_value=expected_chains)
+    @pytest.mark.asyncio
+    async def test_stream_risk_chains_top_k(self, graph_service):
+        """Test streaming yields the top chains and aggregates per start risk"""
+        graph_service._execute_sql = AsyncMock(return_value=self._risk_graph_rows([
+            ("risk-1", "failure-1", 0.5), ("risk-1", "failure-2", 0.4),
+            ("failure-1", "failure-3", 0.2), ("failure-2", "failure-3", 0.5),
+        ]))
+
+        results = [r async for r in graph_service.stream_risk_chains(top_k=2)]
 
-        result = await graph_service.get_risk_chains()
+        assert len(results) == 1
+        assert results[0]["start_risk_id"] == "risk-1"
+        assert [c["total_probability"] for c in results[0]["chains"]] == [0.5, 0.4]
+        assert results[0]["failure_probabilities"]["failure-3"] == pytest.approx(0.28)
 
-        assert len(result) == 1
-        assert result[0]["total_probability"] == 0.5
-        assert result[0]["start_risk_id"] == "risk-1"
+    @pytest.mark.asyncio
+    async def test_risk_graph_cached_until_leads_to_changes(self, graph_service):
+        """Test the LEADS_TO graph is loaded once and reloaded after edge changes"""
+        graph_service._execute_sql = AsyncMock(return_value=[])
+        graph_service.execute_query = AsyncMock(return_value=[{"r": {}}])
+
+        await graph_service.get_risk_chains()
+        await graph_service.get_risk_chains(risk_id="risk-1")
+        assert graph_service._execute_sql.call_count == 1
+
+        await graph_service.create_relationship("a", "b", "TESTED_BY")
+        await graph_service.get_risk_chains()
+        assert graph_service._execute_sql.call_count == 1
 
-    def test_calculate_chain_probability(self, graph_service):
-        """Test calculating chain probability"""
-        # Test empty list
-        assert graph_service._calculate_chain_probability([]) == 0.0
+        await graph_service.create_relationship("risk-1", "failure-1", "LEADS_TO")
+        await graph_service.get_risk_chains()
+        assert graph_service._execute_sql.call_count == 2
 
-        # Test single probability
-        assert graph_service._calculate_chain_probability([0.5]) == 0.5
 
-        # Test multiple probabilities
-        assert graph_service._calculate_chain_probability([0.3, 0.2, 0.5]) == 0.03
+class TestGraphQueryParameters:
+    """Test that IDs and values are bound as Cypher parameters"""
+
+    @pytest.mark.asyncio
+    async def test_relationship_queries_bind_ids(self, graph_service):
+        """IDs are passed as parameters and never appear in the query text"""
+        task_id = "task' OR 1=1 //"
+        graph_service.execute_query = AsyncMock(return_value=[])
 
-        # Test invalid probability (> 1)
-        assert graph_service._calculate_chain_probability([0.3, 1.5]) == 0.0
+        await graph_service.unlink_task_from_risk(task_id, "risk-1")
+        await graph_service.remove_resource_allocation("res-1", task_id)
 
-        # Test invalid probability (< 0)
-        assert graph_service._calculate_chain_probability([0.3, -0.1]) == 0.0
+        for call in graph_service.execute_query.call_args_list:
+            query, params = call.args
+            assert task_id not in query
+            assert task_id in params.values()
 
-        # Test non-numeric probability
-        assert graph_service._calculate_chain_probability([0.3, "invalid"]) == 0.0
+    @pytest.mark.asyncio
+    async def test_update_resource_allocation_binds_values(self, graph_service):
+        """Updated allocation properties are set from parameters"""
+        graph_service.execute_query = AsyncMock(return_value=[{"rel": {}}])
+
+        await graph_service.update_resource_allocation(
+            "res-1", "task-1", allocation_percentage=50, lead=True, end_date="2026-12-31"
+        )
+
+        query, params = graph_service.execute_query.call_args.args
+        assert "rel.allocation_percentage = $allocation_percentage" in query
+        assert "rel.lead = $lead" in query
+        assert "2026-12-31" not in query
+        assert params == {
+            "resource_id": "res-1",
+            "target_id": "task-1",
+            "allocation_percentage": 50,
+            "lead": True,
+            "end_date": "2026-12-31",
+        }
+
+    @pytest.mark.asyncio
+    async def test_worked_entries_for_resource_binds_filters(self, graph_service):
+        """Resource and date filters are bound as parameters"""
+        graph_service.execute_query = AsyncMock(return_value=[])
+
+        await graph_service.get_worked_entries_for_resource(
+            "user-1", start_date="2026-01-01"
+        )
+
+        query, params = graph_service.execute_query.call_args.args
+        assert "w.resource = $resource_id AND w.date >= $start_date" in query
+        assert params == {"resource_id": "user-1", "start_date": "2026-01-01"}
 
 
 class TestGraphTraversalProperties:
     """Property-based tests for graph traversal"""
 
     def test_search_text_escaping_property(self, graph_service):
-        """Property: Search text with quotes should be properly escaped"""
+        """Property: Search text is bound as a parameter, never spliced into the query"""
         # Test various text inputs that could cause SQL injection
         test_cases = [
             "normal text",
@@ -469,67 +602,34 @@ class TestGraphTraversalProperties:
                 # Verify the query was called
                 assert graph_service.execute_query.called
 
-                # Verify quotes are escaped in the query
-                call_args = graph_service.execute_query.call_args[0][0]
-                if "'" in search_text:
-                    # Should contain escaped quotes
-                    escaped_text = search_text.replace("'", "\\'")
-                    assert escaped_text.lower() in call_args.lower()
+                # Verify the text only travels in the parameters
+                call_args, params = graph_service.execute_query.call_args[0]
+                if search_text:
+                    assert search_text.lower() not in call_args.lower()
+                    assert params["search_text"] == search_text.lower()
 
             except Exception as e:
                 # Should only fail due to async context, not SQL injection
                 assert "async" in str(e).lower() or "event loop" in str(e).lower()
 
-    def test_probability_calculation_property(self, graph_service):
-        """Property: Chain probability should always be between 0 and 1"""
-        # Test various probability combinations
-        test_cases = [
-            [0.5, 0.3, 0.8],
-            [1.0],
-            [0.0, 0.5],
-            [0.1, 0.2, 0.3, 0.4, 0.5],
-            [0.9, 0.9, 0.9],
-            []  # Empty case
-        ]
-
-        for probabilities in test_cases:
-            result = graph_service._calculate_chain_probability(probabilities)
-            if probabilities:  # Non-empty list
-                assert 0.0 <= result <= 1.0
-            else:  # Empty list should return 0
-                assert result == 0.0
-
-        # Test invalid probabilities
-        invalid_cases = [
-            [1.5],  # > 1
-            [-0.1], # < 0
-            [0.5, "invalid"], # Non-numeric
-            [0.5, None] # None value
-        ]
-
-        for probabilities in invalid_cases:
-            result = graph_service._calculate_chain_probability(probabilities)
-            assert result == 0.0  # Should return 0 for invalid input
-
     def test_chain_length_property(self, graph_service):
         """Property: Risk chain depth should be respected"""
-        # Test various depth values
-        test_depths = [1, 2, 5, 10]
+        # Long chain risk-0 -> failure-1 -> ... -> failure-12
+        edges = [("risk-0", "failure-1", 0.9)] + [
+            (f"failure-{i}", f"failure-{i + 1}", 0.9) for i in range(1, 12)
+        ]
+        rows = TestGraphQueryMethods._risk_graph_rows(edges)
 
-        for max_depth in test_depths:
-            graph_service.execute_query = AsyncMock(return_value=[])
+        for max_depth in [1, 2, 5, 10]:
+            graph_service._risk_graph_cache = None
+            graph_service._execute_sql = AsyncMock(return_value=rows)
 
-            try:
-                import asyncio
-                asyncio.run(graph_service.get_risk_chains(max_depth=max_depth))
+            import asyncio
+            chains = asyncio.run(
+                graph_service.get_risk_chains(max_depth=max_depth, top_k=100)
+            )
 
-                # Verify the query includes the correct depth limit
-                call_args = graph_service.execute_query.call_args[0][0]
-                assert f"*1..{max_depth}" in call_args
-
-            except Exception as e:
-                # Should only fail due to async context
-                assert "async" in str(e).lower() or "event loop" in str(e).lower()
+            assert max(chain["chain_length"] for chain in chains) == max_depth
 
 
 class TestGraphVisualizationMethods:
@@ -594,6 +694,50 @@ class TestGraphVisualizationMethods:
         assert graph_service._format_node_for_visualization.call_count == 2
         assert graph_service._format_edge_for_visualization.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_get_graph_for_visualization_applies_layout(self, graph_service):
+        """Test computed layout positions are copied onto react-flow and r3f nodes"""
+        mock_nodes = [
+            {"id": "req-1", "type": "requirement", "title": "Requirement 1"},
+            {"id": "test-1", "type": "test", "title": "Test 1"},
+        ]
+        mock_edges = [{"start_id": "req-1", "end_id": "test-1", "type": "TESTED_BY"}]
+        graph_service._get_full_graph = AsyncMock(return_value=(mock_nodes, mock_edges))
+        graph_service.layout_engine.layout = MagicMock(
+            return_value={"req-1": (100.0, 50.0), "test-1": (-100.0, -50.0)}
+        )
+
+        result = await graph_service.get_graph_for_visualization(layout="hierarchical")
+
+        graph_service.layout_engine.layout.assert_called_once_with(
+            ["req-1", "test-1"], [("req-1", "test-1")], "hierarchical"
+        )
+        nodes = {node["id"]: node for node in result["nodes"]}
+        assert nodes["req-1"]["reactFlow"]["position"] == {"x": 100.0, "y": 50.0}
+        assert nodes["req-1"]["r3f"]["position"] == [2.0, 0.0, 1.0]
+        assert result["metadata"]["layout"] == "hierarchical"
+
+    @pytest.mark.asyncio
+    async def test_get_graph_for_visualization_skips_layout_by_default(
+        self, graph_service
+    ):
+        """Test nodes are left at the origin unless a layout is requested"""
+        mock_nodes = [
+            {"id": "req-1", "type": "requirement", "title": "Requirement 1"},
+            {"id": "test-1", "type": "test", "title": "Test 1"},
+        ]
+        mock_edges = [{"start_id": "req-1", "end_id": "test-1", "type": "TESTED_BY"}]
+        graph_service._get_full_graph = AsyncMock(return_value=(mock_nodes, mock_edges))
+        graph_service.layout_engine.layout = MagicMock()
+
+        result = await graph_service.get_graph_for_visualization()
+
+        graph_service.layout_engine.layout.assert_not_called()
+        for node in result["nodes"]:
+            assert node["reactFlow"]["position"] == {"x": 0, "y": 0}
+            assert node["r3f"]["position"] == [0, 0, 0]
+        assert result["metadata"]["layout"] == "none"
+
     @pytest.mark.asyncio
     async def test_get_graph_for_visualization_subgraph(self, graph_service):
         """Test getting subgraph around center node"""
@@ -627,96 +771,147 @@ class TestGraphVisualizationMethods:
         assert metadata["depth"] == 3
 
     @pytest.mark.asyncio
-    async def test_get_subgraph_around_node(self, graph_service):
-        """Test getting subgraph around a specific node"""
-        # Mock center node
-        center_node = {"id": "center-1", "type": "requirement", "title": "Center"}
-
-        # Mock node query results (first query returns nodes)
-        node_query_results = [
-            {"id": "related-1", "type": "test", "title": "Related Test", "properties": {"id": "related-1"}}
-        ]
-
-        # Mock relationship query results (second query returns relationships)
-        rel_query_results = [
+    async def test_get_graph_for_visualization_columnar(self, graph_service):
+        """Test the columnar format returns parallel arrays with shared styles"""
+        mock_nodes = [
             {
-                "rel": {"type": "TESTED_BY", "properties": {}},
-                "start_id": "center-1",
-                "end_id": "related-1",
-                "rel_type": "TESTED_BY"
+                "id": 100 + i,
+                "label": "WorkItem",
+                "properties": {
+                    "id": f"node-{i}",
+                    "type": "requirement" if i % 2 else "test",
+                    "title": f"Node {i}",
+                    "status": "active",
+                    "description": "A fairly long description " * 4,
+                },
             }
+            for i in range(200)
         ]
+        mock_edges = [
+            {"id": 900 + i, "start_id": 100 + i, "end_id": 101 + i, "type": "TESTED_BY"}
+            for i in range(199)
+        ] + [{"id": 999, "start_id": 100, "end_id": 5000, "type": "TESTED_BY"}]
+        graph_service._get_full_graph = AsyncMock(return_value=(mock_nodes, mock_edges))
+
+        result = await graph_service.get_graph_for_visualization(
+            layout="force", output_format="columnar"
+        )
 
-        graph_service.get_node = AsyncMock(return_value=center_node)
-        # execute_query is called twice: once for nodes, once for relationships
-        graph_service.execute_query = AsyncMock(side_effect=[node_query_results, rel_query_results])
+        assert result["format"] == "columnar"
+        nodes, edges = result["nodes"], result["edges"]
+        assert nodes["ids"][:2] == ["node-0", "node-1"]
+        assert nodes["labels"][1] == "Node 1"
+        assert result["dictionaries"]["node_types"] == ["test", "requirement"]
+        assert nodes["types"][:3] == [0, 1, 0]
+        assert result["dictionaries"]["statuses"] == ["active"]
+        assert result["styles"]["node_colors"]["requirement"]["active"] == "#3B82F6"
+        assert result["styles"]["edges"]["TESTED_BY"]["label"] == "Tested By"
+        assert "properties" not in nodes
+
+        # Edges are index pairs; the dangling edge is dropped
+        assert len(edges["ids"]) == 199
+        assert (edges["source"][0], edges["target"][0]) == (0, 1)
+        assert nodes["position_dims"] == 2
+        assert len(nodes["positions"]) == 400
+        assert result["metadata"]["total_nodes"] == 200
+        assert result["metadata"]["total_edges"] == 199
+
+        full = await graph_service.get_graph_for_visualization(layout="force")
+        assert len(json.dumps(result)) * 10 < len(json.dumps(full))
+
+    @pytest.mark.asyncio
+    async def test_get_subgraph_around_node(self, graph_service):
+        """Test getting subgraph around a specific node in a single statement"""
+        rows = [
+            {
+                "kind": "node", "id": 11, "label": "WorkItem", "start_id": None,
+                "end_id": None, "depth": 0,
+                "properties": '{"id": "center-1", "type": "requirement"}',
+            },
+            {
+                "kind": "node", "id": 12, "label": "WorkItem", "start_id": None,
+                "end_id": None, "depth": 1,
+                "properties": '{"id": "related-1", "type": "test"}',
+            },
+            {
+                "kind": "edge", "id": 31, "label": "TESTED_BY", "start_id": 11,
+                "end_id": 12, "depth": None, "properties": '{"weight": 1}',
+            },
+        ]
+        graph_service._execute_sql = AsyncMock(return_value=rows)
+        graph_service.execute_query = AsyncMock()
+        graph_service.get_node = AsyncMock()
 
         nodes, edges = await graph_service._get_subgraph_around_node(
             center_node_id="center-1",
             depth=2,
-            node_types=["requirement", "test"],
+            node_types=["WorkItem"],
             relationship_types=["TESTED_BY"],
             limit=100
         )
 
-        # Should include center node plus related nodes
-        assert len(nodes) == 2  # center + related
-        assert len(edges) == 1
+        assert nodes == [
+            {"id": 11, "label": "WorkItem", "properties": {"id": "center-1", "type": "requirement"}},
+            {"id": 12, "label": "WorkItem", "properties": {"id": "related-1", "type": "test"}},
+        ]
+        assert edges == [
+            {"weight": 1, "id": 31, "start_id": 11, "end_id": 12, "type": "TESTED_BY"}
+        ]
 
-        # Verify center node is included
-        center_found = any(node.get("id") == "center-1" for node in nodes)
-        assert center_found
+        # One round trip, no per-node lookups or id lists in the query text
+        graph_service._execute_sql.assert_called_once()
+        graph_service.execute_query.assert_not_called()
+        graph_service.get_node.assert_not_called()
+        sql, *args = graph_service._execute_sql.call_args[0]
+        assert "WITH RECURSIVE" in sql
+        assert "center-1" not in sql
+        assert args == [
+            graph_service.graph_name, '"center-1"', 2, ["TESTED_BY"], ["WorkItem"], 100
+        ]
 
-        # Verify first query was called with correct filters (node query)
-        first_call_args = graph_service.execute_query.call_args_list[0][0][0]
-        assert "center-1" in first_call_args
-        assert ":TESTED_BY" in first_call_args
-        assert "n:requirement OR n:test" in first_call_args
-        assert "*1..2" in first_call_args
-        assert "LIMIT 100" in first_call_args
+    @pytest.mark.asyncio
+    async def test_get_subgraph_around_node_without_filters(self, graph_service):
+        """Test unfiltered traversal binds NULL filters and handles a missing center"""
+        graph_service._execute_sql = AsyncMock(return_value=[])
+
+        nodes, edges = await graph_service._get_subgraph_around_node(
+            center_node_id="missing", depth=3, node_types=[],
+            relationship_types=None, limit=50
+        )
+
+        assert nodes == [] and edges == []
+        args = graph_service._execute_sql.call_args[0][1:]
+        assert args[3] is None and args[4] is None
 
     @pytest.mark.asyncio
     async def test_get_full_graph(self, graph_service):
-        """Test getting full graph with filters"""
-        # Mock node query results
-        node_results = [
-            {"id": "node-1", "type": "requirement"},
-            {"id": "node-2", "type": "test"}
+        """Test full graph only returns edges between the selected nodes"""
+        rows = [
+            {"kind": "node", "id": 1, "label": "Requirement", "start_id": None,
+             "end_id": None, "properties": '{"id": "node-1"}'},
+            {"kind": "node", "id": 2, "label": "Test", "start_id": None,
+             "end_id": None, "properties": '{"id": "node-2"}'},
+            {"kind": "edge", "id": 7, "label": "TESTED_BY", "start_id": 1,
+             "end_id": 2, "properties": "{}"},
         ]
-
-        # Mock relationship query results - new format with map return
-        rel_results = [
-            {
-                "rel": {"type": "TESTED_BY", "properties": {}},
-                "start_id": "node-1",
-                "end_id": "node-2",
-                "rel_type": "TESTED_BY"
-            }
-        ]
-
-        graph_service.execute_query = AsyncMock(side_effect=[node_results, rel_results])
+        graph_service._execute_sql = AsyncMock(return_value=rows)
 
         nodes, edges = await graph_service._get_full_graph(
-            node_types=["requirement", "test"],
+            node_types=["Requirement", "Test"],
             relationship_types=["TESTED_BY"],
             limit=100
         )
 
         assert len(nodes) == 2
-        assert len(edges) == 1
-
-        # Verify two queries were made
-        assert graph_service.execute_query.call_count == 2
-
-        # Check node query
-        node_query = graph_service.execute_query.call_args_list[0][0][0]
-        assert "n:requirement OR n:test" in node_query
-        assert "LIMIT 100" in node_query
-
-        # Check relationship query
-        rel_query = graph_service.execute_query.call_args_list[1][0][0]
-        assert "r:TESTED_BY" in rel_query
-        assert "LIMIT 200" in rel_query  # limit * 2
+        assert edges == [{"id": 7, "start_id": 1, "end_id": 2, "type": "TESTED_BY"}]
+
+        # Nodes and edges come from one statement; edges join the selected nodes
+        graph_service._execute_sql.assert_called_once()
+        sql, *args = graph_service._execute_sql.call_args[0]
+        assert "e.end_id IN (SELECT id FROM selected)" in sql
+        assert args == [
+            graph_service.graph_name, ["Requirement", "Test"], 100, ["TESTED_BY"]
+        ]
 
     def test_format_node_for_visualization(self, graph_service):
         """Test formatting node for visualization libraries"""
@@ -852,6 +1047,267 @@ class TestGraphVisualizationMethods:
                 assert react_flow["style"]["strokeDasharray"] is None
 
 
+class TestGraphIndexManagement:
+    """Test PostgreSQL index management for AGE label tables"""
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_creates_vertex_and_edge_indexes(self, graph_service):
+        """Vertex labels get property indexes, edge labels get endpoint indexes"""
+        graph_service.get_graph_labels = AsyncMock(return_value=[
+            {"name": "WorkItem", "kind": "vertex"},
+            {"name": "TESTED_BY", "kind": "edge"},
+        ])
+        graph_service.list_indexes = AsyncMock(return_value=[
+            {"name": "WorkItem_graphid_idx", "label": "WorkItem", "definition": ""},
+        ])
+        graph_service._execute_sql = AsyncMock(return_value=[])
+
+        result = await graph_service.ensure_indexes(create_labels=False)
+
+        assert result["existing"] == ["WorkItem_graphid_idx"]
+        assert "WorkItem_properties_gin_idx" in result["created"]
+        assert "WorkItem_id_idx" in result["created"]
+        assert "WorkItem_type_idx" in result["created"]
+        assert "WorkItem_status_idx" in result["created"]
+        assert "TESTED_BY_start_id_idx" in result["created"]
+        assert "TESTED_BY_end_id_idx" in result["created"]
+        assert "TESTED_BY_id_idx" not in result["created"]
+
+        statements = [call[0][0] for call in graph_service._execute_sql.call_args_list]
+        assert len(statements) == len(result["created"])
+        id_index = next(sql for sql in statements if '"WorkItem_id_idx"' in sql)
+        assert f'ON "{graph_service.graph_name}"."WorkItem"' in id_index
+        assert "agtype_access_operator" in id_index
+        assert '\'"id"\'::ag_catalog.agtype' in id_index
+        edge_index = next(sql for sql in statements if '"TESTED_BY_start_id_idx"' in sql)
+        assert "USING btree (start_id)" in edge_index
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_creates_missing_labels(self, graph_service):
+        """Schema labels that were never used get their tables created first"""
+        graph_service.get_graph_labels = AsyncMock(return_value=[
+            {"name": "WorkItem", "kind": "vertex"},
+        ])
+        graph_service.list_indexes = AsyncMock(return_value=[])
+        graph_service._execute_sql = AsyncMock(return_value=[])
+
+        await graph_service.ensure_indexes()
+
+        statements = [call[0][0] for call in graph_service._execute_sql.call_args_list]
+        assert not any("create_vlabel" in sql and "'WorkItem'" in sql for sql in statements)
+        assert any("create_vlabel" in sql and "'Risk'" in sql for sql in statements)
+        assert any("create_elabel" in sql and "'DEPENDS_ON'" in sql for sql in statements)
+        assert any('"DEPENDS_ON_end_id_idx"' in sql for sql in statements)
+
+
+class _FakePool:
+    """Minimal asyncpg pool stand-in that hands out a single connection"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Acquire()
+
+
+class _FakeTransaction:
+    """Records transaction nesting on a fake connection"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        self.conn.transactions += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestGraphServiceBatchedExecution:
+    """Test batched Cypher execution in one transaction"""
+
+    @pytest.mark.asyncio
+    async def test_execute_batched_isolates_failing_batches(self):
+        """Each parameter set runs in a savepoint; failures are returned, not raised"""
+        conn = AsyncMock()
+        conn.transactions = 0
+        conn.transaction = lambda: _FakeTransaction(conn)
+        conn.fetch = AsyncMock(side_effect=[
+            [{"result": '"a"'}],
+            RuntimeError("constraint violated"),
+            [{"result": '"c"'}],
+        ])
+        service = GraphService()
+        service.pool_mode = "session"
+        service._graph_ready = True
+        service.pool = _FakePool(conn)
+
+        results = await service.execute_batched(
+            "UNWIND $rows AS row RETURN row",
+            [{"rows": ["a"]}, {"rows": ["b"]}, {"rows": ["c"]}],
+        )
+
+        assert results[0] == ["a"]
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == ["c"]
+        # One outer transaction plus one savepoint per parameter set
+        assert conn.transactions == 4
+        assert conn.fetch.call_args_list[0][0][1] == '{"rows": ["a"]}'
+
+    @pytest.mark.asyncio
+    async def test_execute_batched_without_params(self):
+        """An empty batch does not touch the database"""
+        service = GraphService()
+        service.pool = None
+
+        assert await service.execute_batched("RETURN 1", []) == []
+
+
+class TestGraphServiceConnectionModes:
+    """Test AGE connection setup in session and per-query pool modes"""
+
+    @pytest.fixture
+    def conn(self):
+        conn = AsyncMock()
+        conn.fetch = AsyncMock(return_value=[{"name": "rxdx_graph", "result": None}])
+        return conn
+
+    @pytest.mark.asyncio
+    async def test_session_mode_runs_no_setup_per_query(self, conn):
+        """Session mode issues only the Cypher statement once the graph is known"""
+        service = GraphService()
+        service.pool_mode = "session"
+        service.pool = _FakePool(conn)
+
+        await service.execute_query("MATCH (n) RETURN n")
+        conn.fetch.reset_mock()
+        await service.execute_query("MATCH (n) RETURN n")
+
+        conn.execute.assert_not_called()
+        assert conn.fetch.call_count == 1
+        assert "ag_graph" not in conn.fetch.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_session_mode_search_path_survives_release(self, monkeypatch):
+        """A reused connection keeps ag_catalog on the search path after RESET ALL"""
+        async def create_pool(url, **kwargs):
+            return _ResettingPool(**kwargs)
+
+        monkeypatch.setattr("app.db.graph.asyncpg.create_pool", create_pool)
+        service = GraphService()
+        service.pool_mode = "session"
+        await service.connect()
+
+        for _ in range(2):
+            async with service.pool.acquire() as conn:
+                assert conn.search_path.startswith("ag_catalog")
+
+        assert conn.statements.count("LOAD 'age';") == 1
+
+    @pytest.mark.asyncio
+    async def test_per_query_mode_repeats_setup(self, conn):
+        """Per-query mode keeps loading AGE and checking the graph on every call"""
+        service = GraphService()
+        service.pool_mode = "per_query"
+        service.pool = _FakePool(conn)
+
+        await service.execute_query("MATCH (n) RETURN n")
+        await service.execute_query("MATCH (n) RETURN n")
+
+        assert conn.execute.call_count == 8
+        assert conn.fetch.call_count == 4
+        assert service.setup_statements_avoided == 0
+
+    @pytest.mark.asyncio
+    async def test_params_bound_as_agtype_argument(self, conn):
+        """Query parameters are sent as one JSON map bound to $1"""
+        service = GraphService()
+        service.pool_mode = "session"
+        service._graph_ready = True
+        service.pool = _FakePool(conn)
+
+        await service.execute_query(
+            "MATCH (n {id: $node_id}) RETURN n", {"node_id": "it's-1"}
+        )
+
+        sql, arg = conn.fetch.call_args[0]
+        assert "$$, $1) as (result ag_catalog.agtype)" in sql
+        assert "it's-1" not in sql
+        assert arg == '{"node_id": "it\'s-1"}'
+
+    @pytest.mark.asyncio
+    async def test_setup_statements_avoided_counted_per_request(self, conn):
+        """The request-scoped stats record avoided setup statements"""
+        from app.db.graph import GraphQueryStats, graph_query_stats_var
+
+        service = GraphService()
+        service.pool_mode = "session"
+        service.pool = _FakePool(conn)
+        stats = GraphQueryStats()
+        token = graph_query_stats_var.set(stats)
+        try:
+            await service.execute_query("MATCH (n) RETURN n")
+            await service.execute_query("MATCH (n) RETURN n")
+        finally:
+            graph_query_stats_var.reset(token)
+
+        assert stats.queries == 2
+        # First call still looks up the graph, the second skips that too
+        assert stats.setup_statements_avoided == 4 + 5
+        assert service.setup_statements_avoided == 9
+
+
+class _ResettingConnection:
+    """Connection stand-in tracking the search path across RESET ALL"""
+
+    def __init__(self, server_settings):
+        self.startup_search_path = (server_settings or {}).get("search_path", "public")
+        self.search_path = self.startup_search_path
+        self.statements: list[str] = []
+
+    async def execute(self, sql):
+        self.statements.append(sql)
+        if sql.startswith("SET search_path = "):
+            self.search_path = sql.removeprefix("SET search_path = ").rstrip(";")
+        elif sql == "RESET ALL":
+            self.search_path = self.startup_search_path
+
+
+class _ResettingPool:
+    """Single-connection pool that resets the connection on release like asyncpg"""
+
+    def __init__(self, server_settings=None, init=None, **kwargs):
+        self.conn = _ResettingConnection(server_settings)
+        self.init = init
+        self.initialized = False
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                if pool.init is not None and not pool.initialized:
+                    await pool.init(pool.conn)
+                    pool.initialized = True
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                await pool.conn.execute("RESET ALL")
+                return False
+
+        return _Acquire()
+
+
 class TestGraphServiceIntegration:
     """Integration tests for GraphService (require actual database)"""
 
@@ -1911,3 +2367,258 @@ class TestEdgeFieldCompleteness:
         assert "a" in result1["id"]
         assert "b" in result1["id"]
         assert "TESTED_BY" in result1["id"]
+
+
+def _stream_rows(rows):
+    """Build a _stream_sql replacement that yields the given rows"""
+
+    async def stream(sql, *args, **kwargs):
+        stream.args = args
+        for row in rows:
+            yield row
+
+    return stream
+
+
+def _node_row(rank, node_id, depth=1):
+    return {
+        "kind": "node", "rank": rank, "depth": depth, "id": 100 + rank,
+        "label": "WorkItem", "start_key": None, "end_key": None,
+        "properties": json.dumps({"id": node_id, "type": "requirement"}),
+    }
+
+
+def _edge_row(rank, start, end):
+    return {
+        "kind": "edge", "rank": rank, "depth": None, "id": 500 + rank,
+        "label": "TESTED_BY", "start_key": json.dumps(start),
+        "end_key": json.dumps(end), "properties": "{}",
+    }
+
+
+class TestGraphStreaming:
+    """Test cursor-based streaming and node expansion"""
+
+    @pytest.mark.asyncio
+    async def test_stream_graph_chunks_in_bfs_order(self, graph_service):
+        """Edges travel in the chunk of their later end; the last line is an end message"""
+        graph_service._stream_sql = _stream_rows([
+            _node_row(1, "center", depth=0),
+            _node_row(2, "a"),
+            _edge_row(2, "center", "a"),
+            _node_row(3, "b"),
+            _edge_row(3, "b", "center"),
+            _edge_row(3, "a", "b"),
+        ])
+
+        messages = [
+            message
+            async for message in graph_service.stream_graph("center", chunk_size=2)
+        ]
+
+        assert [m["type"] for m in messages] == ["chunk", "chunk", "end"]
+        assert [n["id"] for n in messages[0]["nodes"]] == ["center", "a"]
+        assert [(e["source"], e["target"]) for e in messages[0]["edges"]] == [
+            ("center", "a")
+        ]
+        assert [n["depth"] for n in messages[0]["nodes"]] == [0, 1]
+        assert [(e["source"], e["target"]) for e in messages[1]["edges"]] == [
+            ("b", "center"),
+            ("a", "b"),
+        ]
+        assert messages[-1] == {
+            "type": "end", "cursor": None, "has_more": False,
+            "total_nodes": 3, "total_edges": 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_stream_graph_pages_with_cursor(self, graph_service):
+        """A row beyond the page marks has_more and the cursor resumes after the page"""
+        graph_service._stream_sql = _stream_rows([
+            _node_row(6, "f"),
+            _node_row(7, "g"),
+            _node_row(8, "h"),
+        ])
+
+        messages = [
+            message
+            async for message in graph_service.stream_graph(
+                "center", cursor=5, page_size=2, known_node_ids=["x"]
+            )
+        ]
+
+        assert [n["id"] for n in messages[0]["nodes"]] == ["f", "g"]
+        assert messages[-1]["has_more"] is True
+        assert messages[-1]["cursor"] == 7
+        args = graph_service._stream_sql.args
+        assert args[1] == '"center"'
+        assert args[5:] == (['"x"'], 5, 3)
+
+    @pytest.mark.asyncio
+    async def test_expand_node_returns_delta(self, graph_service):
+        """Expanding treats the node itself as known and collects one hop"""
+        graph_service._stream_sql = _stream_rows([
+            _node_row(1, "new-1"),
+            _edge_row(1, "center", "new-1"),
+        ])
+
+        result = await graph_service.expand_node("center", known_node_ids=["other"])
+
+        assert [n["id"] for n in result["nodes"]] == ["new-1"]
+        assert result["edges"][0]["source"] == "center"
+        assert result["has_more"] is False
+        args = graph_service._stream_sql.args
+        assert args[2] == 1
+        assert args[5] == ['"center"', '"other"']
+
+
+class TestFullTextSearch:
+    """Test the full-text search side table"""
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_and_paginates(self, graph_service):
+        """Test the query builds prefix terms, escapes LIKE patterns and pages"""
+        graph_service._search_ready = True
+        graph_service._trigram_search = True
+        graph_service._execute_sql = AsyncMock(return_value=[
+            {"node_id": "r-1", "label": "WorkItem",
+             "properties": '{"id": "r-1", "title": "Alarm UI"}', "total": 42},
+        ])
+
+        nodes, total = await graph_service.full_text_search(
+            "Alarm 100%_ui", labels=["WorkItem", "Risk"], limit=10, offset=20
+        )
+
+        assert nodes == [
+            {"id": "r-1", "label": "WorkItem", "properties": {"id": "r-1", "title": "Alarm UI"}}
+        ]
+        assert total == 42
+        sql, *args = graph_service._execute_sql.call_args[0]
+        assert "to_tsquery('simple', $1)" in sql
+        assert "$7 <% s.title" in sql
+        # Properties are read from the vertices, not the side table
+        assert "_ag_label_vertex" in sql
+        assert "s.properties" not in sql
+        assert "LIMIT $5 OFFSET $6" in sql
+        assert args == [
+            "alarm:* & 100:* & _ui:*",
+            "%Alarm 100\\%\\_ui%",
+            ["WorkItem", "Risk"],
+            None,
+            10,
+            20,
+            "Alarm 100%_ui",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_without_trigram(self, graph_service):
+        """Test fuzzy matching is left out when pg_trgm is unavailable"""
+        graph_service._search_ready = True
+        graph_service._execute_sql = AsyncMock(return_value=[])
+
+        nodes, total = await graph_service.full_text_search(
+            "alarm", property_filters={"status": "active"}
+        )
+
+        assert (nodes, total) == ([], 0)
+        sql, *args = graph_service._execute_sql.call_args[0]
+        assert "<%" not in sql
+        assert len(args) == 6
+        assert args[3] == '{"status": "active"}'
+
+    @pytest.mark.asyncio
+    async def test_ensure_search_index_creates_table_and_indexes(self, graph_service):
+        """Test a missing side table is created with its indexes and filled"""
+        graph_service._execute_sql = AsyncMock(
+            return_value=[{"version": None, "indexed": 7}]
+        )
+
+        result = await graph_service.ensure_search_index()
+
+        assert result == {"trigram": True, "indexed": 7}
+        statements = [call[0][0] for call in graph_service._execute_sql.call_args_list]
+        assert any("CREATE EXTENSION IF NOT EXISTS pg_trgm" in sql for sql in statements)
+        assert any("GENERATED ALWAYS AS" in sql for sql in statements)
+        assert any("gin (title gin_trgm_ops)" in sql for sql in statements)
+        assert any(_SEARCH_INDEX_VERSION in sql for sql in statements)
+        assert any("ON CONFLICT (node_id) DO UPDATE" in sql for sql in statements)
+        assert graph_service._search_ready
+
+    @pytest.mark.asyncio
+    async def test_ensure_search_index_skips_rebuild_when_current(self, graph_service):
+        """Test an up-to-date side table is not dropped or refilled on startup"""
+        graph_service._execute_sql = AsyncMock(
+            return_value=[{"version": _SEARCH_INDEX_VERSION}]
+        )
+
+        result = await graph_service.ensure_search_index()
+
+        assert result == {"trigram": True}
+        statements = [call[0][0] for call in graph_service._execute_sql.call_args_list]
+        assert not any("DROP TABLE" in sql for sql in statements)
+        assert not any("INSERT INTO" in sql for sql in statements)
+
+    @pytest.mark.asyncio
+    async def test_ensure_search_index_recreates_outdated_table(self, graph_service):
+        """Test a side table with an older definition is recreated and refilled"""
+        graph_service._execute_sql = AsyncMock(
+            return_value=[{"version": "node-search v0", "indexed": 3}]
+        )
+
+        result = await graph_service.ensure_search_index()
+
+        assert result == {"trigram": True, "indexed": 3}
+        statements = [call[0][0] for call in graph_service._execute_sql.call_args_list]
+        assert any("DROP TABLE IF EXISTS" in sql for sql in statements)
+        assert any("INSERT INTO" in sql for sql in statements)
+
+    @pytest.mark.asyncio
+    async def test_ensure_search_index_without_pg_trgm(self, graph_service):
+        """Test a missing pg_trgm extension only disables the trigram indexes"""
+
+        async def execute_sql(sql, *args):
+            if "pg_trgm" in sql and "EXTENSION" in sql:
+                raise RuntimeError("permission denied to create extension")
+            if "obj_description" in sql:
+                return [{"version": _SEARCH_INDEX_VERSION}]
+            return []
+
+        graph_service._execute_sql = AsyncMock(side_effect=execute_sql)
+
+        result = await graph_service.ensure_search_index()
+
+        assert result == {"trigram": False}
+        statements = [call[0][0] for call in graph_service._execute_sql.call_args_list]
+        assert not any("gin_trgm_ops" in sql for sql in statements)
+
+    @pytest.mark.asyncio
+    async def test_node_writes_sync_search_index(self, graph_service):
+        """Test create, update and delete keep the search table in sync"""
+        graph_service._search_ready = True
+        graph_service.execute_query = AsyncMock(return_value=[{"id": "n-1"}])
+        graph_service._execute_sql = AsyncMock(return_value=[])
+
+        await graph_service.create_node("WorkItem", {"id": "n-1", "title": "A"})
+        await graph_service.update_node("n-1", {"title": "B"})
+        await graph_service.delete_node("n-1")
+
+        calls = graph_service._execute_sql.call_args_list
+        assert len(calls) == 3
+        assert "INSERT INTO" in calls[0][0][0] and calls[0][0][1] == '"n-1"'
+        assert "INSERT INTO" in calls[1][0][0]
+        assert calls[2][0] == (
+            f'DELETE FROM public."{graph_service.graph_name}_node_search" '
+            "WHERE node_id = $1",
+            "n-1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_sync_failure_does_not_fail_write(self, graph_service):
+        """Test a broken search table never fails the graph write"""
+        graph_service._search_ready = True
+        graph_service.execute_query = AsyncMock(return_value=[{"id": "n-1"}])
+        graph_service._execute_sql = AsyncMock(side_effect=RuntimeError("boom"))
+
+        result = await graph_service.update_node("n-1", {"title": "B"})
+
+        assert result == {"id": "n-1"}
@@ -0,0 +1,113 @@
+"""Tests for FMEA risk propagation"""
+
+import itertools
+
+import pytest
+
+from app.utils.risk_propagation import RiskGraph, edge_probability
+
+
+def _graph(edges, types=None):
+    types = types or {}
+    node_ids = {node_id for edge in edges for node_id in edge[:2]}
+    nodes = {
+        node_id: {"type": types.get(node_id, "risk" if node_id.startswith("r") else "failure")}
+        for node_id in node_ids
+    }
+    return RiskGraph(nodes, edges)
+
+
+class TestEdgeProbability:
+    @pytest.mark.parametrize(
+        "value,expected",
+        [(0.5, 0.5), (1, 1.0), ("0.25", 0.25), (1.5, 0.0), (-0.1, 0.0),
+         (None, 0.0), ("invalid", 0.0), (True, 0.0)],
+    )
+    def test_parsing(self, value, expected):
+        assert edge_probability(value) == expected
+
+
+class TestRiskGraph:
+    def test_single_chain(self):
+        graph = _graph([("r1", "f1", 0.3), ("f1", "f2", 0.2)])
+
+        result = graph.propagate("r1")
+
+        assert [c["chain_length"] for c in result["chains"]] == [1, 2]
+        chain = result["chains"][1]
+        assert [node["id"] for node in chain["path"]] == ["r1", "f1", "f2"]
+        assert chain["probabilities"] == [0.3, 0.2]
+        assert chain["total_probability"] == pytest.approx(0.06)
+        assert chain["start_risk_id"] == "r1"
+        assert result["failure_probabilities"] == pytest.approx({"f1": 0.3, "f2": 0.06})
+
+    def test_diamond_aggregates_with_noisy_or(self):
+        graph = _graph([
+            ("r1", "f1", 0.5), ("r1", "f2", 0.4),
+            ("f1", "f3", 0.2), ("f2", "f3", 0.5),
+        ])
+
+        result = graph.propagate("r1")
+
+        # Two independent causes: 1 - (1 - 0.5 * 0.2) * (1 - 0.4 * 0.5)
+        assert result["failure_probabilities"]["f3"] == pytest.approx(0.28)
+        to_f3 = [c for c in result["chains"] if c["path"][-1]["id"] == "f3"]
+        assert [c["total_probability"] for c in to_f3] == pytest.approx([0.2, 0.1])
+
+    def test_top_k_and_max_depth(self):
+        graph = _graph([("r1", "f1", 0.9), ("f1", "f2", 0.9), ("f2", "f3", 0.9),
+                        ("r1", "f4", 0.1)])
+
+        result = graph.propagate("r1", max_depth=2, top_k=2)
+
+        assert [c["path"][-1]["id"] for c in result["chains"]] == ["f1", "f2"]
+        assert all(c["chain_length"] <= 2 for c in result["chains"])
+        assert "f3" not in result["failure_probabilities"]
+
+    def test_chains_end_at_risks_and_failures_only(self):
+        graph = _graph([("r1", "c1", 1.0), ("c1", "f1", 0.5)], types={"c1": "cause"})
+
+        result = graph.propagate("r1")
+
+        assert [c["path"][-1]["id"] for c in result["chains"]] == ["f1"]
+        assert result["failure_probabilities"]["c1"] == 1.0
+
+    def test_duplicate_edges_keep_highest_probability(self):
+        graph = _graph([("r1", "f1", 0.2), ("r1", "f1", 0.7)])
+
+        result = graph.propagate("r1")
+
+        assert len(result["chains"]) == 1
+        assert result["chains"][0]["total_probability"] == 0.7
+
+    def test_cycles_are_broken(self):
+        graph = _graph([("r1", "f1", 0.5), ("f1", "f2", 0.5), ("f2", "f1", 0.5)])
+
+        result = graph.propagate("r1")
+
+        assert graph.dropped_edges == 1
+        assert all(len({n["id"] for n in c["path"]}) == len(c["path"]) for c in result["chains"])
+
+    def test_unknown_start_and_start_risks(self):
+        graph = _graph([("r1", "f1", 0.5), ("f1", "r2", 0.5)])
+
+        assert graph.propagate("missing")["chains"] == []
+        # r2 has no outgoing LEADS_TO edge
+        assert graph.start_risks() == ["r1"]
+
+    def test_dense_graph_is_bounded(self):
+        # Layered graph with 8^5 paths from r0 to the last layer
+        layers = [["r0"]] + [[f"f{d}_{i}" for i in range(8)] for d in range(1, 6)]
+        edges = [
+            (u, v, 0.5)
+            for upper, lower in itertools.pairwise(layers)
+            for u in upper
+            for v in lower
+        ]
+        graph = _graph(edges)
+
+        result = graph.propagate("r0", max_depth=5, top_k=10)
+
+        assert len(result["chains"]) == 10
+        assert result["chains"][0]["total_probability"] == 0.5
+        assert len(result["failure_probabilities"]) == 40
@@ -173,7 +173,8 @@ def calculate_chain_probability(probabilities):
     Calculate total probability for a failure chain.
 
     This is a standalone function for testing purposes.
-    The actual implementation is in GraphService._calculate_chain_probability
+    Risk chains multiply edge probabilities the same way in
+    app.utils.risk_propagation.RiskGraph
 
     Args:
         probabilities: List of individual step probabilities
@@ -46,6 +46,7 @@ def mock_signature_service():
     """Mock signature service."""
     service = AsyncMock()
     service.get_workitem_signatures.return_value = []
+    service.signed_status_for.return_value = {}
     return service
 
 
@@ -800,7 +801,10 @@ class TestRiskQueryMethods:
                 }
             }
         ]
-        mock_signature_service.get_workitem_signatures.return_value = []
+        mock_signature_service.signed_status_for.return_value = {
+            risk_id_1: True,
+            risk_id_2: False,
+        }
         mock_graph_service.execute_query.return_value = []
 
         result = await risk_service.get_risks()
@@ -818,6 +822,12 @@ class TestRiskQueryMethods:
         assert str(result[1].id) == str(risk_id_2)
         assert result[1].title == 'Component Failure Risk'
 
+        # Signed status of the whole list comes from one batched lookup
+        mock_signature_service.signed_status_for.assert_awaited_once()
+        mock_signature_service.get_workitem_signatures.assert_not_awaited()
+        assert result[0].is_signed is True
+        assert result[1].is_signed is False
+
     @pytest.mark.asyncio
     async def test_get_risks_with_status_filter(
         self,
@@ -1181,6 +1191,7 @@ class TestRiskQueryProperties:
         # Mock the graph service to return all risks as WorkItem nodes with type='risk'
         mock_graph_service.search_nodes.return_value = mock_risks
         mock_signature_service.get_workitem_signatures.return_value = []
+        mock_signature_service.signed_status_for.return_value = {}
         mock_graph_service.execute_query.return_value = []
         
         # Call get_risks
@@ -0,0 +1,229 @@
+"""Unit tests for the persistent schedule store"""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.schedule import StoredSchedule, StoredScheduleJob
+from app.schemas.schedule import (
+    ProjectSchedule,
+    ScheduleConstraints,
+    ScheduledTask,
+    ScheduleJobStatus,
+    ScheduleResponse,
+)
+from app.services.schedule_store import ScheduleJobStore, ScheduleStore, schedule_etag
+
+
+def make_schedule(version: int = 1) -> ProjectSchedule:
+    now = datetime.now(UTC)
+    return ProjectSchedule(
+        project_id=uuid4(),
+        schedule=[
+            ScheduledTask(
+                task_id=f"task-{i}",
+                task_title=f"Task {i}",
+                start_date=now,
+                end_date=now,
+                duration_hours=8,
+            )
+            for i in range(50)
+        ],
+        constraints=ScheduleConstraints(project_start=now),
+        project_duration_hours=400,
+        project_start_date=now,
+        project_end_date=now,
+        created_at=now,
+        updated_at=now,
+        version=version,
+    )
+
+
+class FakeSession:
+    """Minimal async session serving one stored row"""
+
+    def __init__(self, row: StoredSchedule | None):
+        self.row = row
+        self.loads = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement):
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = self.row.version if self.row else None
+        return result
+
+    async def get(self, model, project_id):
+        self.loads += 1
+        return self.row
+
+
+def unavailable_session():
+    raise ConnectionRefusedError("database unavailable")
+
+
+class TestScheduleStore:
+    """Tests for ScheduleStore"""
+
+    def test_encode_decode_round_trip(self):
+        """Test schedules survive compression, with row columns taking precedence"""
+        schedule = make_schedule()
+        data = ScheduleStore._encode(schedule)
+
+        assert len(data) < len(schedule.model_dump_json())
+
+        row = StoredSchedule(
+            project_id=schedule.project_id,
+            version=7,
+            data=data,
+            created_at=schedule.created_at,
+        )
+        decoded = ScheduleStore._decode(row)
+
+        assert decoded.version == 7
+        assert decoded.schedule == schedule.schedule
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_cache_without_database(self):
+        """Test schedules are kept in memory when the database is unreachable"""
+        store = ScheduleStore(session_factory=unavailable_session)
+        schedule = make_schedule()
+
+        saved = await store.save(schedule)
+
+        assert saved.version == 1
+        assert await store.get(schedule.project_id) is saved
+        assert await store.get(uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_save_requires_expected_version(self):
+        """Test a conditional save is refused once another version was stored"""
+        store = ScheduleStore(session_factory=unavailable_session)
+        schedule = make_schedule()
+        await store.save(schedule)
+        newer = await store.save(schedule.model_copy(update={"version": 2}))
+
+        stale = await store.save(
+            schedule.model_copy(update={"version": 2}), expected_version=1
+        )
+
+        assert stale is None
+        assert await store.get(schedule.project_id) is newer
+        assert await store.save(
+            schedule.model_copy(update={"version": 3}), expected_version=2
+        ) is not None
+
+    @pytest.mark.asyncio
+    async def test_read_through_cache(self):
+        """Test the payload is only loaded again when the stored version changes"""
+        schedule = make_schedule(version=3)
+        row = StoredSchedule(
+            project_id=schedule.project_id,
+            version=3,
+            data=ScheduleStore._encode(schedule),
+            created_at=schedule.created_at,
+        )
+        session = FakeSession(row)
+        store = ScheduleStore(session_factory=lambda: session)
+
+        first = await store.get(schedule.project_id)
+        second = await store.get(schedule.project_id)
+        assert first is second
+        assert session.loads == 1
+
+        # Another worker saved a new version
+        row.version = 4
+        third = await store.get(schedule.project_id)
+        assert third.version == 4
+        assert session.loads == 2
+
+    def test_etag_changes_with_version(self):
+        """Test the ETag identifies the schedule version"""
+        schedule = make_schedule(version=1)
+        newer = schedule.model_copy(update={"version": 2})
+
+        assert schedule_etag(schedule) != schedule_etag(newer)
+        assert schedule_etag(schedule).startswith('"')
+
+
+def make_job(status: str = "queued") -> ScheduleJobStatus:
+    return ScheduleJobStatus(
+        job_id=uuid4(),
+        project_id=uuid4(),
+        status=status,
+        submitted_at=datetime.now(UTC),
+    )
+
+
+class TestScheduleJobStore:
+    """Tests for ScheduleJobStore"""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_memory_without_database(self):
+        """Test job state and results are served from memory when the database is down"""
+        store = ScheduleJobStore(session_factory=unavailable_session)
+        job = make_job()
+        await store.create(job)
+
+        finished = job.model_copy(
+            update={"status": "completed", "result_status": "success"}
+        )
+        result = ScheduleResponse(status="success", project_id=job.project_id)
+
+        assert await store.update(finished, result) is True
+        assert await store.get(job.job_id) == finished
+        assert await store.get_result(job.job_id) == result
+        assert await store.get(uuid4()) is None
+        assert await store.get_result(uuid4()) is None
+        assert await store.cancel(uuid4(), "Cancelled by user") is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_not_overwritten(self):
+        """Test the worker running a job cannot undo a cancellation"""
+        store = ScheduleJobStore(session_factory=unavailable_session)
+        job = make_job()
+        await store.create(job)
+
+        cancelled = await store.cancel(job.job_id, "Cancelled by user")
+        running = job.model_copy(update={"status": "running"})
+
+        assert cancelled.status == "cancelled"
+        assert cancelled.finished_at is not None
+        assert await store.update(running) is False
+        assert (await store.get(job.job_id)).status == "cancelled"
+        assert await store.cancel(job.job_id, "again") == cancelled
+
+    @pytest.mark.asyncio
+    async def test_prune_keeps_newest_finished_jobs(self):
+        """Test pruning forgets the oldest finished jobs but never unfinished ones"""
+        store = ScheduleJobStore(session_factory=unavailable_session)
+        queued = make_job()
+        finished = [make_job() for _ in range(3)]
+        for job in [queued, *finished]:
+            await store.create(job)
+        for job in finished:
+            await store.cancel(job.job_id, "Cancelled by user")
+
+        await store.prune(keep=1)
+
+        assert await store.get(queued.job_id) is not None
+        assert await store.get(finished[0].job_id) is None
+        assert await store.get(finished[1].job_id) is None
+        assert await store.get(finished[2].job_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_reads_jobs_of_other_workers(self):
+        """Test a job stored by another worker is read from the database"""
+        job = make_job(status="running")
+        row = StoredScheduleJob(**job.model_dump())
+        session = FakeSession(row)
+        store = ScheduleJobStore(session_factory=lambda: session)
+
+        assert await store.get(job.job_id) == job
+        assert session.loads == 1
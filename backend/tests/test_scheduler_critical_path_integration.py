@@ -452,8 +452,8 @@ class TestCriticalPathIntegration:
         # Create tasks with different dependency types
         # Task A (16h) is the longest task
         # Task B (8h) has start_to_start with A (can start when A starts)
-        # Task C (8h) has finish_to_finish with A (must finish when A finishes)
-        # Critical path should be A -> B (both end at same time, but B depends on A)
+        # Task C (8h) has finish_to_finish with A (can finish when A finishes)
+        # Critical path is A -> C; B runs alongside A with float to spare
         tasks = [
             ScheduleTaskCreate(
                 id="task-a",
@@ -496,12 +496,11 @@ class TestCriticalPathIntegration:
         assert result.critical_path is not None
         assert len(result.critical_path) > 0
 
-        # Task A should be in the critical path (longest task)
-        assert "task-a" in result.critical_path
-        
-        # Either task-b or task-c should be in critical path
-        # (both have same end time, algorithm picks one)
-        assert "task-b" in result.critical_path or "task-c" in result.critical_path
+        # C finishes together with A, driven by the finish_to_finish link
+        assert result.critical_path == ["task-a", "task-c"]
+        task_b = next(t for t in result.schedule if t.task_id == "task-b")
+        assert not task_b.is_critical
+        assert task_b.total_float_hours > 0
 
     @pytest.mark.asyncio
     async def test_critical_path_response_includes_all_required_fields(
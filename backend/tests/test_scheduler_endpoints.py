@@ -1,12 +1,18 @@
 """Integration tests for scheduler API endpoints"""
 
 from datetime import UTC, datetime
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
+from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
+from app.api.deps import get_current_user
 from app.main import app
+from app.models.user import User, UserRole
+from app.schemas.schedule import ProjectSchedule, ScheduleConstraints
+from app.services.scheduler_service import get_scheduler_service
 
 
 @pytest.fixture
@@ -163,6 +169,50 @@ class TestCalculateScheduleEndpoint:
                 assert len(data.get("conflicts", [])) > 0
 
 
+class TestScheduleJobEndpoints:
+    """Tests for asynchronous schedule job endpoints"""
+
+    @pytest.mark.asyncio
+    async def test_calculate_schedule_async(self, sample_schedule_request):
+        """Test queueing a schedule calculation as a job"""
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/schedule/calculate?async=true",
+                json=sample_schedule_request,
+            )
+
+            if response.status_code == 401:
+                pytest.skip("Authentication required - skipping endpoint test")
+
+            assert response.status_code == 202
+            data = response.json()
+
+            assert data["status"] in ["queued", "running", "completed"]
+            assert data["project_id"] == sample_schedule_request["project_id"]
+
+            status_response = await client.get(
+                f"/api/v1/schedule/jobs/{data['job_id']}"
+            )
+            assert status_response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_get_schedule_job_not_found(self):
+        """Test getting a non-existent job"""
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test"
+        ) as client:
+            response = await client.get(f"/api/v1/schedule/jobs/{uuid4()}")
+
+            if response.status_code == 401:
+                pytest.skip("Authentication required - skipping endpoint test")
+
+            assert response.status_code == 404
+
+
 class TestGetScheduleEndpoint:
     """Tests for GET /api/v1/schedule/{project_id} endpoint"""
 
@@ -212,6 +262,65 @@ class TestGetScheduleEndpoint:
             assert len(data["schedule"]) == 3
 
 
+class TestScheduleETag:
+    """Tests for ETag handling on schedule endpoints"""
+
+    @pytest.fixture
+    def stored_schedule(self):
+        now = datetime.now(UTC)
+        return ProjectSchedule(
+            project_id=uuid4(),
+            schedule=[],
+            constraints=ScheduleConstraints(),
+            project_duration_hours=0,
+            project_start_date=now,
+            project_end_date=now,
+            created_at=now,
+            updated_at=now,
+            version=3,
+        )
+
+    @pytest.fixture
+    def client(self, stored_schedule):
+        mock_service = AsyncMock()
+        mock_service.get_schedule.return_value = stored_schedule
+        app.dependency_overrides[get_current_user] = lambda: User(
+            id=uuid4(),
+            email="test@example.com",
+            full_name="Test User",
+            role=UserRole.USER,
+            is_active=True,
+            failed_login_attempts=0,
+        )
+        app.dependency_overrides[get_scheduler_service] = lambda: mock_service
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_get_schedule_returns_etag(self, client, stored_schedule):
+        """Test the schedule response carries a version ETag"""
+        response = client.get(f"/api/v1/schedule/{stored_schedule.project_id}")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == f'"{stored_schedule.project_id}-3"'
+
+    def test_get_schedule_not_modified(self, client, stored_schedule):
+        """Test a matching If-None-Match returns 304 without a body"""
+        etag = f'"{stored_schedule.project_id}-3"'
+        response = client.get(
+            f"/api/v1/schedule/{stored_schedule.project_id}",
+            headers={"If-None-Match": etag},
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+        stale = client.get(
+            f"/api/v1/schedule/{stored_schedule.project_id}",
+            headers={"If-None-Match": f'"{stored_schedule.project_id}-2"'},
+        )
+        assert stale.status_code == 200
+
+
 class TestUpdateScheduleEndpoint:
     """Tests for PATCH /api/v1/schedule/{project_id} endpoint"""
 
@@ -1,19 +1,32 @@
 """Unit tests for SchedulerService"""
 
+import asyncio
+import threading
+from concurrent.futures import Future
 from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
 
 from app.schemas.schedule import (
+    ProjectSchedule,
     ResourceCreate,
     ScheduleConstraints,
+    ScheduleResponse,
+    ScheduleSolverProfile,
     ScheduleTaskCreate,
     TaskDependency,
 )
+from app.services import scheduler_service as scheduler_module
+from app.services.schedule_store import ScheduleJobStore
 from app.services.scheduler_service import SchedulerService
 
 
+def _unavailable_session():
+    raise ConnectionRefusedError("database unavailable")
+
+
 @pytest.fixture
 def scheduler_service():
     """Create a fresh scheduler service for each test"""
@@ -636,6 +649,515 @@ class TestScheduleStorage:
         assert task_1.start_date.date() == new_start.date()
 
 
+class TestGanttCache:
+    """Tests for the per-project Gantt data cache"""
+
+    @staticmethod
+    def _schedule(project_id, version: int) -> ProjectSchedule:
+        now = datetime.now(UTC)
+        return ProjectSchedule(
+            project_id=project_id,
+            schedule=[],
+            constraints=ScheduleConstraints(),
+            project_duration_hours=0,
+            project_start_date=now,
+            project_end_date=now,
+            created_at=now,
+            updated_at=now,
+            version=version,
+        )
+
+    @pytest.mark.asyncio
+    async def test_gantt_data_cached_until_version_changes(self, scheduler_service):
+        """Test that Gantt data is rebuilt only when the schedule version changes"""
+        project_id = uuid4()
+        schedule = self._schedule(project_id, version=1)
+        scheduler_service.get_schedule = AsyncMock(return_value=schedule)
+
+        with (
+            patch("app.db.graph.get_graph_service", AsyncMock()),
+            patch(
+                "app.utils.gantt_utils.prepare_gantt_data",
+                AsyncMock(side_effect=lambda *args: object()),
+            ) as prepare,
+        ):
+            first = await scheduler_service.get_gantt_chart_data(project_id)
+            second = await scheduler_service.get_gantt_chart_data(project_id)
+            assert first is second
+            assert prepare.await_count == 1
+
+            scheduler_service.get_schedule.return_value = schedule.model_copy(
+                update={"version": 2}
+            )
+            third = await scheduler_service.get_gantt_chart_data(project_id)
+            assert third is not first
+            assert prepare.await_count == 2
+
+
+class TestIncrementalReschedule:
+    """Tests for incremental re-scheduling from a stored schedule"""
+
+    @pytest.fixture
+    def independent_task(self):
+        """A task without dependencies on its own resource"""
+        return ScheduleTaskCreate(
+            id="task-4",
+            title="Documentation",
+            estimated_hours=24,
+            required_resources=["doc-1"],
+        )
+
+    @pytest.fixture
+    def resources(self, sample_resources):
+        return sample_resources + [
+            ResourceCreate(id="doc-1", name="Technical Writer", capacity=1)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reschedule_without_stored_schedule(
+        self, scheduler_service, sample_tasks
+    ):
+        """Test re-scheduling an unknown project returns None"""
+        result = await scheduler_service.reschedule_project(uuid4(), sample_tasks)
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_reschedule_moves_only_downstream_tasks(
+        self,
+        scheduler_service,
+        sample_tasks,
+        independent_task,
+        resources,
+        sample_constraints,
+    ):
+        """Test a changed estimate only moves the task's downstream cone"""
+        project_id = uuid4()
+        tasks = sample_tasks + [independent_task]
+        initial = await scheduler_service.schedule_project(
+            project_id=project_id,
+            tasks=tasks,
+            resources=resources,
+            constraints=sample_constraints,
+        )
+        assert initial.status == "success"
+        before = {t.task_id: t for t in initial.schedule}
+
+        edited = [
+            t.model_copy(update={"estimated_hours": 100}) if t.id == "task-2" else t
+            for t in tasks
+        ]
+        result = await scheduler_service.reschedule_project(project_id, edited)
+
+        assert result.status == "success"
+        assert "re-optimized 2 of 4 tasks" in result.message
+        after = {t.task_id: t for t in result.schedule}
+        assert after["task-1"].start_date == before["task-1"].start_date
+        assert after["task-4"].start_date == before["task-4"].start_date
+        assert after["task-2"].start_date == before["task-2"].start_date
+        assert after["task-3"].start_date == before["task-3"].start_date + timedelta(
+            hours=20
+        )
+        assert result.project_duration_hours == initial.project_duration_hours + 20
+
+        stored = await scheduler_service.get_schedule(project_id)
+        assert stored.version == 2
+
+    @pytest.mark.asyncio
+    async def test_reschedule_freezes_started_tasks(
+        self, scheduler_service, sample_tasks, sample_resources, sample_constraints
+    ):
+        """Test started tasks keep their start even when they changed"""
+        project_id = uuid4()
+        initial = await scheduler_service.schedule_project(
+            project_id=project_id,
+            tasks=sample_tasks,
+            resources=sample_resources,
+            constraints=sample_constraints,
+        )
+        before = {t.task_id: t for t in initial.schedule}
+
+        # task-3 is already under way; pretend task-2 shrank so task-3 could move up
+        edited = []
+        for task in sample_tasks:
+            if task.id == "task-2":
+                task = task.model_copy(update={"estimated_hours": 40})
+            elif task.id == "task-3":
+                task = task.model_copy(
+                    update={"start_date_is": before["task-3"].start_date}
+                )
+            edited.append(task)
+
+        result = await scheduler_service.reschedule_project(project_id, edited)
+
+        assert result.status == "success"
+        after = {t.task_id: t for t in result.schedule}
+        assert after["task-3"].start_date == before["task-3"].start_date
+        assert after["task-3"].start_date_is == before["task-3"].start_date
+
+        # The stored schedule already has task-2 at 40 hours, so name the change
+        unfrozen = await scheduler_service.reschedule_project(
+            project_id, edited, changed_task_ids=["task-2"], freeze_started=False
+        )
+        moved = {t.task_id: t for t in unfrozen.schedule}
+        assert moved["task-3"].start_date < before["task-3"].start_date
+
+    def test_working_hours_inverse_of_hours_to_datetime(self, scheduler_service):
+        """Test working hours round-trip through calendar dates"""
+        constraints = ScheduleConstraints(working_hours_per_day=8, respect_weekends=True)
+        # A Saturday evening start exercises the weekend skip
+        start = datetime(2024, 3, 2, 18, 30, tzinfo=UTC)
+
+        for hours in range(0, 400, 3):
+            date = scheduler_service._hours_to_datetime(hours, start, constraints)
+            assert (
+                scheduler_service._working_hours_from_start(date, start, constraints)
+                == hours
+            )
+
+
+class TestSolverProfile:
+    """Tests for solver tuning options and statistics"""
+
+    @pytest.mark.asyncio
+    async def test_solver_statistics_reported(
+        self, scheduler_service, sample_tasks, sample_resources, sample_constraints
+    ):
+        """Test solver statistics are included in the response"""
+        sample_constraints.solver_profile = ScheduleSolverProfile(
+            num_search_workers=4, relative_gap_limit=0.05
+        )
+
+        result = await scheduler_service.schedule_project(
+            project_id=uuid4(),
+            tasks=sample_tasks,
+            resources=sample_resources,
+            constraints=sample_constraints,
+        )
+
+        assert result.status == "success"
+        stats = result.solver_stats
+        assert stats is not None
+        assert stats.num_search_workers == 4
+        assert stats.objective_value == result.project_duration_hours
+        assert stats.best_objective_bound == stats.objective_value
+        assert stats.relative_gap == 0
+        assert stats.wall_time_seconds >= 0
+        assert not result.optimization_in_progress
+
+    @pytest.mark.asyncio
+    async def test_quick_feasible_solve_finishing_in_time(
+        self, scheduler_service, sample_tasks, sample_resources, sample_constraints
+    ):
+        """Test quick mode returns the final schedule when solving is fast"""
+        sample_constraints.solver_profile = ScheduleSolverProfile(
+            quick_feasible_seconds=30
+        )
+
+        result = await scheduler_service.schedule_project(
+            project_id=uuid4(),
+            tasks=sample_tasks,
+            resources=sample_resources,
+            constraints=sample_constraints,
+        )
+
+        assert result.status == "success"
+        assert not result.optimization_in_progress
+        assert not scheduler_service._background_solves
+
+    @pytest.mark.asyncio
+    async def test_quick_feasible_continues_in_background(
+        self, scheduler_service, sample_tasks, sample_resources, sample_constraints
+    ):
+        """Test quick mode returns the incumbent and stores the final schedule later"""
+        sample_constraints.solver_profile = ScheduleSolverProfile(
+            quick_feasible_seconds=0.01
+        )
+        run_solver = scheduler_service._run_solver
+
+        def slow_run_solver(solver, model, stop_event=None, callback=None):
+            status = run_solver(solver, model, None, callback)
+            # Keep "searching" until the service stops the solve
+            stop_event.wait(10)
+            return status
+
+        scheduler_service._run_solver = slow_run_solver
+        project_id = uuid4()
+
+        result = await scheduler_service.schedule_project(
+            project_id=project_id,
+            tasks=sample_tasks,
+            resources=sample_resources,
+            constraints=sample_constraints,
+        )
+
+        assert result.status == "feasible"
+        assert result.optimization_in_progress
+        assert len(result.schedule) == len(sample_tasks)
+        assert result.solver_stats is not None
+
+        background = [task for task, _ in scheduler_service._background_solves.values()]
+        assert len(background) == 1
+
+        scheduler_service.shutdown()
+        await asyncio.wait_for(background[0], 10)
+
+        stored = await scheduler_service.get_schedule(project_id)
+        assert stored is not None
+        assert stored.project_duration_hours == result.project_duration_hours
+
+    @staticmethod
+    def _keep_solving(scheduler_service):
+        """Make solves keep searching until the service stops them"""
+        run_solver = scheduler_service._run_solver
+
+        def slow_run_solver(solver, model, stop_event=None, callback=None):
+            status = run_solver(solver, model, None, callback)
+            stop_event.wait(10)
+            return status
+
+        scheduler_service._run_solver = slow_run_solver
+
+    @pytest.mark.asyncio
+    async def test_background_solve_does_not_overwrite_newer_schedule(
+        self, scheduler_service, sample_tasks, sample_resources, sample_constraints
+    ):
+        """Test a background result is discarded once a newer schedule is stored"""
+        sample_constraints.solver_profile = ScheduleSolverProfile(
+            quick_feasible_seconds=0.01
+        )
+        self._keep_solving(scheduler_service)
+        scheduler_service.update_workitem_task_dates = AsyncMock(return_value={})
+        project_id = uuid4()
+
+        await scheduler_service.schedule_project(
+            project_id=project_id,
+            tasks=sample_tasks,
+            resources=sample_resources,
+            constraints=sample_constraints,
+        )
+        (background, _), = scheduler_service._background_solves.values()
+        scheduler_service.update_workitem_task_dates.reset_mock()
+
+        # A manual edit stores a newer version while optimization continues
+        stored = await scheduler_service.get_schedule(project_id)
+        await scheduler_service._store.save(
+            stored.model_copy(
+                update={"version": stored.version + 1, "project_duration_hours": 999}
+            )
+        )
+
+        scheduler_service.shutdown()
+        await asyncio.wait_for(background, 10)
+
+        latest = await scheduler_service.get_schedule(project_id)
+        assert latest.version == stored.version + 1
+        assert latest.project_duration_hours == 999
+        scheduler_service.update_workitem_task_dates.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_new_solve_replaces_background_solve(
+        self, scheduler_service, sample_tasks, sample_resources, sample_constraints
+    ):
+        """Test only the latest background solve of a project keeps running"""
+        sample_constraints.solver_profile = ScheduleSolverProfile(
+            quick_feasible_seconds=0.01
+        )
+        self._keep_solving(scheduler_service)
+        project_id = uuid4()
+
+        await scheduler_service.schedule_project(
+            project_id=project_id,
+            tasks=sample_tasks,
+            resources=sample_resources,
+            constraints=sample_constraints,
+        )
+        (first, first_stop), = scheduler_service._background_solves.values()
+
+        await scheduler_service.schedule_project(
+            project_id=project_id,
+            tasks=sample_tasks,
+            resources=sample_resources,
+            constraints=sample_constraints,
+        )
+
+        assert first_stop.is_set()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(first, 10)
+        assert len(scheduler_service._background_solves) == 1
+        (latest, _), = scheduler_service._background_solves.values()
+        assert latest is not first
+
+        scheduler_service.shutdown()
+        await asyncio.wait_for(latest, 10)
+
+
+class TestScheduleJobs:
+    """Tests for asynchronous schedule jobs"""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_in_process_pool(
+        self, scheduler_service, sample_tasks, sample_resources, sample_constraints
+    ):
+        """Test a queued job is solved in a worker process and stored"""
+        project_id = uuid4()
+
+        try:
+            job = await scheduler_service.submit_schedule_job(
+                project_id=project_id,
+                tasks=sample_tasks,
+                resources=sample_resources,
+                constraints=sample_constraints,
+            )
+            assert job.status == "queued"
+
+            await asyncio.wait_for(scheduler_service._jobs[job.job_id].task, 60)
+
+            status = await scheduler_service.get_schedule_job(job.job_id)
+            assert status.status == "completed"
+            assert status.result_status in ["success", "feasible"]
+
+            result = await scheduler_service.get_schedule_job_result(job.job_id)
+            assert len(result.schedule) == len(sample_tasks)
+            assert result.critical_path == ["task-1", "task-2", "task-3"]
+            assert await scheduler_service.get_schedule(project_id) is not None
+        finally:
+            scheduler_service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancel_job_before_solving(
+        self, scheduler_service, sample_tasks, sample_resources, sample_constraints
+    ):
+        """Test cancelling a job that has not reached the process pool"""
+        release = asyncio.Event()
+
+        async def slow_context(workpackage_id, milestones):
+            await release.wait()
+            return [], {}
+
+        scheduler_service._load_scheduling_context = slow_context
+
+        job = await scheduler_service.submit_schedule_job(
+            project_id=uuid4(),
+            tasks=sample_tasks,
+            resources=sample_resources,
+            constraints=sample_constraints,
+        )
+        cancelled = await scheduler_service.cancel_schedule_job(job.job_id)
+
+        assert cancelled.status == "cancelled"
+        assert cancelled.finished_at is not None
+        assert await scheduler_service.get_schedule_job_result(job.job_id) is None
+        assert scheduler_service._process_pool is None
+
+    @pytest.mark.asyncio
+    async def test_job_starts_when_worker_is_free(
+        self, scheduler_service, sample_tasks, sample_resources, sample_constraints
+    ):
+        """Test a job is marked running when it reaches a worker, not when polled"""
+        solve = Future()
+        pool = type("Pool", (), {"submit": lambda self, *args: solve})()
+        manager = type("Manager", (), {"Event": staticmethod(threading.Event)})()
+        scheduler_service._get_process_pool = lambda: pool
+        scheduler_service._get_job_manager = lambda: manager
+        scheduler_service._load_scheduling_context = AsyncMock(return_value=([], {}))
+        scheduler_service._job_slots = asyncio.Semaphore(0)
+
+        job = await scheduler_service.submit_schedule_job(
+            project_id=uuid4(),
+            tasks=sample_tasks,
+            resources=sample_resources,
+            constraints=sample_constraints,
+        )
+        await asyncio.sleep(0.05)
+        status = await scheduler_service.get_schedule_job(job.job_id)
+        assert status.status == "queued"
+        assert status.started_at is None
+
+        released_at = datetime.now(UTC)
+        scheduler_service._job_slots.release()
+        await asyncio.sleep(0.05)
+
+        running = scheduler_service._jobs[job.job_id]
+        assert running.status == "running"
+        assert running.started_at >= released_at
+
+        cancelled = await scheduler_service.cancel_schedule_job(job.job_id)
+        assert cancelled.status == "cancelled"
+        assert solve.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_job_cancelled_through_another_worker(
+        self, sample_tasks, sample_resources, sample_constraints, monkeypatch
+    ):
+        """Test a job stops when another worker cancels it in the shared job store"""
+        monkeypatch.setattr(scheduler_module, "_JOB_CANCEL_POLL_SECONDS", 0.01)
+        job_store = ScheduleJobStore(session_factory=_unavailable_session)
+        owner, other = SchedulerService(), SchedulerService()
+        owner._job_store = other._job_store = job_store
+
+        solve = Future()
+        solve.set_running_or_notify_cancel()
+        pool = type("Pool", (), {"submit": lambda self, *args: solve})()
+        manager = type("Manager", (), {"Event": staticmethod(threading.Event)})()
+        owner._get_process_pool = lambda: pool
+        owner._get_job_manager = lambda: manager
+        owner._load_scheduling_context = AsyncMock(return_value=([], {}))
+
+        job = await owner.submit_schedule_job(
+            project_id=uuid4(),
+            tasks=sample_tasks,
+            resources=sample_resources,
+            constraints=sample_constraints,
+        )
+        await asyncio.sleep(0.05)
+        running = owner._jobs[job.job_id]
+        assert (await other.get_schedule_job(job.job_id)).status == "running"
+
+        cancelled = await other.cancel_schedule_job(job.job_id)
+        assert cancelled.status == "cancelled"
+        await asyncio.sleep(0.05)
+        assert running.stop_event.is_set()
+
+        # The solver returns its incumbent once stopped; it is discarded
+        solve.set_result(ScheduleResponse(status="feasible", project_id=job.project_id))
+        await asyncio.wait_for(running.task, 5)
+
+        status = await owner.get_schedule_job(job.job_id)
+        assert status.status == "cancelled"
+        assert status.message == "Cancelled by user"
+        assert await owner.get_schedule_job_result(job.job_id) is None
+        assert job.job_id not in owner._jobs
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self, scheduler_service):
+        """Test unknown jobs return None"""
+        job_id = uuid4()
+
+        assert await scheduler_service.get_schedule_job(job_id) is None
+        assert await scheduler_service.get_schedule_job_result(job_id) is None
+        assert await scheduler_service.cancel_schedule_job(job_id) is None
+
+    def test_stop_event_stops_search(
+        self, scheduler_service, sample_tasks, sample_resources, sample_constraints
+    ):
+        """Test a set stop event ends the solve without an error"""
+        stop_event = threading.Event()
+        stop_event.set()
+
+        result = scheduler_service._solve_schedule(
+            uuid4(),
+            sample_tasks,
+            sample_resources,
+            sample_constraints,
+            [],
+            None,
+            {},
+            stop_event,
+        )
+
+        assert result.status in ["success", "feasible", "error"]
+
+
 class TestSkillsBasedAllocation:
     """Tests for skills-based resource allocation"""
 
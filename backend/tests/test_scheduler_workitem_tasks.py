@@ -1,6 +1,7 @@
 """Unit tests for SchedulerService WorkItem task integration"""
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
@@ -58,6 +59,26 @@ class TestWorkItemTaskQuery:
         assert isinstance(tasks, list)
         assert len(tasks) == 0
 
+    @pytest.mark.asyncio
+    async def test_get_workitem_tasks_binds_workpackage_id(
+        self, scheduler_service, sample_project_id, sample_workpackage_id
+    ):
+        """Test the workpackage ID is passed as a query parameter"""
+        graph_service = AsyncMock()
+        graph_service.execute_query.return_value = []
+
+        with patch(
+            "app.db.graph.get_graph_service", AsyncMock(return_value=graph_service)
+        ):
+            await scheduler_service.get_workitem_tasks(
+                sample_project_id, sample_workpackage_id
+            )
+
+        query, params = graph_service.execute_query.call_args.args
+        assert str(sample_workpackage_id) not in query
+        assert "$workpackage_id" in query
+        assert params == {"workpackage_id": str(sample_workpackage_id)}
+
     @pytest.mark.asyncio
     async def test_get_workitem_tasks_handles_errors(
         self, scheduler_service, sample_project_id
@@ -343,3 +364,48 @@ class TestWorkItemTaskValidation:
         )
 
         assert response.status in ["success", "feasible"]
+
+    @pytest.mark.asyncio
+    async def test_update_workitem_task_dates_batched(self, scheduler_service):
+        """Test dates are written in chunked UNWIND batches with per-task failures"""
+        start_date = datetime.now(UTC)
+        scheduled_tasks = [
+            ScheduledTask(
+                task_id=f"task-{i}",
+                task_title=f"Test Task {i}",
+                start_date=start_date,
+                end_date=start_date + timedelta(hours=8),
+                duration_hours=8,
+            )
+            for i in range(1200)
+        ]
+
+        graph_service = AsyncMock()
+
+        async def execute_batched(query, param_sets):
+            # First chunk misses one task, last chunk fails entirely
+            first = [row["id"] for row in param_sets[0]["rows"] if row["id"] != "task-7"]
+            second = [row["id"] for row in param_sets[1]["rows"]]
+            return [first, second, RuntimeError("deadlock detected")]
+
+        graph_service.execute_batched.side_effect = execute_batched
+
+        with patch(
+            "app.db.graph.get_graph_service", AsyncMock(return_value=graph_service)
+        ):
+            failures = await scheduler_service.update_workitem_task_dates(
+                scheduled_tasks
+            )
+
+        query, param_sets = graph_service.execute_batched.call_args[0]
+        assert "UNWIND $rows AS row" in query
+        assert [len(params["rows"]) for params in param_sets] == [500, 500, 200]
+        assert param_sets[0]["rows"][0] == {
+            "id": "task-0",
+            "start": start_date.isoformat(),
+            "end": (start_date + timedelta(hours=8)).isoformat(),
+        }
+
+        assert failures["task-7"] == "WorkItem task not found"
+        assert "deadlock detected" in failures["task-1000"]
+        assert len(failures) == 201
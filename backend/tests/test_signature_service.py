@@ -6,12 +6,14 @@ from uuid import uuid4
 
 import pytest
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from sqlalchemy import Update
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.signature import DigitalSignature
 from app.models.user import User, UserRole
-from app.services.signature_service import SignatureService
+from app.services.signature_service import PublicKeyRegistry, SignatureService
 
 
 class TestSignatureService:
@@ -400,48 +402,49 @@ class TestSignatureService:
         workitem_id = uuid4()
         reason = "WorkItem modified"
 
-        # Mock signatures to invalidate
-        signature1 = DigitalSignature(
-            id=uuid4(),
-            workitem_id=workitem_id,
-            workitem_version="1.0",
-            user_id=uuid4(),
-            signature_hash="a" * 512,  # Valid hex signature length
-            content_hash="b" * 64,     # Valid SHA-256 hash length
-            signed_at=datetime.now(UTC),
-            is_valid=True,
-        )
-
-        signature2 = DigitalSignature(
-            id=uuid4(),
-            workitem_id=workitem_id,
-            workitem_version="1.1",
-            user_id=uuid4(),
-            signature_hash="c" * 512,  # Valid hex signature length
-            content_hash="d" * 64,     # Valid SHA-256 hash length
-            signed_at=datetime.now(UTC),
-            is_valid=True,
-        )
+        # Signatures as returned by UPDATE ... RETURNING
+        signatures = [
+            DigitalSignature(
+                id=uuid4(),
+                workitem_id=workitem_id,
+                workitem_version=version,
+                user_id=uuid4(),
+                signature_hash="a" * 512,  # Valid hex signature length
+                content_hash="b" * 64,     # Valid SHA-256 hash length
+                signed_at=datetime.now(UTC),
+                is_valid=False,
+                invalidated_at=datetime.now(UTC),
+                invalidation_reason=reason,
+            )
+            for version in ("1.0", "1.1")
+        ]
 
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [signature1, signature2]
+        mock_result.scalars.return_value.all.return_value = signatures
         mock_db.execute.return_value = mock_result
         mock_db.commit = AsyncMock()
 
         # Test invalidation
         result = await signature_service.invalidate_signatures(workitem_id, reason)
 
-        # Verify database operations
+        # Verify a single set-based UPDATE was issued
+        mock_db.execute.assert_awaited_once()
+        statement = mock_db.execute.call_args[0][0]
+        assert isinstance(statement, Update)
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "ANY" in sql
         mock_db.commit.assert_called_once()
 
         # Verify signatures were invalidated
         assert len(result) == 2
-        assert signature1.is_valid is False
-        assert signature1.invalidation_reason == reason
-        assert signature1.invalidated_at is not None
-        assert signature2.is_valid is False
-        assert signature2.invalidation_reason == reason
-        assert signature2.invalidated_at is not None
+        assert all(signature.is_valid is False for signature in result)
+        assert all(signature.invalidation_reason == reason for signature in result)
+        assert all(signature.invalidated_at is not None for signature in result)
+
+    async def test_invalidate_signatures_for_no_workitems(self, signature_service, mock_db):
+        """Test that invalidating no WorkItems issues no query"""
+        assert await signature_service.invalidate_signatures_for([], "WorkItem modified") == []
+        mock_db.execute.assert_not_awaited()
 
     async def test_get_workitem_signatures(self, signature_service, mock_db):
         """Test getting WorkItem signatures"""
@@ -507,6 +510,168 @@ class TestSignatureService:
         result = await signature_service.is_workitem_signed(workitem_id)
         assert result is False
 
+    async def test_signed_status_for(self, signature_service, mock_db):
+        """Test signed status of many WorkItems with one grouped query"""
+        signed_id, unsigned_id = uuid4(), uuid4()
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [signed_id]
+        mock_db.execute.return_value = mock_result
+
+        result = await signature_service.signed_status_for([signed_id, unsigned_id, signed_id])
+
+        assert result == {signed_id: True, unsigned_id: False}
+        mock_db.execute.assert_awaited_once()
+        sql = str(mock_db.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "GROUP BY" in sql
+
+        mock_db.execute.reset_mock()
+        assert await signature_service.signed_status_for([]) == {}
+        mock_db.execute.assert_not_awaited()
+
+
+class TestBulkVerification:
+    """Test cases for bulk signature verification"""
+
+    @pytest.fixture
+    def mock_db(self):
+        """Mock database session"""
+        return AsyncMock(spec=AsyncSession)
+
+    @pytest.fixture
+    def signature_service(self, mock_db):
+        """SignatureService instance with mocked database"""
+        return SignatureService(mock_db)
+
+    @pytest.fixture
+    def signer(self):
+        """Signer user ID with its (private, public) PEM key pair"""
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        private_pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        public_pem = private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        return uuid4(), private_pem, public_pem
+
+    def _sign(self, service, signer, workitem_id, content):
+        user_id, private_pem, _ = signer
+        content_hash = service._generate_content_hash(content)
+        return DigitalSignature(
+            id=uuid4(),
+            workitem_id=workitem_id,
+            workitem_version="1.0",
+            user_id=user_id,
+            signature_hash=service._create_signature(content_hash, private_pem),
+            content_hash=content_hash,
+            signed_at=datetime.now(UTC),
+            is_valid=True,
+        )
+
+    def _returns(self, mock_db, signatures):
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = signatures
+        mock_db.execute.return_value = mock_result
+
+    def test_registry_caches_parsed_keys(self, signer):
+        user_id, _, public_pem = signer
+        registry = PublicKeyRegistry(maxsize=1)
+
+        key = registry.get(user_id, public_pem)
+
+        assert registry.get(user_id, public_pem) is key
+        assert registry.get(uuid4(), public_pem) is not key
+
+    def test_registry_rejects_non_rsa_keys(self):
+        public_pem = ec.generate_private_key(ec.SECP256R1()).public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+
+        with pytest.raises(ValueError):
+            PublicKeyRegistry().get(uuid4(), public_pem)
+
+    async def test_verify_signatures(self, signature_service, mock_db, signer):
+        content = {"title": "Requirement", "version": "1.0"}
+        intact_id, tampered_id = uuid4(), uuid4()
+        intact = self._sign(signature_service, signer, intact_id, content)
+        tampered = self._sign(signature_service, signer, tampered_id, content)
+        missing_id = uuid4()
+        self._returns(mock_db, [intact, tampered])
+
+        results = await signature_service.verify_signatures(
+            public_keys={signer[0]: signer[2]},
+            signature_ids=[missing_id, tampered.id],
+            workitem_ids=[intact_id],
+            workitem_contents={
+                intact_id: content,
+                tampered_id: {**content, "title": "Changed"},
+            },
+        )
+
+        mock_db.execute.assert_awaited_once()
+        assert [r.signature_id for r in results] == [missing_id, tampered.id, intact.id]
+        assert results[0].is_valid is False
+        assert results[0].error_message == "Signature not found"
+        assert results[1].signature_intact is True
+        assert results[1].content_matches is False
+        assert results[1].is_valid is False
+        assert results[2].signature_intact is True
+        assert results[2].content_matches is True
+        assert results[2].is_valid is True
+
+    async def test_verify_signatures_without_content(
+        self, signature_service, mock_db, signer
+    ):
+        signature = self._sign(signature_service, signer, uuid4(), {"title": "A"})
+        self._returns(mock_db, [signature])
+
+        results = await signature_service.verify_signatures(
+            public_keys={signer[0]: signer[2]}, signature_ids=[signature.id]
+        )
+
+        assert results[0].signature_intact is True
+        assert results[0].content_matches is None
+        assert results[0].is_valid is False
+        assert results[0].error_message.startswith("Content not checked")
+
+    async def test_verify_signatures_without_signer_key(
+        self, signature_service, mock_db, signer
+    ):
+        signature = self._sign(signature_service, signer, uuid4(), {"title": "A"})
+        self._returns(mock_db, [signature])
+
+        results = await signature_service.verify_signatures(
+            public_keys={}, signature_ids=[signature.id]
+        )
+
+        assert results[0].is_valid is False
+        assert results[0].error_message == "No public key supplied for the signer"
+
+    async def test_verify_signatures_nothing_requested(self, signature_service, mock_db):
+        assert await signature_service.verify_signatures(public_keys={}) == []
+        mock_db.execute.assert_not_awaited()
+
+    async def test_get_signatures_for_workitems(self, signature_service, mock_db, signer):
+        first, second = uuid4(), uuid4()
+        signatures = [
+            self._sign(signature_service, signer, first, {"title": "A"}),
+            self._sign(signature_service, signer, second, {"title": "B"}),
+            self._sign(signature_service, signer, first, {"title": "A"}),
+        ]
+        self._returns(mock_db, signatures)
+
+        result = await signature_service.get_signatures_for_workitems([first, second, uuid4()])
+
+        mock_db.execute.assert_awaited_once()
+        assert [s.id for s in result[first]] == [signatures[0].id, signatures[2].id]
+        assert [s.id for s in result[second]] == [signatures[1].id]
+        assert len(result) == 2
+
 
 @pytest.mark.unit
 class TestSignatureServiceEdgeCases:
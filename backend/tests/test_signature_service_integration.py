@@ -160,8 +160,11 @@ class TestSignatureServiceWorkItemIntegration:
             signature_hash=signature_response.signature_hash,
             content_hash=signature_response.content_hash,
             signed_at=signature_response.signed_at,
-            is_valid=True,
+            is_valid=False,
+            invalidated_at=datetime.now(UTC),
+            invalidation_reason="WorkItem updated to version 1.1",
         )
+        # Invalidated rows as returned by UPDATE ... RETURNING
         mock_invalidation_result.scalars.return_value.all.return_value = [mock_invalidation_signature]
         mock_db.execute.return_value = mock_invalidation_result
 
@@ -171,8 +174,9 @@ class TestSignatureServiceWorkItemIntegration:
 
         # Verify invalidation
         assert len(invalidated_signatures) == 1
-        assert mock_invalidation_signature.is_valid is False
-        assert mock_invalidation_signature.invalidation_reason == "WorkItem updated to version 1.1"
+        assert invalidated_signatures[0].id == signature_response.id
+        assert invalidated_signatures[0].is_valid is False
+        assert invalidated_signatures[0].invalidation_reason == "WorkItem updated to version 1.1"
 
         # Step 4: Sign the updated WorkItem (version 1.1)
         updated_workitem = sample_workitem.copy()
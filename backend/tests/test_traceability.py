@@ -0,0 +1,134 @@
+"""Tests for the traceability matrix engine"""
+
+import numpy as np
+
+from app.utils.traceability import build_traceability_matrix
+
+
+def _items():
+    return [
+        {"id": "req-1", "type": "requirement", "title": "Login", "is_signed": True},
+        {"id": "req-2", "type": "requirement", "title": "Export"},
+        {"id": "req-3", "type": "requirement", "title": "Audit"},
+        {"id": "test-1", "type": "test", "title": "Login test"},
+        {"id": "test-2", "type": "test", "title": "Export test"},
+        {"id": "test-3", "type": "test", "title": "Orphan test"},
+        {"id": "risk-1", "type": "risk", "title": "Lockout"},
+        {"id": "risk-2", "type": "risk", "title": "Unmitigated"},
+        {"id": "task-1", "type": "task", "title": "Not traced"},
+    ]
+
+
+def _links():
+    return [
+        ("TESTED_BY", "req-1", "test-1"),
+        ("TESTED_BY", "req-1", "test-1"),  # duplicate
+        ("TESTED_BY", "req-2", "test-2"),
+        ("TESTED_BY", "req-1", "test-2"),
+        ("MITIGATES", "req-1", "risk-1"),
+        ("TESTED_BY", "req-3", "risk-1"),  # wrong target type
+        ("MITIGATES", "task-1", "risk-2"),  # source is not a requirement
+        ("DEPENDS_ON", "req-2", "req-3"),
+        ("TESTED_BY", "req-3", "missing"),
+    ]
+
+
+class TestBuildTraceabilityMatrix:
+    def test_keeps_only_traceability_links(self):
+        matrix = build_traceability_matrix(_items(), _links())
+
+        assert [item["id"] for item in matrix.requirements] == ["req-1", "req-2", "req-3"]
+        assert [item["id"] for item in matrix.tests] == ["test-1", "test-2", "test-3"]
+        assert [item["id"] for item in matrix.risks] == ["risk-1", "risk-2"]
+        assert matrix.tested_by.tolist() == [[0, 0], [0, 1], [1, 1]]
+        assert matrix.mitigates.tolist() == [[0, 0]]
+
+    def test_empty(self):
+        matrix = build_traceability_matrix([], [])
+
+        assert matrix.rows() == []
+        assert matrix.coverage_stats()["test_coverage_percentage"] == 0.0
+        assert matrix.to_response() == {
+            "requirements": [],
+            "tests": [],
+            "risks": [],
+            "coverage_stats": matrix.coverage_stats(),
+        }
+
+
+class TestTraceabilityMatrix:
+    def test_rows(self):
+        rows = build_traceability_matrix(_items(), _links()).rows()
+
+        assert rows[0] == {
+            "requirement_id": "req-1",
+            "requirement_title": "Login",
+            "status": None,
+            "is_signed": True,
+            "test_ids": ["test-1", "test-2"],
+            "risk_ids": ["risk-1"],
+        }
+        assert rows[1]["test_ids"] == ["test-2"]
+        assert rows[2]["test_ids"] == [] and rows[2]["risk_ids"] == []
+
+    def test_rows_filtered_by_requirement(self):
+        matrix = build_traceability_matrix(_items(), _links())
+
+        rows = matrix.rows(["req-3", "req-2", "unknown"])
+
+        assert [row["requirement_id"] for row in rows] == ["req-2", "req-3"]
+
+    def test_coverage_stats(self):
+        stats = build_traceability_matrix(_items(), _links()).coverage_stats()
+
+        assert stats == {
+            "total_requirements": 3,
+            "requirements_with_tests": 2,
+            "requirements_without_tests": 1,
+            "requirements_with_risks": 1,
+            "signed_requirements": 1,
+            "test_coverage_percentage": 66.7,
+            "total_tests": 3,
+            "total_risks": 2,
+            "test_links": 3,
+            "risk_links": 1,
+            "orphan_tests": 1,
+            "unmitigated_risks": 1,
+        }
+
+    def test_coverage_stats_for_selected_requirements(self):
+        matrix = build_traceability_matrix(_items(), _links())
+
+        stats = matrix.coverage_stats(["req-2"])
+
+        assert stats["total_requirements"] == 1
+        assert stats["test_coverage_percentage"] == 100.0
+        assert stats["total_tests"] == 1
+        assert stats["total_risks"] == 0
+        assert "orphan_tests" not in stats
+
+    def test_response_links_back_to_requirements(self):
+        response = build_traceability_matrix(_items(), _links()).to_response()
+
+        tests = {test["id"]: test["requirement_ids"] for test in response["tests"]}
+        risks = {risk["id"]: risk["requirement_ids"] for risk in response["risks"]}
+        assert tests == {"test-1": ["req-1"], "test-2": ["req-1", "req-2"], "test-3": []}
+        assert risks == {"risk-1": ["req-1"], "risk-2": []}
+
+    def test_large_matrix(self):
+        rng = np.random.default_rng(0)
+        n = 10_000
+        items = [{"id": f"r{i}", "type": "requirement"} for i in range(n)]
+        items += [{"id": f"t{i}", "type": "test"} for i in range(n)]
+        links = [
+            ("TESTED_BY", f"r{r}", f"t{t}")
+            for r, t in rng.integers(0, n, size=(3 * n, 2)).tolist()
+        ]
+
+        matrix = build_traceability_matrix(items, links)
+        rows = matrix.rows()
+        stats = matrix.coverage_stats()
+
+        covered = sum(1 for row in rows if row["test_ids"])
+        assert stats["requirements_with_tests"] == covered
+        assert stats["test_links"] == sum(len(row["test_ids"]) for row in rows)
@@ -0,0 +1,72 @@
+"""Tests for version snapshot diffs"""
+
+import pytest
+
+from app.utils.version_diff import LONG_TEXT_LENGTH, diff_snapshots, diff_text
+
+
+def _apply(old: str, hunks: list[dict]) -> str:
+    position, parts = 0, []
+    for hunk in hunks:
+        if hunk["op"] == "equal":
+            parts.append(old[position: position + hunk["length"]])
+            position += hunk["length"]
+        elif hunk["op"] == "delete":
+            position += len(hunk["text"])
+        elif hunk["op"] == "insert":
+            parts.append(hunk["text"])
+        else:
+            position += len(hunk["from"])
+            parts.append(hunk["to"])
+    return "".join(parts)
+
+
+class TestDiffText:
+    @pytest.mark.parametrize(
+        "old,new",
+        [
+            ("The system shall log in users.", "The system shall securely log in users."),
+            ("Line one\nLine two\n", "Line one\nLine 2\nLine three\n"),
+            ("remove all of this", ""),
+            ("", "brand new"),
+        ],
+    )
+    def test_hunks_rebuild_new_text(self, old, new):
+        assert _apply(old, diff_text(old, new)) == new
+
+    def test_unchanged_text_is_not_repeated(self):
+        old = "word " * 500
+        new = old + "appended"
+
+        hunks = diff_text(old, new)
+
+        assert hunks == [{"op": "equal", "length": len(old)}, {"op": "insert", "text": "appended"}]
+
+
+class TestDiffSnapshots:
+    def test_only_differences_are_reported(self):
+        old = {"title": "A", "status": "draft", "priority": 1, "version": "1.0", "gone": 1}
+        new = {"title": "B", "status": "draft", "priority": 1, "version": "1.1", "tag": "x"}
+
+        diff = diff_snapshots(old, new)
+
+        assert diff == {
+            "added_fields": {"tag": "x"},
+            "removed_fields": {"gone": 1},
+            "changed_fields": {"title": {"from": "A", "to": "B"}},
+            "unchanged_count": 2,
+        }
+
+    def test_long_text_is_diffed(self):
+        old = {"description": "x " * LONG_TEXT_LENGTH}
+        new = {"description": "x " * LONG_TEXT_LENGTH + "y"}
+
+        diff = diff_snapshots(old, new)
+
+        assert set(diff["changed_fields"]["description"]) == {"diff"}
+
+    def test_field_projection(self):
+        diff = diff_snapshots({"title": "A", "status": "a"}, {"title": "B", "status": "b"}, ["title"])
+
+        assert list(diff["changed_fields"]) == ["title"]
+        assert diff["unchanged_count"] == 0
@@ -619,3 +619,103 @@ class TestVersionServiceIntegration:
                 current_workitem = new_workitem_data
 
         test_user_identity_linking()
+
+
+class TestVersionHistoryPaging:
+    """Paged history and cached diffs"""
+
+    @pytest.fixture
+    def mock_graph_service(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def version_service(self, mock_graph_service):
+        service = VersionService(mock_graph_service, AsyncMock(), AsyncMock())
+        service.version_store = AsyncMock()
+        return service
+
+    async def test_first_page_starts_with_current_version(self, version_service, mock_graph_service):
+        workitem_id = uuid4()
+        mock_graph_service.get_workitem.return_value = {"version": "1.3", "title": "Now", "status": "active"}
+        version_service.version_store.history_page.return_value = [
+            (3, {"version": "1.2", "title": "Before", "status": "draft"}),
+            (2, {"version": "1.1", "title": "Older", "status": "draft"}),
+        ]
+
+        versions, cursor = await version_service.get_version_history_page(
+            workitem_id, limit=3, fields=["title"]
+        )
+
+        assert versions == [
+            {"version": "1.3", "title": "Now"},
+            {"version": "1.2", "title": "Before"},
+            {"version": "1.1", "title": "Older"},
+        ]
+        version_service.version_store.history_page.assert_called_once_with(workitem_id, 2)
+
+        version_service.version_store.history_page.return_value = [(1, {"version": "1.0"})]
+        versions, cursor = await version_service.get_version_history_page(workitem_id, limit=3, cursor=cursor)
+
+        assert versions == [{"version": "1.0"}]
+        assert cursor is None
+        assert version_service.version_store.history_page.call_args.kwargs == {"before": 2}
+
+    async def test_page_with_only_current_version(self, version_service, mock_graph_service):
+        mock_graph_service.get_workitem.return_value = {"version": "1.1"}
+        version_service.version_store.history_page.side_effect = [[], [(1, {"version": "1.0"})]]
+
+        versions, cursor = await version_service.get_version_history_page(uuid4(), limit=1)
+
+        assert versions == [{"version": "1.1"}]
+        assert cursor is not None
+
+    async def test_invalid_cursor(self, version_service):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            await version_service.get_version_history_page(uuid4(), cursor="not-a-cursor")
+
+    async def test_diff_is_cached_per_version_pair(self, version_service, mock_graph_service):
+        workitem_id = uuid4()
+        mock_graph_service.get_workitem.return_value = {
+            "version": "1.2", "title": "New", "status": "a", "updated_at": "2026-01-01T00:00:00Z"
+        }
+        version_service.version_store.reconstruct.return_value = {"version": "1.1", "title": "Old", "status": "a"}
+
+        first = await version_service.diff_versions(workitem_id, "1.1", "1.2")
+        second = await version_service.diff_versions(workitem_id, "1.1", "1.2")
+
+        assert first == second
+        assert first["changed_fields"] == {"title": {"from": "Old", "to": "New"}}
+        assert first["unchanged_count"] == 1
+        assert "unchanged_fields" not in first
+        version_service.version_store.reconstruct.assert_called_once_with(workitem_id, "1.1")
+
+    async def test_diff_against_edited_current_version_is_recomputed(
+        self, version_service, mock_graph_service
+    ):
+        workitem_id = uuid4()
+        version_service.version_store.reconstruct.return_value = {"version": "1.1", "title": "Old"}
+        mock_graph_service.get_workitem.return_value = {
+            "version": "1.2", "title": "New", "updated_at": "2026-01-01T00:00:00Z"
+        }
+        await version_service.diff_versions(workitem_id, "1.1", "1.2", fields=["title"])
+
+        mock_graph_service.get_workitem.return_value = {
+            "version": "1.2", "title": "Newer", "updated_at": "2026-01-02T00:00:00Z"
+        }
+        diff = await version_service.diff_versions(workitem_id, "1.1", "1.2", fields=["title"])
+
+        assert diff["changed_fields"] == {"title": {"from": "Old", "to": "Newer"}}
+
+    async def test_diff_of_stored_versions_is_cached(self, version_service, mock_graph_service):
+        workitem_id = uuid4()
+        mock_graph_service.get_workitem.return_value = {"version": "1.3", "title": "Now"}
+        version_service.version_store.reconstruct.side_effect = [
+            {"version": "1.1", "title": "Old"},
+            {"version": "1.2", "title": "New"},
+        ]
+
+        first = await version_service.diff_versions(workitem_id, "1.1", "1.2")
+        second = await version_service.diff_versions(workitem_id, "1.1", "1.2")
+
+        assert first is second
+        assert version_service.version_store.reconstruct.await_count == 2
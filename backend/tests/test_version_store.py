@@ -0,0 +1,174 @@
+"""Tests for keyframe + delta version storage"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.version_history import VersionHistory
+from app.services.version_store import VersionStore
+from app.utils.json_patch import apply_patch, make_patch
+
+
+def _result(rows):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = list(rows)
+    return result
+
+
+def _since_keyframe(rows):
+    """Rows the store's chain query returns: the latest keyframe onwards"""
+    keyframes = [i for i, row in enumerate(rows) if row.is_keyframe]
+    return rows[keyframes[-1]:] if keyframes else []
+
+
+def _up_to(rows, version):
+    """Rows the reconstruct query returns for a version"""
+    target = max(i for i, row in enumerate(rows) if row.version == version)
+    start = max(i for i, row in enumerate(rows[: target + 1]) if row.is_keyframe)
+    return rows[start: target + 1]
+
+
+def _snapshot(i: int) -> dict:
+    return {
+        "id": "wi-1",
+        "title": "Login" if i < 5 else "Secure login",
+        "description": "Users log in with a password. " * 50,
+        "status": "draft" if i % 2 else "active",
+        "priority": i % 5,
+        "version": f"1.{i}",
+        "metadata": {"reviewers": ["a", "b"][: i % 3], "rev": i},
+    }
+
+
+class TestJsonPatch:
+    def test_round_trip(self):
+        source = {"a": 1, "b": {"c": "x", "d": [1, 2]}, "gone": True, "k/~": 1}
+        target = {"a": 1, "b": {"c": "y", "d": [1, 2, 3], "e": None}, "new": 2, "k/~": 2}
+
+        patch = make_patch(source, target)
+
+        assert apply_patch(json.loads(json.dumps(source)), patch) == target
+        assert {"op": "remove", "path": "/gone"} in patch
+        assert {"op": "replace", "path": "/k~1~0", "value": 2} in patch
+        assert all(op["path"] != "/a" for op in patch)
+
+    def test_type_changes_are_replaced(self):
+        patch = make_patch({"a": 1, "b": 1}, {"a": 1.0, "b": True})
+
+        assert len(patch) == 2
+
+    def test_apply_rejects_missing_paths(self):
+        with pytest.raises(ValueError):
+            apply_patch({}, [{"op": "replace", "path": "/a", "value": 1}])
+        with pytest.raises(ValueError):
+            apply_patch({}, [{"op": "remove", "path": "/a/b"}])
+        with pytest.raises(ValueError):
+            apply_patch({"a": 1}, [{"op": "move", "path": "/a"}])
+
+
+class TestVersionStore:
+    @pytest.fixture
+    def db(self):
+        db = AsyncMock()
+        db.add = MagicMock()
+        return db
+
+    @pytest.fixture
+    def store(self, db):
+        return VersionStore(db, keyframe_interval=10)
+
+    async def _append_all(self, store, db, count):
+        rows: list[VersionHistory] = []
+        db.add.side_effect = rows.append
+        workitem_id = uuid4()
+        for i in range(count):
+            db.execute.return_value = _result(_since_keyframe(rows))
+            await store.append(workitem_id, f"1.{i}", _snapshot(i), created_by=uuid4())
+        return workitem_id, rows
+
+    @pytest.mark.asyncio
+    async def test_keyframe_every_interval(self, store, db):
+        _, rows = await self._append_all(store, db, 25)
+
+        assert [row.sequence for row in rows] == list(range(1, 26))
+        assert [i for i, row in enumerate(rows) if row.is_keyframe] == [0, 10, 20]
+        assert all(row.data is None and row.delta for row in rows if not row.is_keyframe)
+        assert db.flush.await_count == 25
+
+    @pytest.mark.asyncio
+    async def test_append_locks_the_workitem_chain(self, store, db):
+        db.execute.return_value = _result([])
+        workitem_id = uuid4()
+
+        await store.append(workitem_id, "1.0", _snapshot(0), created_by=uuid4())
+
+        lock, chain = (call.args[0] for call in db.execute.await_args_list)
+        assert "pg_advisory_xact_lock" in str(lock)
+        assert lock.compile().params == {"hashtext_1": str(workitem_id)}
+        assert "version_history" in str(chain)
+
+    @pytest.mark.asyncio
+    async def test_deltas_are_small(self, store, db):
+        _, rows = await self._append_all(store, db, 25)
+
+        full = sum(len(json.dumps(_snapshot(i))) for i in range(25))
+        stored = sum(len(json.dumps(row.data if row.is_keyframe else row.delta)) for row in rows)
+        assert stored * 3 < full
+
+    @pytest.mark.asyncio
+    async def test_reconstruct_every_version(self, store, db):
+        workitem_id, rows = await self._append_all(store, db, 25)
+
+        for i in range(25):
+            db.execute.return_value = _result(_up_to(rows, f"1.{i}"))
+            assert await store.reconstruct(workitem_id, f"1.{i}") == _snapshot(i)
+
+        # Replaying must not modify the stored keyframe
+        assert rows[0].data == _snapshot(0)
+
+    @pytest.mark.asyncio
+    async def test_reconstruct_unknown_version(self, store, db):
+        db.execute.return_value = _result([])
+
+        assert await store.reconstruct(uuid4(), "9.9") is None
+
+    @pytest.mark.asyncio
+    async def test_history_in_one_pass(self, store, db):
+        workitem_id, rows = await self._append_all(store, db, 12)
+        db.execute.reset_mock()
+        db.execute.return_value = _result(rows)
+
+        history = await store.history(workitem_id)
+
+        assert history == [_snapshot(i) for i in range(12)]
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("before,expected", [(None, [24, 23, 22, 21]), (13, [12, 11, 10, 9])])
+    async def test_history_page(self, store, db, before, expected):
+        workitem_id, rows = await self._append_all(store, db, 24)
+        top = (before or 25) - 1
+        # Rows the page query returns: from the keyframe at or below the
+        # page's oldest sequence up to its newest
+        start = max(
+            row.sequence for row in rows if row.is_keyframe and row.sequence <= top - 3
+        )
+        db.execute.return_value = _result(rows[start - 1: top])
+
+        page = await store.history_page(workitem_id, 4, before=before)
+
+        assert [sequence for sequence, _ in page] == expected
+        assert [data for _, data in page] == [_snapshot(s - 1) for s in expected]
+
+    @pytest.mark.asyncio
+    async def test_legacy_snapshots_are_keyframes(self, store, db):
+        legacy = VersionHistory(
+            workitem_id=uuid4(), version="1.0", sequence=1, data={"title": "Old"}
+        )
+        legacy.is_keyframe = None
+
+        db.execute.return_value = _result([legacy])
+
+        assert await store.reconstruct(legacy.workitem_id, "1.0") == {"title": "Old"}
@@ -317,8 +317,73 @@ class TestWorkItemEndpoints:
             workitem_type="requirement",
             status=None,
             assigned_to=None,
-            limit=100
+            created_by=None,
+            priority=None,
+            limit=101,
+            offset=0,
+            after=None
         )
+        assert "X-Next-Cursor" not in response.headers
+
+    async def test_get_workitems_next_cursor(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        mock_graph_service: AsyncMock,
+    ):
+        """Test WorkItems pagination with the X-Next-Cursor header"""
+        rows = [
+            {
+                "id": str(uuid4()),
+                "type": "task",
+                "title": f"Task {i}",
+                "status": "active",
+                "priority": 2,
+                "version": "1.0",
+                "created_by": str(uuid4()),
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": f"2024-01-0{9 - i}T00:00:00Z",
+                "is_signed": False
+            }
+            for i in range(3)
+        ]
+        mock_graph_service.search_workitems.return_value = rows
+
+        response = await client.get(
+            "/api/v1/workitems?limit=2",
+            headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 2
+        next_cursor = response.headers["X-Next-Cursor"]
+
+        mock_graph_service.search_workitems.return_value = rows[2:]
+        response = await client.get(
+            "/api/v1/workitems",
+            params={"limit": 2, "cursor": next_cursor},
+            headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [w["title"] for w in response.json()] == ["Task 2"]
+        assert "X-Next-Cursor" not in response.headers
+        call = mock_graph_service.search_workitems.call_args
+        assert call.kwargs["after"] == (rows[1]["updated_at"], rows[1]["id"])
+
+    async def test_get_workitems_invalid_cursor(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        mock_graph_service: AsyncMock,
+    ):
+        """Test a malformed cursor returns 400"""
+        response = await client.get(
+            "/api/v1/workitems?cursor=garbage",
+            headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     async def test_get_workitem_by_id_success(
         self,
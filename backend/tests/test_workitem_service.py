@@ -495,6 +495,119 @@ class TestWorkItemService:
         assert len(results) >= 0  # Results depend on filtering
         mock_graph_service.search_workitems.assert_called_once()
 
+    def _search_rows(self, count, created_by):
+        """Graph rows ordered newest first, as search_workitems returns them"""
+        return [
+            {
+                "id": str(uuid4()),
+                "type": "task",
+                "title": f"Task {i}",
+                "status": "active",
+                "priority": 2,
+                "version": "1.0",
+                "created_by": str(created_by),
+                "created_at": "2024-01-01T00:00:00+00:00",
+                "updated_at": f"2024-01-{28 - i:02d}T00:00:00+00:00",
+                "is_signed": False
+            }
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_workitems_pages_in_query(
+        self,
+        workitem_service,
+        mock_graph_service,
+        sample_user
+    ):
+        """Test filters and offset are passed to the query instead of slicing"""
+        mock_graph_service.search_workitems.return_value = self._search_rows(
+            3, sample_user.id
+        )
+
+        results = await workitem_service.search_workitems(
+            created_by=sample_user.id,
+            priority=2,
+            limit=2,
+            offset=200
+        )
+
+        # An offset beyond the limit still yields a full page
+        assert len(results) == 2
+        mock_graph_service.search_workitems.assert_called_once_with(
+            search_text=None,
+            workitem_type=None,
+            status=None,
+            assigned_to=None,
+            created_by=str(sample_user.id),
+            priority=2,
+            limit=3,
+            offset=200,
+            after=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_workitems_page_keyset_cursor(
+        self,
+        workitem_service,
+        mock_graph_service,
+        sample_user
+    ):
+        """Test the next cursor resumes after the last WorkItem of the page"""
+        rows = self._search_rows(3, sample_user.id)
+        mock_graph_service.search_workitems.return_value = rows
+
+        page, next_cursor = await workitem_service.search_workitems_page(limit=2)
+
+        assert [str(w.id) for w in page] == [rows[0]["id"], rows[1]["id"]]
+        assert next_cursor is not None
+
+        mock_graph_service.search_workitems.return_value = rows[2:]
+        page, last_cursor = await workitem_service.search_workitems_page(
+            limit=2, cursor=next_cursor
+        )
+
+        assert [str(w.id) for w in page] == [rows[2]["id"]]
+        assert last_cursor is None
+        call = mock_graph_service.search_workitems.call_args
+        assert call.kwargs["after"] == (rows[1]["updated_at"], rows[1]["id"])
+        assert call.kwargs["offset"] == 0
+
+    @pytest.mark.asyncio
+    async def test_search_workitems_page_text_search_cursor(
+        self,
+        workitem_service,
+        mock_graph_service,
+        sample_user
+    ):
+        """Test relevance-ranked text searches page by offset"""
+        mock_graph_service.search_workitems.return_value = self._search_rows(
+            3, sample_user.id
+        )
+
+        _, next_cursor = await workitem_service.search_workitems_page(
+            search_text="task", limit=2, offset=4
+        )
+        await workitem_service.search_workitems_page(
+            search_text="task", limit=2, cursor=next_cursor
+        )
+
+        call = mock_graph_service.search_workitems.call_args
+        assert call.kwargs["offset"] == 6
+        assert call.kwargs["after"] is None
+
+    @pytest.mark.asyncio
+    async def test_search_workitems_page_invalid_cursor(
+        self,
+        workitem_service,
+        mock_graph_service
+    ):
+        """Test a malformed cursor is rejected"""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            await workitem_service.search_workitems_page(cursor="not-a-cursor")
+
+        mock_graph_service.search_workitems.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_workitem_version(
         self,